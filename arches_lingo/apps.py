@@ -5,3 +5,6 @@ class ArchesLingoConfig(AppConfig):
     name = "arches_lingo"
     verbose_name = "Arches Lingo"
     is_arches_application = True
+
+    def ready(self):
+        from arches_lingo import signals  # noqa: F401
@@ -0,0 +1,117 @@
+import json
+import logging
+import uuid
+from datetime import datetime
+
+from django.db.models.expressions import RawSQL
+
+import arches.app.utils.task_management as task_management
+from arches.app.models.models import ETLModule, LoadEvent, User
+
+logger = logging.getLogger(__name__)
+
+details = {
+    "etlmoduleid": "6fca1f07-d719-492d-baf6-6258c8836ddf",
+    "name": "Lingo Bulk Operations",
+    "description": "Track long-running Lingo operations such as scheme-wide reverts",
+    "etl_type": "edit",
+    "component": "",
+    "componentname": "",
+    "modulename": "lingo_bulk_operations.py",
+    "classname": "LingoBulkOperations",
+    "config": {"bgColor": "#ffa564", "circleColor": "#ffd2b1", "show": False},
+    "icon": "fa fa-tasks",
+    "slug": "lingo-bulk-operations",
+    "helpsortorder": 7,
+    "helptemplate": "",
+}
+
+
+class LingoBulkOperations:
+    """
+    Progress bookkeeping for background Lingo operations.
+
+    Each operation is recorded as a ``LoadEvent`` so the UI can poll it the
+    same way it polls imports and exports. ``load_details`` is always a JSON
+    object: progress counters and checkpoints are merged into it with
+    ``load_details || jsonb`` so a restarted task can read back where it
+    stopped.
+    """
+
+    def __init__(self, loadid=None, userid=None):
+        self.loadid = str(loadid) if loadid else str(uuid.uuid4())
+        self.userid = userid
+        self.load_event = None
+
+    def start(self, operation, **load_details):
+        self.load_event = LoadEvent.objects.create(
+            loadid=self.loadid,
+            user=User.objects.get(id=self.userid),
+            etl_module=ETLModule.objects.get(slug=details["slug"]),
+            status="running",
+            load_details={"operation": operation, **load_details},
+            load_start_time=datetime.now(),
+            complete=False,
+        )
+        return self.load_event
+
+    def get_load_event(self):
+        self.load_event = LoadEvent.objects.get(loadid=self.loadid)
+        return self.load_event
+
+    def get_details(self) -> dict:
+        load_details = self.get_load_event().load_details
+        return load_details if isinstance(load_details, dict) else {}
+
+    def update_details(self, **load_details):
+        LoadEvent.objects.filter(loadid=self.loadid).update(
+            load_details=RawSQL(
+                "load_details || %s::jsonb", [json.dumps(load_details, default=str)]
+            )
+        )
+
+    def mark_successful(self):
+        """Record that the operation's writes succeeded while it still runs,
+        e.g. before a follow-up step such as indexing."""
+        LoadEvent.objects.filter(loadid=self.loadid).update(successful=True)
+
+    def complete(self, **load_details):
+        if load_details:
+            self.update_details(**load_details)
+        LoadEvent.objects.filter(loadid=self.loadid).update(
+            status="completed",
+            complete=True,
+            successful=True,
+            load_end_time=datetime.now(),
+        )
+
+    def fail(self, error):
+        logger.error(error)
+        LoadEvent.objects.filter(loadid=self.loadid).update(
+            status="failed",
+            complete=True,
+            successful=False,
+            error_message=str(error),
+            load_end_time=datetime.now(),
+        )
+
+    def dispatch(self, task, *args):
+        """Run *task* on Celery when available, otherwise inline."""
+        if task_management.check_if_celery_available():
+            result = task.apply_async(args=[self.loadid, self.userid, *args])
+            LoadEvent.objects.filter(loadid=self.loadid).update(taskid=result.task_id)
+        else:
+            task(self.loadid, self.userid, *args)
+
+    @staticmethod
+    def serialize(load_event) -> dict:
+        return {
+            "loadid": str(load_event.loadid),
+            "status": load_event.status,
+            "complete": load_event.complete,
+            "successful": load_event.successful,
+            "error_message": load_event.error_message,
+            "load_details": load_event.load_details,
+            "load_start_time": load_event.load_start_time,
+            "load_end_time": load_event.load_end_time,
+        }
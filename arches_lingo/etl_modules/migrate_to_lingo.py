@@ -1,16 +1,26 @@
-import copy
+import csv
 import filetype
+import gzip
+import io
 import json
 import logging
+import multiprocessing
 import os
 import re
+import tempfile
+import time
 import uuid
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque, namedtuple
+from itertools import chain, groupby, islice
+from operator import itemgetter
 
+from django.core.files import File
 from django.core.files.storage import default_storage
-from django.db import connection
-from django.db.models import FilteredRelation, OuterRef, Prefetch, Q, Subquery
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.db.backends.postgresql.psycopg_any import is_psycopg3
+from django.db.models import OuterRef, Prefetch, Subquery
 from django.db.models.expressions import RawSQL
 from django.db.models.functions import Coalesce
 from django.utils.translation import gettext as _
@@ -20,14 +30,20 @@ from arches.app.etl_modules.save import save_to_tiles
 from arches.app.etl_modules.decorators import load_data_async
 from arches.app.etl_modules.base_import_module import BaseImportModule
 from arches.app.models import models
-from arches.app.models.models import LoadStaging, NodeGroup, LoadEvent
-from arches.app.models.concept import Concept
+from arches.app.models.models import LoadStaging
 from arches.app.models.system_settings import settings
 from arches.app.tasks import notify_completion
+from arches.app.utils.index_database import index_resources_by_transaction
 import arches.app.utils.task_management as task_management
 
 import arches_lingo.tasks as tasks
 import arches_lingo.const as const
+from arches_lingo.functions.reciprocal_relationship import (
+    deferred_reciprocal_sync,
+    queue_reciprocal_change,
+)
+from arches_lingo.utils import rdf_sources, staging_pool
+from arches_lingo.utils.import_performance import ImportPerformance
 
 logger = logging.getLogger(__name__)
 
@@ -47,12 +63,94 @@ details = {
     "helptemplate": "migrate-to-lingo-help",
 }
 
+# RDM migrations of more concepts than this run in Celery rather than in the
+# request.
+RDM_SYNC_CONCEPT_LIMIT = 1000
+
+# The concepts below an RDM scheme, following the relations that place a
+# concept in a scheme's hierarchy. UNION rather than UNION ALL keeps each
+# concept once and stops at cycles.
+CONCEPTS_TO_MIGRATE_SQL = """
+    with recursive collection_hierarchy as (
+        select conceptidto as child
+        from relations
+        where conceptidfrom = %s
+            and (relationtype = 'narrower' or relationtype = 'hasTopConcept')
+        union
+        select r.conceptidto
+        from collection_hierarchy ch
+        join relations r on ch.child = r.conceptidfrom
+        where relationtype = 'narrower' or relationtype = 'hasTopConcept'
+    )
+    select child as conceptid
+    from collection_hierarchy
+"""
+
+# Session-scoped table holding CONCEPTS_TO_MIGRATE_SQL's results while an RDM
+# migration extracts and stages them.
+CONCEPTS_TO_MIGRATE_TABLE = "lingo_concepts_to_migrate"
+
+# Rows fetched per round trip by the server-side cursors reading RDM values
+# and relations.
+RDM_EXTRACTION_CHUNK_SIZE = 2000
+
 # Number of concepts to process per bulk_create batch in populate_staging_table.
 # Larger batches reduce the number of DB round-trips: 2 000 concepts × ~8 tiles
 # = ~16 000 rows per INSERT, which PostgreSQL handles comfortably while keeping
 # the connection active throughout the loop.
 STAGING_BATCH_CONCEPT_COUNT = 2000
 
+# Concepts per chunk handed to a staging worker process. Smaller than a
+# serial batch so that every worker has work on mid-sized imports.
+STAGING_WORKER_CHUNK_CONCEPT_COUNT = 250
+
+# How staged tiles are written: "copy" streams each batch to load_staging with
+# COPY FROM STDIN; "bulk_create" builds LoadStaging instances and inserts them.
+STAGING_WRITER_COPY = "copy"
+STAGING_WRITER_BULK_CREATE = "bulk_create"
+STAGING_WRITERS = (STAGING_WRITER_COPY, STAGING_WRITER_BULK_CREATE)
+
+# LoadStaging fields written for each staged tile, in row order.
+STAGING_FIELDS = (
+    "load_event",
+    "nodegroup",
+    "resourceid",
+    "tileid",
+    "parenttileid",
+    "value",
+    "nodegroup_depth",
+    "source_description",
+    "passes_validation",
+    "operation",
+    "sortorder",
+)
+STAGING_VALUE_INDEX = STAGING_FIELDS.index("value")
+# Written for None in COPY rows, so it differs from an empty string.
+COPY_NULL = "\\N"
+
+# Phases of an import, in order. Each is recorded as "import_phase" in the
+# load event's load_details once it completes, and staging also records
+# "staged_resources" after every chunk, so a restarted import task resumes
+# after the last completed phase or chunk instead of starting over.
+IMPORT_PHASE_PARSED = "parsed"
+IMPORT_PHASE_STAGED = "staged"
+IMPORT_PHASE_VALIDATED = "validated"
+IMPORT_PHASE_SAVED = "saved"
+IMPORT_PHASES = (
+    IMPORT_PHASE_PARSED,
+    IMPORT_PHASE_STAGED,
+    IMPORT_PHASE_VALIDATED,
+    IMPORT_PHASE_SAVED,
+)
+
+# Keys of stored tile data that are filled in when tiles are saved, so they
+# are blanked before staged and existing tiles are compared by delta imports
+DELTA_VOLATILE_KEYS_PATTERN = r'("resourceXresourceId": )"[^"]*"'
+
+# Parsed schemes and concepts are kept in temp storage as gzipped JSON lines
+# until the import finishes, so a resumed import does not parse them again.
+INTERMEDIATE_FILE_NAME = "resources.jsonl.gz"
+
 ONTOLOGY_PROPERTY_BY_NODE_ALIAS = {
     "top_concept_of": const.TOP_CONCEPT_OF_ONTOLOGY_PROPERTY,
     "part_of_scheme": const.PART_OF_SCHEME_ONTOLOGY_PROPERTY,
@@ -61,6 +159,68 @@ ONTOLOGY_PROPERTY_BY_NODE_ALIAS = {
 }
 
 
+NodeHandler = namedtuple(
+    "NodeHandler", ["nodeid", "datatype", "datatype_instance", "config"]
+)
+
+
+class ImportPlan:
+    """Lookups for staging one graph's mock tiles, compiled once per import.
+
+    Holds a prebound datatype instance and load config for every node, and a
+    flat template of node defaults for every nodegroup, so building a tile
+    value is plain dict construction.
+    """
+
+    def __init__(self, importer, nodegroup_lookup, node_lookup):
+        self.nodegroup_lookup = nodegroup_lookup
+        self.node_lookup = node_lookup
+        self.node_handlers = {
+            node_alias: NodeHandler(
+                node_details["nodeid"],
+                node_details["datatype"],
+                importer.datatype_factory.get_instance(node_details["datatype"]),
+                {
+                    **(node_details["config"] or {}),
+                    "loadid": importer.loadid,
+                    "nodeid": node_details["nodeid"],
+                },
+            )
+            for node_alias, node_details in node_lookup.items()
+        }
+
+        self.tile_templates = defaultdict(list)
+        nodes = (
+            models.Node.objects.filter(nodegroup_id__in=list(nodegroup_lookup))
+            .exclude(datatype="semantic")
+            .prefetch_related("cardxnodexwidget_set")
+        )
+        for node in nodes:
+            # TODO: get default value from cardxnodexwidget if exists
+            default_value = None
+            for cross_record in node.cardxnodexwidget_set.all():
+                widget_default = cross_record.config.get("defaultValue", None)
+                if widget_default != "" and widget_default is not None:
+                    default_value = widget_default
+            self.tile_templates[str(node.nodegroup_id)].append(
+                (str(node.nodeid), default_value, node.datatype)
+            )
+
+    def blank_tile_value(self, nodegroupid):
+        # Defaults are shared between tiles; staged values are only ever
+        # replaced, never mutated in place.
+        return {
+            nodeid: {
+                "value": default_value,
+                "valid": True,
+                "source": "",
+                "notes": "",
+                "datatype": datatype,
+            }
+            for nodeid, default_value, datatype in self.tile_templates[nodegroupid]
+        }
+
+
 class LingoResourceImporter(BaseImportModule):
     def __init__(self, request=None, loadid=None, userid=None, **kwargs):
         if request:
@@ -83,6 +243,23 @@ class LingoResourceImporter(BaseImportModule):
         self.load_event = None
         self.mode = kwargs.get("mode", "cli")
         self.temp_file_path = kwargs.get("temp_file_path", None)
+        self.staging_writer = (
+            request.POST.get("staging_writer")
+            if request
+            else kwargs.get("staging_writer", None)
+        ) or settings.LINGO_IMPORT_STAGING_WRITER
+        self.staging_workers = self.parse_staging_workers(
+            request.POST.get("staging_workers")
+            if request
+            else kwargs.get("staging_workers", None)
+        )
+        # Delta imports stage only the tiles that differ from the existing
+        # resources, which are matched by deterministic resource ids
+        self.delta = (
+            request.POST.get("delta") == "true"
+            if request
+            else kwargs.get("delta", False)
+        )
         self.scheme_conceptid = (
             request.POST.get("scheme")
             if request
@@ -91,7 +268,10 @@ class LingoResourceImporter(BaseImportModule):
         self.language_lookup = {
             lang.code: lang.name for lang in models.Language.objects.all()
         }
-        self.blank_tile_lookup = {}
+        self.pending_load_errors = []
+        self.concepts_to_migrate_table_created = False
+        self.source_statistics = {}
+        self.performance = ImportPerformance()
 
     def get_schemes(self, request):
         schemes = (
@@ -121,15 +301,12 @@ class LingoResourceImporter(BaseImportModule):
         return {"success": True, "data": schemes_json}
 
     def extract_schemes_and_concepts_from_rdm(self, cursor, scheme_conceptid):
+        """Return the scheme and a generator over its concepts."""
         schemes = self.extract_schemes_from_rdm_tables(scheme_conceptid)
+        self.create_concepts_to_migrate_table(cursor, scheme_conceptid)
+        concepts = self.extract_concepts_from_rdm_tables()
 
-        # Prefetch concept hierarchy to avoid building it multiple times
-        concept_hierarchy, concepts_to_migrate = self.build_concept_hierarchy(
-            cursor, self.scheme_conceptid
-        )
-        concepts = self.extract_concepts_from_rdm_tables(concepts_to_migrate)
-
-        return schemes, concepts, concepts_to_migrate, concept_hierarchy
+        return schemes, concepts
 
     def extract_schemes_from_rdm_tables(self, scheme_conceptid):
         schemes = []
@@ -159,50 +336,33 @@ class LingoResourceImporter(BaseImportModule):
             schemes.append(scheme_to_load)
         return schemes
 
-    def extract_concepts_from_rdm_tables(self, concepts_to_migrate):
-        concepts = []
-        concepts_qs = models.Concept.objects.filter(
-            nodetype="Concept", pk__in=concepts_to_migrate
-        ).prefetch_related(
-            Prefetch("value_set", queryset=models.Value.objects.order_by("value"))
-        )
-        for concept in concepts_qs:
-            type_tile = {"type": {"type": "concept", "type_metatype": "classification"}}
-            concept_to_load = {"type": "Concept", "tile_data": [type_tile]}
-            for value in concept.value_set.all():
-                concept_to_load["resourceinstanceid"] = (
-                    concept.pk
-                )  # use old conceptid as new resourceinstanceid
+    def extract_concepts_from_rdm_tables(self):
+        """Yield the concepts in ``CONCEPTS_TO_MIGRATE_TABLE``, one at a time.
 
-                if (
-                    value.valuetype_id == "identifier"
-                    and str(concept.pk) in value.value
-                ):
-                    # Concepts with an auto-generated identifier should be marked as draft and not have their identifier treated as a URI
-                    continue
-
-                mock_tile = self.create_mock_tile_from_value(
-                    value, lang_lookup=self.language_lookup
-                )
-                if mock_tile:
-                    concept_to_load["tile_data"].append(mock_tile)
-
-            concepts.append(concept_to_load)
+        Values and matched concept relations are read with server-side
+        cursors, both ordered by concept id, and merged, so only the concept
+        being built is held in memory.
+        """
+        concepts_to_migrate = RawSQL(
+            f"select conceptid from {CONCEPTS_TO_MIGRATE_TABLE}", ()
+        )
+        values = (
+            models.Value.objects.filter(
+                concept__nodetype="Concept", concept_id__in=concepts_to_migrate
+            )
+            .order_by("concept_id", "value")
+            .values("concept_id", "value", "valuetype_id", "language_id")
+            .iterator(chunk_size=RDM_EXTRACTION_CHUNK_SIZE)
+        )
 
         # Extract matched concept relationships
         mapping_types = models.DRelationType.objects.filter(
             category="Mapping Properties"
         ).values("relationtype")
-
         relations_for_matched_concepts = (
-            models.Relation.objects.annotate(
-                identifier_value=FilteredRelation(
-                    "conceptto",
-                    condition=Q(conceptto__values__valuetype="identifier"),
-                )
-            )
-            .filter(
+            models.Relation.objects.filter(
                 relationtype__in=mapping_types,
+                conceptfrom_id__in=concepts_to_migrate,
             )
             .annotate(
                 uri=Subquery(
@@ -212,18 +372,53 @@ class LingoResourceImporter(BaseImportModule):
                     ).values("value")[:1]
                 )
             )
+            .order_by("conceptfrom_id", "relationid")
+            .values("conceptfrom_id", "relationtype_id", "uri")
+            .iterator(chunk_size=RDM_EXTRACTION_CHUNK_SIZE)
         )
-        for relation in relations_for_matched_concepts:
-            mock_tile = self.create_mock_tile_from_value(
-                {"value": relation.uri, "valuetype_id": relation.relationtype_id},
-            )
-            if mock_tile:
-                for concept in concepts:
-                    if concept["resourceinstanceid"] == relation.conceptfrom_id:
-                        concept["tile_data"].append(mock_tile)
-                        break
+        relations_by_concept = groupby(
+            relations_for_matched_concepts, key=itemgetter("conceptfrom_id")
+        )
+        relations = next(relations_by_concept, None)
+
+        for concept_id, concept_values in groupby(values, key=itemgetter("concept_id")):
+            type_tile = {"type": {"type": "concept", "type_metatype": "classification"}}
+            concept_to_load = {
+                "type": "Concept",
+                # use old conceptid as new resourceinstanceid
+                "resourceinstanceid": concept_id,
+                "tile_data": [type_tile],
+            }
+            for value in concept_values:
+                if (
+                    value["valuetype_id"] == "identifier"
+                    and str(concept_id) in value["value"]
+                ):
+                    # Concepts with an auto-generated identifier should be marked as draft and not have their identifier treated as a URI
+                    continue
+
+                mock_tile = self.create_mock_tile_from_value(
+                    value, lang_lookup=self.language_lookup
+                )
+                if mock_tile:
+                    concept_to_load["tile_data"].append(mock_tile)
 
-        return concepts
+            # Relations of concepts without values are skipped along the way
+            while relations and relations[0] < concept_id:
+                relations = next(relations_by_concept, None)
+            if relations and relations[0] == concept_id:
+                for relation in relations[1]:
+                    mock_tile = self.create_mock_tile_from_value(
+                        {
+                            "value": relation["uri"],
+                            "valuetype_id": relation["relationtype_id"],
+                        },
+                    )
+                    if mock_tile:
+                        concept_to_load["tile_data"].append(mock_tile)
+                relations = next(relations_by_concept, None)
+
+            yield concept_to_load
 
     @staticmethod
     def create_mock_tile_from_value(value, isScheme=False, lang_lookup=None):
@@ -302,58 +497,238 @@ class LingoResourceImporter(BaseImportModule):
         return {relationship["nodegroup_alias"]: mock_tile}
 
     def populate_staging_table(
-        self, cursor, concepts_to_load, nodegroup_lookup, node_lookup
+        self, cursor, resources, lookups_by_type, staged_resources=0
     ):
+        """Stage schemes and concepts from *resources*, a list or generator.
+
+        *lookups_by_type* maps a resource's ``type`` ("Scheme" or "Concept")
+        to its ``(nodegroup_lookup, node_lookup)``. Only a few chunks of
+        resources are held at a time. With more than one staging worker,
+        tile values are prepared in a process pool while this process
+        writes the results in order.
+
+        Each chunk is written in one transaction with its running total as
+        the "staged_resources" checkpoint. When resuming, *resources* starts
+        after the *staged_resources* already staged.
+
+        Returns the number of resources, tiles and load errors staged by
+        this call, with the seconds spent preparing tile values
+        ("transform_seconds") and writing them ("write_seconds").
+        """
+        statistics = {
+            "resources": 0,
+            "tiles": 0,
+            "load_errors": 0,
+            "transform_seconds": 0.0,
+            "write_seconds": 0.0,
+        }
         sortorder_counter = defaultdict(lambda: defaultdict(int))
+        if staged_resources:
+            # A resource may have been staged in more than one chunk
+            cursor.execute(
+                """
+                    SELECT resourceid, nodegroupid, max(sortorder) + 1
+                    FROM load_staging
+                    WHERE loadid = %s
+                    GROUP BY resourceid, nodegroupid
+                """,
+                [self.loadid],
+            )
+            for resourceid, nodegroup_id, next_sortorder in cursor.fetchall():
+                sortorder_counter[str(resourceid)][str(nodegroup_id)] = next_sortorder
 
-        # Process concepts in batches and insert each batch immediately rather
+        # Process concepts in chunks and insert each chunk immediately rather
         # than accumulating all tiles in memory before a single massive insert.
         # This keeps the database connection active throughout the loop and
         # avoids the server-side idle-connection timeout that occurs when
         # ~38k concepts are processed over 45+ minutes with no DB interaction.
-        for batch_start in range(0, len(concepts_to_load), STAGING_BATCH_CONCEPT_COUNT):
-            batch = concepts_to_load[
-                batch_start : batch_start + STAGING_BATCH_CONCEPT_COUNT
-            ]
+        chunks = self._prepare_staging_chunks(resources, lookups_by_type)
+        while True:
+            started = time.perf_counter()
+            prepared_chunk = next(chunks, None)
+            statistics["transform_seconds"] += time.perf_counter() - started
+            if prepared_chunk is None:
+                break
+            resource_count, prepared_tiles, load_errors = prepared_chunk
+            started = time.perf_counter()
             tiles_to_load = []
-            for concept_to_load in batch:
-                for mock_tile in concept_to_load["tile_data"]:
-                    resourceid = concept_to_load["resourceinstanceid"]
-                    nodegroup_alias = next(iter(mock_tile.keys()), None)
-                    nodegroup_id = node_lookup[nodegroup_alias]["nodeid"]
-                    nodegroup_depth = nodegroup_lookup[nodegroup_id]["depth"]
-                    tile_id = uuid.uuid4()
-                    parent_tile_id = None
-                    tile_value_json, passes_validation = self.create_tile_value(
-                        cursor,
-                        mock_tile,
-                        nodegroup_alias,
-                        nodegroup_lookup,
-                        node_lookup,
+            for (
+                resourceid,
+                nodegroup_id,
+                nodegroup_depth,
+                source_description,
+                tile_value_json,
+                passes_validation,
+            ) in prepared_tiles:
+                tile_id = uuid.uuid4()
+                parent_tile_id = None
+                operation = "insert"
+                # Assigned here, in input order, so results do not depend on
+                # which worker prepared a chunk
+                sortorder = sortorder_counter[str(resourceid)][str(nodegroup_id)]
+                sortorder_counter[str(resourceid)][str(nodegroup_id)] += 1
+                # Row values follow STAGING_FIELDS
+                tiles_to_load.append(
+                    (
+                        self.loadid,
+                        nodegroup_id,
+                        resourceid,
+                        tile_id,
+                        parent_tile_id,
+                        tile_value_json,
+                        nodegroup_depth,
+                        source_description,
+                        passes_validation,
+                        operation,
+                        sortorder,
                     )
-                    operation = "insert"
-                    sortorder = sortorder_counter[resourceid][nodegroup_id]
-                    sortorder_counter[resourceid][nodegroup_id] += 1
-                    tiles_to_load.append(
-                        LoadStaging(
-                            load_event=self.load_event or LoadEvent(self.loadid),
-                            nodegroup=NodeGroup(nodegroup_id),
-                            resourceid=resourceid,
-                            tileid=tile_id,
-                            parenttileid=parent_tile_id,
-                            value=tile_value_json,
-                            nodegroup_depth=nodegroup_depth,
-                            source_description="{0}: {1}".format(
-                                concept_to_load["type"], nodegroup_alias
-                            ),
-                            passes_validation=passes_validation,
-                            operation=operation,
-                            sortorder=sortorder,
-                        )
+                )
+            staged_resources += resource_count
+            with transaction.atomic():
+                if tiles_to_load:
+                    self.write_staging_rows(cursor, tiles_to_load)
+                self.pending_load_errors.extend(load_errors)
+                self.write_load_errors(cursor)
+                self.update_load_details(staged_resources=staged_resources)
+            statistics["write_seconds"] += time.perf_counter() - started
+            statistics["resources"] += resource_count
+            statistics["tiles"] += len(tiles_to_load)
+            statistics["load_errors"] += len(load_errors)
+
+        return statistics
+
+    def stage_tile_delta(self, cursor):
+        """Reduce the staged inserts to the changes against existing tiles.
+
+        Staged tiles are compared with the existing top-level tiles of the
+        same resources and nodegroups by a hash of their normalized tile
+        data. Staged tiles matching an existing tile are dropped. Of the
+        rest, each is paired with a remaining existing tile of the same
+        resource and nodegroup and staged as an update of it, or left as an
+        insert. Existing tiles with no staged counterpart are staged as
+        deletes. Nodegroups this load does not stage are left alone.
+        """
+        cursor.execute(
+            """
+            WITH staged AS (
+                SELECT tileid, resourceid, nodegroupid, nodegroup_depth, sortorder,
+                    md5(regexp_replace(
+                        (
+                            SELECT coalesce(jsonb_object_agg(key, value -> 'value'), '{}')
+                            FROM jsonb_each(load_staging.value)
+                        )::text,
+                        %(volatile_keys)s, '\1""', 'g'
+                    )) AS hash
+                FROM load_staging
+                WHERE loadid = %(loadid)s AND operation = 'insert'
+            ),
+            staged_nodegroups AS (
+                SELECT nodegroupid, max(nodegroup_depth) AS nodegroup_depth
+                FROM staged
+                GROUP BY nodegroupid
+            ),
+            existing AS (
+                SELECT tiles.tileid, tiles.resourceinstanceid AS resourceid,
+                    tiles.nodegroupid, tiles.sortorder, tiles.tiledata,
+                    staged_nodegroups.nodegroup_depth,
+                    md5(regexp_replace(
+                        tiles.tiledata::text, %(volatile_keys)s, '\1""', 'g'
+                    )) AS hash
+                FROM tiles
+                JOIN staged_nodegroups USING (nodegroupid)
+                WHERE tiles.parenttileid IS NULL
+                    AND tiles.resourceinstanceid IN (SELECT resourceid FROM staged)
+            ),
+            unchanged AS (
+                SELECT staged_copies.tileid AS staged_tileid,
+                    existing_copies.tileid AS existing_tileid
+                FROM (
+                    SELECT *, row_number() OVER (
+                        PARTITION BY resourceid, nodegroupid, hash
+                        ORDER BY sortorder, tileid
+                    ) AS copy
+                    FROM staged
+                ) staged_copies
+                JOIN (
+                    SELECT *, row_number() OVER (
+                        PARTITION BY resourceid, nodegroupid, hash
+                        ORDER BY sortorder, tileid
+                    ) AS copy
+                    FROM existing
+                ) existing_copies USING (resourceid, nodegroupid, hash, copy)
+            ),
+            changed_staged AS (
+                SELECT *, row_number() OVER (
+                    PARTITION BY resourceid, nodegroupid ORDER BY sortorder, tileid
+                ) AS position
+                FROM staged
+                WHERE tileid NOT IN (SELECT staged_tileid FROM unchanged)
+            ),
+            changed_existing AS (
+                SELECT *, row_number() OVER (
+                    PARTITION BY resourceid, nodegroupid ORDER BY sortorder, tileid
+                ) AS position
+                FROM existing
+                WHERE tileid NOT IN (SELECT existing_tileid FROM unchanged)
+            ),
+            updates AS (
+                SELECT changed_staged.tileid AS staged_tileid,
+                    changed_existing.tileid AS existing_tileid
+                FROM changed_staged
+                JOIN changed_existing USING (resourceid, nodegroupid, position)
+            ),
+            dropped AS (
+                DELETE FROM load_staging
+                WHERE loadid = %(loadid)s
+                    AND tileid IN (SELECT staged_tileid FROM unchanged)
+            ),
+            updated AS (
+                UPDATE load_staging
+                SET operation = 'update', tileid = updates.existing_tileid
+                FROM updates
+                WHERE load_staging.loadid = %(loadid)s
+                    AND load_staging.tileid = updates.staged_tileid
+            )
+            INSERT INTO load_staging (
+                value,
+                resourceid,
+                tileid,
+                passes_validation,
+                nodegroup_depth,
+                source_description,
+                loadid,
+                nodegroupid,
+                operation,
+                sortorder
+            )
+            SELECT
+                (
+                    SELECT coalesce(
+                        jsonb_object_agg(
+                            key, jsonb_build_object('value', value, 'valid', true)
+                        ),
+                        '{}'
                     )
-            if tiles_to_load:
-                LoadStaging.objects.bulk_create(tiles_to_load)
+                    FROM jsonb_each(changed_existing.tiledata)
+                ),
+                resourceid,
+                tileid,
+                true,
+                nodegroup_depth,
+                'Delta: removed tile',
+                %(loadid)s,
+                nodegroupid,
+                'delete',
+                sortorder
+            FROM changed_existing
+            WHERE tileid NOT IN (SELECT existing_tileid FROM updates)
+            """,
+            {"loadid": self.loadid, "volatile_keys": DELTA_VOLATILE_KEYS_PATTERN},
+        )
 
+    def write_tile_errors(self, cursor):
+        """Copy the errors of staged tiles that failed validation to
+        load_errors, once every chunk has been staged."""
         cursor.execute(
             """
                 INSERT INTO load_errors (type, source, error, loadid, nodegroupid)
@@ -364,22 +739,133 @@ class LingoResourceImporter(BaseImportModule):
             [self.loadid],
         )
 
-    def create_tile_value(
-        self, cursor, mock_tile, nodegroup_alias, nodegroup_lookup, node_lookup
-    ):
-        tile_value = self.get_blank_tile_lookup(node_lookup[nodegroup_alias]["nodeid"])
+    def _prepare_staging_chunks(self, resources, lookups_by_type):
+        """Yield ``(resource count, prepared tiles, load errors)`` per chunk
+        of *resources*."""
+        resources = iter(resources)
+        workers = self.staging_workers
+        if workers > 1 and multiprocessing.current_process().daemon:
+            # Daemonic processes (e.g. some task pools) cannot start children
+            logger.warning("Preparing import tiles serially in a daemonic process")
+            workers = 1
+
+        if workers > 1:
+            # Chunks are submitted ahead of their results, in the same order
+            chunk_sizes = deque()
+
+            def chunks():
+                while chunk := list(
+                    islice(resources, STAGING_WORKER_CHUNK_CONCEPT_COUNT)
+                ):
+                    chunk_sizes.append(len(chunk))
+                    yield chunk
+
+            for prepared_tiles, load_errors in staging_pool.iter_prepared_chunks(
+                chunks(), workers, self.loadid, self.userid, lookups_by_type
+            ):
+                yield chunk_sizes.popleft(), prepared_tiles, load_errors
+        else:
+            import_plans = {
+                resource_type: ImportPlan(self, *lookups)
+                for resource_type, lookups in lookups_by_type.items()
+            }
+            while batch := list(islice(resources, STAGING_BATCH_CONCEPT_COUNT)):
+                yield len(batch), *self.prepare_staging_chunk(batch, import_plans)
+
+    def prepare_staging_chunk(self, resources, import_plans):
+        """Build tile values for *resources* without touching load_staging.
+
+        Returns ``(prepared tiles, load errors)``; each prepared tile is
+        ``(resourceid, nodegroup_id, nodegroup_depth, source_description,
+        tile value, passes_validation)``, in input order.
+        """
+        prepared_tiles = []
+        for concept_to_load in resources:
+            import_plan = import_plans[concept_to_load["type"]]
+            resourceid = concept_to_load["resourceinstanceid"]
+            for mock_tile in concept_to_load["tile_data"]:
+                nodegroup_alias = next(iter(mock_tile.keys()), None)
+                nodegroup_id = import_plan.node_lookup[nodegroup_alias]["nodeid"]
+                tile_value_json, passes_validation = self.create_tile_value(
+                    mock_tile, nodegroup_alias, import_plan
+                )
+                prepared_tiles.append(
+                    (
+                        resourceid,
+                        nodegroup_id,
+                        import_plan.nodegroup_lookup[nodegroup_id]["depth"],
+                        "{0}: {1}".format(concept_to_load["type"], nodegroup_alias),
+                        tile_value_json,
+                        passes_validation,
+                    )
+                )
+        load_errors, self.pending_load_errors = self.pending_load_errors, []
+        return prepared_tiles, load_errors
+
+    def write_staging_rows(self, cursor, rows):
+        """Write staged tile *rows* (tuples following ``STAGING_FIELDS``)
+        with the importer's staging writer."""
+        if self.staging_writer == STAGING_WRITER_COPY:
+            self._copy_staging_rows(cursor, rows)
+        elif self.staging_writer == STAGING_WRITER_BULK_CREATE:
+            LoadStaging.objects.bulk_create(
+                LoadStaging(
+                    **{
+                        LoadStaging._meta.get_field(field).attname: value
+                        for field, value in zip(STAGING_FIELDS, row)
+                    }
+                )
+                for row in rows
+            )
+        else:
+            raise ValueError(
+                _("Unknown staging writer: {}").format(self.staging_writer)
+            )
+
+    def _copy_staging_rows(self, cursor, rows):
+        """Stream *rows* into load_staging with one ``COPY ... FROM STDIN``.
+
+        Tile values are serialized to JSON once, here; no model instances
+        are built.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            row = list(row)
+            row[STAGING_VALUE_INDEX] = json.dumps(
+                row[STAGING_VALUE_INDEX], cls=DjangoJSONEncoder
+            )
+            writer.writerow([COPY_NULL if value is None else value for value in row])
+
+        columns = ", ".join(
+            LoadStaging._meta.get_field(field).column for field in STAGING_FIELDS
+        )
+        copy_sql = (
+            f"COPY {LoadStaging._meta.db_table} ({columns}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+        )
+        if is_psycopg3:
+            with cursor.copy(copy_sql) as staging_copy:
+                staging_copy.write(buffer.getvalue())
+        else:
+            buffer.seek(0)
+            cursor.copy_expert(copy_sql, buffer)
+
+    def create_tile_value(self, mock_tile, nodegroup_alias, import_plan):
+        """Return ``(tile value, valid)`` for *mock_tile*.
+
+        Validation errors are queued on ``pending_load_errors`` and written
+        by ``write_load_errors`` once per batch.
+        """
+        tile_value = import_plan.blank_tile_value(
+            import_plan.node_lookup[nodegroup_alias]["nodeid"]
+        )
         tile_valid = False
-        for node_alias in mock_tile[nodegroup_alias].keys():
+        for node_alias, source_value in mock_tile[nodegroup_alias].items():
             try:
-                nodeid = node_lookup[node_alias]["nodeid"]
-                node_details = node_lookup[node_alias]
-                datatype = node_details["datatype"]
-                datatype_instance = self.datatype_factory.get_instance(datatype)
-                source_value = mock_tile[nodegroup_alias][node_alias]
-                config = node_details["config"]
-                config["loadid"] = self.loadid
-                config["nodeid"] = nodeid
-
+                nodeid, datatype, datatype_instance, config = import_plan.node_handlers[
+                    node_alias
+                ]
                 value, validation_errors = self.prepare_data_for_loading(
                     datatype_instance, source_value, config
                 )
@@ -388,8 +874,7 @@ class LingoResourceImporter(BaseImportModule):
                 error_message = ""
                 for error in validation_errors:
                     error_message = error["message"]
-                    cursor.execute(
-                        """INSERT INTO load_errors (type, value, source, error, message, datatype, loadid, nodeid) VALUES (%s,%s,%s,%s,%s,%s,%s,%s)""",
+                    self.pending_load_errors.append(
                         (
                             "node",
                             source_value,
@@ -399,7 +884,7 @@ class LingoResourceImporter(BaseImportModule):
                             datatype,
                             self.loadid,
                             nodeid,
-                        ),
+                        )
                     )
 
                 tile_value[nodeid]["value"] = value
@@ -412,74 +897,57 @@ class LingoResourceImporter(BaseImportModule):
 
         return tile_value, tile_valid
 
-    def get_blank_tile_lookup(self, nodegroupid):
-        if nodegroupid not in self.blank_tile_lookup.keys():
-            blank_tile = {}
-            nodes = (
-                models.Node.objects.filter(nodegroup_id=nodegroupid)
-                .exclude(datatype="semantic")
-                .prefetch_related("cardxnodexwidget_set")
-            )
-            for node in nodes:
-                # TODO: get default value from cardxnodexwidget if exists
-                blank_tile[str(node.nodeid)] = {
-                    "value": None,
-                    "valid": True,
-                    "source": "",
-                    "notes": "",
-                    "datatype": node.datatype,
-                }
-                for cross_record in node.cardxnodexwidget_set.all():
-                    default_value = cross_record.config.get("defaultValue", None)
-                    if default_value != "" and default_value is not None:
-                        blank_tile[str(node.nodeid)]["value"] = default_value
-            self.blank_tile_lookup[nodegroupid] = blank_tile
-        return copy.deepcopy(self.blank_tile_lookup[nodegroupid])
-
-    def build_concept_hierarchy(self, cursor, scheme_conceptid):
+    def write_load_errors(self, cursor):
+        """Insert the queued node validation errors as one batch."""
+        if not self.pending_load_errors:
+            return
+        cursor.executemany(
+            """INSERT INTO load_errors (type, value, source, error, message, datatype, loadid, nodeid) VALUES (%s,%s,%s,%s,%s,%s,%s,%s)""",
+            self.pending_load_errors,
+        )
+        self.pending_load_errors = []
+
+    def count_concepts_to_migrate(self, cursor, scheme_conceptid):
+        """Estimate how many concepts migrating *scheme_conceptid* creates.
+
+        Counts the scheme and the distinct concepts below it without
+        fetching any of them.
+        """
         cursor.execute(
-            """
-            with recursive collection_hierarchy as (
-                select conceptidfrom as root_scheme,
-                    conceptidto as child,
-                    ARRAY[conceptidfrom] AS path,
-                    0 as depth
-                from relations
-                where not exists (
-                    select 1 from relations r2 where r2.conceptidto = relations.conceptidfrom
-                ) and (relationtype = 'narrower' or relationtype = 'hasTopConcept')
-                union all
-                select ch.root_scheme,
-                    r.conceptidto,
-                    ch.path || r.conceptidfrom,
-                    ch.depth + 1
-                from collection_hierarchy ch
-                join relations r on ch.child = r.conceptidfrom
-                where relationtype = 'narrower' or relationtype = 'hasTopConcept'
-            )
-            select * 
-            from collection_hierarchy
-            where root_scheme = %s;
-            """,
+            f"select count(*) + 1 from ({CONCEPTS_TO_MIGRATE_SQL}) concepts",
             (scheme_conceptid,),
         )
-        results = cursor.fetchall()
-        concept_hierarchy = []
-        concepts_to_migrate = []
-        for result in results:
-            concept_dict = {
-                "root_scheme": result[0],
-                "concept": result[1],
-                "path": result[2],
-                "depth": result[3],
-            }
-            concepts_to_migrate.append(result[1])
-            concept_hierarchy.append(concept_dict)
-        return concept_hierarchy, concepts_to_migrate
+        return cursor.fetchone()[0]
 
-    def _init_relationships(
-        self, cursor, loadid, concepts_to_migrate, concept_hierarchy
-    ):
+    def estimate_concept_count(self, request):
+        scheme_conceptid = request.POST.get("scheme")
+        with connection.cursor() as cursor:
+            concept_count = self.count_concepts_to_migrate(cursor, scheme_conceptid)
+        return {
+            "success": True,
+            "data": {
+                "concept_count": concept_count,
+                "runs_in_background": concept_count > RDM_SYNC_CONCEPT_LIMIT,
+            },
+        }
+
+    def create_concepts_to_migrate_table(self, cursor, scheme_conceptid):
+        """(Re)create ``CONCEPTS_TO_MIGRATE_TABLE`` for *scheme_conceptid*
+        on this connection, so the concepts never leave the database."""
+        cursor.execute(f"drop table if exists pg_temp.{CONCEPTS_TO_MIGRATE_TABLE}")
+        cursor.execute(
+            f"create temporary table {CONCEPTS_TO_MIGRATE_TABLE} as {CONCEPTS_TO_MIGRATE_SQL}",
+            (scheme_conceptid,),
+        )
+        cursor.execute(
+            f"alter table {CONCEPTS_TO_MIGRATE_TABLE} add primary key (conceptid)"
+        )
+        cursor.execute(f"analyze {CONCEPTS_TO_MIGRATE_TABLE}")
+        self.concepts_to_migrate_table_created = True
+
+    def _init_relationships(self, cursor, loadid):
+        """Stage the relationship tiles of the concepts in
+        ``CONCEPTS_TO_MIGRATE_TABLE``."""
         # prefetch default values for hidden nodes
         reference_datatype = self.datatype_factory.get_instance("reference")
         WARRANT_ASSERTION_EVENT = json.dumps(
@@ -495,7 +963,7 @@ class LingoResourceImporter(BaseImportModule):
 
         # Create top concept of scheme relationships (derived from relations with 'hasTopConcept' relationtype)
         cursor.execute(
-            """
+            f"""
            insert into load_staging(
                 value,
                 resourceid,
@@ -532,19 +1000,18 @@ class LingoResourceImporter(BaseImportModule):
             left join values v on r.conceptidto = v.conceptid
             where relationtype = 'hasTopConcept'
                 and v.valuetype = 'prefLabel'
-                and conceptidto = ANY(%s);
+                and conceptidto in (select conceptid from {CONCEPTS_TO_MIGRATE_TABLE});
         """,
             (
                 const.TOP_CONCEPT_OF_NODE_AND_NODEGROUP,
                 loadid,
                 const.TOP_CONCEPT_OF_NODE_AND_NODEGROUP,
-                concepts_to_migrate,
             ),
         )
 
         # Create broader relationships (derived from relations with 'narrower' relationtype)
         cursor.execute(
-            """
+            f"""
            insert into load_staging(
                 value,
                 resourceid,
@@ -595,7 +1062,7 @@ class LingoResourceImporter(BaseImportModule):
             left join values v on r.conceptidto = v.conceptid
             where relationtype = 'narrower'
                 and v.valuetype = 'prefLabel'
-                and conceptidto = ANY(%s);
+                and conceptidto in (select conceptid from {CONCEPTS_TO_MIGRATE_TABLE});
         """,
             (
                 const.CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID,
@@ -610,7 +1077,6 @@ class LingoResourceImporter(BaseImportModule):
                 const.CLASSIFICATION_STATUS_TIMESPAN_BEGIN_OF_BEGIN_NODEID,
                 loadid,
                 const.CLASSIFICATION_STATUS_NODEGROUP,
-                concepts_to_migrate,
             ),
         )
 
@@ -618,7 +1084,7 @@ class LingoResourceImporter(BaseImportModule):
         # Related relationships are modeled with conceptidfrom as the source and conceptidto as the target
         # In Lingo, this relationship is stored on the source (conceptidfrom), pointing to the target (conceptidto)
         cursor.execute(
-            """
+            f"""
            insert into load_staging(
                 value,
                 resourceid,
@@ -676,7 +1142,7 @@ class LingoResourceImporter(BaseImportModule):
             left join values v on r.conceptidto = v.conceptid
             where relationtype = 'related'
                 and v.valuetype = 'prefLabel'
-                and conceptidfrom = ANY(%s);
+                and conceptidfrom in (select conceptid from {CONCEPTS_TO_MIGRATE_TABLE});
         """,
             (
                 const.RELATION_STATUS_ASCRIBED_COMPARATE_NODEID,
@@ -692,76 +1158,54 @@ class LingoResourceImporter(BaseImportModule):
                 WARRANT_ASSERTION_EVENT,
                 loadid,
                 const.RELATION_STATUS_NODEGROUP,
-                concepts_to_migrate,
             ),
         )
 
-        # Create Part of Scheme relationships - derived by recursively generating concept hierarchy & associating
-        # concepts with their schemes
-        part_of_scheme_tiles = []
-        part_of_scheme_nodegroup = NodeGroup.objects.get(
-            nodegroupid=const.CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID
-        )
-        concepts_with_scheme = {}
-        for concept in concept_hierarchy:
-            root_scheme = str(concept["root_scheme"])
-            resourceinstanceid = concept["concept"]
-
-            concept_has_part_of_scheme = resourceinstanceid in concepts_with_scheme
-            existing_scheme = concepts_with_scheme.get(resourceinstanceid)
-            if not concept_has_part_of_scheme:
-                concepts_with_scheme[resourceinstanceid] = root_scheme
-            elif concept_has_part_of_scheme and existing_scheme == root_scheme:
-                continue
-            elif concept_has_part_of_scheme and existing_scheme != root_scheme:
-                return {
-                    "status": 400,
-                    "success": False,
-                    "title": "Concepts may only participate in one scheme",
-                    "message": _(
-                        "Concept {conceptid} cannot have multiple schemes: {current_scheme} and {existing_scheme}"
-                    ).format(
-                        {
-                            "conceptid": resourceinstanceid,
-                            "current_scheme": root_scheme,
-                            "existing_scheme": concepts_with_scheme[resourceinstanceid],
-                        }
-                    ),
-                }
-
-            value_obj = {
-                str(const.CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID): {
-                    "notes": "",
-                    "valid": True,
-                    "value": [
-                        {
-                            "resourceId": root_scheme,
-                            "ontologyProperty": "",
-                            "resourceXresourceId": "",
-                            "inverseOntologyProperty": "",
-                        }
-                    ],
-                    "source": root_scheme,
-                    "datatype": "resource-instance",
-                }
-            }
-
-            staging_tile = LoadStaging(
-                value=value_obj,
-                resourceid=resourceinstanceid,
-                tileid=uuid.uuid4(),
-                passes_validation=True,
-                nodegroup_depth=0,
-                source_description="Concept: Part of Scheme",
-                load_event=LoadEvent(self.loadid),
-                nodegroup=part_of_scheme_nodegroup,
-                operation="insert",
-                sortorder=0,
+        # Create Part of Scheme relationships - every concept in the scheme's
+        # hierarchy is part of that scheme
+        cursor.execute(
+            f"""
+           insert into load_staging(
+                value,
+                resourceid,
+                tileid,
+                passes_validation,
+                nodegroup_depth,
+                source_description,
+                loadid,
+                nodegroupid,
+                operation,
+                sortorder
             )
-            staging_tile.full_clean()
-            part_of_scheme_tiles.append(staging_tile)
-
-        LoadStaging.objects.bulk_create(part_of_scheme_tiles)
+            select
+                json_build_object(%s::uuid,
+                    json_build_object(
+                        'notes', '',
+                        'valid', true,
+                        'value', json_build_array(json_build_object('resourceId', %s::text, 'ontologyProperty', '', 'resourceXresourceId', '', 'inverseOntologyProperty', '')),
+                        'source', %s::text,
+                        'datatype', 'resource-instance'
+                    )
+                ) as value,
+                conceptid as resourceinstanceid,
+                uuid_generate_v4() as tileid,
+                true as passes_validation,
+                0 as nodegroup_depth,
+                'Concept: Part of Scheme' as source_description,
+                %s::uuid as loadid,
+                %s::uuid as nodegroupid,
+                'insert' as operation,
+                0 as sortorder
+            from {CONCEPTS_TO_MIGRATE_TABLE};
+        """,
+            (
+                const.CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID,
+                str(self.scheme_conceptid),
+                str(self.scheme_conceptid),
+                loadid,
+                const.CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID,
+            ),
+        )
 
     def start(self, request):
         load_details = {"operation": "Lingo Thesaurus Import"}
@@ -772,7 +1216,7 @@ class LingoResourceImporter(BaseImportModule):
             user=models.User.objects.get(id=self.userid),
             etl_module=models.ETLModule.objects.get(pk=self.moduleid),
             status="running",
-            load_details=json.dumps(load_details),
+            load_details=load_details,
             load_start_time=datetime.now(),
             complete=False,
         )
@@ -786,6 +1230,10 @@ class LingoResourceImporter(BaseImportModule):
 
     def write(self, request):
         self.load_event = models.LoadEvent.objects.get(loadid=self.loadid)
+        if self.staging_writer not in STAGING_WRITERS:
+            return self.return_with_error(
+                _("Unknown staging writer: {}").format(self.staging_writer)
+            )
         # scheme_conceptid is indicator of the entrypoint -
         # if it's present, we're migrating a thesaurus from the RDM
         # if absent, we're loading data from an external SKOS file
@@ -801,29 +1249,16 @@ class LingoResourceImporter(BaseImportModule):
                 .first()
                 .value
             )
-            # use RawSQL to mimic behavior in _save_to_tiles method
-            self.load_event.load_details = RawSQL(
-                "load_details || %s::jsonb",
-                [json.dumps({"thesaurus_name": self.thesaurus_name})],
-            )
-            self.load_event.save()
-
-            num_concepts_to_import = len(
-                Concept()
-                .get(
-                    id=self.scheme_conceptid,
-                    include_subconcepts=True,
-                    include_parentconcepts=False,
-                    include_relatedconcepts=True,
-                    depth_limit=None,
-                    up_depth_limit=None,
+            self.update_load_details(thesaurus_name=self.thesaurus_name)
+
+            with connection.cursor() as cursor:
+                num_concepts_to_import = self.count_concepts_to_migrate(
+                    cursor, self.scheme_conceptid
                 )
-                .flatten()
-            )
             try:
-                if num_concepts_to_import <= 1000:
+                if num_concepts_to_import <= RDM_SYNC_CONCEPT_LIMIT:
                     self.run_load_task()
-                elif num_concepts_to_import > 1000:
+                elif num_concepts_to_import > RDM_SYNC_CONCEPT_LIMIT:
                     if not task_management.check_if_celery_available():
                         return self.return_with_error(
                             task_management.CeleryNotAvailableError()
@@ -835,36 +1270,32 @@ class LingoResourceImporter(BaseImportModule):
                 return self.return_with_error(error)
 
         elif self.file is not None:
-            # sanitize file name
-            file_name = os.path.basename(self.file.name)
-            file_name, extension = os.path.splitext(file_name)
             # Do minimal file validation to mock file checking in FileValidator
+            try:
+                file_name, _serialization, gzipped = rdf_sources.split_file_name(
+                    self.file.name
+                )
+            except ValueError as extension:
+                message = f"File extension {extension} not allowed"
+                return self.return_with_error(message)
             self.thesaurus_name = file_name
             guessed_file_type = filetype.guess(self.file)
 
-            # guessed_file_type will be None if the file is xml
-            if extension != ".xml" or guessed_file_type is not None:
-                message = f"File extension {extension}/{guessed_file_type.extension} not allowed"
+            # guessed_file_type will be None if the file is text (RDF/XML,
+            # N-Triples, Turtle or JSON-LD)
+            expected_file_type = "gz" if gzipped else None
+            guessed_extension = guessed_file_type and guessed_file_type.extension
+            if guessed_extension != expected_file_type:
+                message = f"File type {guessed_extension} not allowed"
                 return self.return_with_error(message)
 
-            self.load_event.load_details = RawSQL(
-                "load_details || %s::jsonb", [json.dumps({"thesaurus_name": file_name})]
-            )
-            self.load_event.save()
+            self.update_load_details(thesaurus_name=file_name)
 
             use_celery_file_size_threshold = self.config.get(
                 "celeryByteSizeLimit", 100000
             )
             try:
                 if self.file.size <= use_celery_file_size_threshold:
-                    # Prevent circular import
-                    from arches_lingo.utils.skos import SKOSReader
-
-                    skos_reader = SKOSReader()
-                    rdf = skos_reader.read_file(self.file)
-                    self.schemes, self.concepts = (
-                        skos_reader.extract_concepts_from_skos_for_lingo_import(rdf)
-                    )
                     self.run_load_task()
 
                 elif self.file.size > use_celery_file_size_threshold:
@@ -895,63 +1326,111 @@ class LingoResourceImporter(BaseImportModule):
             )
 
     def run_load_task(self):
+        """Parse, stage, validate and save the import.
+
+        Progress is checkpointed in the load event's load_details (see
+        ``IMPORT_PHASES``), so running this again for the same load, e.g.
+        after a worker was lost, resumes where the last run stopped. The
+        time, peak memory and row counts of each phase are stored there as
+        "performance".
+        """
+        load_details = self.get_load_details()
+        import_phase = load_details.get("import_phase")
+        self.performance = ImportPerformance(
+            load_details.get("performance"),
+            on_update=lambda report: self.update_load_details(performance=report),
+        )
         with connection.cursor() as cursor:
-            # Create node and nodegroup lookups
-            schemes_nodegroup_lookup, schemes_nodes = self.get_graph_tree(
-                const.SCHEMES_GRAPH_ID
-            )
-            schemes_node_lookup = self.get_node_lookup(schemes_nodes)
-            concepts_nodegroup_lookup, concepts_nodes = self.get_graph_tree(
-                const.CONCEPTS_GRAPH_ID
-            )
-            concepts_node_lookup = self.get_node_lookup(concepts_nodes)
-
-            # If importing data from the RDM, extract the resources & mock tiles
-            if self.scheme_conceptid:
-                self.schemes, self.concepts, concepts_to_migrate, concept_hierarchy = (
-                    self.extract_schemes_and_concepts_from_rdm(
-                        cursor, self.scheme_conceptid
+            lookups_by_type = self.get_lookups_by_type()
+
+            # Extract the resources & mock tiles from the RDM or the SKOS file
+            # once, into an intermediate file that a resumed import reads back
+            if not self.import_phase_reached(import_phase, IMPORT_PHASE_PARSED):
+                with self.performance.phase("parse") as counters:
+                    if self.scheme_conceptid:
+                        resources = self.read_rdm_resources(cursor)
+                    else:
+                        resources = self.read_skos_resources()
+                    intermediate_file, resource_count = self.write_intermediate_file(
+                        resources
                     )
-                )
-            # If using celery and importing from SKOS file, read from temp file path
-            elif self.temp_file_path:
-                file = default_storage.open(self.temp_file_path, "rb")
-                # Prevent circular import
-                from arches_lingo.utils.skos import SKOSReader
-
-                skos_reader = SKOSReader()
-                rdf = skos_reader.read_file(file)
-                self.schemes, self.concepts = (
-                    skos_reader.extract_concepts_from_skos_for_lingo_import(rdf)
-                )
+                    counters.update(self.source_statistics, resources=resource_count)
+                checkpoint = {
+                    "import_phase": IMPORT_PHASE_PARSED,
+                    "intermediate_file": intermediate_file,
+                    "parsed_resources": resource_count,
+                    "staged_resources": 0,
+                }
+                self.update_load_details(**checkpoint)
+                load_details.update(checkpoint)
+                import_phase = IMPORT_PHASE_PARSED
 
             # Populate staging table with schemes and concepts
-            self.populate_staging_table(
-                cursor, self.schemes, schemes_nodegroup_lookup, schemes_node_lookup
-            )
-            self.populate_staging_table(
-                cursor, self.concepts, concepts_nodegroup_lookup, concepts_node_lookup
-            )
-
-            # Create relationships
-            if self.scheme_conceptid:
-                self._init_relationships(
-                    cursor, self.loadid, concepts_to_migrate, concept_hierarchy
+            if not self.import_phase_reached(import_phase, IMPORT_PHASE_STAGED):
+                staged_resources = load_details.get("staged_resources", 0)
+                staging_statistics = self.populate_staging_table(
+                    cursor,
+                    islice(
+                        self.read_intermediate_file(load_details["intermediate_file"]),
+                        staged_resources,
+                        None,
+                    ),
+                    lookups_by_type,
+                    staged_resources=staged_resources,
                 )
-
-            # Validate and save to tiles
-            validation = self.validate(self.loadid)
-            if len(validation["data"]) == 0:
-                cursor.execute(
-                    """UPDATE load_event SET status = %s WHERE loadid = %s""",
-                    ("validated", self.loadid),
+                self.performance.record(
+                    "transform",
+                    staging_statistics["transform_seconds"],
+                    resources=staging_statistics["resources"],
                 )
-                save_to_tiles(self.userid, self.loadid)
-                cursor.execute(
-                    """CALL __arches_update_resource_x_resource_with_graphids();"""
+                self.performance.record(
+                    "stage",
+                    staging_statistics["write_seconds"],
+                    tiles=staging_statistics["tiles"],
+                    load_errors=staging_statistics["load_errors"],
                 )
-                cursor.execute("""SELECT __arches_refresh_spatial_views();""")
-                refresh_successful = cursor.fetchone()[0]
+                with transaction.atomic():
+                    # Create relationships
+                    if self.scheme_conceptid:
+                        with self.performance.phase("relationships"):
+                            if not self.concepts_to_migrate_table_created:
+                                self.create_concepts_to_migrate_table(
+                                    cursor, self.scheme_conceptid
+                                )
+                            self._init_relationships(cursor, self.loadid)
+                    if self.delta:
+                        with self.performance.phase("delta") as counters:
+                            self.stage_tile_delta(cursor)
+                            counters.update(self.count_staged_operations(cursor))
+                    self.write_tile_errors(cursor)
+                    self.update_load_details(import_phase=IMPORT_PHASE_STAGED)
+                import_phase = IMPORT_PHASE_STAGED
+
+            # Validate and save to tiles
+            valid = self.import_phase_reached(import_phase, IMPORT_PHASE_VALIDATED)
+            if not valid:
+                with self.performance.phase("validate") as counters:
+                    validation = self.validate(self.loadid)
+                    counters["errors"] = len(validation["data"])
+                valid = len(validation["data"]) == 0
+                if valid:
+                    with transaction.atomic():
+                        cursor.execute(
+                            """UPDATE load_event SET status = %s WHERE loadid = %s""",
+                            ("validated", self.loadid),
+                        )
+                        self.update_load_details(import_phase=IMPORT_PHASE_VALIDATED)
+            if valid:
+                if not self.import_phase_reached(import_phase, IMPORT_PHASE_SAVED):
+                    self.save_staged_tiles()
+                    self.update_load_details(import_phase=IMPORT_PHASE_SAVED)
+                with self.performance.phase("update_resource_x_resource"):
+                    cursor.execute(
+                        """CALL __arches_update_resource_x_resource_with_graphids();"""
+                    )
+                with self.performance.phase("refresh_spatial_views"):
+                    cursor.execute("""SELECT __arches_refresh_spatial_views();""")
+                    refresh_successful = cursor.fetchone()[0]
                 if not refresh_successful:
                     raise Exception("Unable to refresh spatial views")
             else:
@@ -959,13 +1438,369 @@ class LingoResourceImporter(BaseImportModule):
                     """UPDATE load_event SET status = %s, load_end_time = %s WHERE loadid = %s""",
                     ("failed", datetime.now(), self.loadid),
                 )
+        self.delete_intermediate_file(load_details.get("intermediate_file"))
         self._finalize_import()
 
+    @staticmethod
+    def parse_staging_workers(value):
+        """Return *value* as a worker count between 1 and the larger of
+        LINGO_IMPORT_STAGING_WORKERS and the CPU count.
+
+        A missing or non-numeric value falls back to the setting.
+        """
+        try:
+            workers = int(value)
+        except (TypeError, ValueError):
+            if value not in (None, ""):
+                logger.warning("Ignoring invalid staging_workers value %r", value)
+            workers = settings.LINGO_IMPORT_STAGING_WORKERS
+        max_workers = max(settings.LINGO_IMPORT_STAGING_WORKERS, os.cpu_count() or 1)
+        return max(1, min(workers, max_workers))
+
+    def get_lookups_by_type(self):
+        """Return the ``(nodegroup_lookup, node_lookup)`` of each resource
+        type ("Scheme" and "Concept")."""
+        schemes_nodegroup_lookup, schemes_nodes = self.get_graph_tree(
+            const.SCHEMES_GRAPH_ID
+        )
+        concepts_nodegroup_lookup, concepts_nodes = self.get_graph_tree(
+            const.CONCEPTS_GRAPH_ID
+        )
+        return {
+            "Scheme": (schemes_nodegroup_lookup, self.get_node_lookup(schemes_nodes)),
+            "Concept": (
+                concepts_nodegroup_lookup,
+                self.get_node_lookup(concepts_nodes),
+            ),
+        }
+
+    def compare_staging_writers(self):
+        """Stage the uploaded SKOS file once with each of ``STAGING_WRITERS``.
+
+        Returns ``{staging writer: populate_staging_table statistics}``.
+        Every run is rolled back, so nothing is imported.
+        """
+        lookups_by_type = self.get_lookups_by_type()
+        staging_writer = self.staging_writer
+        statistics_by_writer = {}
+        try:
+            for self.staging_writer in STAGING_WRITERS:
+                with transaction.atomic(), connection.cursor() as cursor:
+                    self.start(request=None)
+                    statistics_by_writer[self.staging_writer] = (
+                        self.populate_staging_table(
+                            cursor, self.read_skos_resources(), lookups_by_type
+                        )
+                    )
+                    transaction.set_rollback(True)
+        finally:
+            self.staging_writer = staging_writer
+        return statistics_by_writer
+
+    def count_staged_operations(self, cursor):
+        """Return the number of staged tiles per operation, e.g. after
+        ``stage_tile_delta``."""
+        cursor.execute(
+            """
+                SELECT operation, count(*)
+                FROM load_staging
+                WHERE loadid = %s
+                GROUP BY operation
+            """,
+            [self.loadid],
+        )
+        return dict(cursor.fetchall())
+
+    @staticmethod
+    def import_phase_reached(import_phase, phase):
+        return import_phase in IMPORT_PHASES and IMPORT_PHASES.index(
+            import_phase
+        ) >= IMPORT_PHASES.index(phase)
+
+    def get_load_details(self):
+        """Return the load event's load_details as a dict.
+
+        Load events created before load_details was stored as an object
+        hold a JSON string followed by the objects merged into it.
+        """
+        load_details = models.LoadEvent.objects.get(loadid=self.loadid).load_details
+        if isinstance(load_details, dict):
+            return load_details
+        merged = {}
+        for item in load_details if isinstance(load_details, list) else []:
+            if isinstance(item, str):
+                item = json.loads(item)
+            if isinstance(item, dict):
+                merged.update(item)
+        return merged
+
+    def update_load_details(self, **load_details):
+        models.LoadEvent.objects.filter(loadid=self.loadid).update(
+            load_details=RawSQL(
+                "coalesce(load_details, '{}'::jsonb) || %s::jsonb",
+                [json.dumps(load_details, default=str)],
+            )
+        )
+
+    def read_rdm_resources(self, cursor):
+        """Return the scheme and concepts migrated from the RDM."""
+        schemes, concepts = self.extract_schemes_and_concepts_from_rdm(
+            cursor, self.scheme_conceptid
+        )
+        return chain(schemes, concepts)
+
+    def write_intermediate_file(self, resources):
+        """Write *resources* to temp storage as gzipped JSON lines.
+
+        Returns ``(path, resource count)``.
+        """
+        path = os.path.join(
+            settings.UPLOADED_FILES_DIR, "tmp", self.loadid, INTERMEDIATE_FILE_NAME
+        )
+        resource_count = 0
+        with tempfile.TemporaryFile() as buffer:
+            with gzip.GzipFile(fileobj=buffer, mode="wb") as intermediate_file:
+                for resource in resources:
+                    intermediate_file.write(
+                        json.dumps(
+                            resource, cls=DjangoJSONEncoder, separators=(",", ":")
+                        ).encode()
+                        + b"\n"
+                    )
+                    resource_count += 1
+            buffer.seek(0)
+            # Replace the file left by a run that stopped before its checkpoint
+            self.delete_intermediate_file(path)
+            path = default_storage.save(path, File(buffer))
+        return path, resource_count
+
+    def read_intermediate_file(self, path):
+        with default_storage.open(path, "rb") as file:
+            with gzip.GzipFile(fileobj=file) as intermediate_file:
+                for line in intermediate_file:
+                    yield json.loads(line)
+
+    def delete_intermediate_file(self, path):
+        if path and default_storage.exists(path):
+            default_storage.delete(path)
+
+    def save_staged_tiles(self):
+        """Save the staged tiles unless an interrupted run already has.
+
+        ``save_to_tiles`` saves every staged tile in one statement and marks
+        the load "completed" before indexing it, so a completed load only
+        needs indexing. It saves inserts and updates only: the tiles a
+        delta import staged as deletes are deleted afterwards by
+        ``apply_staged_deletes``, which a resumed run repeats.
+        """
+        status = models.LoadEvent.objects.values_list("status", flat=True).get(
+            loadid=self.loadid
+        )
+        if status == "indexed":
+            return
+        if status != "completed":
+            tiles = LoadStaging.objects.filter(load_event_id=self.loadid).count()
+            staged_relation_tiles = self.read_staged_relation_tiles()
+            started = time.perf_counter()
+            saved = save_to_tiles(self.userid, self.loadid)
+            seconds = time.perf_counter() - started
+            # An indexing error still leaves the tiles saved
+            if saved["success"] or saved.get("data") == "saved":
+                self.apply_staged_deletes(staged_relation_tiles)
+            # save_to_tiles indexes the saved resources before returning;
+            # its timestamps tell the two apart
+            load_end_time, indexed_time = models.LoadEvent.objects.values_list(
+                "load_end_time", "indexed_time"
+            ).get(loadid=self.loadid)
+            index_seconds = (
+                (indexed_time - load_end_time).total_seconds()
+                if load_end_time and indexed_time
+                else 0
+            )
+            self.performance.record(
+                "save_to_tiles", seconds - index_seconds, tiles=tiles
+            )
+            self.performance.record("index", index_seconds)
+            return
+        # The deletes may not have run before the interrupted run stopped;
+        # tiles already deleted are skipped
+        self.apply_staged_deletes(
+            [
+                staged_relation_tile
+                for staged_relation_tile in self.read_staged_relation_tiles()
+                if staged_relation_tile[2] == "delete"
+            ]
+        )
+        with self.performance.phase("index"):
+            index_resources_by_transaction(
+                self.loadid,
+                quiet=True,
+                use_multiprocessing=False,
+                recalculate_descriptors=True,
+            )
+        models.LoadEvent.objects.filter(loadid=self.loadid).update(
+            status="indexed",
+            indexed_time=datetime.now(),
+            complete=True,
+            successful=True,
+        )
+
+    def apply_staged_deletes(self, staged_relation_tiles):
+        """Delete the tiles staged as deletes, then sync the relation tiles.
+
+        The deletes, their edit-log rows and the queued reciprocal changes
+        commit together, so the counterparts are only synced once the
+        source tiles are gone. Resources that lost a tile are reindexed on
+        commit.
+        """
+        from arches_lingo.utils.concept_lifecycle import schedule_concept_reindex
+
+        with transaction.atomic():
+            with self.performance.phase("delete") as counters:
+                deleted_resource_ids = self.delete_staged_tiles()
+                counters["resources"] = len(deleted_resource_ids)
+            schedule_concept_reindex(deleted_resource_ids)
+            with self.performance.phase("reciprocal_sync"):
+                self.sync_relation_counterparts(staged_relation_tiles)
+
+    def delete_staged_tiles(self):
+        """Delete the existing tiles staged with ``operation = 'delete'``,
+        and their child tiles, with edit-log rows in the load's transaction.
+
+        Returns the ids of the resources that lost a tile.
+        """
+        from arches_lingo.utils.edit_log import write_tile_edit_log_entries
+
+        tile_ids = set(
+            LoadStaging.objects.filter(
+                load_event_id=self.loadid, operation="delete"
+            ).values_list("tileid", flat=True)
+        )
+        deleted_tiles = []
+        while tile_ids:
+            tiles = list(
+                models.TileModel.objects.filter(pk__in=tile_ids).values_list(
+                    "pk", "resourceinstance_id", "nodegroup_id", "data"
+                )
+            )
+            deleted_tiles.extend(tiles)
+            tile_ids = set(
+                models.TileModel.objects.filter(
+                    parenttile_id__in=[tileid for tileid, *_rest in tiles]
+                ).values_list("pk", flat=True)
+            )
+        if not deleted_tiles:
+            return set()
+
+        write_tile_edit_log_entries(
+            [
+                {
+                    "resourceid": resourceid,
+                    "tileid": tileid,
+                    "nodegroupid": nodegroupid,
+                    "edittype": "tile delete",
+                    "oldvalue": data,
+                    "newvalue": None,
+                }
+                for tileid, resourceid, nodegroupid, data in deleted_tiles
+            ],
+            models.User.objects.get(id=self.userid),
+            note="loaded from staging_table",
+            transaction_id=self.loadid,
+        )
+        models.TileModel.objects.filter(
+            pk__in=[tileid for tileid, *_rest in deleted_tiles]
+        ).delete()
+        return {str(resourceid) for _tileid, resourceid, *_rest in deleted_tiles}
+
+    def read_staged_relation_tiles(self):
+        """Return the staged relation tiles as ``(tileid, resourceid,
+        operation, previous data)``, read before they are saved."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                    SELECT tileid, resourceid, operation
+                    FROM load_staging
+                    WHERE loadid = %s AND nodegroupid = %s
+                """,
+                [self.loadid, const.RELATION_STATUS_NODEGROUP],
+            )
+            staged = cursor.fetchall()
+        previous_data = dict(
+            models.TileModel.objects.filter(
+                pk__in=[tileid for tileid, _resourceid, _operation in staged]
+            ).values_list("pk", "data")
+        )
+        return [
+            (tileid, resourceid, operation, previous_data.get(tileid))
+            for tileid, resourceid, operation in staged
+        ]
+
+    def sync_relation_counterparts(self, staged_relation_tiles):
+        """Mirror the saved relation tiles onto their related concepts.
+
+        ``save_to_tiles`` writes tiles without running tile functions, so
+        the reciprocal changes are queued here and reconciled in one batch
+        when the surrounding transaction commits. Staged deletes must have
+        been applied by then.
+        """
+        if not staged_relation_tiles:
+            return
+        saved_data = dict(
+            models.TileModel.objects.filter(
+                pk__in=[
+                    tileid
+                    for tileid, _resourceid, operation, _data in staged_relation_tiles
+                    if operation != "delete"
+                ]
+            ).values_list("pk", "data")
+        )
+        user = models.User.objects.get(id=self.userid)
+        with deferred_reciprocal_sync(user):
+            for tileid, resourceid, operation, previous_data in staged_relation_tiles:
+                queue_reciprocal_change(
+                    resourceid,
+                    const.RELATION_STATUS_NODEGROUP,
+                    previous_data,
+                    None if operation == "delete" else saved_data.get(tileid),
+                )
+
+    def read_skos_resources(self):
+        """Yield schemes and concepts from the uploaded SKOS file, in any of
+        ``rdf_sources.SKOS_IMPORT_FORMATS`` and optionally gzipped.
+
+        When the import runs in celery the file is read from temp storage.
+        """
+        # Prevent circular import
+        from arches_lingo.utils.skos import SKOS_IMPORT_BASEUUID, SKOSReader
+
+        skos_reader = SKOSReader()
+        # Filled in by the reader as the file is parsed
+        self.source_statistics = skos_reader.statistics
+        _file_name, serialization, gzipped = rdf_sources.split_file_name(
+            self.temp_file_path or self.file.name
+        )
+        if self.temp_file_path:
+            with default_storage.open(self.temp_file_path, "rb") as file:
+                yield from skos_reader.iter_lingo_resources(
+                    rdf_sources.decompress(file, gzipped),
+                    serialization,
+                    SKOS_IMPORT_BASEUUID,
+                )
+        else:
+            # filetype.guess() has already read the head of the upload
+            self.file.seek(0)
+            yield from skos_reader.iter_lingo_resources(
+                rdf_sources.decompress(self.file, gzipped),
+                serialization,
+                SKOS_IMPORT_BASEUUID,
+            )
+
     def _finalize_import(self):
         self.load_event = models.LoadEvent.objects.get(loadid=self.loadid)
         thesaurus_name = getattr(self, "thesaurus_name", None)
-        if thesaurus_name is None and type(self.load_event.load_details) is list:
-            thesaurus_name = self.load_event.load_details[1].get("thesaurus_name")
+        if thesaurus_name is None:
+            thesaurus_name = self.get_load_details().get("thesaurus_name")
         user = models.User.objects.get(id=self.userid)
         if self.load_event.status == "indexed":
             message = (
@@ -991,6 +1826,9 @@ class LingoResourceImporter(BaseImportModule):
                     "scheme_conceptid": self.scheme_conceptid,
                     "temp_file_path": self.temp_file_path,
                     "mode": self.mode,
+                    "staging_writer": self.staging_writer,
+                    "staging_workers": self.staging_workers,
+                    "delta": self.delta,
                 },
             ]
         )
@@ -1006,10 +1844,10 @@ class LingoResourceImporter(BaseImportModule):
             self.load_event = models.LoadEvent.objects.get(loadid=self.loadid)
         self.load_event.status = "failed"
         self.load_event.error_message = str(error)
-        self.load_event.save()
+        self.load_event.save(update_fields=["status", "error_message"])
         thesaurus_name = getattr(self, "thesaurus_name", None)
-        if thesaurus_name is None and type(self.load_event.load_details) is list:
-            thesaurus_name = self.load_event.load_details[1].get("thesaurus_name")
+        if thesaurus_name is None:
+            thesaurus_name = self.get_load_details().get("thesaurus_name")
         if isinstance(error, task_management.CeleryNotAvailableError):
             message = _(
                 "The thesaurus exceeds threshold for synchronous processing, but Celery is not available. Please contact your system administrator."
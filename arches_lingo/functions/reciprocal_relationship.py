@@ -2,8 +2,14 @@ import copy
 import logging
 import threading
 import uuid
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
 
 from arches.app.functions.base import BaseFunction
+from arches.app.models.models import TileModel
 from arches.app.models.tile import Tile
 
 from arches_lingo.const import (
@@ -29,6 +35,9 @@ RECIPROCAL_SYNC_CONTEXT = "reciprocal_sync"
 # - delete has no context param, so thread-local is the only guard
 _thread_local = threading.local()
 
+# Queued in place of counterpart data when the source tile was deleted.
+DELETE_COUNTERPART = object()
+
 details = {
     "functionid": "dc0a3a78-f8a3-4472-b77d-7301d6718a36",
     "name": "Reciprocal Relationship",
@@ -105,6 +114,13 @@ class ReciprocalRelationshipFunction(BaseFunction):
             )
             return
 
+        deferred_batch = getattr(_thread_local, "deferred_batch", None)
+        if deferred_batch is not None:
+            deferred_batch[(source_resource_id, related_resource_id)] = (
+                self._build_counterpart_data(tile, source_resource_id)
+            )
+            return
+
         counterpart_tile = self._find_counterpart_tile(
             related_resource_id, source_resource_id
         )
@@ -156,6 +172,13 @@ class ReciprocalRelationshipFunction(BaseFunction):
         if related_resource_id == source_resource_id:
             return
 
+        deferred_batch = getattr(_thread_local, "deferred_batch", None)
+        if deferred_batch is not None:
+            deferred_batch[(source_resource_id, related_resource_id)] = (
+                DELETE_COUNTERPART
+            )
+            return
+
         counterpart_tile = self._find_counterpart_tile(
             related_resource_id, source_resource_id
         )
@@ -216,19 +239,26 @@ class ReciprocalRelationshipFunction(BaseFunction):
 
     def _find_counterpart_tile(self, target_resource_id, pointing_to_resource_id):
         """Find an existing tile on target_resource_id whose comparate
-        points back to pointing_to_resource_id."""
-        tiles = Tile.objects.filter(
-            resourceinstance_id=target_resource_id,
-            nodegroup_id=RELATION_STATUS_NODEGROUP,
+        points back to pointing_to_resource_id.
+
+        A single containment query on the comparate node, served by the
+        partial GIN index on relation tiles; it matches both the list and
+        the single-dict value formats.
+        """
+        comparate_lookup = (
+            f"data__{RELATION_STATUS_ASCRIBED_COMPARATE_NODEID}__contains"
         )
-        for candidate in tiles:
-            candidate_comparate = candidate.data.get(
-                RELATION_STATUS_ASCRIBED_COMPARATE_NODEID
+        pointing_to_resource_id = str(pointing_to_resource_id)
+        return (
+            Tile.objects.filter(
+                Q(**{comparate_lookup: [{"resourceId": pointing_to_resource_id}]})
+                | Q(**{comparate_lookup: {"resourceId": pointing_to_resource_id}}),
+                resourceinstance_id=target_resource_id,
+                nodegroup_id=RELATION_STATUS_NODEGROUP,
             )
-            candidate_related_id = self._get_related_resource_id(candidate_comparate)
-            if candidate_related_id and candidate_related_id == pointing_to_resource_id:
-                return candidate
-        return None
+            .order_by("tileid")
+            .first()
+        )
 
     def _build_comparate_value(self, resource_id):
         """Build a resource-instance value pointing to the given resource."""
@@ -317,3 +347,247 @@ class ReciprocalRelationshipFunction(BaseFunction):
                 counterpart_tile.tileid,
                 counterpart_tile.resourceinstance_id,
             )
+
+    def sync_counterparts(self, counterpart_changes):
+        """Reconcile queued relation changes in one batch.
+
+        *counterpart_changes* maps ``(source resource id, related resource
+        id)`` to the counterpart tile data to write on the related resource,
+        or ``DELETE_COUNTERPART``. Existing counterparts are found in one
+        query, then created, updated and deleted with bulk operations that
+        bypass ``Tile.save``, so no function pipeline runs per tile. When both
+        directions of a pair were changed in the batch, each side already has
+        its own tile and neither is mirrored onto the other.
+        """
+        from arches_lingo.utils.concept_lifecycle import schedule_concept_reindex
+        from arches_lingo.utils.edit_log import (
+            refresh_tile_resource_relationships,
+            write_tile_edit_log_entries,
+        )
+
+        counterpart_changes = {
+            (source_resource_id, related_resource_id): change
+            for (source_resource_id, related_resource_id), change in (
+                counterpart_changes.items()
+            )
+            if change is DELETE_COUNTERPART
+            or (related_resource_id, source_resource_id) not in counterpart_changes
+        }
+        if not counterpart_changes:
+            return
+
+        counterpart_by_pair = self._find_counterpart_tiles(counterpart_changes)
+
+        tiles_to_create = []
+        tiles_to_update = []
+        tile_ids_to_delete = []
+        edit_log_entries = []
+        for (
+            source_resource_id,
+            related_resource_id,
+        ), change in counterpart_changes.items():
+            counterpart_tile = counterpart_by_pair.get(
+                (related_resource_id, source_resource_id)
+            )
+            if change is DELETE_COUNTERPART:
+                if counterpart_tile:
+                    tile_ids_to_delete.append(counterpart_tile.pk)
+                    edit_log_entries.append(
+                        self._edit_log_entry(
+                            counterpart_tile, "tile delete", counterpart_tile.data, None
+                        )
+                    )
+            elif counterpart_tile:
+                previous_data = counterpart_tile.data
+                counterpart_tile.data = change
+                tiles_to_update.append(counterpart_tile)
+                edit_log_entries.append(
+                    self._edit_log_entry(
+                        counterpart_tile, "tile edit", previous_data, change
+                    )
+                )
+            else:
+                counterpart_tile = TileModel(
+                    tileid=uuid.uuid4(),
+                    resourceinstance_id=related_resource_id,
+                    nodegroup_id=RELATION_STATUS_NODEGROUP,
+                    parenttile_id=None,
+                    data=change,
+                    sortorder=0,
+                    provisionaledits=None,
+                )
+                tiles_to_create.append(counterpart_tile)
+                edit_log_entries.append(
+                    self._edit_log_entry(counterpart_tile, "tile create", None, change)
+                )
+
+        with transaction.atomic():
+            if tile_ids_to_delete:
+                TileModel.objects.filter(pk__in=tile_ids_to_delete).delete()
+            TileModel.objects.bulk_update(tiles_to_update, ["data"])
+            TileModel.objects.bulk_create(tiles_to_create)
+            refresh_tile_resource_relationships(
+                [tile.pk for tile in tiles_to_update + tiles_to_create]
+            )
+            write_tile_edit_log_entries(edit_log_entries, None)
+            schedule_concept_reindex(
+                {str(entry["resourceid"]) for entry in edit_log_entries}
+            )
+
+        logger.info(
+            "Reciprocal sync batch: created %d, updated %d, deleted %d "
+            "counterpart relationship tiles",
+            len(tiles_to_create),
+            len(tiles_to_update),
+            len(tile_ids_to_delete),
+        )
+
+    def _find_counterpart_tiles(self, pairs):
+        """Return ``{(resource id, points-to resource id): tile}`` in one query.
+
+        For each ``(source, related)`` pair, the counterpart is a relation
+        tile on *related* whose comparate points back to *source*.
+        """
+        counterpart_keys = {
+            (related_resource_id, source_resource_id)
+            for source_resource_id, related_resource_id in pairs
+        }
+        candidates = (
+            TileModel.objects.filter(
+                nodegroup_id=RELATION_STATUS_NODEGROUP,
+                resourceinstance_id__in={key[0] for key in counterpart_keys},
+            )
+            .annotate(
+                comparate_resource_id=RawSQL(
+                    "coalesce(tiledata -> %s -> 0 ->> 'resourceId', "
+                    "tiledata -> %s ->> 'resourceId')",
+                    [
+                        RELATION_STATUS_ASCRIBED_COMPARATE_NODEID,
+                        RELATION_STATUS_ASCRIBED_COMPARATE_NODEID,
+                    ],
+                )
+            )
+            .filter(comparate_resource_id__in={key[1] for key in counterpart_keys})
+            .order_by("tileid")
+        )
+
+        counterpart_by_pair = {}
+        for candidate in candidates:
+            key = (str(candidate.resourceinstance_id), candidate.comparate_resource_id)
+            if key in counterpart_keys:
+                counterpart_by_pair.setdefault(key, candidate)
+        return counterpart_by_pair
+
+    def _edit_log_entry(self, tile, edittype, oldvalue, newvalue):
+        return {
+            "resourceid": tile.resourceinstance_id,
+            "tileid": tile.pk,
+            "nodegroupid": tile.nodegroup_id,
+            "edittype": edittype,
+            "oldvalue": oldvalue,
+            "newvalue": newvalue,
+        }
+
+
+def _sync_deferred_batch(deferred_batch, user):
+    """Run a queued batch; a failure is logged and, when a user is known,
+    handed to a repairing reciprocal integrity audit, since the source
+    tiles are already committed. Reindexing the changed resources is not
+    part of the sync: ``schedule_concept_reindex`` logs its own errors, so
+    they never start an audit."""
+    try:
+        ReciprocalRelationshipFunction().sync_counterparts(deferred_batch)
+    except Exception:
+        logger.exception(
+            "Reciprocal sync of %d queued relation changes failed",
+            len(deferred_batch),
+        )
+        if user is None:
+            logger.error(
+                "Run the audit_reciprocal_relationships command with --repair "
+                "to restore the missing counterparts."
+            )
+            return
+
+        from arches_lingo.utils.reciprocal_integrity import (
+            start_reciprocal_integrity_audit,
+        )
+
+        try:
+            loadid = start_reciprocal_integrity_audit(user, repair=True)
+        except Exception:
+            logger.exception("Could not start a reciprocal relationship repair")
+        else:
+            logger.warning(
+                "Started reciprocal relationship repair audit %s after a "
+                "failed sync",
+                loadid,
+            )
+
+
+@contextmanager
+def deferred_reciprocal_sync(user=None):
+    """Queue reciprocal sync for relation tiles saved or deleted in this block.
+
+    Instead of one counterpart lookup and ``Tile.save`` per relation tile,
+    the queued changes are reconciled in one batch when the surrounding
+    transaction commits (immediately, outside a transaction). Nothing is
+    synced if the block raises. Nested blocks share the outer queue. If the
+    batch fails after commit, a repairing audit is started on behalf of
+    *user*.
+    """
+    if getattr(_thread_local, "deferred_batch", None) is not None:
+        yield
+        return
+
+    deferred_batch = {}
+    _thread_local.deferred_batch = deferred_batch
+    try:
+        yield
+    finally:
+        _thread_local.deferred_batch = None
+
+    if deferred_batch:
+        transaction.on_commit(lambda: _sync_deferred_batch(deferred_batch, user))
+
+
+def queue_reciprocal_change(resource_id, nodegroup_id, old_data, new_data):
+    """Queue reciprocal sync for a tile written without ``Tile.save``.
+
+    For bulk writes that bypass the function pipeline; must be called inside
+    ``deferred_reciprocal_sync``. *old_data* is ``None`` for a created tile
+    and *new_data* is ``None`` for a deleted one. Tiles outside the relation
+    nodegroup are ignored. When the comparate changed, the counterpart on
+    the previously related resource is removed.
+    """
+    deferred_batch = getattr(_thread_local, "deferred_batch", None)
+    if deferred_batch is None:
+        raise RuntimeError(
+            "queue_reciprocal_change must be called inside deferred_reciprocal_sync"
+        )
+    if str(nodegroup_id) != RELATION_STATUS_NODEGROUP:
+        return
+
+    reciprocal_function = ReciprocalRelationshipFunction()
+    source_resource_id = str(resource_id)
+    old_related_resource_id, new_related_resource_id = (
+        reciprocal_function._get_related_resource_id(
+            (data or {}).get(RELATION_STATUS_ASCRIBED_COMPARATE_NODEID)
+        )
+        for data in (old_data, new_data)
+    )
+
+    if old_related_resource_id not in (
+        None,
+        source_resource_id,
+        new_related_resource_id,
+    ):
+        deferred_batch[(source_resource_id, old_related_resource_id)] = (
+            DELETE_COUNTERPART
+        )
+    if new_related_resource_id not in (None, source_resource_id):
+        deferred_batch[(source_resource_id, new_related_resource_id)] = (
+            reciprocal_function._build_counterpart_data(
+                TileModel(data=new_data), source_resource_id
+            )
+        )
@@ -1,8 +1,13 @@
 import copy
+import json
 import uuid
+from itertools import islice
 
-from django.db import transaction
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import OuterRef, Subquery
 
+import arches.app.utils.task_management as task_management
 from arches.app.functions.base import BaseFunction
 from arches.app.models.models import (
     CardModel,
@@ -28,7 +33,11 @@ from arches_lingo.const import (
 
 from arches_lingo.models import ConceptIdentifierCounter, SchemeURITemplate
 from arches_lingo.utils.concept_identifier_allocator import (
-    allocate_concept_identifier_number,
+    allocate_concept_identifier_range,
+)
+from arches_lingo.utils.identifier_cache import invalidate_identifiers_on_commit
+from arches_lingo.utils.scheme_lifecycle_transition import (
+    start_scheme_lifecycle_transition,
 )
 
 
@@ -48,6 +57,9 @@ RETIRED_RESOURCE_INSTANCE_LIFECYCLE_STATE_ID = uuid.UUID(
 )
 
 
+URI_RECALCULATION_BATCH_SIZE = 2000
+
+
 details = {
     "name": "Update Concept Lifecycle States For Scheme",
     "functiontype": "lifecyclehandler",
@@ -91,7 +103,12 @@ class UpdateConceptLifecycleStatesForScheme(BaseFunction):
             and new_state.id == ACTIVE_RESOURCE_INSTANCE_LIFECYCLE_STATE_ID
         )
 
+        run_in_background = self._should_run_in_background(
+            related_non_retired_concepts_queryset, request
+        )
+
         with transaction.atomic():
+            url_template = scheme_identifier_value = None
             if is_scheme_promoting_to_active:
                 url_template, scheme_identifier_value = (
                     self._handle_scheme_promoted_to_active(
@@ -100,23 +117,72 @@ class UpdateConceptLifecycleStatesForScheme(BaseFunction):
                         request=request,
                     )
                 )
-                self._handle_draft_concepts_promoted_to_active(
+            if run_in_background:
+                start_scheme_lifecycle_transition(
+                    user=request.user,
                     scheme_resource_instance_id=scheme_resource_instance_id,
-                    concept_graph_id=concept_graph_id,
-                    related_non_retired_concepts_queryset=related_non_retired_concepts_queryset,
-                    request=request,
-                )
-                self._recalculate_non_retired_concept_uris(
+                    new_state_id=new_state.id,
+                    is_scheme_promoting_to_active=is_scheme_promoting_to_active,
                     url_template=url_template,
                     scheme_identifier_value=scheme_identifier_value,
+                )
+            else:
+                self.transition_concepts(
+                    scheme_resource_instance_id=scheme_resource_instance_id,
                     concept_graph_id=concept_graph_id,
-                    related_non_retired_concepts_queryset=related_non_retired_concepts_queryset,
+                    concepts_queryset=related_non_retired_concepts_queryset,
+                    new_state_id=new_state.id,
+                    is_scheme_promoting_to_active=is_scheme_promoting_to_active,
+                    url_template=url_template,
+                    scheme_identifier_value=scheme_identifier_value,
+                    request=request,
                 )
 
-            if related_non_retired_concepts_queryset.exists():
-                related_non_retired_concepts_queryset.update(
-                    resource_instance_lifecycle_state_id=new_state.id
-                )
+    def transition_concepts(
+        self,
+        scheme_resource_instance_id,
+        concept_graph_id,
+        concepts_queryset,
+        new_state_id,
+        is_scheme_promoting_to_active,
+        url_template,
+        scheme_identifier_value,
+        request=None,
+    ):
+        """Move the concepts in concepts_queryset to new_state_id.
+
+        Called once for the whole scheme, or once per chunk by the background
+        job. Drafts are moved out of Draft in the same call that allocates
+        their identifiers, so re-running a chunk never allocates twice.
+        """
+        if is_scheme_promoting_to_active:
+            self._handle_draft_concepts_promoted_to_active(
+                scheme_resource_instance_id=scheme_resource_instance_id,
+                concept_graph_id=concept_graph_id,
+                related_non_retired_concepts_queryset=concepts_queryset,
+                request=request,
+            )
+            self._recalculate_non_retired_concept_uris(
+                url_template=url_template,
+                scheme_identifier_value=scheme_identifier_value,
+                concept_graph_id=concept_graph_id,
+                related_non_retired_concepts_queryset=concepts_queryset,
+            )
+
+        if concepts_queryset.exists():
+            concepts_queryset.update(resource_instance_lifecycle_state_id=new_state_id)
+
+    def _should_run_in_background(self, related_non_retired_concepts_queryset, request):
+        if request is None or not request.user.is_authenticated:
+            return False
+        threshold = settings.LINGO_LIFECYCLE_TRANSITION_BACKGROUND_THRESHOLD
+        # Reads at most threshold + 1 ids rather than counting the scheme
+        concept_ids = related_non_retired_concepts_queryset.values_list(
+            "pk", flat=True
+        )[: threshold + 1]
+        if len(concept_ids) <= threshold:
+            return False
+        return task_management.check_if_celery_available()
 
     def _get_related_non_retired_concepts_for_scheme(
         self,
@@ -209,6 +275,7 @@ class UpdateConceptLifecycleStatesForScheme(BaseFunction):
                     source="arches-lingo",
                     identifier_type="identifier",
                 )
+                invalidate_identifiers_on_commit([scheme_identifier_value])
 
         if (
             scheme_identifier_value
@@ -257,10 +324,26 @@ class UpdateConceptLifecycleStatesForScheme(BaseFunction):
         related_non_retired_concepts_queryset,
         request,
     ):
+        nodes = {
+            node.alias: node
+            for node in Node.objects.filter(
+                graph_id=concept_graph_id,
+                alias__in=["identifier", "identifier_content", "identifier_type"],
+            )
+        }
+        identifier_nodegroup_id = nodes["identifier"].nodegroup_id
+
+        # Drafts that already carry an identifier keep it: a cloned scheme's
+        # concepts are renumbered from its own counter when they are copied.
         draft_concept_resource_instance_ids = list(
             related_non_retired_concepts_queryset.filter(
                 resource_instance_lifecycle_state_id=DRAFT_RESOURCE_INSTANCE_LIFECYCLE_STATE_ID
             )
+            .exclude(
+                resourceinstanceid__in=TileModel.objects.filter(
+                    nodegroup_id=identifier_nodegroup_id
+                ).values("resourceinstance_id")
+            )
             .select_for_update()
             .order_by("resourceinstanceid")
             .values_list("resourceinstanceid", flat=True)
@@ -268,14 +351,6 @@ class UpdateConceptLifecycleStatesForScheme(BaseFunction):
         if not draft_concept_resource_instance_ids:
             return
 
-        nodes = {
-            node.alias: node
-            for node in Node.objects.filter(
-                graph_id=concept_graph_id,
-                alias__in=["identifier", "identifier_content", "identifier_type"],
-            )
-        }
-        identifier_nodegroup_id = nodes["identifier"].nodegroup_id
         identifier_content_node_id = str(nodes["identifier_content"].nodeid)
         identifier_type_node_id = str(nodes["identifier_type"].nodeid)
 
@@ -284,7 +359,7 @@ class UpdateConceptLifecycleStatesForScheme(BaseFunction):
         )
         identifier_type_tile_value = [identifier_type_list_item.build_tile_value()]
 
-        allocated_start_number = allocate_concept_identifier_number(
+        allocated_numbers = allocate_concept_identifier_range(
             scheme_resource_instance_id=scheme_resource_instance_id,
             count=len(draft_concept_resource_instance_ids),
         )
@@ -297,10 +372,10 @@ class UpdateConceptLifecycleStatesForScheme(BaseFunction):
         resource_identifiers_to_create = []
         concept_tiles_to_create = []
 
-        for concept_index, concept_resource_instance_id in enumerate(
-            draft_concept_resource_instance_ids
+        for concept_resource_instance_id, allocated_number in zip(
+            draft_concept_resource_instance_ids, allocated_numbers
         ):
-            concept_identifier_value = str(allocated_start_number + concept_index)
+            concept_identifier_value = str(allocated_number)
 
             resource_identifiers_to_create.append(
                 ResourceIdentifier(
@@ -327,6 +402,10 @@ class UpdateConceptLifecycleStatesForScheme(BaseFunction):
             )
 
         ResourceIdentifier.objects.bulk_create(resource_identifiers_to_create)
+        invalidate_identifiers_on_commit(
+            resource_identifier.identifier
+            for resource_identifier in resource_identifiers_to_create
+        )
         TileModel.objects.bulk_create(concept_tiles_to_create)
 
     def _recalculate_non_retired_concept_uris(
@@ -339,23 +418,6 @@ class UpdateConceptLifecycleStatesForScheme(BaseFunction):
         if not scheme_identifier_value:
             return
 
-        concept_resource_instance_ids = list(
-            related_non_retired_concepts_queryset.values_list(
-                "resourceinstanceid", flat=True
-            )
-        )
-        if not concept_resource_instance_ids:
-            return
-
-        concept_identifier_by_resource_instance_id = dict(
-            ResourceIdentifier.objects.filter(
-                resourceid_id__in=concept_resource_instance_ids,
-                source="arches-lingo",
-            ).values_list("resourceid_id", "identifier")
-        )
-        if not concept_identifier_by_resource_instance_id:
-            return
-
         nodes = {
             node.alias: node
             for node in Node.objects.filter(
@@ -366,69 +428,209 @@ class UpdateConceptLifecycleStatesForScheme(BaseFunction):
         uri_nodegroup_id = nodes["uri"].nodegroup_id
         uri_content_node_id_string = str(nodes["uri_content"].nodeid)
 
-        existing_uri_tiles = list(
-            TileModel.objects.filter(
-                resourceinstance_id__in=concept_resource_instance_ids,
-                nodegroup_id=uri_nodegroup_id,
-            ).only("tileid", "resourceinstance_id", "data")
+        # The scheme part is the same for every concept; only
+        # <concept_identifier> varies per row.
+        scheme_url_template = url_template.replace(
+            "<scheme_identifier>", scheme_identifier_value
         )
 
-        existing_uri_tile_by_resource_instance_id = {
-            existing_uri_tile.resourceinstance_id: existing_uri_tile
-            for existing_uri_tile in existing_uri_tiles
-        }
+        if settings.LINGO_URI_RECALCULATION_MODE == "stream":
+            recalculate = self._recalculate_concept_uris_streaming
+        else:
+            recalculate = self._recalculate_concept_uris_in_sql
+        recalculate(
+            scheme_url_template=scheme_url_template,
+            uri_nodegroup_id=uri_nodegroup_id,
+            uri_content_node_id_string=uri_content_node_id_string,
+            related_non_retired_concepts_queryset=related_non_retired_concepts_queryset,
+        )
+
+    def _recalculate_concept_uris_in_sql(
+        self,
+        scheme_url_template,
+        uri_nodegroup_id,
+        uri_content_node_id_string,
+        related_non_retired_concepts_queryset,
+    ):
+        """Rewrite URI tiles with one UPDATE and one INSERT ... SELECT.
+
+        Concept URIs are computed in the database with ``replace()`` on the
+        template and written into the tile JSON with ``jsonb_set``; no concept
+        or tile rows are loaded into Python.
+        """
+        concept_ids_sql, concept_ids_params = (
+            related_non_retired_concepts_queryset.order_by()
+            .values("resourceinstanceid")
+            .query.sql_with_params()
+        )
+        resource_identifier_table = ResourceIdentifier._meta.db_table
+        resource_identifier_resource_column = ResourceIdentifier._meta.get_field(
+            "resourceid"
+        ).column
+        resource_identifier_pk_column = ResourceIdentifier._meta.pk.column
+        # A concept with several arches-lingo identifiers uses the one with the
+        # lowest primary key, in this mode and in the streaming one alike.
+        concept_uris_sql = f"""
+            SELECT DISTINCT ON (ri.{resource_identifier_resource_column})
+                ri.{resource_identifier_resource_column} AS resourceinstanceid,
+                replace(%s, '<concept_identifier>', ri.identifier) AS uri
+            FROM {resource_identifier_table} ri
+            WHERE ri.source = 'arches-lingo'
+            AND ri.{resource_identifier_resource_column} IN ({concept_ids_sql})
+            ORDER BY
+                ri.{resource_identifier_resource_column},
+                ri.{resource_identifier_pk_column}
+        """
+        concept_uris_params = [scheme_url_template, *concept_ids_params]
 
         default_uri_tile_data = self._get_nodegroup_data_with_widget_defaults(
             nodegroup_id=uri_nodegroup_id,
-            resourceinstance_id=concept_resource_instance_ids[0],
+            resourceinstance_id=None,
         )
 
-        uri_tiles_to_create = []
-        uri_tiles_to_update = []
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE tiles t
+                SET tiledata = jsonb_set(
+                    coalesce(t.tiledata, '{{}}'::jsonb),
+                    ARRAY[%s],
+                    to_jsonb(concept_uris.uri)
+                )
+                FROM ({concept_uris_sql}) concept_uris
+                WHERE t.resourceinstanceid = concept_uris.resourceinstanceid
+                AND t.nodegroupid = %s::uuid
+                AND t.tiledata ->> %s IS DISTINCT FROM concept_uris.uri
+                """,
+                [
+                    uri_content_node_id_string,
+                    *concept_uris_params,
+                    str(uri_nodegroup_id),
+                    uri_content_node_id_string,
+                ],
+            )
+            cursor.execute(
+                f"""
+                INSERT INTO tiles (
+                    tileid, resourceinstanceid, nodegroupid, parenttileid,
+                    tiledata, sortorder, provisionaledits
+                )
+                SELECT
+                    gen_random_uuid(),
+                    concept_uris.resourceinstanceid,
+                    %s::uuid,
+                    NULL,
+                    jsonb_set(%s::jsonb, ARRAY[%s], to_jsonb(concept_uris.uri)),
+                    0,
+                    NULL
+                FROM ({concept_uris_sql}) concept_uris
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM tiles t
+                    WHERE t.resourceinstanceid = concept_uris.resourceinstanceid
+                    AND t.nodegroupid = %s::uuid
+                )
+                """,
+                [
+                    str(uri_nodegroup_id),
+                    json.dumps(default_uri_tile_data),
+                    uri_content_node_id_string,
+                    *concept_uris_params,
+                    str(uri_nodegroup_id),
+                ],
+            )
 
-        for concept_resource_instance_id in concept_resource_instance_ids:
-            concept_identifier_value = concept_identifier_by_resource_instance_id.get(
-                concept_resource_instance_id
+    def _recalculate_concept_uris_streaming(
+        self,
+        scheme_url_template,
+        uri_nodegroup_id,
+        uri_content_node_id_string,
+        related_non_retired_concepts_queryset,
+    ):
+        """Rewrite URI tiles batch by batch from a server-side cursor.
+
+        At most ``URI_RECALCULATION_BATCH_SIZE`` concepts and their URI tiles
+        are held in memory at once.
+        """
+        concept_identifiers = (
+            related_non_retired_concepts_queryset.order_by()
+            .annotate(
+                concept_identifier=Subquery(
+                    ResourceIdentifier.objects.filter(
+                        resourceid_id=OuterRef("resourceinstanceid"),
+                        source="arches-lingo",
+                    )
+                    .order_by("pk")
+                    .values("identifier")[:1]
+                )
             )
-            if not concept_identifier_value:
-                continue
+            .exclude(concept_identifier=None)
+            .values_list("resourceinstanceid", "concept_identifier")
+            .iterator(chunk_size=URI_RECALCULATION_BATCH_SIZE)
+        )
 
-            desired_uri_value = url_template.replace(
-                "<scheme_identifier>", scheme_identifier_value
-            ).replace("<concept_identifier>", concept_identifier_value)
+        default_uri_tile_data = None
 
-            existing_uri_tile = existing_uri_tile_by_resource_instance_id.get(
-                concept_resource_instance_id
-            )
+        while batch := list(islice(concept_identifiers, URI_RECALCULATION_BATCH_SIZE)):
+            existing_uri_tile_by_resource_instance_id = {
+                existing_uri_tile.resourceinstance_id: existing_uri_tile
+                for existing_uri_tile in TileModel.objects.filter(
+                    resourceinstance_id__in=[
+                        concept_resource_instance_id
+                        for concept_resource_instance_id, _identifier in batch
+                    ],
+                    nodegroup_id=uri_nodegroup_id,
+                ).only("tileid", "resourceinstance_id", "data")
+            }
 
-            if existing_uri_tile is None:
-                new_tile_data = copy.deepcopy(default_uri_tile_data)
-                new_tile_data[uri_content_node_id_string] = desired_uri_value
-                uri_tiles_to_create.append(
-                    TileModel(
-                        resourceinstance_id=concept_resource_instance_id,
-                        nodegroup_id=uri_nodegroup_id,
-                        parenttile_id=None,
-                        data=new_tile_data,
-                        sortorder=0,
-                        provisionaledits=None,
-                    )
+            uri_tiles_to_create = []
+            uri_tiles_to_update = []
+
+            for concept_resource_instance_id, concept_identifier_value in batch:
+                desired_uri_value = scheme_url_template.replace(
+                    "<concept_identifier>", concept_identifier_value
                 )
-                continue
 
-            existing_uri_value = existing_uri_tile.data.get(uri_content_node_id_string)
+                existing_uri_tile = existing_uri_tile_by_resource_instance_id.get(
+                    concept_resource_instance_id
+                )
 
-            if existing_uri_value == desired_uri_value:
-                continue
+                if existing_uri_tile is None:
+                    if default_uri_tile_data is None:
+                        default_uri_tile_data = (
+                            self._get_nodegroup_data_with_widget_defaults(
+                                nodegroup_id=uri_nodegroup_id,
+                                resourceinstance_id=concept_resource_instance_id,
+                            )
+                        )
+                    new_tile_data = copy.deepcopy(default_uri_tile_data)
+                    new_tile_data[uri_content_node_id_string] = desired_uri_value
+                    uri_tiles_to_create.append(
+                        TileModel(
+                            resourceinstance_id=concept_resource_instance_id,
+                            nodegroup_id=uri_nodegroup_id,
+                            parenttile_id=None,
+                            data=new_tile_data,
+                            sortorder=0,
+                            provisionaledits=None,
+                        )
+                    )
+                    continue
+
+                existing_uri_value = existing_uri_tile.data.get(
+                    uri_content_node_id_string
+                )
+
+                if existing_uri_value == desired_uri_value:
+                    continue
 
-            existing_uri_tile.data[uri_content_node_id_string] = desired_uri_value
-            uri_tiles_to_update.append(existing_uri_tile)
+                existing_uri_tile.data[uri_content_node_id_string] = desired_uri_value
+                uri_tiles_to_update.append(existing_uri_tile)
 
-        if uri_tiles_to_create:
-            TileModel.objects.bulk_create(uri_tiles_to_create)
+            if uri_tiles_to_create:
+                TileModel.objects.bulk_create(uri_tiles_to_create)
 
-        if uri_tiles_to_update:
-            TileModel.objects.bulk_update(uri_tiles_to_update, ["data"])
+            if uri_tiles_to_update:
+                TileModel.objects.bulk_update(uri_tiles_to_update, ["data"])
 
     def _get_nodegroup_data_with_widget_defaults(
         self,
@@ -0,0 +1,54 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from arches_lingo.utils.reciprocal_integrity import (
+    audit_reciprocal_relationships,
+    repair_reciprocal_relationships,
+    summarize_issues,
+    write_report,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Report relation tiles whose reciprocal counterpart is missing or has "
+        "diverged, and optionally repair them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repair",
+            action="store_true",
+            help="Create missing counterparts and resync mismatched ones.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["json", "csv"],
+            default="json",
+            help="Report format (default: json).",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the report to this file instead of standard output.",
+        )
+
+    def handle(self, *args, **options):
+        relation_tile_count, issues = audit_reciprocal_relationships()
+
+        if options["output"]:
+            with open(options["output"], "w", newline="") as report_file:
+                write_report(issues, report_file, options["format"])
+        else:
+            write_report(issues, sys.stdout, options["format"])
+
+        # The summary goes to stderr so a report on stdout stays parseable.
+        summary = summarize_issues(relation_tile_count, issues)
+        self.stderr.write(
+            "Checked {relation_tiles} relation tiles: {orphan} orphaned, "
+            "{mismatch} mismatched, {dangling} dangling.".format(**summary)
+        )
+
+        if options["repair"]:
+            repaired = repair_reciprocal_relationships(issues)
+            self.stderr.write(self.style.SUCCESS(f"Repaired {repaired} relationships."))
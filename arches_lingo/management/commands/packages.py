@@ -1,12 +1,16 @@
 import uuid
 import os
-import io
+import mimetypes
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from arches.app.models import models
 from arches_controlled_lists.management.commands.packages import (
     Command as PackagesCommand,
 )
-from arches_lingo.etl_modules.migrate_to_lingo import LingoResourceImporter
+from arches_lingo.etl_modules.migrate_to_lingo import (
+    LingoResourceImporter,
+    STAGING_WRITERS,
+)
+from arches_lingo.utils.import_performance import ImportPerformance
 
 
 class Command(PackagesCommand):
@@ -16,34 +20,101 @@ class Command(PackagesCommand):
 
         idx_of_operation_arg = [a.dest for a in parser._actions].index("operation")
         parser._actions[idx_of_operation_arg].choices.extend(["import_lingo_resources"])
+        parser.add_argument(
+            "--staging_writer",
+            choices=STAGING_WRITERS,
+            default=None,
+            help="How import_lingo_resources writes tiles to the staging table "
+            "(defaults to the LINGO_IMPORT_STAGING_WRITER setting)",
+        )
+        parser.add_argument(
+            "--compare_staging_writers",
+            action="store_true",
+            default=False,
+            help="Instead of importing, stage the import_lingo_resources source "
+            "with each staging writer, print their timings and roll back",
+        )
+        parser.add_argument(
+            "--delta",
+            action="store_true",
+            default=False,
+            help="Import only the tiles that changed since the vocabulary was "
+            "last imported with --delta",
+        )
 
     def handle(self, *args, **options):
         super().handle(self, *args, **options)
 
         if options["operation"] == "import_lingo_resources":
-            self.import_lingo_resources(options["source"], options["overwrite"])
+            if options["compare_staging_writers"]:
+                self.compare_staging_writers(options["source"])
+                return
+            self.import_lingo_resources(
+                options["source"],
+                options["overwrite"],
+                options["staging_writer"],
+                options["delta"],
+            )
 
-    def import_lingo_resources(self, source, overwrite_options):
+    @staticmethod
+    def open_source(source):
         file_name = os.path.basename(source)
-        with open(source, "rb") as f:
-            file_data = f.read()
-        inmemory_file = InMemoryUploadedFile(
-            file=io.BytesIO(file_data),
+        # The file is read as it is imported rather than loaded into memory:
+        # N-Triples and RDF/XML dumps can be several gigabytes.
+        content_type, _encoding = mimetypes.guess_type(file_name)
+        return InMemoryUploadedFile(
+            file=open(source, "rb"),
             field_name="file",
             name=file_name,
-            content_type="application/xml",
-            size=len(file_data),
+            content_type=content_type or "application/octet-stream",
+            size=os.path.getsize(source),
             charset=None,
         )
 
+    def compare_staging_writers(self, source):
+        bulk_loader = LingoResourceImporter(
+            loadid=str(uuid.uuid4()),
+            userid=models.User.objects.get(username="admin").pk,
+            mode="cli",
+        )
+        bulk_loader.file = self.open_source(source)
+        try:
+            statistics_by_writer = bulk_loader.compare_staging_writers()
+        finally:
+            bulk_loader.file.close()
+
+        self.stdout.write("Staging writer comparison (rolled back):")
+        for staging_writer, statistics in statistics_by_writer.items():
+            self.stdout.write(
+                f"  {staging_writer}: stage {statistics['write_seconds']:.3f}s, "
+                f"transform {statistics['transform_seconds']:.3f}s, "
+                f"{statistics['tiles']} tiles"
+            )
+
+    def import_lingo_resources(
+        self, source, overwrite_options, staging_writer=None, delta=False
+    ):
+        inmemory_file = self.open_source(source)
+
         self.loadid = str(uuid.uuid4())
         bulk_loader = LingoResourceImporter(
             loadid=self.loadid,
             userid=models.User.objects.get(username="admin").pk,
             mode="cli",
+            staging_writer=staging_writer,
+            delta=delta,
         )
         start_request = bulk_loader.start(request=None)
         bulk_loader.file = inmemory_file
         # Avoid using celery for package import
         bulk_loader.config["celeryByteSizeLimit"] = 90000000  # 90mb
-        write_request = bulk_loader.write(request=None)
+        try:
+            write_request = bulk_loader.write(request=None)
+        finally:
+            inmemory_file.close()
+
+        performance = bulk_loader.get_load_details().get("performance")
+        if performance:
+            self.stdout.write("Import performance:")
+            for line in ImportPerformance.format(performance):
+                self.stdout.write(f"  {line}")
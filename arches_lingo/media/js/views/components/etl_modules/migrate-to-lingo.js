@@ -23,6 +23,25 @@ const viewModel = function(params) {
     } else {
         this.loadDetails = ko.observable(params.load_details);
     }
+    this.performancePhases = ko.computed(function() {
+        const phases = self.loadDetails()?.performance?.phases || {};
+        return Object.entries(phases).map(([name, phase]) => {
+            const { seconds, rss_kb: rssKb } = phase;
+            return {
+                name: name,
+                seconds: seconds.toFixed(1),
+                memoryMb: rssKb ? (rssKb / 1024).toFixed(0) : '',
+                counters: Object.entries(phase)
+                    .filter(([key]) => !['seconds', 'rss_kb', 'peak_rss_kb'].includes(key))
+                    .map(([counter, value]) => `${counter}: ${value}`)
+                    .join(', '),
+            };
+        });
+    });
+    this.performancePeakMemoryMb = ko.computed(function() {
+        const peakRssKb = self.loadDetails()?.performance?.peak_rss_kb;
+        return peakRssKb ? (peakRssKb / 1024).toFixed(0) : '';
+    });
     this.state = params.state;
     this.loading = params.loading || ko.observable();
     this.alert = params.alert;
@@ -32,6 +51,7 @@ const viewModel = function(params) {
     this.schemes = ko.observable();
     this.selectedScheme = ko.observable();
     this.selectedSchemeName = ko.observable();
+    this.conceptCountEstimate = ko.observable();
     this.selectedLoadEvent = params.selectedLoadEvent || ko.observable();
     this.formatTime = params.formatTime;
     this.timeDifference = params.timeDifference;
@@ -52,9 +72,22 @@ const viewModel = function(params) {
             if (scheme) {
                 self.selectedSchemeName(scheme.prefLabel);
             }
+            self.estimateConceptCount(newValue);
+        } else {
+            self.conceptCountEstimate(undefined);
         }
     });
 
+    this.estimateConceptCount = function(scheme) {
+        self.conceptCountEstimate(undefined);
+        self.formData.set('scheme', scheme);
+        self.submit('estimate_concept_count').then(function(response){
+            if (self.selectedScheme() === scheme) {
+                self.conceptCountEstimate(response.result);
+            }
+        });
+    };
+
     this.ready = ko.computed(function(){
         const ready = !!self.selectedScheme();
         return ready;
@@ -65,7 +98,7 @@ const viewModel = function(params) {
             return;
         }
         self.loading(true);
-        self.formData.append('scheme', self.selectedScheme());
+        self.formData.set('scheme', self.selectedScheme());
         self.submit('start').then(data => {
             params.activeTab("import");
             self.formData.append('async', true);
@@ -0,0 +1,67 @@
+from django.db import migrations
+
+from arches_lingo.etl_modules.lingo_bulk_operations import details
+
+
+def forward(apps, schema_editor):
+    ETLModule = apps.get_model("models", "ETLModule")
+    ETLModule.objects.update_or_create(
+        etlmoduleid=details["etlmoduleid"],
+        defaults={key: value for key, value in details.items() if key != "etlmoduleid"},
+    )
+
+    schema_editor.execute(
+        """
+        insert into guardian_groupobjectpermission (
+            "object_pk",
+            "content_type_id",
+            "group_id",
+            "permission_id"
+        )
+        select
+            etl_modules.etlmoduleid as object_pk,
+            dct.id as content_type_id,
+            ag.id as group_id,
+            ap.id as permission_id
+        from etl_modules
+        join django_content_type dct on dct.model = 'etlmodule'
+        join auth_group ag on ag.name = 'Lingo Editor'
+        join auth_permission ap on ap.codename = 'view_etlmodule'
+        where etl_modules.slug = 'lingo-bulk-operations';
+        """
+    )
+
+
+def reverse(apps, schema_editor):
+    schema_editor.execute(
+        """
+        DELETE FROM guardian_groupobjectpermission
+        WHERE
+            object_pk = %s
+            AND permission_id = (
+                SELECT id
+                FROM auth_permission
+                WHERE codename = 'view_etlmodule'
+            )
+            AND group_id = (
+                SELECT id
+                FROM auth_group
+                WHERE name = 'Lingo Editor'
+            );
+        """,
+        [details["etlmoduleid"]],
+    )
+
+    ETLModule = apps.get_model("models", "ETLModule")
+    ETLModule.objects.filter(etlmoduleid=details["etlmoduleid"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("arches_lingo", "0015_add_retired_to_editing_lifecycle_transition"),
+    ]
+
+    operations = [
+        migrations.RunPython(forward, reverse),
+    ]
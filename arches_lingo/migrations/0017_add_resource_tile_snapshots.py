@@ -0,0 +1,51 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("arches_lingo", "0016_add_lingo_bulk_operations_etl_module"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResourceTileSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("snapshot_time", models.DateTimeField()),
+                (
+                    "tiles",
+                    models.JSONField(
+                        help_text="Full tile state keyed by tile id: nodegroup, parent tile, sortorder, data."
+                    ),
+                ),
+                (
+                    "resourceinstance",
+                    models.ForeignKey(
+                        db_column="resourceinstanceid",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="lingo_tile_snapshots",
+                        to="models.resourceinstance",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "resource_tile_snapshots",
+                "indexes": [
+                    models.Index(
+                        fields=["resourceinstance", "-snapshot_time"],
+                        name="tile_snapshot_resource_time",
+                    )
+                ],
+            },
+        ),
+    ]
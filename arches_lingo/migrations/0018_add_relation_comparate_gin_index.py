@@ -0,0 +1,38 @@
+from django.db import migrations
+
+from arches_lingo.const import (
+    RELATION_STATUS_ASCRIBED_COMPARATE_NODEID,
+    RELATION_STATUS_NODEGROUP,
+)
+
+
+class Migration(migrations.Migration):
+    """Add a GIN expression index on the comparate of relation tiles.
+
+    Reciprocal relationship sync looks up the counterpart of a relation tile
+    with a JSONB @> containment query on the comparate node. The partial,
+    jsonb_path_ops index answers that lookup directly instead of loading
+    every relation tile on the related concept.
+    """
+
+    atomic = False
+
+    dependencies = [
+        ("arches_lingo", "0017_add_resource_tile_snapshots"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS
+                    tiles_relation_comparate_gin
+                ON tiles
+                USING GIN (
+                    (tiledata -> '{RELATION_STATUS_ASCRIBED_COMPARATE_NODEID}')
+                    jsonb_path_ops
+                )
+                WHERE nodegroupid = '{RELATION_STATUS_NODEGROUP}'::uuid;
+            """,
+            reverse_sql="DROP INDEX IF EXISTS tiles_relation_comparate_gin;",
+        ),
+    ]
@@ -95,3 +95,29 @@ class ConceptSetMember(models.Model):
 
     def __str__(self):
         return f"{self.concept_set.name}: {self.concept_id}"
+
+
+class ResourceTileSnapshot(models.Model):
+    resourceinstance = models.ForeignKey(
+        "models.ResourceInstance",
+        to_field="resourceinstanceid",
+        db_column="resourceinstanceid",
+        on_delete=models.CASCADE,
+        related_name="lingo_tile_snapshots",
+    )
+    snapshot_time = models.DateTimeField()
+    tiles = models.JSONField(
+        help_text=_(
+            "Full tile state keyed by tile id: nodegroup, parent tile, sortorder, data."
+        )
+    )
+
+    class Meta:
+        app_label = "arches_lingo"
+        db_table = "resource_tile_snapshots"
+        indexes = [
+            models.Index(
+                fields=["resourceinstance", "-snapshot_time"],
+                name="tile_snapshot_resource_time",
+            )
+        ]
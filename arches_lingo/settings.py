@@ -483,6 +483,10 @@ CELERY_BEAT_SCHEDULE = {
         "schedule": CELERY_SEARCH_EXPORT_CHECK,
         "args": ("Celery Beat is Running",),
     },
+    "lingo-tile-snapshots": {
+        "task": "arches_lingo.tasks.snapshot_lingo_resources_task",
+        "schedule": 24 * 3600,  # seconds
+    },
 }
 
 # Set to True if you want to send celery tasks to the broker without being able to detect celery.
@@ -611,6 +615,54 @@ LINGO_ALLOW_ANONYMOUS_ACCESS = False
 
 RESOURCE_LIST_PAGE_SIZE = 25
 
+# Dashboard stats are cached per (scheme set, days) in the "lingo" cache.
+# Entries older than the timeout are served stale for up to the stale window
+# while one background refresh rebuilds them. Set the timeout to 0 to disable.
+LINGO_DASHBOARD_CACHE_TIMEOUT = 300  # seconds
+LINGO_DASHBOARD_CACHE_STALE_TIMEOUT = 3600  # seconds
+LINGO_DASHBOARD_CACHE_LOCK_TIMEOUT = 120  # seconds
+
+# Identifier → resource resolution (published URIs) is cached in the "lingo"
+# cache. Misses are cached too, for a shorter time, so repeated requests for
+# unknown identifiers do not reach the database. Set a timeout to 0 to disable.
+LINGO_IDENTIFIER_CACHE_TIMEOUT = 3600  # seconds
+LINGO_IDENTIFIER_NEGATIVE_CACHE_TIMEOUT = 60  # seconds
+
+# Scheme lifecycle transitions touching more concepts than this run as a
+# chunked, resumable Celery job (when Celery is available) instead of inside
+# the request.
+LINGO_LIFECYCLE_TRANSITION_BACKGROUND_THRESHOLD = 1000
+
+# Bulk concept state changes (e.g. unretiring a scheme) touching more concepts
+# than this reindex them in a background job instead of on commit.
+LINGO_BULK_REINDEX_BACKGROUND_THRESHOLD = 1000
+
+# How concept URIs are rewritten when a scheme is promoted to Active:
+# "sql" rewrites URI tiles in place with jsonb_set in two statements;
+# "stream" walks concepts with a server-side cursor and writes in batches.
+LINGO_URI_RECALCULATION_MODE = "sql"
+
+# Periodic full tile-state snapshots of schemes and concepts. History lookups
+# (revert, "as of" views) start from the nearest snapshot and replay only the
+# edits after it. Only resources with at least the threshold number of tile
+# edits since their last snapshot are snapshotted on each run.
+LINGO_TILE_SNAPSHOTS_ENABLED = False
+LINGO_TILE_SNAPSHOT_EDIT_THRESHOLD = 1
+# Snapshots older than this many days are pruned on each run, except the
+# latest one of each resource. None keeps every snapshot.
+LINGO_TILE_SNAPSHOT_RETENTION_DAYS = 90
+
+# How thesaurus imports write tiles to the staging table: "copy" streams each
+# batch with COPY FROM STDIN; "bulk_create" inserts LoadStaging instances.
+# An import can choose either with its "staging_writer" option.
+LINGO_IMPORT_STAGING_WRITER = "copy"
+
+# Processes used to prepare tile values during thesaurus imports. With more
+# than one, concepts are prepared in a process pool while the importing
+# process writes the results. An import can override this with its
+# "staging_workers" option.
+LINGO_IMPORT_STAGING_WORKERS = 1
+
 try:
     from .package_settings import *
 except ImportError:
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from arches.app.models.models import ResourceIdentifier
+
+from arches_lingo.utils.identifier_cache import invalidate_identifiers_on_commit
+
+
+@receiver(post_delete, sender=ResourceIdentifier)
+def invalidate_deleted_identifier(sender, instance, **kwargs):
+    # Also reached through the cascade when a resource is deleted.
+    invalidate_identifiers_on_commit([instance.identifier])
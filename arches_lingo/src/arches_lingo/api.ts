@@ -767,11 +767,18 @@ export const dismissNotifications = async (notificationIds: string[]) => {
 
 export const fetchResourceEditLog = async (
     resourceId: string,
-): Promise<{ resourceid: string; edits: EditLogEntry[] }> => {
+    cursor?: string | null,
+): Promise<{
+    resourceid: string;
+    edits: EditLogEntry[];
+    next_cursor: string | null;
+}> => {
     const url = generateArchesURL("arches_lingo:api-lingo-edit-log", {
         resourceid: resourceId,
     });
-    const response = await fetch(url);
+    const response = await fetch(
+        cursor ? `${url}?${new URLSearchParams({ cursor })}` : url,
+    );
     const parsed = await response.json();
     if (!response.ok) throw new Error(parsed.message || response.statusText);
     return parsed;
@@ -46,7 +46,9 @@ def export_lingo_resources_task(
         notify_completion(message, user)
 
 
-@shared_task
+# Redelivered if its worker is lost; run_load_task resumes from the import
+# checkpoints stored on the LoadEvent.
+@shared_task(acks_late=True, reject_on_worker_lost=True)
 def load_lingo_resources_task(loadid, userid, kwargs={}):
     logger = logging.getLogger(__name__)
 
@@ -75,3 +77,122 @@ def load_lingo_resources_task(loadid, userid, kwargs={}):
             else _("Import failed")
         )
         notify_completion(message, user)
+
+
+# acks_late + reject_on_worker_lost: a task interrupted by a worker restart
+# is redelivered and resumes from the checkpoint stored on its LoadEvent.
+@shared_task(acks_late=True, reject_on_worker_lost=True)
+def revert_resources_to_timestamp_task(loadid, userid):
+    logger = logging.getLogger(__name__)
+
+    from arches_lingo.etl_modules.lingo_bulk_operations import LingoBulkOperations
+    from arches_lingo.utils.bulk_revert import run_bulk_revert
+
+    user = User.objects.get(id=userid)
+    try:
+        errors = run_bulk_revert(loadid, userid)
+        message = _("Revert completed with errors") if errors else _("Revert completed")
+    except Exception as exception:
+        logger.error(exception, exc_info=True)
+        LingoBulkOperations(loadid=loadid, userid=userid).fail(exception)
+        message = _("Revert failed")
+    notify_completion(message, user)
+
+
+@shared_task(acks_late=True, reject_on_worker_lost=True)
+def transition_scheme_lifecycle_task(loadid, userid):
+    logger = logging.getLogger(__name__)
+
+    from arches_lingo.etl_modules.lingo_bulk_operations import LingoBulkOperations
+    from arches_lingo.utils.scheme_lifecycle_transition import (
+        run_scheme_lifecycle_transition,
+    )
+
+    user = User.objects.get(id=userid)
+    try:
+        run_scheme_lifecycle_transition(loadid, userid)
+        message = _("Scheme lifecycle update completed")
+    except Exception as exception:
+        logger.error(exception, exc_info=True)
+        LingoBulkOperations(loadid=loadid, userid=userid).fail(exception)
+        message = _("Scheme lifecycle update failed")
+    notify_completion(message, user)
+
+
+@shared_task
+def refresh_dashboard_stats_task(cache_key, scheme_ids, days):
+    from arches_lingo.utils.dashboard_cache import refresh_dashboard_stats
+
+    refresh_dashboard_stats(cache_key, scheme_ids, days)
+
+
+@shared_task
+def snapshot_lingo_resources_task():
+    from django.conf import settings
+
+    from arches_lingo.utils.tile_snapshots import (
+        prune_snapshots,
+        snapshot_lingo_resources,
+    )
+
+    if not settings.LINGO_TILE_SNAPSHOTS_ENABLED:
+        return 0
+    snapshot_count = snapshot_lingo_resources()
+    prune_snapshots()
+    return snapshot_count
+
+
+@shared_task(acks_late=True, reject_on_worker_lost=True)
+def audit_reciprocal_relationships_task(loadid, userid):
+    logger = logging.getLogger(__name__)
+
+    from arches_lingo.etl_modules.lingo_bulk_operations import LingoBulkOperations
+    from arches_lingo.utils.reciprocal_integrity import (
+        run_reciprocal_integrity_audit,
+    )
+
+    user = User.objects.get(id=userid)
+    try:
+        run_reciprocal_integrity_audit(loadid, userid)
+        message = _("Relationship audit completed")
+    except Exception as exception:
+        logger.error(exception, exc_info=True)
+        LingoBulkOperations(loadid=loadid, userid=userid).fail(exception)
+        message = _("Relationship audit failed")
+    notify_completion(message, user)
+
+
+@shared_task(acks_late=True, reject_on_worker_lost=True)
+def reindex_concepts_task(loadid, userid):
+    logger = logging.getLogger(__name__)
+
+    from arches_lingo.etl_modules.lingo_bulk_operations import LingoBulkOperations
+    from arches_lingo.utils.concept_reindex import run_concept_reindex
+
+    user = User.objects.get(id=userid)
+    try:
+        run_concept_reindex(loadid, userid)
+        message = _("Concept reindex completed")
+    except Exception as exception:
+        logger.error(exception, exc_info=True)
+        LingoBulkOperations(loadid=loadid, userid=userid).fail(exception)
+        message = _("Concept reindex failed")
+    notify_completion(message, user)
+
+
+@shared_task(acks_late=True, reject_on_worker_lost=True)
+def clone_scheme_task(loadid, userid):
+    logger = logging.getLogger(__name__)
+
+    from arches_lingo.etl_modules.lingo_bulk_operations import LingoBulkOperations
+    from arches_lingo.utils.scheme_clone import run_scheme_clone
+
+    user = User.objects.get(id=userid)
+    try:
+        run_scheme_clone(loadid, userid)
+        message = _("Scheme copy completed")
+    except Exception as exception:
+        logger.error(exception, exc_info=True)
+        LingoBulkOperations(loadid=loadid, userid=userid).fail(exception)
+        message = _("Scheme copy failed")
+    notify_completion(message, user)
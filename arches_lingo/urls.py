@@ -15,7 +15,18 @@ from arches_lingo.views.api.concepts import (
 )
 from arches_lingo.views.api.lifecycle import LifecycleStatesView
 from arches_lingo.views.api.dashboard import DashboardStatsView
-from arches_lingo.views.api.edit_log import ResourceEditLogAPIView
+from arches_lingo.views.api.edit_log import (
+    ResourceEditLogAPIView,
+    ResourceStateAsOfView,
+)
+from arches_lingo.views.api.bulk_operations import (
+    BulkOperationStatusView,
+    ConceptSetRevertView,
+    ReciprocalIntegrityAuditView,
+    SchemeCloneView,
+    SchemeLifecycleTransitionStatusView,
+    SchemeRevertView,
+)
 from arches_lingo.views.api.schemes import SchemeResourceView, SchemeLabelCountView
 from arches_lingo.views.api.advanced_search import (
     AdvancedSearchView,
@@ -41,12 +52,17 @@ from arches_lingo.views.api.scheme_uri_template import (
     SchemeURITemplateView,
 )
 from arches_lingo.views.api.concept_lifecycle import (
+    ConceptRemovalPreviewView,
     ConceptRetireView,
+    ConceptSetUnretireView,
     ConceptUnretireView,
     SchemeUnretireConceptsView,
 )
 from arches_lingo.views.api.settings import AppSettingsView
-from arches_lingo.views.api.identifier_resolve import IdentifierResolveView
+from arches_lingo.views.api.identifier_resolve import (
+    BulkIdentifierResolveView,
+    IdentifierResolveView,
+)
 from arches_lingo.views.api.resource_list import (
     ContributorsListView,
     ResourceReferenceCountView,
@@ -210,6 +226,41 @@ urlpatterns = [
         ResourceEditLogAPIView.as_view(),
         name="api-lingo-edit-log",
     ),
+    path(
+        "api/lingo/resource/<uuid:resourceid>/as-of",
+        ResourceStateAsOfView.as_view(),
+        name="api-lingo-resource-as-of",
+    ),
+    path(
+        "api/lingo/scheme/<uuid:pk>/revert",
+        SchemeRevertView.as_view(),
+        name="api-lingo-scheme-revert",
+    ),
+    path(
+        "api/lingo/scheme/<uuid:pk>/clone",
+        SchemeCloneView.as_view(),
+        name="api-lingo-scheme-clone",
+    ),
+    path(
+        "api/concept-sets/<int:pk>/revert",
+        ConceptSetRevertView.as_view(),
+        name="api-concept-set-revert",
+    ),
+    path(
+        "api/lingo/reciprocal-relationships/audit",
+        ReciprocalIntegrityAuditView.as_view(),
+        name="api-lingo-reciprocal-relationship-audit",
+    ),
+    path(
+        "api/lingo/bulk-operations/<uuid:loadid>",
+        BulkOperationStatusView.as_view(),
+        name="api-lingo-bulk-operation",
+    ),
+    path(
+        "api/lingo/scheme/<uuid:pk>/lifecycle-transition",
+        SchemeLifecycleTransitionStatusView.as_view(),
+        name="api-lingo-scheme-lifecycle-transition",
+    ),
     path(
         "api/lingo/schemes/<uuid:pk>/label-counts",
         SchemeLabelCountView.as_view(),
@@ -240,6 +291,11 @@ urlpatterns = [
         ConceptRetireView.as_view(),
         name="api-concept-retire",
     ),
+    path(
+        "api/lingo/concept/<uuid:pk>/removal-preview",
+        ConceptRemovalPreviewView.as_view(),
+        name="api-concept-removal-preview",
+    ),
     path(
         "api/lingo/concept/<uuid:pk>/unretire",
         ConceptUnretireView.as_view(),
@@ -250,6 +306,11 @@ urlpatterns = [
         SchemeUnretireConceptsView.as_view(),
         name="api-scheme-unretire-concepts",
     ),
+    path(
+        "api/concept-sets/<int:pk>/unretire",
+        ConceptSetUnretireView.as_view(),
+        name="api-concept-set-unretire",
+    ),
     path(
         "api/lingo/<slug:graph>",
         LingoResourceListCreateView.as_view(),
@@ -275,6 +336,11 @@ urlpatterns = [
         LingoTileDetailView.as_view(),
         name="api-lingo-tile",
     ),
+    path(
+        "api/lingo/identifiers/resolve",
+        BulkIdentifierResolveView.as_view(),
+        name="api-lingo-identifiers-resolve",
+    ),
     path(
         "api/lingo/schemes/<slug:scheme_identifier>/resolve",
         IdentifierResolveView.as_view(),
@@ -0,0 +1,159 @@
+"""Point-in-time revert of every resource in a scheme or concept set."""
+
+from datetime import datetime, timezone
+from itertools import groupby
+
+from django.db import transaction
+from django.db.models import Q, TextField
+from django.db.models.functions import Cast
+
+from arches.app.models import models
+
+from arches_lingo.const import CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID
+from arches_lingo.etl_modules.lingo_bulk_operations import LingoBulkOperations
+from arches_lingo.functions.reciprocal_relationship import deferred_reciprocal_sync
+from arches_lingo.models import ConceptSetMember
+from arches_lingo.utils.edit_log import (
+    bulk_revert_resource_to_timestamp,
+    get_tile_edits,
+)
+
+BULK_REVERT_OPERATION = "Lingo Bulk Revert"
+BULK_REVERT_CHUNK_SIZE = 100
+EDIT_LOG_STREAM_CHUNK_SIZE = 2000
+
+
+def get_scope_filter(scheme_id=None, concept_set_id=None) -> Q:
+    """Return an ``EditLog`` filter matching the resources in a revert scope.
+
+    A scheme scope covers the scheme itself and every concept that is part of
+    it; a concept-set scope covers the set's members. Membership is expressed
+    as subqueries cast to text so they compare directly with
+    ``EditLog.resourceinstanceid`` without materializing the ID lists.
+    """
+    if concept_set_id is not None:
+        member_text_ids = (
+            ConceptSetMember.objects.filter(concept_set_id=concept_set_id)
+            .annotate(_id_text=Cast("concept_id", output_field=TextField()))
+            .values("_id_text")
+        )
+        return Q(resourceinstanceid__in=member_text_ids)
+
+    concept_text_ids = (
+        models.TileModel.objects.filter(
+            nodegroup_id=CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID,
+            data__contains={
+                CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID: [{"resourceId": str(scheme_id)}]
+            },
+        )
+        .annotate(_id_text=Cast("resourceinstance_id", output_field=TextField()))
+        .values("_id_text")
+    )
+    return Q(resourceinstanceid=str(scheme_id)) | Q(
+        resourceinstanceid__in=concept_text_ids
+    )
+
+
+def get_resources_edited_since(scope_filter, target_timestamp, after=None):
+    """Return the sorted IDs of in-scope resources with tile edits after the target."""
+    edited_resource_ids = models.EditLog.objects.filter(
+        scope_filter,
+        timestamp__gt=target_timestamp,
+        tileinstanceid__isnull=False,
+    )
+    if after:
+        edited_resource_ids = edited_resource_ids.filter(resourceinstanceid__gt=after)
+    return (
+        edited_resource_ids.order_by("resourceinstanceid")
+        .values_list("resourceinstanceid", flat=True)
+        .distinct()
+    )
+
+
+def iter_tile_edits_by_resource(resource_ids):
+    """Stream ``(resourceid, edits)`` groups in resource-id order.
+
+    Rows come from a server-side cursor, so only one resource's history is
+    held in memory at a time regardless of how many resources are reverted.
+    """
+    tile_edits = get_tile_edits(resource_ids).iterator(
+        chunk_size=EDIT_LOG_STREAM_CHUNK_SIZE
+    )
+    for resourceid, edits in groupby(tile_edits, key=lambda e: e.resourceinstanceid):
+        yield resourceid, list(edits)
+
+
+def run_bulk_revert(loadid, userid, chunk_size=BULK_REVERT_CHUNK_SIZE):
+    """Revert every resource recorded on the ``LoadEvent`` *loadid*.
+
+    Resources are processed in ID order and committed in chunks of
+    *chunk_size*. After each chunk the last resource ID is stored on the
+    load event in the same transaction, so a task restarted after a worker
+    crash resumes after the last committed chunk instead of from zero.
+    Reciprocal relationships touched by a chunk are synced in one batch
+    once it commits.
+    """
+    operation = LingoBulkOperations(loadid=loadid, userid=userid)
+    load_details = operation.get_details()
+    user = models.User.objects.get(id=userid)
+
+    target_timestamp = datetime.fromisoformat(load_details["target_timestamp"])
+    if target_timestamp.tzinfo is None:
+        target_timestamp = target_timestamp.replace(tzinfo=timezone.utc)
+
+    scope_filter = get_scope_filter(
+        scheme_id=load_details.get("scheme_id"),
+        concept_set_id=load_details.get("concept_set_id"),
+    )
+    last_resourceid = load_details.get("last_resourceid")
+    processed = load_details.get("processed", 0)
+    errors = load_details.get("errors", [])
+
+    if "total" not in load_details:
+        operation.update_details(
+            total=get_resources_edited_since(scope_filter, target_timestamp).count()
+        )
+
+    # Materialize the (sorted, deduplicated) ID list up front: it is small
+    # compared with the edit history and keeps the edit-log stream a plain
+    # ``IN`` query rather than a nested DISTINCT subquery.
+    resource_ids = list(
+        get_resources_edited_since(
+            scope_filter, target_timestamp, after=last_resourceid
+        )
+    )
+
+    for chunk_start in range(0, len(resource_ids), chunk_size):
+        chunk = resource_ids[chunk_start : chunk_start + chunk_size]
+        with deferred_reciprocal_sync(user), transaction.atomic():
+            for resourceid, edits in iter_tile_edits_by_resource(chunk):
+                resource_errors = bulk_revert_resource_to_timestamp(
+                    resourceid, target_timestamp, user, tile_edits=edits
+                )
+                errors.extend(
+                    {"resourceid": resourceid, "error": error}
+                    for error in resource_errors
+                )
+            processed += len(chunk)
+            operation.update_details(
+                processed=processed, last_resourceid=chunk[-1], errors=errors
+            )
+
+    operation.complete()
+    return errors
+
+
+def start_bulk_revert(user, target_timestamp, scheme_id=None, concept_set_id=None):
+    """Record a bulk revert on a new ``LoadEvent`` and dispatch it; return the loadid."""
+    from arches_lingo import tasks
+
+    operation = LingoBulkOperations(userid=user.id)
+    operation.start(
+        BULK_REVERT_OPERATION,
+        target_timestamp=target_timestamp.isoformat(),
+        scheme_id=str(scheme_id) if scheme_id else None,
+        concept_set_id=concept_set_id,
+        processed=0,
+    )
+    operation.dispatch(tasks.revert_resources_to_timestamp_task)
+    return operation.loadid
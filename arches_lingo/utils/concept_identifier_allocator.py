@@ -1,16 +1,32 @@
-from django.db import transaction
+from django.db import connection, transaction
 
 from arches_lingo.models import ConceptIdentifierCounter
 
+# Advances the counter by count in one locked statement and returns the first
+# reserved number.
+RESERVE_RANGE_SQL = f"""
+    UPDATE {ConceptIdentifierCounter._meta.db_table}
+    SET next_number = next_number + %(count)s
+    WHERE scheme_resource_instance_id = %(scheme_id)s
+    RETURNING next_number - %(count)s
+"""
 
-def allocate_concept_identifier_number(scheme_resource_instance_id, count=1):
-    with transaction.atomic():
-        counter_record = ConceptIdentifierCounter.objects.select_for_update().get(
-            scheme_id=scheme_resource_instance_id
-        )
 
-        allocated_number = counter_record.next_number
-        counter_record.next_number = allocated_number + count
-        counter_record.save(update_fields=["next_number"])
+def allocate_concept_identifier_range(scheme_resource_instance_id, count):
+    """Reserve *count* consecutive identifier numbers in one locked update.
 
-        return allocated_number
+    Intended for bulk paths (lifecycle promotion, scheme cloning) that need
+    many numbers at once. Returns a ``range`` of exactly *count* numbers.
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            RESERVE_RANGE_SQL,
+            {"scheme_id": str(scheme_resource_instance_id), "count": count},
+        )
+        row = cursor.fetchone()
+    if row is None:
+        raise ConceptIdentifierCounter.DoesNotExist(
+            "ConceptIdentifierCounter not found for the given scheme."
+        )
+    (start_number,) = row
+    return range(start_number, start_number + count)
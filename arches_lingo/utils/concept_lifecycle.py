@@ -1,14 +1,39 @@
+import logging
 import uuid
+from collections import namedtuple
 
-from arches.app.models.models import ResourceInstance, TileModel
-from arches.app.models.tile import Tile
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef, Q
+
+from arches.app.models.models import (
+    ResourceInstance,
+    ResourceInstanceLifecycleState,
+    TileModel,
+)
 
 from arches_lingo.const import (
     CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID,
     CLASSIFICATION_STATUS_NODEGROUP,
+    CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID,
+    RELATION_STATUS_NODEGROUP,
     TOP_CONCEPT_OF_NODE_AND_NODEGROUP,
 )
+from arches_lingo.functions.reciprocal_relationship import (
+    deferred_reciprocal_sync,
+    queue_reciprocal_change,
+)
+from arches_lingo.models import ConceptSetMember
+from arches_lingo.utils.concept_reindex import (
+    index_resource_ids,
+    start_concept_reindex,
+)
+from arches_lingo.utils.edit_log import (
+    refresh_tile_resource_relationships,
+    write_tile_edit_log_entries,
+)
 
+logger = logging.getLogger(__name__)
 
 DRAFT_STATE_ID = uuid.UUID("0e7f8c6d-1f7b-4c2a-9a0c-2b9e0d6c8f11")
 EDITING_STATE_ID = uuid.UUID("b3a6a0d2-2b5c-4c2f-9d6c-0c2a5b7d1e8f")
@@ -20,6 +45,33 @@ STRATEGY_ORPHAN = "orphan"
 
 VALID_STRATEGIES = {STRATEGY_REPARENT, STRATEGY_DELETE_CHILDREN, STRATEGY_ORPHAN}
 
+BULK_BATCH_SIZE = 1000
+
+LIFECYCLE_STATE_EDIT_TYPE = "update_resource_instance_lifecycle_state"
+
+ConceptTransitionResult = namedtuple(
+    "ConceptTransitionResult", ["concept_ids", "reindex_loadid"]
+)
+
+# Seeded from the root; each level finds the concepts whose classification
+# contains one of the previous level's concepts. The containment test on the
+# classification node is served by the partial GIN index from 0013, so only
+# the subtree's tiles are read however many concepts the database holds.
+DESCENDANTS_SQL = """
+    WITH RECURSIVE descendants(concept_id) AS (
+        SELECT %(concept_id)s::uuid
+      UNION
+        SELECT t.resourceinstanceid
+        FROM descendants d
+        JOIN tiles t
+          ON t.nodegroupid = %(nodegroup_id)s::uuid
+         AND t.tiledata -> %(node_id)s @> jsonb_build_array(
+                jsonb_build_object('resourceId', d.concept_id::text)
+             )
+    )
+    SELECT concept_id FROM descendants WHERE concept_id <> %(concept_id)s::uuid
+"""
+
 
 def get_narrower_ids(concept_id: str) -> set[str]:
     return {
@@ -72,36 +124,45 @@ def get_scheme_id_if_top_concept(concept_id: str) -> str | None:
 
 
 def get_all_descendant_ids(concept_id: str) -> set[str]:
-    descendant_ids = set()
-    frontier = {concept_id}
-
-    while frontier:
-        next_frontier = set()
-        for ancestor_id in frontier:
-            next_frontier.update(get_narrower_ids(ancestor_id))
-
-        new_descendant_ids = next_frontier - descendant_ids - {concept_id}
-        descendant_ids.update(new_descendant_ids)
-        frontier = new_descendant_ids
-
-    return descendant_ids
+    """Return every concept below concept_id in one recursive CTE round-trip.
 
+    UNION (not UNION ALL) de-duplicates diamonds and stops on cycles.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            DESCENDANTS_SQL,
+            {
+                "node_id": str(CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID),
+                "nodegroup_id": str(CLASSIFICATION_STATUS_NODEGROUP),
+                "concept_id": str(concept_id),
+            },
+        )
+        return {str(row[0]) for row in cursor.fetchall()}
 
-def reparent_children(concept_id: str, parent_ids: set[str], scheme_id: str | None):
-    """Move children of concept_id up to its parents.
 
-    If the concept being removed was itself a top concept, children with no
-    remaining broader parent are promoted to top concepts of the same scheme.
-    """
-    child_classification_tiles = TileModel.objects.filter(
+def get_child_classification_tiles(concept_id: str):
+    return TileModel.objects.filter(
         nodegroup_id=CLASSIFICATION_STATUS_NODEGROUP,
         **{
             f"data__{CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID}__contains": [
                 {"resourceId": concept_id}
             ]
         },
-    )
-    for classification_tile in child_classification_tiles:
+    ).only("tileid", "resourceinstance_id", "nodegroup_id", "data")
+
+
+def plan_child_rewrites(concept_id: str, parent_ids: set[str], scheme_id: str | None):
+    """Work out how the children of concept_id change when it is removed.
+
+    Returns ``(updates, deletes, promotions)``: classification tiles paired
+    with their new broader references, classification tiles left with no
+    broader reference, and the IDs of children to promote to top concepts of
+    scheme_id. Nothing is written.
+    """
+    updates = []
+    deletes = []
+    promotions = []
+    for classification_tile in get_child_classification_tiles(concept_id):
         existing_broader_references = (
             classification_tile.data.get(
                 CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID
@@ -118,124 +179,388 @@ def reparent_children(concept_id: str, parent_ids: set[str], scheme_id: str | No
             resource_reference.get("resourceId")
             for resource_reference in updated_broader_references
         }
-        for parent_id in parent_ids:
-            if parent_id not in already_referenced_parent_ids:
-                updated_broader_references.append({"resourceId": parent_id})
+        for parent_id in sorted(parent_ids - already_referenced_parent_ids):
+            updated_broader_references.append({"resourceId": parent_id})
 
         if updated_broader_references:
-            tile = Tile.objects.get(tileid=classification_tile.tileid)
-            tile.data = {
-                **tile.data,
-                CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID: updated_broader_references,
-            }
-            tile.save(request=None)
+            updates.append((classification_tile, updated_broader_references))
         else:
-            classification_tile.delete()
-
+            deletes.append(classification_tile)
             if scheme_id:
-                Tile(
-                    resourceinstance_id=classification_tile.resourceinstance_id,
-                    nodegroup_id=TOP_CONCEPT_OF_NODE_AND_NODEGROUP,
-                    data={
-                        TOP_CONCEPT_OF_NODE_AND_NODEGROUP: [{"resourceId": scheme_id}]
-                    },
-                ).save(request=None)
-
-
-def orphan_children(concept_id: str):
-    """Remove concept_id as a broader parent from all its children."""
-    child_classification_tiles = TileModel.objects.filter(
-        nodegroup_id=CLASSIFICATION_STATUS_NODEGROUP,
-        **{
-            f"data__{CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID}__contains": [
-                {"resourceId": concept_id}
-            ]
-        },
-    )
+                promotions.append(classification_tile.resourceinstance_id)
 
-    for classification_tile in child_classification_tiles:
-        existing_broader_references = (
-            classification_tile.data.get(
-                CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID
+    return updates, deletes, promotions
+
+
+def apply_child_rewrites(plan, scheme_id: str | None, user=None) -> set[str]:
+    """Write a plan from plan_child_rewrites in a fixed number of queries.
+
+    Tiles are bulk-updated, deleted and created without ``Tile.save``, so
+    resource relationships are refreshed and edit-log rows written here in
+    bulk. Returns the IDs of the concepts whose tiles changed.
+    """
+    updates, deletes, promotions = plan
+    edit_log_entries = []
+
+    tiles_to_update = []
+    for classification_tile, updated_broader_references in updates:
+        previous_data = classification_tile.data
+        classification_tile.data = {
+            **previous_data,
+            CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID: updated_broader_references,
+        }
+        tiles_to_update.append(classification_tile)
+        edit_log_entries.append(
+            _edit_log_entry(
+                classification_tile,
+                "tile edit",
+                previous_data,
+                classification_tile.data,
             )
-            or []
         )
+    TileModel.objects.bulk_update(tiles_to_update, ["data"], batch_size=BULK_BATCH_SIZE)
 
-        updated_broader_references = [
-            resource_reference
-            for resource_reference in existing_broader_references
-            if resource_reference.get("resourceId") != concept_id
-        ]
+    if deletes:
+        edit_log_entries.extend(
+            _edit_log_entry(tile, "tile delete", tile.data, None) for tile in deletes
+        )
+        TileModel.objects.filter(pk__in=[tile.pk for tile in deletes]).delete()
+
+    tiles_to_create = [
+        TileModel(
+            resourceinstance_id=resourceinstance_id,
+            nodegroup_id=TOP_CONCEPT_OF_NODE_AND_NODEGROUP,
+            parenttile_id=None,
+            data={TOP_CONCEPT_OF_NODE_AND_NODEGROUP: [{"resourceId": scheme_id}]},
+            sortorder=0,
+            provisionaledits=None,
+        )
+        for resourceinstance_id in promotions
+    ]
+    TileModel.objects.bulk_create(tiles_to_create, batch_size=BULK_BATCH_SIZE)
+    edit_log_entries.extend(
+        _edit_log_entry(tile, "tile create", None, tile.data)
+        for tile in tiles_to_create
+    )
 
-        if updated_broader_references:
-            tile = Tile.objects.get(tileid=classification_tile.tileid)
-            tile.data = {
-                **tile.data,
-                CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID: updated_broader_references,
-            }
-            tile.save(request=None)
-        else:
-            classification_tile.delete()
+    refresh_tile_resource_relationships(
+        [tile.pk for tile in tiles_to_update + tiles_to_create]
+    )
+    write_tile_edit_log_entries(edit_log_entries, user)
 
+    return {str(entry["resourceid"]) for entry in edit_log_entries}
 
-def delete_concept(concept: ResourceInstance, strategy: str | None):
-    concept_id = str(concept.pk)
 
-    if strategy == STRATEGY_DELETE_CHILDREN:
-        descendant_ids = get_all_descendant_ids(concept_id)
-        if (
-            ResourceInstance.objects.filter(pk__in=descendant_ids)
-            .exclude(resource_instance_lifecycle_state_id=DRAFT_STATE_ID)
-            .exists()
-        ):
-            raise ValueError(
-                "One or more descendant concepts have been published and cannot be deleted."
+def _edit_log_entry(tile, edittype, oldvalue, newvalue):
+    return {
+        "resourceid": tile.resourceinstance_id,
+        "tileid": tile.pk,
+        "nodegroupid": tile.nodegroup_id,
+        "edittype": edittype,
+        "oldvalue": oldvalue,
+        "newvalue": newvalue,
+    }
+
+
+def reparent_children(
+    concept_id: str, parent_ids: set[str], scheme_id: str | None, user=None
+) -> set[str]:
+    """Move children of concept_id up to its parents.
+
+    If the concept being removed was itself a top concept, children with no
+    remaining broader parent are promoted to top concepts of the same scheme.
+    Returns the IDs of the children that changed.
+    """
+    return apply_child_rewrites(
+        plan_child_rewrites(concept_id, parent_ids, scheme_id), scheme_id, user
+    )
+
+
+def orphan_children(concept_id: str, user=None) -> set[str]:
+    """Remove concept_id as a broader parent from all its children.
+
+    Returns the IDs of the children that changed.
+    """
+    return apply_child_rewrites(
+        plan_child_rewrites(concept_id, set(), None), None, user
+    )
+
+
+def schedule_concept_reindex(resource_ids):
+    """Reindex resource_ids in a single bulk call once the transaction commits.
+
+    The writes are committed by then, so an indexing error is logged rather
+    than raised to the caller.
+    """
+    resource_ids = list(resource_ids)
+    if not resource_ids:
+        return
+
+    def reindex():
+        try:
+            index_resource_ids(resource_ids)
+        except Exception:
+            logger.exception("Reindexing %d concepts failed", len(resource_ids))
+
+    transaction.on_commit(reindex)
+
+
+def preview_concept_removal(concept_id: str) -> dict:
+    """Report how many rows each strategy would touch if concept_id were removed.
+
+    Uses the same planning as the write path; nothing is written.
+    """
+    concept_id = str(concept_id)
+    descendant_ids = get_all_descendant_ids(concept_id)
+    scheme_id = get_scheme_id_if_top_concept(concept_id)
+
+    def _counts(plan):
+        updates, deletes, promotions = plan
+        return {
+            "classification_tiles_updated": len(updates),
+            "classification_tiles_deleted": len(deletes),
+            "top_concept_tiles_created": len(promotions),
+        }
+
+    return {
+        STRATEGY_REPARENT: _counts(
+            plan_child_rewrites(concept_id, get_broader_ids(concept_id), scheme_id)
+        ),
+        STRATEGY_ORPHAN: _counts(plan_child_rewrites(concept_id, set(), None)),
+        STRATEGY_DELETE_CHILDREN: {
+            "descendant_concepts": len(descendant_ids),
+            "descendant_tiles": TileModel.objects.filter(
+                resourceinstance_id__in=descendant_ids
+            ).count(),
+            "published_descendants": ResourceInstance.objects.filter(
+                pk__in=descendant_ids
             )
-        ResourceInstance.objects.filter(pk__in=descendant_ids).delete()
+            .exclude(resource_instance_lifecycle_state_id=DRAFT_STATE_ID)
+            .count(),
+        },
+    }
 
-    elif strategy == STRATEGY_REPARENT:
-        reparent_children(
-            concept_id,
-            get_broader_ids(concept_id),
-            get_scheme_id_if_top_concept(concept_id),
+
+def queue_relation_counterpart_deletes(resource_ids):
+    """Queue the counterparts of the relation tiles on resource_ids for
+    deletion, ahead of deleting the resources with a cascade that bypasses
+    ``Tile.delete``. Must be called inside ``deferred_reciprocal_sync``."""
+    for resourceinstance_id, data in TileModel.objects.filter(
+        nodegroup_id=RELATION_STATUS_NODEGROUP,
+        resourceinstance_id__in=resource_ids,
+    ).values_list("resourceinstance_id", "data"):
+        queue_reciprocal_change(
+            resourceinstance_id, RELATION_STATUS_NODEGROUP, data, None
         )
 
-    elif strategy == STRATEGY_ORPHAN:
-        orphan_children(concept_id)
 
-    concept.delete()
+def delete_concept(concept: ResourceInstance, strategy: str | None, user=None):
+    """Delete concept, applying strategy to its children.
+
+    Relation counterparts on surviving concepts are removed in one batch
+    after commit. Returns the IDs of surviving concepts whose tiles changed,
+    for reindexing.
+    """
+    concept_id = str(concept.pk)
+    changed_concept_ids = set()
+
+    with deferred_reciprocal_sync(user):
+        if strategy == STRATEGY_DELETE_CHILDREN:
+            descendant_ids = get_all_descendant_ids(concept_id)
+            if (
+                ResourceInstance.objects.filter(pk__in=descendant_ids)
+                .exclude(resource_instance_lifecycle_state_id=DRAFT_STATE_ID)
+                .exists()
+            ):
+                raise ValueError(
+                    "One or more descendant concepts have been published and cannot be deleted."
+                )
+            queue_relation_counterpart_deletes(descendant_ids)
+            ResourceInstance.objects.filter(pk__in=descendant_ids).delete()
+
+        elif strategy == STRATEGY_REPARENT:
+            changed_concept_ids = reparent_children(
+                concept_id,
+                get_broader_ids(concept_id),
+                get_scheme_id_if_top_concept(concept_id),
+                user=user,
+            )
+
+        elif strategy == STRATEGY_ORPHAN:
+            changed_concept_ids = orphan_children(concept_id, user=user)
+
+        queue_relation_counterpart_deletes([concept_id])
+        concept.delete()
+    return changed_concept_ids
 
 
-def retire_concept(concept: ResourceInstance, strategy: str | None):
+def retire_concept(concept: ResourceInstance, strategy: str | None, user=None):
+    """Retire concept, applying strategy to its children.
+
+    Returns the IDs of other concepts that changed, for reindexing.
+    """
     concept_id = str(concept.pk)
+    changed_concept_ids = set()
 
     if strategy == STRATEGY_DELETE_CHILDREN:
         descendant_ids = get_all_descendant_ids(concept_id)
         ResourceInstance.objects.filter(pk__in=descendant_ids).update(
             resource_instance_lifecycle_state_id=RETIRED_STATE_ID
         )
+        changed_concept_ids = descendant_ids
 
     elif strategy == STRATEGY_REPARENT:
-        reparent_children(
+        changed_concept_ids = reparent_children(
             concept_id,
             get_broader_ids(concept_id),
             get_scheme_id_if_top_concept(concept_id),
+            user=user,
         )
 
     elif strategy == STRATEGY_ORPHAN:
-        orphan_children(concept_id)
+        changed_concept_ids = orphan_children(concept_id, user=user)
 
     concept.resource_instance_lifecycle_state_id = RETIRED_STATE_ID
     concept.save(update_fields=["resource_instance_lifecycle_state"])
+    return changed_concept_ids
 
 
-def unretire_concept(concept: ResourceInstance, cascade: bool):
-    if cascade:
-        descendant_ids = get_all_descendant_ids(str(concept.pk))
-        ResourceInstance.objects.filter(
-            pk__in=descendant_ids,
-            resource_instance_lifecycle_state_id=RETIRED_STATE_ID,
-        ).update(resource_instance_lifecycle_state_id=EDITING_STATE_ID)
+def get_scheme_concept_ids(scheme_id) -> set[str]:
+    """Return the IDs of concepts that are part of, or top concepts of, a scheme."""
+    scheme_id = str(scheme_id)
+    return {
+        str(pk)
+        for pk in TileModel.objects.filter(
+            Q(
+                nodegroup_id=CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID,
+                **{
+                    f"data__{CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID}__contains": [
+                        {"resourceId": scheme_id}
+                    ]
+                },
+            )
+            | Q(
+                nodegroup_id=TOP_CONCEPT_OF_NODE_AND_NODEGROUP,
+                **{
+                    f"data__{TOP_CONCEPT_OF_NODE_AND_NODEGROUP}__contains": [
+                        {"resourceId": scheme_id}
+                    ]
+                },
+            )
+        )
+        .values_list("resourceinstance_id", flat=True)
+        .distinct()
+    }
 
-    concept.resource_instance_lifecycle_state_id = EDITING_STATE_ID
-    concept.save(update_fields=["resource_instance_lifecycle_state"])
+
+def get_subtree_concept_ids(root_concept_id) -> set[str]:
+    """Return root_concept_id and the IDs of all its descendants."""
+    return {str(root_concept_id)} | get_all_descendant_ids(str(root_concept_id))
+
+
+def get_concept_set_concept_ids(concept_set_id) -> set[str]:
+    return {
+        str(pk)
+        for pk in ConceptSetMember.objects.filter(
+            concept_set_id=concept_set_id
+        ).values_list("concept_id", flat=True)
+    }
+
+
+def transition_concepts_lifecycle_state(
+    concept_ids, new_state_id, user=None, from_state_ids=None
+) -> ConceptTransitionResult:
+    """Move concept_ids to new_state_id as one set-based state change.
+
+    Only concepts currently in one of from_state_ids (when given) are moved.
+    Their current states are read, locked and checked against the allowed
+    lifecycle transitions in one query; a ValueError is raised before
+    anything is written if any transition is not allowed. The states are
+    then changed with one UPDATE and recorded in one edit-log batch.
+
+    Reindexing happens on commit, or, when more than
+    ``LINGO_BULK_REINDEX_BACKGROUND_THRESHOLD`` concepts changed and a user
+    is given, in a single background job whose loadid is returned.
+    """
+    concept_ids = [str(concept_id) for concept_id in concept_ids]
+    with transaction.atomic():
+        candidates = (
+            ResourceInstance.objects.select_for_update()
+            .filter(pk__in=concept_ids)
+            .exclude(resource_instance_lifecycle_state_id=new_state_id)
+        )
+        if from_state_ids is not None:
+            candidates = candidates.filter(
+                resource_instance_lifecycle_state_id__in=from_state_ids
+            )
+        candidates = list(
+            candidates.annotate(
+                transition_allowed=Exists(
+                    ResourceInstanceLifecycleState.objects.filter(
+                        pk=OuterRef("resource_instance_lifecycle_state_id"),
+                        next_resource_instance_lifecycle_states=new_state_id,
+                    )
+                )
+            ).values_list(
+                "pk", "resource_instance_lifecycle_state_id", "transition_allowed"
+            )
+        )
+
+        disallowed_state_ids = sorted(
+            {str(state_id) for _pk, state_id, allowed in candidates if not allowed}
+        )
+        if disallowed_state_ids:
+            raise ValueError(
+                "Concepts in lifecycle state(s) %s cannot move to state %s."
+                % (", ".join(disallowed_state_ids), new_state_id)
+            )
+        if not candidates:
+            return ConceptTransitionResult(set(), None)
+
+        changed_ids = {str(pk) for pk, _state_id, _allowed in candidates}
+        ResourceInstance.objects.filter(pk__in=changed_ids).update(
+            resource_instance_lifecycle_state_id=new_state_id
+        )
+        edit_transaction_id = write_tile_edit_log_entries(
+            [
+                {
+                    "resourceid": pk,
+                    "tileid": None,
+                    "nodegroupid": None,
+                    "edittype": LIFECYCLE_STATE_EDIT_TYPE,
+                    "oldvalue": str(state_id),
+                    "newvalue": str(new_state_id),
+                }
+                for pk, state_id, _allowed in candidates
+            ],
+            user,
+        )
+
+        reindex_loadid = None
+        if (
+            user is not None
+            and len(changed_ids) > settings.LINGO_BULK_REINDEX_BACKGROUND_THRESHOLD
+        ):
+            reindex_loadid = start_concept_reindex(user, edit_transaction_id)
+        else:
+            schedule_concept_reindex(changed_ids)
+
+    return ConceptTransitionResult(changed_ids, reindex_loadid)
+
+
+def bulk_unretire_concepts(concept_ids, user=None) -> ConceptTransitionResult:
+    """Move the retired concepts among concept_ids back to Editing."""
+    return transition_concepts_lifecycle_state(
+        concept_ids,
+        EDITING_STATE_ID,
+        user=user,
+        from_state_ids=[RETIRED_STATE_ID],
+    )
+
+
+def unretire_concept(
+    concept: ResourceInstance, cascade: bool, user=None
+) -> ConceptTransitionResult:
+    """Unretire concept and, with cascade, its retired descendants."""
+    concept_ids = get_subtree_concept_ids(concept.pk) if cascade else {str(concept.pk)}
+    return bulk_unretire_concepts(concept_ids, user=user)
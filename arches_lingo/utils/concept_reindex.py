@@ -0,0 +1,72 @@
+"""Background, checkpointed reindexing of resources changed in one bulk edit."""
+
+from django.db import transaction
+
+from arches.app.models import models
+from arches.app.models.resource import Resource
+from arches.app.utils.index_database import index_resources_using_singleprocessing
+
+from arches_lingo.etl_modules.lingo_bulk_operations import LingoBulkOperations
+
+CONCEPT_REINDEX_OPERATION = "Lingo Concept Reindex"
+CONCEPT_REINDEX_CHUNK_SIZE = 1000
+
+
+def index_resource_ids(resource_ids):
+    """Index the resources in *resource_ids* with one bulk indexer."""
+    index_resources_using_singleprocessing(
+        Resource.objects.filter(pk__in=resource_ids), quiet=True
+    )
+
+
+def run_concept_reindex(loadid, userid, chunk_size=CONCEPT_REINDEX_CHUNK_SIZE):
+    """Reindex every resource touched by the edit-log transaction on *loadid*.
+
+    The resources are read back from the edit log rather than stored on the
+    load event, so the job is the same size whether it covers ten concepts
+    or a whole scheme. Each chunk goes through the bulk indexer that
+    ``index_resources_by_transaction`` uses and is checkpointed, so a
+    restarted task resumes after the last indexed chunk.
+    """
+    operation = LingoBulkOperations(loadid=loadid, userid=userid)
+    load_details = operation.get_details()
+    last_resourceid = load_details.get("last_resourceid")
+    processed = load_details.get("processed", 0)
+
+    resource_ids = models.EditLog.objects.filter(
+        transactionid=load_details["edit_transaction_id"]
+    )
+    if last_resourceid:
+        resource_ids = resource_ids.filter(resourceinstanceid__gt=last_resourceid)
+    resource_ids = list(
+        resource_ids.order_by("resourceinstanceid")
+        .values_list("resourceinstanceid", flat=True)
+        .distinct()
+    )
+    if "total" not in load_details:
+        operation.update_details(total=len(resource_ids))
+
+    for chunk_start in range(0, len(resource_ids), chunk_size):
+        chunk = resource_ids[chunk_start : chunk_start + chunk_size]
+        index_resource_ids(chunk)
+        processed += len(chunk)
+        operation.update_details(processed=processed, last_resourceid=chunk[-1])
+
+    operation.complete()
+
+
+def start_concept_reindex(user, edit_transaction_id):
+    """Record a reindex on a new ``LoadEvent``; dispatch it on commit.
+
+    Returns the loadid.
+    """
+    from arches_lingo import tasks
+
+    operation = LingoBulkOperations(userid=user.id)
+    operation.start(
+        CONCEPT_REINDEX_OPERATION,
+        edit_transaction_id=str(edit_transaction_id),
+        processed=0,
+    )
+    transaction.on_commit(lambda: operation.dispatch(tasks.reindex_concepts_task))
+    return operation.loadid
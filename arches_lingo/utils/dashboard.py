@@ -61,8 +61,8 @@ def parse_scheme_ids(request) -> list:
     return scheme_ids
 
 
-def parse_days_param(request):
-    """Parse the optional ``days`` query param into a cutoff datetime."""
+def parse_days(request):
+    """Parse the optional ``days`` query param into a positive int (or ``None``)."""
     days_param = request.GET.get("days")
     if days_param is None:
         return None
@@ -70,8 +70,13 @@ def parse_days_param(request):
         days_int = int(days_param)
     except ValueError:
         raise ValueError(_("days must be an integer"))
-    if days_int > 0:
-        return timezone.now() - timedelta(days=days_int)
+    return days_int if days_int > 0 else None
+
+
+def days_to_cutoff(days):
+    """Convert a ``days`` window into a cutoff datetime (``None`` for no cutoff)."""
+    if days:
+        return timezone.now() - timedelta(days=days)
     return None
 
 
@@ -342,6 +347,43 @@ def attach_activity_labels(activity: list) -> None:
         item["labels"] = labels_map.get(item["resource_id"], [])
 
 
+def build_dashboard_stats(scheme_ids: list, days) -> dict:
+    """
+    Compute the shareable dashboard statistics body.
+
+    The result depends only on *scheme_ids* and *days*, never on the
+    requesting user, so it can be cached and served to every editor.
+    """
+    total_scheme_count = models.ResourceInstance.objects.filter(
+        graph_id=SCHEMES_GRAPH_ID
+    ).count()
+    scheme_count = len(scheme_ids) if scheme_ids else total_scheme_count
+
+    concept_count, concept_qs = get_concept_ids(scheme_ids)
+    resolved_scheme_ids = scheme_ids or get_all_scheme_ids()
+
+    recent_activity = build_recent_activity(
+        concept_qs, resolved_scheme_ids, days_to_cutoff(days)
+    )
+    attach_activity_labels(recent_activity)
+
+    concepts_by_type = get_concept_type_breakdown(concept_qs, concept_count)
+    label_count, labels_by_type, labels_by_language = get_label_stats(concept_qs)
+
+    labels_per_concept = round(label_count / concept_count, 1) if concept_count else 0
+
+    return {
+        "scheme_count": scheme_count,
+        "concept_count": concept_count,
+        "concepts_by_type": concepts_by_type,
+        "label_count": label_count,
+        "labels_per_concept": labels_per_concept,
+        "labels_by_type": labels_by_type,
+        "labels_by_language": labels_by_language,
+        "recent_activity": recent_activity,
+    }
+
+
 def get_missing_translation_ids(
     language_code: str,
     scheme_ids: list,
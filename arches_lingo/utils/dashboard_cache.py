@@ -0,0 +1,128 @@
+"""Stale-while-revalidate response cache for the Lingo dashboard statistics."""
+
+import hashlib
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+import arches.app.utils.task_management as task_management
+
+from arches_lingo.utils.dashboard import build_dashboard_stats
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_CACHE_ALIAS = "lingo"
+DASHBOARD_CACHE_KEY_PREFIX = "lingo-dashboard-stats"
+# How often a request waiting for another request's cold-miss build polls
+DASHBOARD_CACHE_WAIT_SECONDS = 0.1
+
+
+def get_dashboard_cache_settings() -> tuple:
+    """Return ``(fresh_seconds, stale_seconds, lock_seconds)`` from settings."""
+    return (
+        getattr(settings, "LINGO_DASHBOARD_CACHE_TIMEOUT", 300),
+        getattr(settings, "LINGO_DASHBOARD_CACHE_STALE_TIMEOUT", 3600),
+        getattr(settings, "LINGO_DASHBOARD_CACHE_LOCK_TIMEOUT", 120),
+    )
+
+
+def build_dashboard_cache_key(scheme_ids: list, days) -> str:
+    """
+    Return the cache key for a ``(scheme set, days)`` pair.
+
+    Scheme IDs are sorted so that ``?scheme=a&scheme=b`` and
+    ``?scheme=b&scheme=a`` share an entry; the digest keeps keys within
+    memcached's length limit however many schemes are selected.
+    """
+    raw_key = ",".join(sorted(scheme_ids)) + "|" + str(days or 0)
+    digest = hashlib.sha1(raw_key.encode("utf-8")).hexdigest()
+    return f"{DASHBOARD_CACHE_KEY_PREFIX}:{digest}"
+
+
+def _store_dashboard_stats(cache, cache_key: str, scheme_ids: list, days) -> dict:
+    fresh_seconds, stale_seconds, _lock_seconds = get_dashboard_cache_settings()
+    body = build_dashboard_stats(scheme_ids, days)
+    cache.set(
+        cache_key,
+        {"computed_at": time.time(), "body": body},
+        fresh_seconds + stale_seconds,
+    )
+    return body
+
+
+def refresh_dashboard_stats(cache_key: str, scheme_ids: list, days) -> None:
+    """Recompute a stale entry, then release the lock taken to schedule it."""
+    cache = caches[DASHBOARD_CACHE_ALIAS]
+    try:
+        _store_dashboard_stats(cache, cache_key, scheme_ids, days)
+    except Exception:
+        logger.exception("Failed to refresh dashboard stats for %s", cache_key)
+    finally:
+        cache.delete(f"{cache_key}:lock")
+
+
+def _refresh_in_background(cache_key: str, scheme_ids: list, days) -> None:
+    """Hand a stale entry to a celery worker, or refresh it on this request
+    when celery is not running."""
+    # Prevent circular import
+    from arches_lingo.tasks import refresh_dashboard_stats_task
+
+    if task_management.check_if_celery_available():
+        refresh_dashboard_stats_task.delay(cache_key, scheme_ids, days)
+    else:
+        refresh_dashboard_stats(cache_key, scheme_ids, days)
+
+
+def _build_on_miss(cache, cache_key: str, scheme_ids: list, days) -> dict:
+    """Compute a missing entry once: the request that takes the lock builds
+    it while concurrent requests wait for it to appear."""
+    _fresh_seconds, _stale_seconds, lock_seconds = get_dashboard_cache_settings()
+    lock_key = f"{cache_key}:lock"
+    if cache.add(lock_key, True, lock_seconds):
+        try:
+            return _store_dashboard_stats(cache, cache_key, scheme_ids, days)
+        finally:
+            cache.delete(lock_key)
+
+    deadline = time.monotonic() + lock_seconds
+    while time.monotonic() < deadline:
+        time.sleep(DASHBOARD_CACHE_WAIT_SECONDS)
+        entry = cache.get(cache_key)
+        if entry is not None:
+            return entry["body"]
+        if cache.get(lock_key) is None:
+            # The builder failed or its lock expired
+            break
+    return _store_dashboard_stats(cache, cache_key, scheme_ids, days)
+
+
+def get_dashboard_stats(scheme_ids: list, days) -> dict:
+    """
+    Return the shared dashboard body for *scheme_ids* and *days*.
+
+    Fresh entries are returned as-is. Stale entries are returned immediately
+    while a single celery task recomputes them: ``cache.add`` on the lock key
+    is atomic, so only the first worker to see the stale entry schedules the
+    rebuild. Without celery that request rebuilds the entry itself. On a
+    miss the same lock lets one request compute the body while the others
+    wait for it. Setting ``LINGO_DASHBOARD_CACHE_TIMEOUT`` to 0 disables
+    caching.
+    """
+    fresh_seconds, _stale_seconds, lock_seconds = get_dashboard_cache_settings()
+    if not fresh_seconds:
+        return build_dashboard_stats(scheme_ids, days)
+
+    cache = caches[DASHBOARD_CACHE_ALIAS]
+    cache_key = build_dashboard_cache_key(scheme_ids, days)
+    entry = cache.get(cache_key)
+
+    if entry is None:
+        return _build_on_miss(cache, cache_key, scheme_ids, days)
+
+    if time.time() - entry["computed_at"] > fresh_seconds:
+        if cache.add(f"{cache_key}:lock", True, lock_seconds):
+            _refresh_in_background(cache_key, scheme_ids, days)
+
+    return entry["body"]
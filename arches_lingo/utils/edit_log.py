@@ -1,103 +1,289 @@
 import uuid
-from datetime import timezone
+from collections import namedtuple
+from datetime import datetime, timezone
 
+from django.db import connection, transaction
+from django.db.models import F, Max, Q
+from django.utils import timezone as django_timezone
 from django.utils.translation import gettext as _
 
 from arches.app.models import models
 from arches.app.models.card import Card
+from arches.app.models.resource import Resource
 from arches.app.models.tile import Tile
 
 from arches_lingo.const import EDIT_TYPE_LABELS
+from arches_lingo.functions.reciprocal_relationship import (
+    deferred_reciprocal_sync,
+    queue_reciprocal_change,
+)
+from arches_lingo.utils.tile_snapshots import get_nearest_snapshot
 
 
-def build_permitted_edit_log(resource_instance, user):
-    """Return a list of serialized edit dicts for resource_instance, filtered by user permissions."""
+EDIT_LOG_CURSOR_SEPARATOR = "|"
+
+
+def parse_edit_log_filters(request) -> dict:
+    """Parse the optional edit-log filter query params.
+
+    Supported params: ``edittype`` (repeatable), ``userid``, ``nodegroupid``,
+    ``since`` and ``until`` (ISO 8601; naive values are treated as UTC).
+    Raises ``ValueError`` for malformed values.
+    """
+    filters = {}
+    edit_types = request.GET.getlist("edittype")
+    if edit_types:
+        filters["edittype__in"] = edit_types
+    if userid := request.GET.get("userid"):
+        filters["userid"] = userid
+    if nodegroupid := request.GET.get("nodegroupid"):
+        try:
+            filters["nodegroupid"] = str(uuid.UUID(nodegroupid))
+        except ValueError:
+            raise ValueError(_("nodegroupid must be a valid UUID"))
+    for param, lookup in (("since", "timestamp__gte"), ("until", "timestamp__lte")):
+        if value := request.GET.get(param):
+            try:
+                parsed = datetime.fromisoformat(value)
+            except ValueError:
+                raise ValueError(
+                    _("%(param)s must be an ISO 8601 timestamp") % {"param": param}
+                )
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            filters[lookup] = parsed
+    return filters
+
+
+def encode_edit_log_cursor(edit) -> str:
+    """Return an opaque cursor pointing just after *edit*.
+
+    Edits without a timestamp sort last and have an empty timestamp part.
+    """
+    timestamp_text = edit.timestamp.isoformat() if edit.timestamp else ""
+    return f"{timestamp_text}{EDIT_LOG_CURSOR_SEPARATOR}{edit.editlogid}"
+
+
+def decode_edit_log_cursor(cursor: str) -> tuple:
+    """Return ``(timestamp or None, editlogid)`` from an encoded cursor."""
+    try:
+        timestamp_text, editlogid = cursor.rsplit(EDIT_LOG_CURSOR_SEPARATOR, 1)
+        timestamp = datetime.fromisoformat(timestamp_text) if timestamp_text else None
+        return timestamp, uuid.UUID(editlogid)
+    except ValueError:
+        raise ValueError(_("cursor is invalid"))
+
+
+def edits_after_cursor(edits, cursor: str):
+    """Filter *edits*, ordered by ``(timestamp NULLS LAST, editlogid)``, to
+    those after *cursor*."""
+    cursor_timestamp, cursor_editlogid = decode_edit_log_cursor(cursor)
+    after_in_null_timestamps = Q(timestamp__isnull=True, editlogid__gt=cursor_editlogid)
+    if cursor_timestamp is None:
+        return edits.filter(after_in_null_timestamps)
+    return edits.filter(
+        Q(timestamp__gt=cursor_timestamp)
+        | Q(timestamp=cursor_timestamp, editlogid__gt=cursor_editlogid)
+        | Q(timestamp__isnull=True)
+    )
+
+
+def get_denied_nodegroup_ids(edits, user) -> list:
+    """Return the nodegroup IDs among *edits* that *user* may not read.
+
+    Permissions are resolved once per distinct nodegroup rather than once
+    per edit, so the check costs O(nodegroups) regardless of history size.
+    """
+    return get_unreadable_nodegroup_ids(
+        edits.exclude(nodegroupid__isnull=True)
+        .exclude(nodegroupid="")
+        .values_list("nodegroupid", flat=True)
+        .distinct(),
+        user,
+    )
+
+
+def get_unreadable_nodegroup_ids(nodegroup_ids, user) -> list:
+    """Return those of *nodegroup_ids* that *user* may not read, as strings."""
+    nodegroups = models.NodeGroup.objects.filter(
+        pk__in={uuid.UUID(str(nodegroupid)) for nodegroupid in nodegroup_ids}
+    )
+    return [
+        str(nodegroup.pk)
+        for nodegroup in nodegroups
+        if not user.has_perm("read_nodegroup", nodegroup)
+    ]
+
+
+def filter_readable_changes(changes, user) -> list:
+    """Drop revert preview changes in nodegroups *user* may not read."""
+    denied_nodegroup_ids = set(
+        get_unreadable_nodegroup_ids(
+            {change["nodegroupid"] for change in changes if change["nodegroupid"]},
+            user,
+        )
+    )
+    return [
+        change
+        for change in changes
+        if change["nodegroupid"] not in denied_nodegroup_ids
+    ]
+
+
+def serialize_edit(edit, card_name_by_nodegroup_id: dict) -> dict:
+    return {
+        "editlogid": str(edit.editlogid),
+        "transactionid": (str(edit.transactionid) if edit.transactionid else None),
+        "edittype": edit.edittype,
+        "edittype_label": EDIT_TYPE_LABELS.get(edit.edittype, edit.edittype),
+        "timestamp": edit.timestamp.isoformat() if edit.timestamp else None,
+        "userid": edit.userid,
+        "user_firstname": edit.user_firstname,
+        "user_lastname": edit.user_lastname,
+        "user_username": edit.user_username,
+        "user_email": edit.user_email,
+        "nodegroupid": edit.nodegroupid,
+        "tileinstanceid": edit.tileinstanceid,
+        "card_name": (
+            card_name_by_nodegroup_id.get(edit.nodegroupid)
+            if edit.nodegroupid
+            else None
+        ),
+        "note": edit.note,
+    }
+
+
+def build_permitted_edit_log_page(
+    resource_instance,
+    user,
+    *,
+    filters: dict | None = None,
+    cursor: str | None = None,
+    page_size: int | None = None,
+) -> dict:
+    """Return ``{"edits": [...], "next_cursor": str | None}`` for resource_instance.
+
+    Edits are ordered by ``(timestamp, editlogid)`` ascending, with edits
+    that have no timestamp last. Filtering,
+    permission exclusion and the cursor are all applied in SQL, so only one
+    page of rows is ever loaded. When *page_size* is ``None`` every matching
+    edit is returned and ``next_cursor`` is ``None``.
+    """
     edits = models.EditLog.objects.filter(
-        resourceinstanceid=str(resource_instance.pk)
-    ).order_by("timestamp")
+        resourceinstanceid=str(resource_instance.pk), **(filters or {})
+    )
+
+    denied_nodegroup_ids = get_denied_nodegroup_ids(edits, user)
+    if denied_nodegroup_ids:
+        edits = edits.exclude(nodegroupid__in=denied_nodegroup_ids)
+
+    if cursor:
+        edits = edits_after_cursor(edits, cursor)
+
+    edits = edits.order_by(F("timestamp").asc(nulls_last=True), "editlogid")
+    next_cursor = None
+    if page_size is not None:
+        page = list(edits[: page_size + 1])
+        if len(page) > page_size:
+            page = page[:page_size]
+            next_cursor = encode_edit_log_cursor(page[-1])
+        edits = page
 
     card_name_by_nodegroup_id = {
         str(card.nodegroup_id): card.name
         for card in Card.objects.filter(graph=resource_instance.graph)
     }
 
-    nodegroups_by_id = models.NodeGroup.objects.filter(
-        pk__in=[uuid.UUID(edit.nodegroupid) for edit in edits if edit.nodegroupid]
-    ).in_bulk()
+    return {
+        "edits": [serialize_edit(edit, card_name_by_nodegroup_id) for edit in edits],
+        "next_cursor": next_cursor,
+    }
 
-    permitted_edits = []
-    for edit in edits:
-        if edit.nodegroupid:
-            nodegroup = nodegroups_by_id.get(uuid.UUID(edit.nodegroupid))
-            if nodegroup and not user.has_perm("read_nodegroup", nodegroup):
-                continue
 
-        permitted_edits.append(
-            {
-                "editlogid": str(edit.editlogid),
-                "transactionid": (
-                    str(edit.transactionid) if edit.transactionid else None
-                ),
-                "edittype": edit.edittype,
-                "edittype_label": EDIT_TYPE_LABELS.get(edit.edittype, edit.edittype),
-                "timestamp": edit.timestamp.isoformat() if edit.timestamp else None,
-                "userid": edit.userid,
-                "user_firstname": edit.user_firstname,
-                "user_lastname": edit.user_lastname,
-                "user_username": edit.user_username,
-                "user_email": edit.user_email,
-                "nodegroupid": edit.nodegroupid,
-                "tileinstanceid": edit.tileinstanceid,
-                "card_name": (
-                    card_name_by_nodegroup_id.get(edit.nodegroupid)
-                    if edit.nodegroupid
-                    else None
-                ),
-                "note": edit.note,
-            }
+def build_permitted_edit_log(resource_instance, user, **kwargs):
+    """Return a list of serialized edit dicts for resource_instance, filtered by user permissions."""
+    return build_permitted_edit_log_page(resource_instance, user, **kwargs)["edits"]
+
+
+def get_tile_edits(resource_ids):
+    """Return tile edits for *resource_ids*, ordered by resource then timestamp."""
+    return (
+        models.EditLog.objects.filter(
+            resourceinstanceid__in=resource_ids,
+            tileinstanceid__isnull=False,
+            timestamp__isnull=False,
         )
+        .exclude(tileinstanceid="")
+        .order_by("resourceinstanceid", "timestamp")
+    )
 
-    return permitted_edits
 
+# Stands in for an edit-log row when a tile's state at the target comes from
+# a snapshot rather than from an edit.
+SnapshotTileState = namedtuple(
+    "SnapshotTileState", ["edittype", "newvalue", "nodegroupid"]
+)
 
-def revert_resource_to_timestamp(resourceid, target_timestamp, request):
-    """Revert all tiles for resourceid to their state at target_timestamp.
+# Sentinel for revert steps that have no recorded state to restore.
+NO_RECORDED_STATE = object()
 
-    target_timestamp may be naive (interpreted as UTC) or timezone-aware.
-    Returns a list of error strings. An empty list means full success.
+
+def _as_utc(timestamp):
+    return timestamp.replace(tzinfo=timestamp.tzinfo or timezone.utc)
+
+
+def build_revert_plan(resourceid, target_timestamp, tile_edits=None) -> list:
+    """Return ``(tileid, nodegroupid, last_edit_before_target)`` steps for a revert.
+
+    The edit log is replayed in a single chronological pass: for every tile
+    touched after *target_timestamp* we keep the last edit at or before it
+    (``None`` if the tile did not exist yet). Steps are ordered by nodegroup
+    depth so parent tiles are processed before their children — otherwise a
+    child tile that needs recreation would fail because its parent hasn't
+    been restored yet.
+
+    *tile_edits* may supply the resource's tile edits, already ordered by
+    timestamp, so callers streaming many resources avoid a query per resource.
+    Otherwise, when a tile snapshot exists at or before the target, only the
+    edits after that snapshot are read and the snapshot supplies the state of
+    tiles not edited between the snapshot and the target.
     """
     if target_timestamp.tzinfo is None:
         target_timestamp = target_timestamp.replace(tzinfo=timezone.utc)
 
-    all_tile_edits_chronological = list(
-        models.EditLog.objects.filter(
-            resourceinstanceid=str(resourceid),
-            tileinstanceid__isnull=False,
-        )
-        .exclude(tileinstanceid="")
-        .order_by("timestamp")
-    )
-
-    affected_tile_ids = {
-        edit.tileinstanceid
-        for edit in all_tile_edits_chronological
-        if edit.timestamp is not None
-        and edit.timestamp.replace(tzinfo=edit.timestamp.tzinfo or timezone.utc)
-        > target_timestamp
-    }
+    snapshot = None
+    if tile_edits is None:
+        snapshot = get_nearest_snapshot(resourceid, target_timestamp)
+        tile_edits = get_tile_edits([str(resourceid)])
+        if snapshot:
+            tile_edits = tile_edits.filter(timestamp__gt=snapshot.snapshot_time)
+        tile_edits = tile_edits.iterator()
+
+    affected_tile_ids = set()
+    last_edit_before_target_by_tileid = {}
+    tileid_to_nodegroupid = {}
+    for edit in tile_edits:
+        if edit.nodegroupid:
+            tileid_to_nodegroupid[edit.tileinstanceid] = edit.nodegroupid
+        if _as_utc(edit.timestamp) > target_timestamp:
+            affected_tile_ids.add(edit.tileinstanceid)
+        else:
+            last_edit_before_target_by_tileid[edit.tileinstanceid] = edit
+
+    if snapshot:
+        for tileid, snapshot_tile in snapshot.tiles.items():
+            nodegroupid = snapshot_tile["nodegroupid"]
+            tileid_to_nodegroupid.setdefault(tileid, nodegroupid)
+            last_edit_before_target_by_tileid.setdefault(
+                tileid,
+                SnapshotTileState("tile edit", snapshot_tile["data"], nodegroupid),
+            )
 
-    # Build a nodegroup depth map so parent tiles are processed before their
-    # children — otherwise a child tile that needs recreation will fail because
-    # its parent hasn't been restored yet.
-    tileid_to_nodegroupid = {
-        edit.tileinstanceid: edit.nodegroupid
-        for edit in all_tile_edits_chronological
-        if edit.nodegroupid
-    }
-    unique_nodegroup_ids = set(tileid_to_nodegroupid.values())
     nodegroups_by_id = {
         str(ng.pk): ng
-        for ng in models.NodeGroup.objects.filter(pk__in=unique_nodegroup_ids)
+        for ng in models.NodeGroup.objects.filter(
+            pk__in=set(tileid_to_nodegroupid.values())
+        )
     }
 
     def _nodegroup_depth(tileid):
@@ -108,40 +294,332 @@ def revert_resource_to_timestamp(resourceid, target_timestamp, request):
             nodegroup = nodegroups_by_id.get(str(nodegroup.parentnodegroup_id))
         return depth
 
-    errors = []
-    for tileid in sorted(affected_tile_ids, key=_nodegroup_depth):
-        tile_edits_at_or_before_target = [
-            edit
-            for edit in all_tile_edits_chronological
-            if edit.tileinstanceid == tileid
-            and edit.timestamp is not None
-            and edit.timestamp.replace(tzinfo=edit.timestamp.tzinfo or timezone.utc)
-            <= target_timestamp
-        ]
+    return [
+        (
+            tileid,
+            tileid_to_nodegroupid.get(tileid),
+            last_edit_before_target_by_tileid.get(tileid),
+        )
+        for tileid in sorted(affected_tile_ids, key=_nodegroup_depth)
+    ]
 
-        last_edit_before_target = (
-            tile_edits_at_or_before_target[-1]
-            if tile_edits_at_or_before_target
-            else None
+
+def _target_state(last_edit_before_target):
+    """Return the tile data to restore, ``None`` to delete, or ``NO_RECORDED_STATE``."""
+    if (
+        last_edit_before_target is None
+        or last_edit_before_target.edittype == "tile delete"
+    ):
+        # Tile either didn't exist yet or was already deleted at the target time.
+        return None
+    if not last_edit_before_target.newvalue:
+        return NO_RECORDED_STATE
+    return last_edit_before_target.newvalue
+
+
+def preview_revert_resource_to_timestamp(
+    resourceid, target_timestamp, tile_edits=None
+) -> list:
+    """Return the changes a revert to target_timestamp would make, without applying them.
+
+    Each change is a dict with ``tileid``, ``nodegroupid``, ``action``
+    (``"create"``, ``"update"`` or ``"delete"``), the ``current`` and ``target``
+    tile data, and the ``changed_nodes`` whose values differ. Tiles whose
+    current data already matches the target state are omitted.
+    """
+    plan = build_revert_plan(resourceid, target_timestamp, tile_edits)
+    current_data_by_tileid = {
+        str(tileid): data
+        for tileid, data in models.TileModel.objects.filter(
+            pk__in=[tileid for tileid, _nodegroupid, _edit in plan]
+        ).values_list("tileid", "data")
+    }
+
+    changes = []
+    for tileid, nodegroupid, last_edit_before_target in plan:
+        target = _target_state(last_edit_before_target)
+        if target is NO_RECORDED_STATE:
+            continue
+        current = current_data_by_tileid.get(tileid)
+        if target is None:
+            if current is None:
+                continue
+            action = "delete"
+        elif current is None:
+            action = "create"
+        elif current == target:
+            continue
+        else:
+            action = "update"
+
+        changed_nodes = sorted(
+            node_id
+            for node_id in set(current or {}) | set(target or {})
+            if (current or {}).get(node_id) != (target or {}).get(node_id)
+        )
+        changes.append(
+            {
+                "tileid": tileid,
+                "nodegroupid": nodegroupid,
+                "action": action,
+                "current": current,
+                "target": target,
+                "changed_nodes": changed_nodes,
+            }
         )
+    return changes
+
+
+def revert_resource_to_timestamp(resourceid, target_timestamp, request):
+    """Revert all tiles for resourceid to their state at target_timestamp.
 
-        if (
-            last_edit_before_target is None
-            or last_edit_before_target.edittype == "tile delete"
+    target_timestamp may be naive (interpreted as UTC) or timezone-aware.
+    Returns a list of error strings. An empty list means full success.
+    Reciprocal relationship tiles touched by the revert are synced in one
+    batch after commit.
+    """
+    errors = []
+    with deferred_reciprocal_sync(request.user):
+        for tileid, _nodegroupid, last_edit_before_target in build_revert_plan(
+            resourceid, target_timestamp
         ):
-            # Tile either didn't exist yet or was already deleted at the target time.
-            error = _delete_tile_by_id(tileid, request)
-        else:
-            error = _revert_tile_to_state_at_edit(
-                tileid, last_edit_before_target, resourceid, request
+            if _target_state(last_edit_before_target) is None:
+                error = _delete_tile_by_id(tileid, request)
+            else:
+                error = _revert_tile_to_state_at_edit(
+                    tileid, last_edit_before_target, resourceid, request
+                )
+
+            if error:
+                errors.append(error)
+
+    return errors
+
+
+def bulk_revert_resource_to_timestamp(
+    resourceid, target_timestamp, user, tile_edits=None
+):
+    """Revert resourceid to target_timestamp as one batch.
+
+    Unlike ``revert_resource_to_timestamp`` this bypasses ``Tile.save`` and
+    ``Tile.delete``: the changes computed by
+    ``preview_revert_resource_to_timestamp`` are written with bulk queries in
+    a single transaction, edit-log rows are inserted in one batch, and the
+    resource is reindexed once after commit. Tile functions do not run;
+    reciprocal relationship tiles are instead queued for
+    ``deferred_reciprocal_sync``. Recreated tiles take their sortorder from
+    the nearest snapshot at or before the target, or else go after their
+    siblings, as ``Tile.save`` would place them.
+
+    Returns a list of error strings. An empty list means full success; on
+    any error nothing is written.
+    """
+    changes = preview_revert_resource_to_timestamp(
+        resourceid, target_timestamp, tile_edits
+    )
+    if not changes:
+        return []
+
+    changes_by_action = {"create": [], "update": [], "delete": []}
+    for change in changes:
+        changes_by_action[change["action"]].append(change)
+
+    parent_nodegroup_by_nodegroup_id = {
+        str(nodegroup_id): str(parent_id) if parent_id else None
+        for nodegroup_id, parent_id in models.NodeGroup.objects.filter(
+            pk__in={change["nodegroupid"] for change in changes_by_action["create"]}
+        ).values_list("pk", "parentnodegroup_id")
+    }
+
+    snapshot_tiles = {}
+    if changes_by_action["create"]:
+        snapshot = get_nearest_snapshot(resourceid, target_timestamp)
+        snapshot_tiles = snapshot.tiles if snapshot else {}
+
+    errors = []
+    with deferred_reciprocal_sync(user), transaction.atomic():
+        deleted_tile_ids = [change["tileid"] for change in changes_by_action["delete"]]
+        models.TileModel.objects.filter(pk__in=deleted_tile_ids).delete()
+
+        tiles_to_update = list(
+            models.TileModel.objects.filter(
+                pk__in=[change["tileid"] for change in changes_by_action["update"]]
+            )
+        )
+        target_by_tileid = {
+            change["tileid"]: change["target"] for change in changes_by_action["update"]
+        }
+        for tile in tiles_to_update:
+            tile.data = target_by_tileid[str(tile.pk)]
+        models.TileModel.objects.bulk_update(tiles_to_update, ["data"])
+
+        # Changes are already depth-ordered, so a parent recreated in this
+        # batch is registered before any of its children look it up.
+        tile_id_by_nodegroup_id = {
+            str(nodegroup_id): tile_id
+            for tile_id, nodegroup_id in models.TileModel.objects.filter(
+                resourceinstance_id=str(resourceid),
+                nodegroup_id__in={
+                    parent_id
+                    for parent_id in parent_nodegroup_by_nodegroup_id.values()
+                    if parent_id
+                },
+            ).values_list("tileid", "nodegroup_id")
+        }
+        next_sortorder = {}
+        tiles_to_create = []
+        for change in changes_by_action["create"]:
+            parent_nodegroup_id = parent_nodegroup_by_nodegroup_id.get(
+                change["nodegroupid"]
+            )
+            parent_tile_id = None
+            if parent_nodegroup_id:
+                parent_tile_id = tile_id_by_nodegroup_id.get(parent_nodegroup_id)
+                if parent_tile_id is None:
+                    errors.append(
+                        _(
+                            "Cannot restore nested tile %(tileid)s: "
+                            "no parent tile exists for nodegroup %(nodegroupid)s."
+                        )
+                        % {
+                            "tileid": change["tileid"],
+                            "nodegroupid": parent_nodegroup_id,
+                        }
+                    )
+                    continue
+            tile_id_by_nodegroup_id.setdefault(change["nodegroupid"], change["tileid"])
+            sortorder = snapshot_tiles.get(change["tileid"], {}).get("sortorder")
+            if sortorder is None:
+                sortorder = _next_sibling_sortorder(
+                    next_sortorder, resourceid, change["nodegroupid"], parent_tile_id
+                )
+            tiles_to_create.append(
+                models.TileModel(
+                    tileid=uuid.UUID(change["tileid"]),
+                    resourceinstance_id=str(resourceid),
+                    nodegroup_id=change["nodegroupid"],
+                    parenttile_id=parent_tile_id,
+                    data=change["target"],
+                    sortorder=sortorder,
+                    provisionaledits=None,
+                )
             )
 
-        if error:
-            errors.append(error)
+        if errors:
+            transaction.set_rollback(True)
+            return errors
+
+        models.TileModel.objects.bulk_create(tiles_to_create)
+
+        refresh_tile_resource_relationships(
+            [tile.pk for tile in tiles_to_create + tiles_to_update]
+        )
+
+        write_revert_edit_log_entries(resourceid, changes, target_timestamp, user)
+
+        for change in changes:
+            queue_reciprocal_change(
+                resourceid, change["nodegroupid"], change["current"], change["target"]
+            )
+
+        transaction.on_commit(lambda: Resource.objects.get(pk=resourceid).index())
 
     return errors
 
 
+def _next_sibling_sortorder(next_sortorder, resourceid, nodegroupid, parent_tile_id):
+    """Return the sortorder after the last existing sibling tile, counting
+    tiles already placed in this batch via *next_sortorder*."""
+    key = (nodegroupid, parent_tile_id)
+    if key not in next_sortorder:
+        last_sortorder = models.TileModel.objects.filter(
+            resourceinstance_id=str(resourceid),
+            nodegroup_id=nodegroupid,
+            parenttile_id=parent_tile_id,
+        ).aggregate(last=Max("sortorder"))["last"]
+        next_sortorder[key] = -1 if last_sortorder is None else last_sortorder
+    next_sortorder[key] += 1
+    return next_sortorder[key]
+
+
+def refresh_tile_resource_relationships(tile_ids):
+    """Rebuild resource-x-resource rows for tiles written without ``Tile.save``."""
+    if not tile_ids:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT __arches_refresh_tile_resource_relationships(tileid)
+            FROM unnest(%s::uuid[]) AS tileid
+            """,
+            [list(tile_ids)],
+        )
+
+
+def write_tile_edit_log_entries(entries, user, note=None, transaction_id=None):
+    """Insert edit-log rows for tile changes made outside ``Tile.save``.
+
+    Each entry is a dict with ``resourceid``, ``tileid``, ``nodegroupid``,
+    ``edittype``, ``oldvalue`` and ``newvalue``; ``tileid`` and
+    ``nodegroupid`` may be ``None`` for resource-level changes. All rows
+    share a single transaction id and timestamp; the id is *transaction_id*
+    when given (e.g. a load's id) and is returned. *user* may be ``None``
+    for system changes.
+    """
+    transaction_id = transaction_id or uuid.uuid4()
+    edit_timestamp = django_timezone.now()
+    userid = str(user.pk) if user is not None and user.pk else ""
+    models.EditLog.objects.bulk_create(
+        [
+            models.EditLog(
+                resourceinstanceid=str(entry["resourceid"]),
+                tileinstanceid=str(entry["tileid"]) if entry["tileid"] else None,
+                nodegroupid=(
+                    str(entry["nodegroupid"]) if entry["nodegroupid"] else None
+                ),
+                edittype=entry["edittype"],
+                oldvalue=entry["oldvalue"],
+                newvalue=entry["newvalue"],
+                timestamp=edit_timestamp,
+                userid=userid,
+                user_firstname=getattr(user, "first_name", ""),
+                user_lastname=getattr(user, "last_name", ""),
+                user_username=getattr(user, "username", ""),
+                user_email=getattr(user, "email", ""),
+                transactionid=transaction_id,
+                note=note,
+            )
+            for entry in entries
+        ]
+    )
+    return transaction_id
+
+
+def write_revert_edit_log_entries(resourceid, changes, target_timestamp, user):
+    """Insert one edit-log row per change, sharing a single transaction id."""
+    edit_type_by_action = {
+        "create": "tile create",
+        "update": "tile edit",
+        "delete": "tile delete",
+    }
+    write_tile_edit_log_entries(
+        [
+            {
+                "resourceid": resourceid,
+                "tileid": change["tileid"],
+                "nodegroupid": change["nodegroupid"],
+                "edittype": edit_type_by_action[change["action"]],
+                "oldvalue": change["current"],
+                "newvalue": change["target"],
+            }
+            for change in changes
+        ],
+        user,
+        note=_("Reverted to %(timestamp)s")
+        % {"timestamp": target_timestamp.isoformat()},
+    )
+
+
 def _delete_tile_by_id(tileid, request):
     """Delete a tile. Silently ignores DoesNotExist. Returns an error string on unexpected failure."""
     try:
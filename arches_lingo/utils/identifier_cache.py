@@ -0,0 +1,113 @@
+"""Cached identifier → resource id resolution for published Lingo URIs."""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from arches.app.models.models import ResourceIdentifier
+
+IDENTIFIER_CACHE_ALIAS = "lingo"
+IDENTIFIER_CACHE_KEY_PREFIX = "lingo-identifier"
+LINGO_IDENTIFIER_SOURCE = "arches-lingo"
+MAX_BULK_RESOLVE_IDENTIFIERS = 1000
+
+# Cached for identifiers with no resource, so repeated misses skip the query.
+NOT_FOUND = ""
+
+
+def get_identifier_cache_settings() -> tuple:
+    """Return ``(hit_seconds, miss_seconds)`` from settings."""
+    return (
+        getattr(settings, "LINGO_IDENTIFIER_CACHE_TIMEOUT", 3600),
+        getattr(settings, "LINGO_IDENTIFIER_NEGATIVE_CACHE_TIMEOUT", 60),
+    )
+
+
+def build_identifier_cache_key(identifier, source=LINGO_IDENTIFIER_SOURCE) -> str:
+    """Return the cache key for an identifier within a source (``None``: any)."""
+    raw_key = f"{source or '*'}|{identifier}"
+    digest = hashlib.sha1(raw_key.encode("utf-8")).hexdigest()
+    return f"{IDENTIFIER_CACHE_KEY_PREFIX}:{digest}"
+
+
+def _query_resource_ids(identifiers, source) -> dict:
+    """Map each identifier to its first resource id (by row id), in one query."""
+    resource_identifiers = ResourceIdentifier.objects.filter(identifier__in=identifiers)
+    if source:
+        resource_identifiers = resource_identifiers.filter(source=source)
+    resource_id_by_identifier = {}
+    for identifier, resource_id in resource_identifiers.order_by("pk").values_list(
+        "identifier", "resourceid"
+    ):
+        resource_id_by_identifier.setdefault(identifier, str(resource_id))
+    return resource_id_by_identifier
+
+
+def resolve_identifiers(identifiers, source=LINGO_IDENTIFIER_SOURCE) -> dict:
+    """Return ``{identifier: resource id or None}`` for *identifiers*.
+
+    Cached entries (including cached misses) are served from the ``lingo``
+    cache; everything else is resolved in a single query and cached, hits
+    and misses with their own timeouts.
+    """
+    identifiers = list(dict.fromkeys(identifiers))
+    cache = caches[IDENTIFIER_CACHE_ALIAS]
+    hit_seconds, miss_seconds = get_identifier_cache_settings()
+
+    key_by_identifier = {
+        identifier: build_identifier_cache_key(identifier, source)
+        for identifier in identifiers
+    }
+    cached = cache.get_many(list(key_by_identifier.values()))
+
+    resolved = {}
+    uncached_identifiers = []
+    for identifier, cache_key in key_by_identifier.items():
+        if cache_key in cached:
+            resolved[identifier] = cached[cache_key] or None
+        else:
+            uncached_identifiers.append(identifier)
+
+    if uncached_identifiers:
+        resource_id_by_identifier = _query_resource_ids(uncached_identifiers, source)
+        hits = {}
+        misses = {}
+        for identifier in uncached_identifiers:
+            resource_id = resource_id_by_identifier.get(identifier)
+            resolved[identifier] = resource_id
+            if resource_id:
+                hits[key_by_identifier[identifier]] = resource_id
+            else:
+                misses[key_by_identifier[identifier]] = NOT_FOUND
+        if hits and hit_seconds:
+            cache.set_many(hits, hit_seconds)
+        if misses and miss_seconds:
+            cache.set_many(misses, miss_seconds)
+
+    return resolved
+
+
+def resolve_identifier(identifier, source=LINGO_IDENTIFIER_SOURCE):
+    """Return the resource id for *identifier*, or ``None``."""
+    return resolve_identifiers([identifier], source)[identifier]
+
+
+def invalidate_identifiers(identifiers):
+    """Drop cached resolutions of *identifiers*; call after writing them."""
+    caches[IDENTIFIER_CACHE_ALIAS].delete_many(
+        [
+            build_identifier_cache_key(identifier, source)
+            for identifier in identifiers
+            if identifier
+            for source in (LINGO_IDENTIFIER_SOURCE, None)
+        ]
+    )
+
+
+def invalidate_identifiers_on_commit(identifiers):
+    """Drop cached resolutions of *identifiers* once the current transaction
+    commits, so a concurrent lookup cannot re-cache the pre-commit state."""
+    identifiers = list(identifiers)
+    transaction.on_commit(lambda: invalidate_identifiers(identifiers))
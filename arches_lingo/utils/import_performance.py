@@ -0,0 +1,114 @@
+"""Phase timings, row counts and memory use of thesaurus imports."""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def rss_kb():
+    """Current resident set size of this process, in KiB.
+
+    Returns None where /proc is not available (e.g. macOS and Windows).
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process over its whole lifetime, in
+    KiB. A long-lived worker reports the peak of earlier tasks too.
+
+    Returns None where the platform does not report it.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+# Phase keys that are not row counters ("peak_rss_kb" is in the phases of
+# reports written before phases recorded their current memory)
+NON_COUNTER_KEYS = ("seconds", "rss_kb", "peak_rss_kb")
+
+
+class ImportPerformance:
+    """Per-phase report of one import, kept in ``load_details``.
+
+    ``phases`` maps each phase name to its ``seconds``, the process's
+    resident memory (``rss_kb``) when it ended, and any row counters the
+    phase recorded. ``peak_rss_kb`` of the report is the process-lifetime
+    peak.
+    A resumed import starts from the report of the run it resumes, so
+    phases that are not repeated keep their original figures.
+    """
+
+    def __init__(self, report=None, on_update=None):
+        self.phases = dict((report or {}).get("phases", {}))
+        self.on_update = on_update
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block as phase *name*.
+
+        Yields a dict; counters stored in it are added to the phase.
+        """
+        counters = {}
+        started = time.perf_counter()
+        try:
+            yield counters
+        finally:
+            self.record(
+                name,
+                seconds=time.perf_counter() - started,
+                **counters,
+            )
+
+    def record(self, name, seconds, **counters):
+        self.phases[name] = {
+            "seconds": round(seconds, 3),
+            "rss_kb": rss_kb(),
+            **counters,
+        }
+        if self.on_update:
+            self.on_update(self.report())
+
+    def report(self):
+        return {
+            "phases": self.phases,
+            "total_seconds": round(
+                sum(phase["seconds"] for phase in self.phases.values()), 3
+            ),
+            "peak_rss_kb": peak_rss_kb(),
+        }
+
+    @staticmethod
+    def format(report):
+        """Render *report* as aligned text lines, e.g. for command output."""
+        lines = []
+        for name, phase in report.get("phases", {}).items():
+            counters = ", ".join(
+                f"{key}={value}"
+                for key, value in phase.items()
+                if key not in NON_COUNTER_KEYS
+            )
+            lines.append(
+                f"{name:<28}{phase['seconds']:>10.3f}s"
+                f"{phase.get('rss_kb') or 0:>12} KiB  {counters}".rstrip()
+            )
+        lines.append(f"{'total':<28}{report.get('total_seconds', 0):>10.3f}s")
+        lines.append(
+            f"{'process lifetime peak':<28}{'':>11}"
+            f"{report.get('peak_rss_kb') or 0:>12} KiB"
+        )
+        return lines
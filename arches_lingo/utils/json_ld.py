@@ -0,0 +1,39 @@
+"""JSON-LD parsing with PyLD, as rdflib 4.2 has no JSON-LD parser."""
+
+import json
+
+from pyld import jsonld
+from rdflib import BNode, Literal, URIRef
+from rdflib.namespace import XSD
+
+
+def _term(node):
+    """Return the rdflib term for one PyLD RDF *node*."""
+    if node["type"] == "IRI":
+        return URIRef(node["value"])
+    if node["type"] == "blank node":
+        return BNode(node["value"][len("_:") :])
+    if node.get("language"):
+        return Literal(node["value"], lang=node["language"])
+    if node["datatype"] == str(XSD.string):
+        # Plain literals, matching the other parsers
+        return Literal(node["value"])
+    return Literal(node["value"], datatype=URIRef(node["datatype"]))
+
+
+def iter_subject_statements(source):
+    """Yield ``(subject, [(predicate, object), ...])`` from JSON-LD *source*.
+
+    *source* is a binary file object. JSON-LD cannot be read incrementally,
+    so the whole document is converted to RDF first and each subject is
+    yielded once, whichever graph its triples are in. Objects are rdflib
+    terms, matching what a parsed ``Graph`` would return.
+    """
+    dataset = jsonld.to_rdf(json.load(source))
+    groups = {}
+    for triples in dataset.values():
+        for triple in triples:
+            groups.setdefault(_term(triple["subject"]), []).append(
+                (_term(triple["predicate"]), _term(triple["object"]))
+            )
+    yield from groups.items()
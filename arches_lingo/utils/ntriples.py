@@ -0,0 +1,115 @@
+"""Line-by-line N-Triples parsing for files too large to load as a graph."""
+
+import re
+
+from rdflib import BNode, Literal, URIRef
+
+_IRI = r"<([^>]*)>"
+_BNODE = r"_:(\S+?)"
+_LITERAL = r'"((?:[^"\\]|\\.)*)"(?:@([A-Za-z]+(?:-[A-Za-z0-9]+)*)|\^\^<([^>]*)>)?'
+TRIPLE = re.compile(
+    rf"\s*(?:{_IRI}|{_BNODE})\s*{_IRI}\s*(?:{_IRI}|{_BNODE}|{_LITERAL})\s*\.\s*(?:#.*)?$"
+)
+
+_ESCAPE = re.compile(r"\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))")
+_ESCAPED_CHARACTERS = {
+    "t": "\t",
+    "b": "\b",
+    "n": "\n",
+    "r": "\r",
+    "f": "\f",
+    '"': '"',
+    "'": "'",
+    "\\": "\\",
+}
+
+
+def _unescape_match(match):
+    code_point = match.group(1) or match.group(2)
+    if code_point:
+        return chr(int(code_point, 16))
+    return _ESCAPED_CHARACTERS[match.group(3)]
+
+
+def _unescape(text):
+    if "\\" not in text:
+        return text
+    return _ESCAPE.sub(_unescape_match, text)
+
+
+def parse_line(line):
+    """Return ``(subject, predicate, object)`` for one N-Triples *line*, or
+    None for a blank or comment line.
+
+    Raises ValueError if the line is not a triple.
+    """
+    stripped = line.strip()
+    if not stripped or stripped.startswith("#"):
+        return None
+    match = TRIPLE.match(stripped)
+    if match is None:
+        raise ValueError(stripped)
+    (
+        subject_iri,
+        subject_bnode,
+        predicate,
+        object_iri,
+        object_bnode,
+        literal,
+        language,
+        datatype,
+    ) = match.groups()
+    try:
+        subject = (
+            URIRef(_unescape(subject_iri))
+            if subject_iri is not None
+            else BNode(subject_bnode)
+        )
+        if object_iri is not None:
+            object = URIRef(_unescape(object_iri))
+        elif object_bnode is not None:
+            object = BNode(object_bnode)
+        else:
+            object = Literal(
+                _unescape(literal),
+                lang=language,
+                datatype=URIRef(_unescape(datatype)) if datatype else None,
+            )
+    except KeyError:
+        raise ValueError(stripped)
+    return subject, URIRef(_unescape(predicate)), object
+
+
+def iter_subject_statements(source):
+    """Yield ``(subject, [(predicate, object), ...])`` from N-Triples *source*.
+
+    *source* is a path or a binary file object. Consecutive triples about
+    the same subject are grouped, so a file sorted by subject, as dumps
+    usually are, yields each subject once; otherwise a subject is yielded
+    once per run of triples. Only the current group is held in memory.
+    Objects are rdflib terms, matching what a parsed ``Graph`` would return.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as file:
+            yield from iter_subject_statements(file)
+        return
+
+    subject = None
+    statements = []
+    for line_number, line in enumerate(source, start=1):
+        try:
+            triple = parse_line(line.decode("utf-8"))
+        except ValueError as error:
+            raise ValueError(
+                "Invalid N-Triples on line {}: {}".format(line_number, error)
+            ) from None
+        if triple is None:
+            continue
+        if triple[0] != subject:
+            if statements:
+                yield subject, statements
+            subject = triple[0]
+            statements = []
+        statements.append(triple[1:])
+    if statements:
+        yield subject, statements
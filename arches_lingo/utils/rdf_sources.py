@@ -0,0 +1,87 @@
+"""Read SKOS files in any supported RDF serialization as subject groups."""
+
+import gzip
+import os
+
+from rdflib import Graph
+
+from arches_lingo.utils import json_ld, ntriples, rdf_xml
+
+# File extension -> serialization. Each may also be gzipped, e.g. ".nt.gz".
+SKOS_IMPORT_FORMATS = {
+    ".xml": "xml",
+    ".nt": "nt",
+    ".ttl": "turtle",
+    ".jsonld": "json-ld",
+}
+GZIP_EXTENSION = ".gz"
+
+# Serializations read incrementally; the rest are parsed into memory
+STREAMING_PARSERS = {
+    "xml": rdf_xml.iter_subject_statements,
+    "nt": ntriples.iter_subject_statements,
+}
+
+
+def split_file_name(file_name):
+    """Return ``(name, serialization, gzipped)`` for an import *file_name*.
+
+    Raises ValueError if the extension is not a supported serialization.
+    """
+    name, extension = os.path.splitext(os.path.basename(file_name))
+    gzipped = extension.lower() == GZIP_EXTENSION
+    if gzipped:
+        name, extension = os.path.splitext(name)
+    try:
+        return name, SKOS_IMPORT_FORMATS[extension.lower()], gzipped
+    except KeyError:
+        raise ValueError(extension or file_name)
+
+
+def decompress(file, gzipped):
+    """Return a binary file object reading the contents of *file*."""
+    return gzip.GzipFile(fileobj=file, mode="rb") if gzipped else file
+
+
+def read_subject_groups(source, serialization):
+    """Return ``{subject: [(predicate, object), ...]}`` for all of *source*,
+    a binary file object in a serialization that cannot be streamed.
+    """
+    if serialization == "json-ld":
+        return dict(json_ld.iter_subject_statements(source))
+    graph = Graph()
+    graph.parse(source=source, format=serialization)
+    # Graph.subjects() repeats a subject once per triple
+    return {
+        subject: list(graph.predicate_objects(subject))
+        for subject in set(graph.subjects())
+    }
+
+
+def subject_statement_reader(source, serialization):
+    """Return a function yielding ``(subject, [(predicate, object), ...])``
+    groups from *source*, a seekable binary file object.
+
+    Each call reads *source* again from the start. Streaming
+    serializations are re-parsed on every call, holding one group at a
+    time; the others are parsed into memory on the first call only.
+    """
+    if serialization in STREAMING_PARSERS:
+        parser = STREAMING_PARSERS[serialization]
+
+        def read_streaming():
+            source.seek(0)
+            return parser(source)
+
+        return read_streaming
+
+    groups = None
+
+    def read_graph():
+        nonlocal groups
+        if groups is None:
+            source.seek(0)
+            groups = read_subject_groups(source, serialization)
+        yield from groups.items()
+
+    return read_graph
@@ -0,0 +1,140 @@
+"""Incremental RDF/XML parsing for files too large to load as a graph."""
+
+from urllib.parse import urljoin
+from xml.etree.ElementTree import iterparse, tostring
+
+from rdflib import BNode, Literal, URIRef
+
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+XML_NS = "http://www.w3.org/XML/1998/namespace"
+
+RDF_ROOT = "{%s}RDF" % RDF_NS
+RDF_DESCRIPTION = "{%s}Description" % RDF_NS
+RDF_TYPE = URIRef(RDF_NS + "type")
+RDF_TYPE_ATTRIBUTE = "{%s}type" % RDF_NS
+RDF_XML_LITERAL = URIRef(RDF_NS + "XMLLiteral")
+XML_BASE = "{%s}base" % XML_NS
+XML_LANG = "{%s}lang" % XML_NS
+
+
+def _rdf_attribute(element, name):
+    return element.get("{%s}%s" % (RDF_NS, name))
+
+
+def _uri_from_tag(tag):
+    namespace, _, local_name = tag[1:].partition("}")
+    return URIRef(namespace + local_name)
+
+
+def _scope(element, base, language):
+    """Apply the ``xml:base`` and ``xml:lang`` declared on *element*."""
+    if element.get(XML_BASE) is not None:
+        base = urljoin(base, element.get(XML_BASE))
+    # xml:lang="" resets the language for the element and its descendants
+    return base, element.get(XML_LANG, language) or None
+
+
+def _node_subject(element, base):
+    about = _rdf_attribute(element, "about")
+    if about is not None:
+        return URIRef(urljoin(base, about))
+    rdf_id = _rdf_attribute(element, "ID")
+    if rdf_id is not None:
+        return URIRef(urljoin(base, "#" + rdf_id))
+    node_id = _rdf_attribute(element, "nodeID")
+    return BNode(node_id) if node_id is not None else BNode()
+
+
+def _parse_node_element(element, base, language, groups, subject=None):
+    """Append ``(subject, statements)`` for *element* and any nested nodes.
+
+    Returns the subject so a parent property element can use it as its
+    object. When *subject* is given, *element* is a property element with
+    ``rdf:parseType="Resource"`` and its children describe that blank node.
+    """
+    base, language = _scope(element, base, language)
+    statements = []
+    if subject is None:
+        subject = _node_subject(element, base)
+        if element.tag != RDF_DESCRIPTION:
+            statements.append((RDF_TYPE, _uri_from_tag(element.tag)))
+        for name, value in element.attrib.items():
+            if not name.startswith("{") or name.startswith("{%s}" % XML_NS):
+                continue
+            if name.startswith("{%s}" % RDF_NS):
+                if name == RDF_TYPE_ATTRIBUTE:
+                    statements.append((RDF_TYPE, URIRef(urljoin(base, value))))
+                continue
+            statements.append((_uri_from_tag(name), Literal(value, lang=language)))
+
+    for property_element in element:
+        value = _parse_property_element(property_element, base, language, groups)
+        if value is not None:
+            statements.append((_uri_from_tag(property_element.tag), value))
+
+    groups.append((subject, statements))
+    return subject
+
+
+def _parse_property_element(element, base, language, groups):
+    base, language = _scope(element, base, language)
+    resource = _rdf_attribute(element, "resource")
+    if resource is not None:
+        return URIRef(urljoin(base, resource))
+    node_id = _rdf_attribute(element, "nodeID")
+    if node_id is not None:
+        return BNode(node_id)
+
+    parse_type = _rdf_attribute(element, "parseType")
+    if parse_type == "Resource":
+        return _parse_node_element(element, base, language, groups, BNode())
+    if parse_type == "Literal":
+        return Literal(
+            (element.text or "")
+            + "".join(tostring(child, encoding="unicode") for child in element),
+            datatype=RDF_XML_LITERAL,
+        )
+    if len(element):
+        return _parse_node_element(element[0], base, language, groups)
+
+    datatype = _rdf_attribute(element, "datatype")
+    if datatype is not None:
+        return Literal(element.text or "", datatype=URIRef(urljoin(base, datatype)))
+    return Literal(element.text or "", lang=language)
+
+
+def iter_subject_statements(source):
+    """Yield ``(subject, [(predicate, object), ...])`` from RDF/XML *source*.
+
+    *source* is a path or a binary file object. Statements are grouped by
+    the node element that describes them, so a subject described in more
+    than one place is yielded more than once. A node element nested inside
+    a property is yielded as its own group, and the parent's statement
+    points at its subject.
+
+    Each top-level node element is parsed once it closes and then cleared
+    from the tree, so memory is bounded by the largest top-level element
+    rather than the size of the file. Objects are rdflib terms, matching
+    what a parsed ``Graph`` would return.
+    """
+    root = None
+    base = ""
+    language = None
+    depth = 0
+    for event, element in iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+                base, language = _scope(root, base, language)
+            depth += 1
+            continue
+
+        depth -= 1
+        if root.tag == RDF_ROOT and depth != 1:
+            continue
+        if root.tag != RDF_ROOT and depth != 0:
+            continue
+        groups = []
+        _parse_node_element(element, base, language, groups)
+        yield from groups
+        root.clear()
@@ -0,0 +1,275 @@
+"""Audit and repair of reciprocal relationship tiles."""
+
+import csv
+import json
+import uuid
+from collections import namedtuple
+
+from django.db.models import Max
+from django.db.models.expressions import RawSQL
+
+from arches.app.models import models
+
+from arches_lingo.const import (
+    RELATION_STATUS_ASCRIBED_COMPARATE_NODEID,
+    RELATION_STATUS_NODEGROUP,
+)
+from arches_lingo.etl_modules.lingo_bulk_operations import LingoBulkOperations
+from arches_lingo.functions.reciprocal_relationship import (
+    ReciprocalRelationshipFunction,
+)
+
+RECIPROCAL_INTEGRITY_OPERATION = "Lingo Reciprocal Relationship Audit"
+AUDIT_STREAM_CHUNK_SIZE = 5000
+REPAIR_BATCH_SIZE = 1000
+# Issues stored on the load event; the command writes the full report.
+MAX_RECORDED_ISSUES = 1000
+
+# The counterpart is missing and the related resource exists.
+ORPHAN = "orphan"
+# Both tiles exist but their mirrored node values differ.
+MISMATCH = "mismatch"
+# The related resource no longer exists; reported, never repaired.
+DANGLING = "dangling"
+
+RelationIssue = namedtuple(
+    "RelationIssue",
+    ["kind", "tileid", "resourceid", "related_resourceid", "counterpart_tileid"],
+)
+
+COMPARATE_RESOURCE_ID_SQL = (
+    "coalesce(tiledata -> %s -> 0 ->> 'resourceId', tiledata -> %s ->> 'resourceId')"
+)
+
+
+def _mirrored_values_hash():
+    """Return an md5 of the mirrored node values, computed in the database.
+
+    ``jsonb`` renders with sorted keys, so equal values always hash equally;
+    missing and null nodes both render as ``null``, matching how counterpart
+    data is built.
+    """
+    mirrored_nodes = ReciprocalRelationshipFunction.MIRRORED_NODES
+    return RawSQL(
+        "md5(jsonb_build_array(%s)::text)"
+        % ", ".join(["tiledata -> %s"] * len(mirrored_nodes)),
+        mirrored_nodes,
+    )
+
+
+def _uuid_int(value):
+    try:
+        return uuid.UUID(str(value)).int
+    except ValueError:
+        return None
+
+
+def _iter_relation_tiles():
+    """Stream ``(tileid, resourceid, related resourceid, values hash)`` rows."""
+    return (
+        models.TileModel.objects.filter(nodegroup_id=RELATION_STATUS_NODEGROUP)
+        .annotate(
+            comparate_resource_id=RawSQL(
+                COMPARATE_RESOURCE_ID_SQL,
+                [
+                    RELATION_STATUS_ASCRIBED_COMPARATE_NODEID,
+                    RELATION_STATUS_ASCRIBED_COMPARATE_NODEID,
+                ],
+            ),
+            mirrored_values_hash=_mirrored_values_hash(),
+        )
+        .order_by("tileid")
+        .values_list(
+            "tileid",
+            "resourceinstance_id",
+            "comparate_resource_id",
+            "mirrored_values_hash",
+        )
+        .iterator(chunk_size=AUDIT_STREAM_CHUNK_SIZE)
+    )
+
+
+def _existing_resource_ids(resource_ids) -> set:
+    resource_ids = list(resource_ids)
+    existing = set()
+    for batch_start in range(0, len(resource_ids), REPAIR_BATCH_SIZE):
+        existing.update(
+            resourceid.int
+            for resourceid in models.ResourceInstance.objects.filter(
+                pk__in=[
+                    uuid.UUID(int=resource_id)
+                    for resource_id in resource_ids[
+                        batch_start : batch_start + REPAIR_BATCH_SIZE
+                    ]
+                ]
+            ).values_list("pk", flat=True)
+        )
+    return existing
+
+
+def audit_reciprocal_relationships() -> tuple:
+    """Find relation tiles whose counterpart is missing or has diverged.
+
+    Every relation tile is read in one streaming pass; only a tuple of
+    128-bit integers per tile is kept, keyed by ``(resource, related
+    resource)``. Mirrored values are compared by a hash computed in the
+    database, so no tile data is decoded in Python. When a resource has
+    several tiles pointing at the same resource, the first by tile id is
+    the one paired, as in ``sync_counterparts``.
+
+    Returns ``(relation tile count, issues)``; each mismatched pair is
+    reported once.
+    """
+    tiles_by_pair = {}
+    relation_tile_count = 0
+    for tileid, resourceid, related_resourceid, values_hash in _iter_relation_tiles():
+        relation_tile_count += 1
+        related = _uuid_int(related_resourceid) if related_resourceid else None
+        if related is None or related == resourceid.int:
+            continue
+        tiles_by_pair.setdefault(
+            (resourceid.int, related), (tileid.int, int(values_hash, 16))
+        )
+
+    missing_pairs = []
+    issues = []
+    for (resource, related), (tile, values_hash) in tiles_by_pair.items():
+        counterpart = tiles_by_pair.get((related, resource))
+        if counterpart is None:
+            missing_pairs.append((resource, related, tile))
+        elif counterpart[1] != values_hash and resource < related:
+            issues.append(
+                RelationIssue(
+                    MISMATCH,
+                    str(uuid.UUID(int=tile)),
+                    str(uuid.UUID(int=resource)),
+                    str(uuid.UUID(int=related)),
+                    str(uuid.UUID(int=counterpart[0])),
+                )
+            )
+    del tiles_by_pair
+
+    existing_resources = _existing_resource_ids(
+        {related for _resource, related, _tile in missing_pairs}
+    )
+    for resource, related, tile in missing_pairs:
+        issues.append(
+            RelationIssue(
+                ORPHAN if related in existing_resources else DANGLING,
+                str(uuid.UUID(int=tile)),
+                str(uuid.UUID(int=resource)),
+                str(uuid.UUID(int=related)),
+                None,
+            )
+        )
+
+    return relation_tile_count, issues
+
+
+def _latest_edit_times(tile_ids) -> dict:
+    return dict(
+        models.EditLog.objects.filter(tileinstanceid__in=tile_ids)
+        .values("tileinstanceid")
+        .annotate(latest=Max("timestamp"))
+        .values_list("tileinstanceid", "latest")
+    )
+
+
+def repair_reciprocal_relationships(issues, batch_size=REPAIR_BATCH_SIZE) -> int:
+    """Repair orphaned and mismatched relations; return the number repaired.
+
+    A missing counterpart is created from its source tile. For a mismatch
+    the tile edited most recently (per the edit log) is taken as the source
+    and the other side is overwritten; when neither was edited, the tile on
+    the lower resource id wins. Writes go through ``sync_counterparts`` in
+    batches of *batch_size*, so each batch is one set of bulk writes.
+    """
+    reciprocal_function = ReciprocalRelationshipFunction()
+    repairable = [issue for issue in issues if issue.kind in (ORPHAN, MISMATCH)]
+
+    repaired = 0
+    for batch_start in range(0, len(repairable), batch_size):
+        batch = repairable[batch_start : batch_start + batch_size]
+        edit_times = _latest_edit_times(
+            [issue.tileid for issue in batch if issue.kind == MISMATCH]
+            + [issue.counterpart_tileid for issue in batch if issue.kind == MISMATCH]
+        )
+
+        source_tile_ids = []
+        for issue in batch:
+            source_tile_id = issue.tileid
+            if issue.kind == MISMATCH:
+                tile_time = edit_times.get(issue.tileid)
+                counterpart_time = edit_times.get(issue.counterpart_tileid)
+                if counterpart_time and (
+                    tile_time is None or counterpart_time > tile_time
+                ):
+                    source_tile_id = issue.counterpart_tileid
+            source_tile_ids.append(source_tile_id)
+
+        source_tiles = models.TileModel.objects.in_bulk(source_tile_ids)
+        counterpart_changes = {}
+        for source_tile in source_tiles.values():
+            source_resource_id = str(source_tile.resourceinstance_id)
+            related_resource_id = reciprocal_function._get_related_resource_id(
+                source_tile.data.get(RELATION_STATUS_ASCRIBED_COMPARATE_NODEID)
+            )
+            counterpart_changes[(source_resource_id, related_resource_id)] = (
+                reciprocal_function._build_counterpart_data(
+                    source_tile, source_resource_id
+                )
+            )
+        reciprocal_function.sync_counterparts(counterpart_changes)
+        repaired += len(counterpart_changes)
+
+    return repaired
+
+
+def write_report(issues, stream, report_format="json"):
+    """Write *issues* to *stream* as a JSON array or CSV with a header row."""
+    if report_format == "csv":
+        writer = csv.writer(stream)
+        writer.writerow(RelationIssue._fields)
+        writer.writerows(issues)
+    else:
+        json.dump([issue._asdict() for issue in issues], stream, indent=2)
+        stream.write("\n")
+
+
+def summarize_issues(relation_tile_count, issues) -> dict:
+    summary = {"relation_tiles": relation_tile_count}
+    for kind in (ORPHAN, MISMATCH, DANGLING):
+        summary[kind] = sum(1 for issue in issues if issue.kind == kind)
+    return summary
+
+
+def run_reciprocal_integrity_audit(loadid, userid):
+    """Audit (and optionally repair) relations for the ``LoadEvent`` *loadid*.
+
+    Counts per issue kind and the first ``MAX_RECORDED_ISSUES`` issues are
+    stored on the load event.
+    """
+    operation = LingoBulkOperations(loadid=loadid, userid=userid)
+    load_details = operation.get_details()
+
+    relation_tile_count, issues = audit_reciprocal_relationships()
+    summary = summarize_issues(relation_tile_count, issues)
+    if load_details.get("repair"):
+        summary["repaired"] = repair_reciprocal_relationships(issues)
+
+    operation.complete(
+        **summary,
+        issues=[issue._asdict() for issue in issues[:MAX_RECORDED_ISSUES]],
+        issues_truncated=len(issues) > MAX_RECORDED_ISSUES,
+    )
+    return summary
+
+
+def start_reciprocal_integrity_audit(user, repair=False):
+    """Record an audit on a new ``LoadEvent`` and dispatch it; return the loadid."""
+    from arches_lingo import tasks
+
+    operation = LingoBulkOperations(userid=user.id)
+    operation.start(RECIPROCAL_INTEGRITY_OPERATION, repair=repair)
+    operation.dispatch(tasks.audit_reciprocal_relationships_task)
+    return operation.loadid
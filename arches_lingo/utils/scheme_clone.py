@@ -0,0 +1,412 @@
+"""Set-based deep copy of a scheme and its concepts."""
+
+import logging
+import uuid
+
+from django.db import connection, transaction
+from django.utils.translation import gettext as _
+
+from arches.app.models.models import (
+    Node,
+    ResourceIdentifier,
+    ResourceInstance,
+    TileModel,
+    User,
+)
+
+from arches_lingo.const import (
+    CONCEPTS_GRAPH_ID,
+    CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID,
+    IDENTIFIER_CONTENT_NODE,
+    IDENTIFIER_NODEGROUP,
+    SCHEME_IDENTIFIER_CONTENT_NODE,
+    SCHEME_IDENTIFIER_NODEGROUP,
+    SCHEMES_GRAPH_ID,
+    TOP_CONCEPT_OF_NODE_AND_NODEGROUP,
+    URI_NODEGROUP,
+)
+from arches_lingo.etl_modules.lingo_bulk_operations import LingoBulkOperations
+from arches_lingo.models import ConceptIdentifierCounter, SchemeURITemplate
+from arches_lingo.utils.concept_identifier_allocator import (
+    allocate_concept_identifier_range,
+)
+from arches_lingo.utils.concept_lifecycle import (
+    DRAFT_STATE_ID,
+    RETIRED_STATE_ID,
+    get_scheme_concept_ids,
+)
+from arches_lingo.utils.concept_reindex import run_concept_reindex
+from arches_lingo.utils.edit_log import write_tile_edit_log_entries
+from arches_lingo.utils.identifier_cache import invalidate_identifiers_on_commit
+
+logger = logging.getLogger(__name__)
+
+SCHEME_CLONE_OPERATION = "Lingo Scheme Clone"
+
+RESOURCE_MAP_TABLE = "lingo_clone_resource_map"
+TILE_MAP_TABLE = "lingo_clone_tile_map"
+
+# Membership nodes only keep references to the cloned scheme, so a concept
+# that is also listed in another scheme is not added to that scheme too.
+CLONED_SCHEME_ONLY_NODE_IDS = {
+    CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID,
+    TOP_CONCEPT_OF_NODE_AND_NODEGROUP,
+}
+
+# References to cloned resources are pointed at their copies; references to
+# anything else are kept. Every reference gets a new resourceXresourceId so
+# the copies' relationship rows never collide with the originals'.
+REWRITE_REFERENCES_SQL = f"""
+    UPDATE tiles t
+    SET tiledata = jsonb_set(
+        t.tiledata,
+        ARRAY[%(node_id)s],
+        coalesce(
+            (
+                SELECT jsonb_agg(
+                    e.elem || jsonb_build_object(
+                        'resourceId', coalesce(m.new_id::text, e.elem ->> 'resourceId'),
+                        'resourceXresourceId', gen_random_uuid()::text
+                    )
+                    ORDER BY e.ord
+                )
+                FROM jsonb_array_elements(t.tiledata -> %(node_id)s)
+                    WITH ORDINALITY AS e(elem, ord)
+                LEFT JOIN {RESOURCE_MAP_TABLE} m
+                    ON m.old_id::text = e.elem ->> 'resourceId'
+                WHERE m.new_id IS NOT NULL OR NOT %(cloned_only)s
+            ),
+            '[]'::jsonb
+        )
+    )
+    FROM {TILE_MAP_TABLE} tm
+    WHERE t.tileid = tm.new_id
+      AND t.nodegroupid = %(nodegroup_id)s::uuid
+      AND jsonb_typeof(t.tiledata -> %(node_id)s) = 'array'
+"""
+
+# Cloned concept identifiers are renumbered from a freshly reserved block,
+# keeping the original (numeric-looking) order.
+RENUMBER_IDENTIFIERS_SQL = f"""
+    UPDATE tiles t
+    SET tiledata = jsonb_set(
+        t.tiledata,
+        ARRAY[%(node_id)s],
+        to_jsonb((%(start_number)s + numbered.position - 1)::text)
+    )
+    FROM (
+        SELECT
+            tm.new_id,
+            row_number() OVER (
+                ORDER BY
+                    length(src.tiledata ->> %(node_id)s),
+                    src.tiledata ->> %(node_id)s,
+                    tm.new_id
+            ) AS position
+        FROM {TILE_MAP_TABLE} tm
+        JOIN tiles src ON src.tileid = tm.old_id
+        WHERE src.nodegroupid = %(nodegroup_id)s::uuid
+    ) numbered
+    WHERE t.tileid = numbered.new_id
+    RETURNING t.resourceinstanceid, t.tiledata ->> %(node_id)s
+"""
+
+
+def _insert_select_sql(model, source_alias, overrides, joins):
+    """Build ``INSERT INTO <table> SELECT ...`` copying every column of *model*.
+
+    Columns are read from the model so the statement follows the installed
+    Arches schema; *overrides* maps a column to the SQL expression to use.
+    """
+    columns = [field.column for field in model._meta.concrete_fields]
+    select_list = ", ".join(
+        overrides.get(column, f"{source_alias}.{column}") for column in columns
+    )
+    return (
+        f"INSERT INTO {model._meta.db_table} ({', '.join(columns)}) "
+        f"SELECT {select_list} FROM {model._meta.db_table} {source_alias} {joins}"
+    )
+
+
+def _column(model, field_name):
+    return model._meta.get_field(field_name).column
+
+
+def _create_mapping_tables(cursor, resource_ids, skipped_nodegroup_ids):
+    for table in (RESOURCE_MAP_TABLE, TILE_MAP_TABLE):
+        cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        cursor.execute(
+            f"CREATE TEMP TABLE {table} "
+            "(old_id uuid PRIMARY KEY, new_id uuid NOT NULL) ON COMMIT DROP"
+        )
+    cursor.execute(
+        f"INSERT INTO {RESOURCE_MAP_TABLE} "
+        "SELECT old_id, gen_random_uuid() FROM unnest(%s::uuid[]) AS old_id",
+        [resource_ids],
+    )
+    cursor.execute(
+        f"""
+        INSERT INTO {TILE_MAP_TABLE}
+        SELECT t.tileid, gen_random_uuid()
+        FROM tiles t
+        JOIN {RESOURCE_MAP_TABLE} m ON m.old_id = t.resourceinstanceid
+        WHERE NOT t.nodegroupid = ANY(%s::uuid[])
+        """,
+        [skipped_nodegroup_ids],
+    )
+
+
+def _copy_resources_and_tiles(cursor, userid):
+    state_column = _column(ResourceInstance, "resource_instance_lifecycle_state")
+    cursor.execute(
+        _insert_select_sql(
+            ResourceInstance,
+            "src",
+            {
+                _column(ResourceInstance, "resourceinstanceid"): "m.new_id",
+                _column(ResourceInstance, "legacyid"): "NULL",
+                _column(ResourceInstance, "createdtime"): "now()",
+                _column(ResourceInstance, "principaluser"): "%(userid)s",
+                state_column: (
+                    f"CASE WHEN src.{state_column} = %(retired)s::uuid "
+                    "THEN %(retired)s::uuid ELSE %(draft)s::uuid END"
+                ),
+            },
+            f"JOIN {RESOURCE_MAP_TABLE} m ON m.old_id = src.resourceinstanceid",
+        ),
+        {
+            "userid": userid,
+            "retired": str(RETIRED_STATE_ID),
+            "draft": str(DRAFT_STATE_ID),
+        },
+    )
+    cursor.execute(
+        _insert_select_sql(
+            TileModel,
+            "src",
+            {
+                _column(TileModel, "tileid"): "tm.new_id",
+                _column(TileModel, "resourceinstance"): "rm.new_id",
+                _column(TileModel, "parenttile"): "ptm.new_id",
+                _column(TileModel, "provisionaledits"): "NULL",
+            },
+            f"""
+            JOIN {TILE_MAP_TABLE} tm ON tm.old_id = src.tileid
+            JOIN {RESOURCE_MAP_TABLE} rm ON rm.old_id = src.resourceinstanceid
+            LEFT JOIN {TILE_MAP_TABLE} ptm ON ptm.old_id = src.parenttileid
+            """,
+        ),
+    )
+
+
+def _rewrite_references(cursor):
+    """Point resource-instance values in the copied tiles at the copies."""
+    reference_nodes = Node.objects.filter(
+        graph_id__in=[SCHEMES_GRAPH_ID, CONCEPTS_GRAPH_ID],
+        datatype__in=["resource-instance", "resource-instance-list"],
+    ).values_list("nodeid", "nodegroup_id")
+    reference_nodegroup_ids = set()
+    for node_id, nodegroup_id in reference_nodes:
+        cursor.execute(
+            REWRITE_REFERENCES_SQL,
+            {
+                "node_id": str(node_id),
+                "nodegroup_id": str(nodegroup_id),
+                "cloned_only": str(node_id) in CLONED_SCHEME_ONLY_NODE_IDS,
+            },
+        )
+        reference_nodegroup_ids.add(str(nodegroup_id))
+
+    cursor.execute(
+        f"""
+        SELECT __arches_refresh_tile_resource_relationships(t.tileid)
+        FROM {TILE_MAP_TABLE} tm
+        JOIN tiles t ON t.tileid = tm.new_id
+        WHERE t.nodegroupid = ANY(%s::uuid[])
+        """,
+        [list(reference_nodegroup_ids)],
+    )
+
+
+def _renumber_concept_identifiers(cursor, scheme_id, new_scheme_id):
+    """Give cloned concepts identifiers from the new scheme's own counter."""
+    source_counter = ConceptIdentifierCounter.objects.filter(
+        scheme_id=scheme_id
+    ).first()
+    start_number = source_counter.start_number if source_counter else 1
+    ConceptIdentifierCounter.objects.create(
+        scheme_id=new_scheme_id,
+        start_number=start_number,
+        next_number=start_number,
+    )
+
+    cursor.execute(
+        f"""
+        SELECT count(*) FROM {TILE_MAP_TABLE} tm
+        JOIN tiles t ON t.tileid = tm.new_id
+        WHERE t.nodegroupid = %s::uuid
+        """,
+        [IDENTIFIER_NODEGROUP],
+    )
+    (identifier_count,) = cursor.fetchone()
+    if not identifier_count:
+        return
+
+    allocated_numbers = allocate_concept_identifier_range(
+        new_scheme_id, identifier_count
+    )
+    cursor.execute(
+        RENUMBER_IDENTIFIERS_SQL,
+        {
+            "node_id": IDENTIFIER_CONTENT_NODE,
+            "nodegroup_id": IDENTIFIER_NODEGROUP,
+            "start_number": allocated_numbers.start,
+        },
+    )
+    resource_identifiers = [
+        ResourceIdentifier(
+            resourceid_id=resourceid,
+            identifier=identifier,
+            source="arches-lingo",
+            identifier_type="identifier",
+        )
+        for resourceid, identifier in cursor.fetchall()
+    ]
+    ResourceIdentifier.objects.bulk_create(resource_identifiers)
+    invalidate_identifiers_on_commit(
+        resource_identifier.identifier for resource_identifier in resource_identifiers
+    )
+
+
+def clone_scheme(scheme_id, user, scheme_identifier=None) -> tuple:
+    """Copy a scheme, its concepts and all their tiles in one transaction.
+
+    Resources and tiles are copied with ``INSERT ... SELECT`` through
+    temporary old-to-new ID mapping tables, so no ``Tile.save`` runs.
+    References between cloned resources (part of scheme, top concept,
+    broader, relations, ...) are rewritten inside the JSONB to point at the
+    copies. The copy is a Draft (retired concepts stay Retired); URI tiles
+    are not copied, as URIs are minted when the copy is promoted. The scheme
+    identifier tile is copied, and registered as the copy's resource
+    identifier, only when a new *scheme_identifier* is given.
+
+    Returns ``(new scheme id, edit-log transaction id)``; the edit-log
+    transaction lists every new resource, for reindexing.
+    """
+    scheme_id = str(scheme_id)
+    resource_ids = [scheme_id, *sorted(get_scheme_concept_ids(scheme_id))]
+    skipped_nodegroup_ids = [URI_NODEGROUP]
+    if not scheme_identifier:
+        skipped_nodegroup_ids.append(SCHEME_IDENTIFIER_NODEGROUP)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        _create_mapping_tables(cursor, resource_ids, skipped_nodegroup_ids)
+        _copy_resources_and_tiles(cursor, user.pk)
+        _rewrite_references(cursor)
+
+        cursor.execute(f"SELECT old_id, new_id FROM {RESOURCE_MAP_TABLE}")
+        new_ids = dict(cursor.fetchall())
+        new_scheme_id = new_ids[uuid.UUID(scheme_id)]
+
+        if scheme_identifier:
+            cursor.execute(
+                """
+                UPDATE tiles
+                SET tiledata = jsonb_set(tiledata, ARRAY[%s], to_jsonb(%s::text))
+                WHERE resourceinstanceid = %s AND nodegroupid = %s::uuid
+                """,
+                [
+                    SCHEME_IDENTIFIER_CONTENT_NODE,
+                    scheme_identifier,
+                    new_scheme_id,
+                    SCHEME_IDENTIFIER_NODEGROUP,
+                ],
+            )
+            ResourceIdentifier.objects.create(
+                resourceid_id=new_scheme_id,
+                identifier=scheme_identifier,
+                source="arches-lingo",
+                identifier_type="identifier",
+            )
+            invalidate_identifiers_on_commit([scheme_identifier])
+
+        _renumber_concept_identifiers(cursor, scheme_id, new_scheme_id)
+
+        source_uri_template = SchemeURITemplate.objects.filter(
+            scheme_id=scheme_id
+        ).first()
+        if source_uri_template:
+            SchemeURITemplate.objects.create(
+                scheme_id=new_scheme_id,
+                url_template=source_uri_template.url_template,
+            )
+
+        edit_transaction_id = write_tile_edit_log_entries(
+            [
+                {
+                    "resourceid": new_id,
+                    "tileid": None,
+                    "nodegroupid": None,
+                    "edittype": "create",
+                    "oldvalue": None,
+                    "newvalue": None,
+                }
+                for new_id in new_ids.values()
+            ],
+            user,
+            note=_("Cloned from scheme %(scheme_id)s") % {"scheme_id": scheme_id},
+        )
+
+        for table in (RESOURCE_MAP_TABLE, TILE_MAP_TABLE):
+            cursor.execute(f"DROP TABLE {table}")
+
+    return str(new_scheme_id), edit_transaction_id
+
+
+def run_scheme_clone(loadid, userid):
+    """Clone the scheme recorded on the ``LoadEvent`` *loadid*, then index it.
+
+    The copy commits together with the new scheme ID, the edit-log
+    transaction ID and the load event's success, so a restarted task skips
+    straight to the (checkpointed) indexing of the new resources. An
+    indexing error completes the load with ``index_error`` instead of
+    failing it, since the copy is already committed.
+    """
+    operation = LingoBulkOperations(loadid=loadid, userid=userid)
+    load_details = operation.get_details()
+
+    if "edit_transaction_id" not in load_details:
+        operation.update_details(phase="copying")
+        with transaction.atomic():
+            new_scheme_id, edit_transaction_id = clone_scheme(
+                load_details["scheme_id"],
+                User.objects.get(id=userid),
+                scheme_identifier=load_details.get("scheme_identifier"),
+            )
+            operation.update_details(
+                phase="indexing",
+                new_scheme_id=new_scheme_id,
+                edit_transaction_id=str(edit_transaction_id),
+            )
+            operation.mark_successful()
+
+    try:
+        run_concept_reindex(loadid, userid)
+    except Exception as error:
+        logger.exception("Indexing cloned scheme for load %s failed", loadid)
+        operation.complete(phase="index_failed", index_error=str(error))
+
+
+def start_scheme_clone(user, scheme_id, scheme_identifier=None):
+    """Record a scheme clone on a new ``LoadEvent`` and dispatch it; return the loadid."""
+    from arches_lingo import tasks
+
+    operation = LingoBulkOperations(userid=user.id)
+    operation.start(
+        SCHEME_CLONE_OPERATION,
+        scheme_id=str(scheme_id),
+        scheme_identifier=scheme_identifier,
+        phase="queued",
+    )
+    operation.dispatch(tasks.clone_scheme_task)
+    return operation.loadid
@@ -0,0 +1,120 @@
+"""Background, checkpointed lifecycle transitions for large schemes."""
+
+from django.db import transaction
+
+from arches.app.models.models import GraphModel, LoadEvent
+
+from arches_lingo.etl_modules.lingo_bulk_operations import LingoBulkOperations
+
+SCHEME_LIFECYCLE_TRANSITION_OPERATION = "Lingo Scheme Lifecycle Transition"
+SCHEME_LIFECYCLE_TRANSITION_CHUNK_SIZE = 1000
+
+
+def run_scheme_lifecycle_transition(
+    loadid, userid, chunk_size=SCHEME_LIFECYCLE_TRANSITION_CHUNK_SIZE
+):
+    """Transition the concepts of the scheme recorded on the ``LoadEvent`` *loadid*.
+
+    Concepts are processed in ID order, *chunk_size* per transaction, so row
+    locks are held only for one chunk at a time. The last concept ID and the
+    processed count are stored on the load event in the same transaction as
+    the chunk, so a restarted task resumes after the last committed chunk.
+    """
+    from arches_lingo.functions.update_concept_lifecycle_states_for_scheme import (
+        UpdateConceptLifecycleStatesForScheme,
+    )
+
+    operation = LingoBulkOperations(loadid=loadid, userid=userid)
+    load_details = operation.get_details()
+    scheme_resource_instance_id = load_details["scheme_id"]
+    last_resourceid = load_details.get("last_resourceid")
+    processed = load_details.get("processed", 0)
+
+    lifecycle_function = UpdateConceptLifecycleStatesForScheme()
+    concept_graph_id = GraphModel.objects.only("graphid").get(slug="concept").graphid
+    related_concepts_queryset = (
+        lifecycle_function._get_related_non_retired_concepts_for_scheme(
+            concept_graph_id=concept_graph_id,
+            scheme_resource_instance_id=scheme_resource_instance_id,
+        )
+    )
+
+    # Fix the work list up front: a transition to Retired removes processed
+    # concepts from the "non-retired" queryset as it goes.
+    remaining_concepts_queryset = related_concepts_queryset.order_by(
+        "resourceinstanceid"
+    )
+    if last_resourceid:
+        remaining_concepts_queryset = remaining_concepts_queryset.filter(
+            resourceinstanceid__gt=last_resourceid
+        )
+    concept_ids = list(
+        remaining_concepts_queryset.values_list("resourceinstanceid", flat=True)
+    )
+    if "total" not in load_details:
+        operation.update_details(total=len(concept_ids))
+
+    for chunk_start in range(0, len(concept_ids), chunk_size):
+        chunk = concept_ids[chunk_start : chunk_start + chunk_size]
+        with transaction.atomic():
+            lifecycle_function.transition_concepts(
+                scheme_resource_instance_id=scheme_resource_instance_id,
+                concept_graph_id=concept_graph_id,
+                concepts_queryset=related_concepts_queryset.filter(
+                    resourceinstanceid__in=chunk
+                ),
+                new_state_id=load_details["new_state_id"],
+                is_scheme_promoting_to_active=load_details[
+                    "is_scheme_promoting_to_active"
+                ],
+                url_template=load_details.get("url_template"),
+                scheme_identifier_value=load_details.get("scheme_identifier_value"),
+            )
+            processed += len(chunk)
+            operation.update_details(processed=processed, last_resourceid=chunk[-1])
+
+    operation.complete()
+
+
+def start_scheme_lifecycle_transition(
+    user,
+    scheme_resource_instance_id,
+    new_state_id,
+    is_scheme_promoting_to_active,
+    url_template=None,
+    scheme_identifier_value=None,
+):
+    """Record a scheme transition on a new ``LoadEvent``; dispatch it on commit.
+
+    Dispatch waits for the surrounding transaction so the worker sees the
+    scheme's new state and the load event. Returns the loadid.
+    """
+    from arches_lingo import tasks
+
+    operation = LingoBulkOperations(userid=user.id)
+    operation.start(
+        SCHEME_LIFECYCLE_TRANSITION_OPERATION,
+        scheme_id=str(scheme_resource_instance_id),
+        new_state_id=str(new_state_id),
+        is_scheme_promoting_to_active=is_scheme_promoting_to_active,
+        url_template=url_template,
+        scheme_identifier_value=scheme_identifier_value,
+        processed=0,
+    )
+    transaction.on_commit(
+        lambda: operation.dispatch(tasks.transition_scheme_lifecycle_task)
+    )
+    return operation.loadid
+
+
+def get_latest_scheme_lifecycle_transition(scheme_resource_instance_id):
+    """Return the most recent transition ``LoadEvent`` for a scheme, if any."""
+    return (
+        LoadEvent.objects.filter(
+            etl_module__slug="lingo-bulk-operations",
+            load_details__operation=SCHEME_LIFECYCLE_TRANSITION_OPERATION,
+            load_details__scheme_id=str(scheme_resource_instance_id),
+        )
+        .order_by("-load_start_time")
+        .first()
+    )
@@ -1,3 +1,4 @@
+import time
 import uuid
 from collections import defaultdict
 from django.db.models import Q
@@ -11,10 +12,27 @@ from arches_controlled_lists.utils.skos import SKOSReader
 from arches_controlled_lists.models import List, ListItem, ListItemValue
 
 from arches_lingo.etl_modules.migrate_to_lingo import LingoResourceImporter
+from arches_lingo.utils import rdf_sources
 
 # define the ARCHES namespace
 ARCHES = Namespace(settings.ARCHES_NAMESPACE_FOR_DATA_EXPORT)
 
+# Namespace for resource ids minted from subject URIs by SKOS file imports, so
+# every edition of a vocabulary maps its subjects to the same resources and a
+# delta import can match the resources of any earlier import
+SKOS_IMPORT_BASEUUID = uuid.UUID("0fa62c0e-977c-4ea2-a413-f36f41b913a0")
+
+RELATION_PREDICATES = (SKOS.broader, SKOS.narrower, SKOS.related)
+MATCH_PREDICATES = (
+    SKOS.broadMatch,
+    SKOS.closeMatch,
+    SKOS.exactMatch,
+    SKOS.inverseOf,
+    SKOS.mappingRelation,
+    SKOS.narrowMatch,
+    SKOS.relatedMatch,
+)
+
 
 class SKOSReader(SKOSReader):
     """
@@ -26,37 +44,48 @@ class SKOSReader(SKOSReader):
         self.schemes = []
         self.concepts = []
         self.relations = defaultdict(list)
+        # Timings and counts of the last streamed import
+        self.statistics = {}
         self.prefLabel_valuetype = models.DValueType.objects.get(valuetype="prefLabel")
 
-    def extract_concepts_from_skos_for_lingo_import(
-        self, graph, overwrite_options="overwrite"
-    ):
-        baseuuid = uuid.uuid4()
+    def load_lookups(self):
+        """Cache the languages and value types used to build mock tiles."""
         self.allowed_languages = {}
         for lang in models.Language.objects.all():
             self.allowed_languages[lang.code] = lang
         self.default_lang = settings.LANGUAGE_CODE
 
-        if isinstance(graph, Graph):
-
-            # Create lookups for valuetypes used during Concept processing
-            value_types = models.DValueType.objects.all()
-            skos_value_types = value_types.filter(
-                Q(namespace="skos") | Q(namespace="arches")
-            )
-            skos_note_and_label_types = skos_value_types.filter(
-                Q(category="note") | Q(category="label")
-            )
-            self.skos_value_types = skos_value_types.values_list("valuetype", flat=True)
-            self.skos_note_and_label_types = skos_note_and_label_types.values_list(
-                "valuetype", flat=True
-            )
-            self.dcterms_value_types = value_types.filter(
-                namespace="dcterms"
-            ).values_list("valuetype", flat=True)
-            self.match_types = models.DRelationType.objects.filter(
+        # Create lookups for valuetypes used during Concept processing
+        value_types = models.DValueType.objects.all()
+        skos_value_types = value_types.filter(
+            Q(namespace="skos") | Q(namespace="arches")
+        )
+        skos_note_and_label_types = skos_value_types.filter(
+            Q(category="note") | Q(category="label")
+        )
+        # Sets, as these are checked for every statement in the file
+        self.skos_value_types = set(
+            skos_value_types.values_list("valuetype", flat=True)
+        )
+        self.skos_note_and_label_types = set(
+            skos_note_and_label_types.values_list("valuetype", flat=True)
+        )
+        self.dcterms_value_types = set(
+            value_types.filter(namespace="dcterms").values_list("valuetype", flat=True)
+        )
+        self.match_types = set(
+            models.DRelationType.objects.filter(
                 category="Mapping Properties"
             ).values_list("relationtype", flat=True)
+        )
+
+    def extract_concepts_from_skos_for_lingo_import(
+        self, graph, overwrite_options="overwrite"
+    ):
+        baseuuid = uuid.uuid4()
+        self.load_lookups()
+
+        if isinstance(graph, Graph):
 
             ### Schemes ###
             top_concept_mock_tiles = {}
@@ -72,11 +101,7 @@ class SKOSReader(SKOSReader):
                 }
 
                 for predicate, object in graph.predicate_objects(scheme):
-                    predicate_str = (
-                        predicate.replace(ARCHES, "")
-                        .replace(SKOS, "")
-                        .replace(DCTERMS, "")
-                    )
+                    predicate_str = self.predicate_str(predicate)
 
                     if (
                         predicate_str in self.dcterms_value_types
@@ -150,11 +175,7 @@ class SKOSReader(SKOSReader):
                             # Cast dcterms:description to scopeNote (same behavior in RDM)
                             predicate_str = "scopeNote"
                         else:
-                            predicate_str = (
-                                predicate.replace(ARCHES, "")
-                                .replace(SKOS, "")
-                                .replace(DCTERMS, "")
-                            )
+                            predicate_str = self.predicate_str(predicate)
 
                         if predicate == SKOS.topConceptOf and not new_concept.get(
                             "is_top_concept"
@@ -178,48 +199,15 @@ class SKOSReader(SKOSReader):
                             )
                             new_concept["tile_data"].append(top_concept_mock_tile)
                             new_concept["is_top_concept"] = True
-                        elif predicate in [
-                            SKOS.broader,
-                            SKOS.narrower,
-                            SKOS.related,
-                        ]:
+                        elif predicate in RELATION_PREDICATES:
                             related_concept_id = self.generate_uuidv5_from_subject(
                                 baseuuid, object
                             )
-                            if predicate == SKOS.broader:
-                                relationship = {
-                                    "resourceId": related_concept_id,
-                                    "node_alias": "classification_status_ascribed_classification",
-                                    "nodegroup_alias": "classification_status",
-                                }
-                                resourceinstanceid = concept_pk
-                            elif predicate == SKOS.narrower:
-                                relationship = {
-                                    "resourceId": concept_pk,
-                                    "node_alias": "classification_status_ascribed_classification",
-                                    "nodegroup_alias": "classification_status",
-                                }
-                                resourceinstanceid = related_concept_id
-                            elif predicate == SKOS.related:
-                                relationship = {
-                                    "resourceId": concept_pk,
-                                    "node_alias": "relation_status_ascribed_comparate",
-                                    "nodegroup_alias": "relation_status",
-                                }
-                                resourceinstanceid = related_concept_id
-                            mock_tile = LingoResourceImporter.create_mock_tile_from_relationship(
-                                relationship
+                            resourceinstanceid, mock_tile = self.relation_mock_tile(
+                                predicate, concept_pk, related_concept_id
                             )
                             self.relations[resourceinstanceid].append(mock_tile)
-                        elif predicate in [
-                            SKOS.broadMatch,
-                            SKOS.closeMatch,
-                            SKOS.exactMatch,
-                            SKOS.inverseOf,
-                            SKOS.mappingRelation,
-                            SKOS.narrowMatch,
-                            SKOS.relatedMatch,
-                        ]:
+                        elif predicate in MATCH_PREDICATES:
                             matched_URI = None
                             for (
                                 matched_predicate,
@@ -257,6 +245,266 @@ class SKOSReader(SKOSReader):
 
             return self.schemes, self.concepts
 
+    def iter_lingo_resources_from_rdf_xml(self, source, baseuuid=None):
+        """Yield scheme and concept resources from RDF/XML *source*; see
+        ``iter_lingo_resources``."""
+        return self.iter_lingo_resources(source, "xml", baseuuid)
+
+    def iter_lingo_resources(self, source, serialization="xml", baseuuid=None):
+        """Yield scheme and concept resources from *source* as it is parsed.
+
+        *source* is a path or a seekable binary file object in one of
+        ``rdf_sources.SKOS_IMPORT_FORMATS``. RDF/XML and N-Triples are read
+        incrementally, without building an rdflib ``Graph``. Resources have
+        the same shape as those returned by
+        ``extract_concepts_from_skos_for_lingo_import``, but one resource may
+        be yielded several times: a subject's statements may be split across
+        several groups (repeated ``rdf:Description`` elements, nesting, or
+        unsorted N-Triples), and tiles stated on another subject (a
+        ``skos:narrower`` on the parent, a ``skos:hasTopConcept`` on the
+        scheme) are yielded with the subject that states them. The staging
+        table keys tiles by resource, so the pieces end up on the same
+        resource.
+
+        The file is read twice. The first read collects the scheme and
+        concept subjects and the ``dcterms:identifier`` of every match
+        target, so the second read can build each group's tiles without
+        holding any back. Memory grows with the number of resources and
+        identifiers, not with the number of statements. Tiles stated for a
+        subject that is not a concept are dropped, as they are by the
+        graph-based import.
+
+        Resource ids are minted from subject URIs in the *baseuuid*
+        namespace, a new one per import unless given.
+
+        ``statistics`` is updated in place with the time spent on the first
+        read ("subject_scan_seconds") and, once the file has been read, the
+        number of subjects, statements, schemes and concepts.
+        """
+        if isinstance(source, str):
+            with open(source, "rb") as file:
+                yield from self.iter_lingo_resources(file, serialization, baseuuid)
+            return
+
+        self.load_lookups()
+        baseuuid = baseuuid or uuid.uuid4()
+        self.statistics.clear()
+        read_subject_statements = rdf_sources.subject_statement_reader(
+            source, serialization
+        )
+
+        # First read: which subjects are schemes and concepts (a subject's
+        # statements may come in several groups, in any order), and the
+        # dcterms:identifier of every match target
+        started = time.perf_counter()
+        scheme_subjects = set()
+        concept_subjects = set()
+        match_targets = set()
+        identifiers = {}
+        for subject, statements in read_subject_statements():
+            for predicate, object in statements:
+                if predicate == RDF.type and object == SKOS.ConceptScheme:
+                    scheme_subjects.add(subject)
+                elif predicate == SKOS.inScheme:
+                    concept_subjects.add(subject)
+                elif predicate in MATCH_PREDICATES:
+                    match_targets.add(object)
+                elif predicate == DCTERMS.identifier:
+                    identifiers.setdefault(subject, object)
+        match_identifiers = {
+            target: identifiers[target]
+            for target in match_targets
+            if target in identifiers
+        }
+        del identifiers, match_targets
+        scheme_subject_by_id = {
+            self.generate_uuidv5_from_subject(baseuuid, subject): subject
+            for subject in scheme_subjects
+        }
+        concept_ids = {
+            self.generate_uuidv5_from_subject(baseuuid, subject)
+            for subject in concept_subjects - scheme_subjects
+        }
+        del scheme_subjects, concept_subjects
+        self.statistics["subject_scan_seconds"] = round(
+            time.perf_counter() - started, 3
+        )
+
+        subject_count = 0
+        statement_count = 0
+        read_concept_ids = set()
+        labelled_scheme_ids = set()
+        top_concept_ids = set()
+
+        def resource(resourceinstanceid, resource_type, tile_data, legacyid=None):
+            return {
+                "resourceinstanceid": resourceinstanceid,
+                "legacyid": legacyid,
+                "type": resource_type,
+                "tile_data": tile_data,
+            }
+
+        for subject, statements in read_subject_statements():
+            subject_count += 1
+            statement_count += len(statements)
+            pk = self.generate_uuidv5_from_subject(baseuuid, subject)
+
+            ### Schemes ###
+            if pk in scheme_subject_by_id:
+                tile_data = []
+                for predicate, object in statements:
+                    predicate_str = self.predicate_str(predicate)
+                    if (
+                        predicate_str in self.dcterms_value_types
+                        or predicate_str in self.skos_note_and_label_types
+                    ):
+                        mock_tile = self.map_predicate_object_to_mock_tile(
+                            object, predicate_str, isScheme=True
+                        )
+                        if mock_tile:
+                            tile_data.append(mock_tile)
+                    elif predicate == SKOS.hasTopConcept:
+                        top_concept_id = self.generate_uuidv5_from_subject(
+                            baseuuid, object
+                        )
+                        if top_concept_id in top_concept_ids:
+                            continue
+                        top_concept_ids.add(top_concept_id)
+                        if top_concept_id in concept_ids:
+                            mock_tile = self.scheme_relationship_mock_tile(
+                                "top_concept_of", pk
+                            )
+                            yield resource(top_concept_id, "Concept", [mock_tile])
+
+                if any("appellative_status" in mock_tile for mock_tile in tile_data):
+                    labelled_scheme_ids.add(pk)
+                yield resource(pk, "Scheme", tile_data, str(subject))
+
+            ### Concepts ###
+            elif pk in concept_ids:
+                tile_data = [
+                    self.scheme_relationship_mock_tile(
+                        "part_of_scheme",
+                        self.generate_uuidv5_from_subject(baseuuid, object),
+                    )
+                    for predicate, object in statements
+                    if predicate == SKOS.inScheme
+                ]
+
+                for predicate, object in statements:
+                    if predicate == DCTERMS.description:
+                        # Cast dcterms:description to scopeNote (same behavior in RDM)
+                        predicate_str = "scopeNote"
+                    else:
+                        predicate_str = self.predicate_str(predicate)
+
+                    if predicate == SKOS.topConceptOf:
+                        # Only one top concept tile, whether the scheme states
+                        # hasTopConcept, the concept states topConceptOf, or both.
+                        if pk not in top_concept_ids:
+                            top_concept_ids.add(pk)
+                            tile_data.append(
+                                self.scheme_relationship_mock_tile(
+                                    "top_concept_of",
+                                    self.generate_uuidv5_from_subject(baseuuid, object),
+                                )
+                            )
+                    elif predicate in RELATION_PREDICATES:
+                        resourceinstanceid, mock_tile = self.relation_mock_tile(
+                            predicate,
+                            pk,
+                            self.generate_uuidv5_from_subject(baseuuid, object),
+                        )
+                        if resourceinstanceid == pk:
+                            tile_data.append(mock_tile)
+                        elif resourceinstanceid in concept_ids:
+                            yield resource(resourceinstanceid, "Concept", [mock_tile])
+                    elif predicate in MATCH_PREDICATES:
+                        if object in match_identifiers:
+                            mock_tile = self.map_predicate_object_to_mock_tile(
+                                match_identifiers[object], predicate_str
+                            )
+                            if mock_tile:
+                                tile_data.append(mock_tile)
+                    else:
+                        mock_tile = self.map_predicate_object_to_mock_tile(
+                            object, predicate_str
+                        )
+                        if mock_tile:
+                            tile_data.append(mock_tile)
+
+                if pk not in read_concept_ids:
+                    read_concept_ids.add(pk)
+                    tile_data.append(
+                        {"type": {"type": "concept", "type_metatype": "classification"}}
+                    )
+                yield resource(pk, "Concept", tile_data, str(subject))
+
+        # Schemes without a label of their own are labelled with their URI
+        for pk, subject in scheme_subject_by_id.items():
+            if pk not in labelled_scheme_ids:
+                mock_tile = self.map_predicate_object_to_mock_tile(
+                    str(subject), "prefLabel", isScheme=True
+                )
+                if mock_tile:
+                    yield resource(pk, "Scheme", [mock_tile], str(subject))
+
+        self.statistics.update(
+            subjects=subject_count,
+            statements=statement_count,
+            schemes=len(scheme_subject_by_id),
+            concepts=len(concept_ids),
+        )
+
+    @staticmethod
+    def predicate_str(predicate):
+        return predicate.replace(ARCHES, "").replace(SKOS, "").replace(DCTERMS, "")
+
+    @staticmethod
+    def scheme_relationship_mock_tile(node_alias, scheme_pk):
+        """Return a ``top_concept_of`` or ``part_of_scheme`` mock tile."""
+        return LingoResourceImporter.create_mock_tile_from_relationship(
+            {
+                "resourceId": scheme_pk,
+                "node_alias": node_alias,
+                "nodegroup_alias": node_alias,
+            }
+        )
+
+    @staticmethod
+    def relation_mock_tile(predicate, concept_pk, related_concept_id):
+        """Return ``(resourceinstanceid, mock tile)`` for a hierarchy or
+        associative relation stated on *concept_pk*.
+
+        ``skos:narrower`` and ``skos:related`` are stored on the related
+        concept, so the returned resource is not always *concept_pk*.
+        """
+        if predicate == SKOS.broader:
+            relationship = {
+                "resourceId": related_concept_id,
+                "node_alias": "classification_status_ascribed_classification",
+                "nodegroup_alias": "classification_status",
+            }
+            resourceinstanceid = concept_pk
+        elif predicate == SKOS.narrower:
+            relationship = {
+                "resourceId": concept_pk,
+                "node_alias": "classification_status_ascribed_classification",
+                "nodegroup_alias": "classification_status",
+            }
+            resourceinstanceid = related_concept_id
+        elif predicate == SKOS.related:
+            relationship = {
+                "resourceId": concept_pk,
+                "node_alias": "relation_status_ascribed_comparate",
+                "nodegroup_alias": "relation_status",
+            }
+            resourceinstanceid = related_concept_id
+        mock_tile = LingoResourceImporter.create_mock_tile_from_relationship(
+            relationship
+        )
+        return resourceinstanceid, mock_tile
+
     def language_exists(self, rdf_tag, allowed_languages):
         """
         Override the parent implementation to fix two issues with extended BCP-47
@@ -0,0 +1,60 @@
+"""Process pool that prepares import tile values in parallel.
+
+Worker processes are spawned rather than forked, so they never share the
+parent's database connection. This module imports nothing from Django at
+module level: a spawned worker imports it before Django has been set up.
+"""
+
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Chunks submitted per worker ahead of the one being written, so workers stay
+# busy while the parent writes without the whole import being queued.
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+_worker = {}
+
+
+def _init_worker(loadid, userid, lookups_by_type):
+    import django
+
+    django.setup()
+
+    from arches_lingo.etl_modules.migrate_to_lingo import (
+        ImportPlan,
+        LingoResourceImporter,
+    )
+
+    importer = LingoResourceImporter(loadid=loadid, userid=userid)
+    _worker["importer"] = importer
+    _worker["import_plans"] = {
+        resource_type: ImportPlan(importer, *lookups)
+        for resource_type, lookups in lookups_by_type.items()
+    }
+
+
+def _prepare_chunk(resources):
+    return _worker["importer"].prepare_staging_chunk(resources, _worker["import_plans"])
+
+
+def iter_prepared_chunks(chunks, workers, loadid, userid, lookups_by_type):
+    """Yield ``prepare_staging_chunk`` results for *chunks*, in order.
+
+    Each worker builds its import plans once, from *lookups_by_type*, when
+    it starts. At most ``workers * CHUNKS_IN_FLIGHT_PER_WORKER`` chunks are
+    queued at a time, so *chunks* may be a generator over a large import.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(str(loadid), userid, lookups_by_type),
+    ) as executor:
+        in_flight = deque()
+        for chunk in chunks:
+            in_flight.append(executor.submit(_prepare_chunk, chunk))
+            if len(in_flight) >= workers * CHUNKS_IN_FLIGHT_PER_WORKER:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
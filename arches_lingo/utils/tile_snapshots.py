@@ -0,0 +1,207 @@
+"""Periodic tile-state snapshots used as starting points for history replay."""
+
+from datetime import timedelta
+from datetime import timezone as datetime_timezone
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from arches.app.models import models
+
+from arches_lingo.const import CONCEPTS_GRAPH_ID, SCHEMES_GRAPH_ID
+from arches_lingo.models import ResourceTileSnapshot
+
+SNAPSHOT_BATCH_SIZE = 1000
+
+# Edit-log times are taken when an edit is made, not when it commits, so an
+# edit stamped shortly before a snapshot can commit after the snapshot read
+# the tiles. Replay starts this long before the snapshot to pick such edits
+# up; edits the snapshot already holds are replayed in order, leaving the
+# same state.
+SNAPSHOT_REPLAY_OVERLAP = timedelta(minutes=5)
+
+RESOURCES_DUE_FOR_SNAPSHOT_SQL = """
+    SELECT ri.resourceinstanceid
+    FROM resource_instances ri
+    LEFT JOIN LATERAL (
+        SELECT max(s.snapshot_time) AS last_snapshot_time
+        FROM resource_tile_snapshots s
+        WHERE s.resourceinstanceid = ri.resourceinstanceid
+    ) latest ON true
+    WHERE ri.graphid = ANY(%(graph_ids)s::uuid[])
+    AND (
+        SELECT count(*)
+        FROM edit_log e
+        WHERE e.resourceinstanceid = ri.resourceinstanceid::text
+        AND e.tileinstanceid IS NOT NULL
+        AND (latest.last_snapshot_time IS NULL OR e.timestamp > latest.last_snapshot_time)
+    ) >= %(edit_threshold)s
+    ORDER BY ri.resourceinstanceid
+"""
+
+# One row per resource: every tile is folded into a single JSONB object in
+# the database, so no tile data passes through Python.
+INSERT_SNAPSHOTS_SQL = """
+    INSERT INTO resource_tile_snapshots (resourceinstanceid, snapshot_time, tiles)
+    SELECT
+        ri.resourceinstanceid,
+        statement_timestamp(),
+        coalesce(
+            jsonb_object_agg(
+                t.tileid::text,
+                jsonb_build_object(
+                    'nodegroupid', t.nodegroupid,
+                    'parenttileid', t.parenttileid,
+                    'sortorder', t.sortorder,
+                    'data', t.tiledata
+                )
+            ) FILTER (WHERE t.tileid IS NOT NULL),
+            '{}'::jsonb
+        )
+    FROM resource_instances ri
+    LEFT JOIN tiles t ON t.resourceinstanceid = ri.resourceinstanceid
+    WHERE ri.resourceinstanceid = ANY(%(resource_ids)s::uuid[])
+    GROUP BY ri.resourceinstanceid
+"""
+
+
+# Keeps the latest snapshot of each resource, so history lookups after the
+# cutoff still start from a snapshot.
+PRUNE_SNAPSHOTS_SQL = """
+    DELETE FROM resource_tile_snapshots s
+    WHERE s.snapshot_time < %(cutoff)s
+    AND EXISTS (
+        SELECT 1
+        FROM resource_tile_snapshots newer
+        WHERE newer.resourceinstanceid = s.resourceinstanceid
+        AND newer.snapshot_time > s.snapshot_time
+    )
+"""
+
+
+def as_db_timestamp(timestamp):
+    """Return *timestamp* in the form edit-log times are stored in.
+
+    Naive times are read as UTC throughout history replay. Without
+    ``USE_TZ`` the database holds naive times, so aware ones are converted
+    to naive UTC before they are compared in SQL.
+    """
+    if settings.USE_TZ or timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone(datetime_timezone.utc).replace(tzinfo=None)
+
+
+def get_resources_due_for_snapshot(edit_threshold: int) -> list:
+    """Return IDs of Lingo resources with at least *edit_threshold* tile edits since their last snapshot.
+
+    A threshold of 0 selects every scheme and concept.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            RESOURCES_DUE_FOR_SNAPSHOT_SQL,
+            {
+                "graph_ids": [str(SCHEMES_GRAPH_ID), str(CONCEPTS_GRAPH_ID)],
+                "edit_threshold": edit_threshold,
+            },
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def take_snapshots(resource_ids, batch_size: int = SNAPSHOT_BATCH_SIZE) -> int:
+    """Record the current full tile state of each resource; return the count."""
+    resource_ids = [str(resource_id) for resource_id in resource_ids]
+    with connection.cursor() as cursor:
+        for batch_start in range(0, len(resource_ids), batch_size):
+            # The snapshot time is the database's, taken by the statement
+            # that reads the tiles, so it cannot drift from the read
+            cursor.execute(
+                INSERT_SNAPSHOTS_SQL,
+                {"resource_ids": resource_ids[batch_start : batch_start + batch_size]},
+            )
+    return len(resource_ids)
+
+
+def snapshot_lingo_resources(edit_threshold=None) -> int:
+    """Snapshot every Lingo resource that has changed enough since its last snapshot."""
+    if edit_threshold is None:
+        edit_threshold = settings.LINGO_TILE_SNAPSHOT_EDIT_THRESHOLD
+    return take_snapshots(get_resources_due_for_snapshot(edit_threshold))
+
+
+def prune_snapshots(retention_days=None) -> int:
+    """Delete snapshots older than *retention_days* except each resource's
+    latest; return the number deleted. ``None`` keeps every snapshot."""
+    if retention_days is None:
+        retention_days = settings.LINGO_TILE_SNAPSHOT_RETENTION_DAYS
+    if retention_days is None:
+        return 0
+    cutoff = as_db_timestamp(timezone.now() - timedelta(days=retention_days))
+    with connection.cursor() as cursor:
+        cursor.execute(PRUNE_SNAPSHOTS_SQL, {"cutoff": cutoff})
+        return cursor.rowcount
+
+
+def get_nearest_snapshot(resourceid, timestamp):
+    """Return the latest snapshot of resourceid taken at or before timestamp, if any."""
+    return (
+        ResourceTileSnapshot.objects.filter(
+            resourceinstance_id=resourceid,
+            snapshot_time__lte=as_db_timestamp(timestamp),
+        )
+        .order_by("-snapshot_time")
+        .first()
+    )
+
+
+def get_resource_tiles_at(resourceid, timestamp) -> tuple:
+    """Reconstruct the tiles of resourceid as they were at timestamp.
+
+    Starts from the nearest earlier snapshot (or an empty resource when none
+    exists) and replays the tile edits recorded after it, from
+    ``SNAPSHOT_REPLAY_OVERLAP`` before its time. Returns
+    ``(snapshot_time, tiles)`` where ``tiles`` maps tile id to a dict of
+    ``nodegroupid``, ``parenttileid``, ``sortorder`` and ``data``.
+
+    The edit log records tile data only. Tiles not in the snapshot take
+    their parent and sortorder from the tile as it is now; both are
+    ``None`` for a tile that no longer exists.
+    """
+    snapshot = get_nearest_snapshot(resourceid, timestamp)
+    tiles = dict(snapshot.tiles) if snapshot else {}
+
+    edits = models.EditLog.objects.filter(
+        resourceinstanceid=str(resourceid),
+        tileinstanceid__isnull=False,
+        timestamp__lte=as_db_timestamp(timestamp),
+    ).exclude(tileinstanceid="")
+    if snapshot:
+        edits = edits.filter(
+            timestamp__gt=snapshot.snapshot_time - SNAPSHOT_REPLAY_OVERLAP
+        )
+
+    unplaced_tile_ids = set()
+    for edit in edits.order_by("timestamp").iterator():
+        if edit.edittype == "tile delete":
+            tiles.pop(edit.tileinstanceid, None)
+        elif edit.newvalue:
+            previous = tiles.get(edit.tileinstanceid)
+            if previous is None:
+                previous = {}
+                unplaced_tile_ids.add(edit.tileinstanceid)
+            tiles[edit.tileinstanceid] = {
+                "nodegroupid": edit.nodegroupid or previous.get("nodegroupid"),
+                "parenttileid": previous.get("parenttileid"),
+                "sortorder": previous.get("sortorder"),
+                "data": edit.newvalue,
+            }
+
+    for tileid, parenttileid, sortorder in models.TileModel.objects.filter(
+        pk__in=unplaced_tile_ids & tiles.keys()
+    ).values_list("tileid", "parenttile_id", "sortorder"):
+        tiles[str(tileid)].update(
+            parenttileid=str(parenttileid) if parenttileid else None,
+            sortorder=sortorder,
+        )
+
+    return (snapshot.snapshot_time if snapshot else None), tiles
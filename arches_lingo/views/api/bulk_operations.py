@@ -0,0 +1,146 @@
+import json
+from datetime import datetime, timezone
+from http import HTTPStatus
+
+from django.utils.translation import gettext as _
+from django.views.generic import View
+
+from arches.app.models.models import LoadEvent, ResourceInstance
+from arches.app.utils.response import JSONErrorResponse, JSONResponse
+
+from arches_lingo.const import SCHEMES_GRAPH_ID
+from arches_lingo.etl_modules.lingo_bulk_operations import LingoBulkOperations
+from arches_lingo.mixins.permissions import LingoEditorMixin
+from arches_lingo.models import ConceptSet
+from arches_lingo.utils.bulk_revert import start_bulk_revert
+from arches_lingo.utils.reciprocal_integrity import start_reciprocal_integrity_audit
+from arches_lingo.utils.scheme_clone import start_scheme_clone
+from arches_lingo.utils.scheme_lifecycle_transition import (
+    get_latest_scheme_lifecycle_transition,
+)
+
+
+def _parse_target_timestamp(request):
+    """Return ``(timestamp, error_response)`` from a ``{"timestamp": ...}`` body."""
+    try:
+        body = json.loads(request.body)
+        target_timestamp = datetime.fromisoformat(body["timestamp"])
+    except (KeyError, ValueError, json.JSONDecodeError) as parse_error:
+        return None, JSONErrorResponse(
+            title=_("Invalid request"),
+            message=_("Invalid request body: %(error)s") % {"error": str(parse_error)},
+            status=HTTPStatus.BAD_REQUEST,
+        )
+    if target_timestamp.tzinfo is None:
+        target_timestamp = target_timestamp.replace(tzinfo=timezone.utc)
+    return target_timestamp, None
+
+
+class SchemeRevertView(LingoEditorMixin, View):
+    def post(self, request, pk):
+        if not ResourceInstance.objects.filter(
+            pk=pk, graph_id=SCHEMES_GRAPH_ID
+        ).exists():
+            return JSONErrorResponse(
+                title=_("Not found"),
+                message=_("Scheme not found."),
+                status=HTTPStatus.NOT_FOUND,
+            )
+
+        target_timestamp, error_response = _parse_target_timestamp(request)
+        if error_response:
+            return error_response
+
+        loadid = start_bulk_revert(request.user, target_timestamp, scheme_id=pk)
+        return JSONResponse({"loadid": loadid}, status=HTTPStatus.ACCEPTED)
+
+
+class ConceptSetRevertView(LingoEditorMixin, View):
+    def post(self, request, pk):
+        if not ConceptSet.objects.filter(pk=pk, user=request.user).exists():
+            return JSONErrorResponse(
+                title=_("Not found"),
+                message=_("Concept set not found."),
+                status=HTTPStatus.NOT_FOUND,
+            )
+
+        target_timestamp, error_response = _parse_target_timestamp(request)
+        if error_response:
+            return error_response
+
+        loadid = start_bulk_revert(request.user, target_timestamp, concept_set_id=pk)
+        return JSONResponse({"loadid": loadid}, status=HTTPStatus.ACCEPTED)
+
+
+class SchemeCloneView(LingoEditorMixin, View):
+    def post(self, request, pk):
+        if not ResourceInstance.objects.filter(
+            pk=pk, graph_id=SCHEMES_GRAPH_ID
+        ).exists():
+            return JSONErrorResponse(
+                title=_("Not found"),
+                message=_("Scheme not found."),
+                status=HTTPStatus.NOT_FOUND,
+            )
+
+        try:
+            body = json.loads(request.body) if request.body else {}
+        except json.JSONDecodeError as parse_error:
+            return JSONErrorResponse(
+                title=_("Invalid request"),
+                message=_("Invalid request body: %(error)s")
+                % {"error": str(parse_error)},
+                status=HTTPStatus.BAD_REQUEST,
+            )
+
+        loadid = start_scheme_clone(
+            request.user, pk, scheme_identifier=body.get("scheme_identifier")
+        )
+        return JSONResponse({"loadid": loadid}, status=HTTPStatus.ACCEPTED)
+
+
+class ReciprocalIntegrityAuditView(LingoEditorMixin, View):
+    def post(self, request):
+        try:
+            body = json.loads(request.body) if request.body else {}
+        except json.JSONDecodeError as parse_error:
+            return JSONErrorResponse(
+                title=_("Invalid request"),
+                message=_("Invalid request body: %(error)s")
+                % {"error": str(parse_error)},
+                status=HTTPStatus.BAD_REQUEST,
+            )
+
+        loadid = start_reciprocal_integrity_audit(
+            request.user, repair=body.get("repair") is True
+        )
+        return JSONResponse({"loadid": loadid}, status=HTTPStatus.ACCEPTED)
+
+
+class BulkOperationStatusView(LingoEditorMixin, View):
+    def get(self, request, loadid):
+        try:
+            load_event = LoadEvent.objects.get(
+                loadid=loadid, etl_module__slug="lingo-bulk-operations"
+            )
+            if load_event.user_id != request.user.id and not request.user.is_superuser:
+                raise LoadEvent.DoesNotExist
+        except LoadEvent.DoesNotExist:
+            return JSONErrorResponse(
+                title=_("Not found"),
+                message=_("Operation not found."),
+                status=HTTPStatus.NOT_FOUND,
+            )
+        return JSONResponse(LingoBulkOperations.serialize(load_event))
+
+
+class SchemeLifecycleTransitionStatusView(LingoEditorMixin, View):
+    def get(self, request, pk):
+        load_event = get_latest_scheme_lifecycle_transition(pk)
+        if load_event is None:
+            return JSONErrorResponse(
+                title=_("Not found"),
+                message=_("No lifecycle update has been recorded for this scheme."),
+                status=HTTPStatus.NOT_FOUND,
+            )
+        return JSONResponse(LingoBulkOperations.serialize(load_event))
@@ -1,24 +1,23 @@
 from http import HTTPStatus
 
 from django.db import transaction
-from django.db.models import Q
 from django.utils.translation import gettext as _
 from django.views.generic import View
 
-from arches.app.models.models import ResourceInstance, TileModel
+from arches.app.models.models import ResourceInstance
 from arches.app.utils.response import JSONErrorResponse, JSONResponse
 
-from arches_lingo.const import (
-    CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID,
-    TOP_CONCEPT_OF_NODE_AND_NODEGROUP,
-)
 from arches_lingo.mixins.permissions import LingoEditorMixin
+from arches_lingo.models import ConceptSet
 from arches_lingo.utils.concept_lifecycle import (
-    EDITING_STATE_ID,
-    RETIRED_STATE_ID,
     VALID_STRATEGIES,
+    bulk_unretire_concepts,
+    get_concept_set_concept_ids,
     get_narrower_ids,
+    get_scheme_concept_ids,
+    preview_concept_removal,
     retire_concept,
+    schedule_concept_reindex,
     unretire_concept,
 )
 
@@ -47,11 +46,43 @@ class ConceptRetireView(LingoEditorMixin, View):
             )
 
         with transaction.atomic():
-            retire_concept(concept, strategy)
+            schedule_concept_reindex(
+                retire_concept(concept, strategy, user=request.user)
+            )
 
         return JSONResponse({"retired": True})
 
 
+class ConceptRemovalPreviewView(LingoEditorMixin, View):
+    def get(self, request, pk):
+        if not ResourceInstance.objects.filter(pk=pk).exists():
+            return JSONErrorResponse(
+                title=_("Not found"),
+                message=_("Concept not found."),
+                status=HTTPStatus.NOT_FOUND,
+            )
+
+        return JSONResponse({"strategies": preview_concept_removal(str(pk))})
+
+
+def _unretire_response(transition_result):
+    return JSONResponse(
+        {
+            "unretired": True,
+            "count": len(transition_result.concept_ids),
+            "reindex_loadid": transition_result.reindex_loadid,
+        }
+    )
+
+
+def _invalid_transition_response(error):
+    return JSONErrorResponse(
+        title=_("Invalid lifecycle transition"),
+        message=str(error),
+        status=HTTPStatus.BAD_REQUEST,
+    )
+
+
 class ConceptUnretireView(LingoEditorMixin, View):
     def post(self, request, pk):
         try:
@@ -65,52 +96,47 @@ class ConceptUnretireView(LingoEditorMixin, View):
 
         cascade = request.GET.get("cascade", "").lower() == "true"
 
-        with transaction.atomic():
-            unretire_concept(concept, cascade)
+        try:
+            transition_result = unretire_concept(concept, cascade, user=request.user)
+        except ValueError as error:
+            return _invalid_transition_response(error)
 
-        return JSONResponse({"unretired": True})
+        return _unretire_response(transition_result)
 
 
 class SchemeUnretireConceptsView(LingoEditorMixin, View):
     def post(self, request, pk):
-        try:
-            ResourceInstance.objects.get(pk=pk)
-        except ResourceInstance.DoesNotExist:
+        if not ResourceInstance.objects.filter(pk=pk).exists():
             return JSONErrorResponse(
                 title=_("Not found"),
                 message=_("Scheme not found."),
                 status=HTTPStatus.NOT_FOUND,
             )
 
-        scheme_id = str(pk)
-
-        concept_ids = set(
-            TileModel.objects.filter(
-                Q(
-                    nodegroup_id=CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID,
-                    **{
-                        f"data__{CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID}__contains": [
-                            {"resourceId": scheme_id}
-                        ]
-                    },
-                )
-                | Q(
-                    nodegroup_id=TOP_CONCEPT_OF_NODE_AND_NODEGROUP,
-                    **{
-                        f"data__{TOP_CONCEPT_OF_NODE_AND_NODEGROUP}__contains": [
-                            {"resourceId": scheme_id}
-                        ]
-                    },
-                )
+        try:
+            transition_result = bulk_unretire_concepts(
+                get_scheme_concept_ids(pk), user=request.user
             )
-            .values_list("resourceinstance_id", flat=True)
-            .distinct()
-        )
+        except ValueError as error:
+            return _invalid_transition_response(error)
 
-        with transaction.atomic():
-            ResourceInstance.objects.filter(
-                pk__in=concept_ids,
-                resource_instance_lifecycle_state_id=RETIRED_STATE_ID,
-            ).update(resource_instance_lifecycle_state_id=EDITING_STATE_ID)
+        return _unretire_response(transition_result)
+
+
+class ConceptSetUnretireView(LingoEditorMixin, View):
+    def post(self, request, pk):
+        if not ConceptSet.objects.filter(pk=pk, user=request.user).exists():
+            return JSONErrorResponse(
+                title=_("Not found"),
+                message=_("Concept set not found."),
+                status=HTTPStatus.NOT_FOUND,
+            )
+
+        try:
+            transition_result = bulk_unretire_concepts(
+                get_concept_set_concept_ids(pk), user=request.user
+            )
+        except ValueError as error:
+            return _invalid_transition_response(error)
 
-        return JSONResponse({"unretired": True})
+        return _unretire_response(transition_result)
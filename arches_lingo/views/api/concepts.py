@@ -17,6 +17,7 @@ from arches_lingo.utils.concept_lifecycle import (
     VALID_STRATEGIES,
     delete_concept,
     get_narrower_ids,
+    schedule_concept_reindex,
 )
 from arches_lingo.utils.concepts import (
     resolve_max_edit_distance,
@@ -278,7 +279,9 @@ class ConceptDeleteView(LingoEditorMixin, View):
 
         try:
             with transaction.atomic():
-                delete_concept(concept, strategy)
+                schedule_concept_reindex(
+                    delete_concept(concept, strategy, user=request.user)
+                )
         except ValueError as error:
             return JSONErrorResponse(
                 title=_("Cannot delete"),
@@ -14,9 +14,17 @@ from arches_lingo.permissions import (
     is_lingo_editor,
 )
 from arches_lingo.utils.edit_log import (
-    build_permitted_edit_log,
+    build_permitted_edit_log_page,
+    bulk_revert_resource_to_timestamp,
+    filter_readable_changes,
+    parse_edit_log_filters,
+    preview_revert_resource_to_timestamp,
     revert_resource_to_timestamp,
 )
+from arches_lingo.utils.tile_snapshots import get_resource_tiles_at
+
+DEFAULT_EDIT_LOG_PAGE_SIZE = 100
+MAX_EDIT_LOG_PAGE_SIZE = 1000
 
 
 class ResourceEditLogAPIView(View):
@@ -36,8 +44,33 @@ class ResourceEditLogAPIView(View):
                 status=404,
             )
 
-        permitted_edits = build_permitted_edit_log(resource_instance, request.user)
-        return JSONResponse({"resourceid": str(resourceid), "edits": permitted_edits})
+        try:
+            filters = parse_edit_log_filters(request)
+            page_size = min(
+                max(int(request.GET.get("page_size", DEFAULT_EDIT_LOG_PAGE_SIZE)), 1),
+                MAX_EDIT_LOG_PAGE_SIZE,
+            )
+            page = build_permitted_edit_log_page(
+                resource_instance,
+                request.user,
+                filters=filters,
+                cursor=request.GET.get("cursor"),
+                page_size=page_size,
+            )
+        except ValueError as error:
+            return JSONErrorResponse(
+                title=_("Invalid parameter"),
+                message=str(error),
+                status=400,
+            )
+
+        return JSONResponse(
+            {
+                "resourceid": str(resourceid),
+                "edits": page["edits"],
+                "next_cursor": page["next_cursor"],
+            }
+        )
 
     def post(self, request, resourceid):
         if not is_lingo_editor(request.user):
@@ -67,7 +100,28 @@ class ResourceEditLogAPIView(View):
                 status=404,
             )
 
-        errors = revert_resource_to_timestamp(resourceid, target_timestamp, request)
+        if body.get("dry_run"):
+            changes = filter_readable_changes(
+                preview_revert_resource_to_timestamp(resourceid, target_timestamp),
+                request.user,
+            )
+            return JSONResponse({"status": "preview", "changes": changes})
+
+        if body.get("mode") == "bulk":
+            errors = bulk_revert_resource_to_timestamp(
+                resourceid, target_timestamp, request.user
+            )
+            if errors:
+                # The batch is all-or-nothing, so nothing was applied.
+                return JSONResponse(
+                    {
+                        "status": "failed",
+                        "message": _("Resource could not be reverted."),
+                        "errors": errors,
+                    }
+                )
+        else:
+            errors = revert_resource_to_timestamp(resourceid, target_timestamp, request)
 
         if errors:
             return JSONResponse(
@@ -83,3 +137,53 @@ class ResourceEditLogAPIView(View):
         return JSONResponse(
             {"status": "ok", "message": _("Resource reverted successfully.")}
         )
+
+
+class ResourceStateAsOfView(View):
+    def get(self, request, resourceid):
+        if not anonymous_access_allowed() and not is_authenticated_user(request.user):
+            return JsonResponse(
+                {"message": _("Authentication required.")},
+                status=403,
+            )
+
+        try:
+            timestamp = datetime.fromisoformat(request.GET["timestamp"])
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+        except (KeyError, ValueError) as parse_error:
+            return JSONErrorResponse(
+                title=_("Invalid parameter"),
+                message=f"Invalid timestamp: {str(parse_error)}",
+                status=400,
+            )
+
+        if not models.ResourceInstance.objects.filter(pk=resourceid).exists():
+            return JSONErrorResponse(
+                title="Not found",
+                message=f"Resource {resourceid} not found",
+                status=404,
+            )
+
+        snapshot_time, tiles = get_resource_tiles_at(resourceid, timestamp)
+
+        readable_by_nodegroupid = {}
+        permitted_tiles = []
+        for tileid, tile in tiles.items():
+            nodegroupid = tile["nodegroupid"]
+            if nodegroupid not in readable_by_nodegroupid:
+                nodegroup = models.NodeGroup.objects.filter(pk=nodegroupid).first()
+                readable_by_nodegroupid[nodegroupid] = bool(
+                    nodegroup and request.user.has_perm("read_nodegroup", nodegroup)
+                )
+            if readable_by_nodegroupid[nodegroupid]:
+                permitted_tiles.append({"tileid": tileid, **tile})
+
+        return JSONResponse(
+            {
+                "resourceid": str(resourceid),
+                "timestamp": timestamp.isoformat(),
+                "snapshot_time": (snapshot_time.isoformat() if snapshot_time else None),
+                "tiles": permitted_tiles,
+            }
+        )
@@ -1,22 +1,58 @@
+import json
+
 from django.http import Http404, JsonResponse
+from django.utils.decorators import method_decorator
+from django.utils.translation import gettext as _
 from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+from arches.app.utils.response import JSONErrorResponse
 
-from arches.app.models.models import ResourceIdentifier
+from arches_lingo.utils.identifier_cache import (
+    MAX_BULK_RESOLVE_IDENTIFIERS,
+    resolve_identifier,
+    resolve_identifiers,
+)
 
 
 class IdentifierResolveView(View):
     def get(self, request, **kwargs):
         identifier = kwargs.get("concept_identifier") or kwargs.get("scheme_identifier")
-        resource_id = (
-            ResourceIdentifier.objects.filter(
-                identifier=identifier,
-                source="arches-lingo",
-            )
-            .values_list("resourceid", flat=True)
-            .first()
-        )
+        resource_id = resolve_identifier(identifier)
 
         if resource_id is None:
             raise Http404()
 
-        return JsonResponse({"resourceinstanceid": str(resource_id)})
+        return JsonResponse({"resourceinstanceid": resource_id})
+
+
+# Read-only lookup for external reconciliation clients, which have no CSRF token.
+@method_decorator(csrf_exempt, name="dispatch")
+class BulkIdentifierResolveView(View):
+    def post(self, request):
+        try:
+            identifiers = json.loads(request.body)["identifiers"]
+        except (KeyError, TypeError, ValueError) as parse_error:
+            return JSONErrorResponse(
+                title=_("Invalid request"),
+                message=f"Invalid request body: {str(parse_error)}",
+                status=400,
+            )
+
+        if not isinstance(identifiers, list) or not all(
+            isinstance(identifier, str) for identifier in identifiers
+        ):
+            return JSONErrorResponse(
+                title=_("Invalid request"),
+                message=_("identifiers must be a list of strings."),
+                status=400,
+            )
+        if len(identifiers) > MAX_BULK_RESOLVE_IDENTIFIERS:
+            return JSONErrorResponse(
+                title=_("Too many identifiers"),
+                message=_("At most %(limit)d identifiers can be resolved at once.")
+                % {"limit": MAX_BULK_RESOLVE_IDENTIFIERS},
+                status=400,
+            )
+
+        return JsonResponse({"resolved": resolve_identifiers(identifiers)})
@@ -14,6 +14,7 @@ from arches_lingo.const import (
     SCHEME_IDENTIFIER_TYPE_LIST_ITEM_ID,
 )
 from arches_lingo.mixins.permissions import LingoEditorMixin
+from arches_lingo.utils.identifier_cache import invalidate_identifiers_on_commit
 
 
 class SchemeIdentifierView(LingoEditorMixin, APIBase):
@@ -24,6 +25,11 @@ class SchemeIdentifierView(LingoEditorMixin, APIBase):
         if not identifier:
             return JSONErrorResponse("identifier is required", status=400)
 
+        previous_identifiers = list(
+            ResourceIdentifier.objects.filter(
+                resourceid_id=scheme_resource_instance_id, source="arches-lingo"
+            ).values_list("identifier", flat=True)
+        )
         resource_identifier, _ = ResourceIdentifier.objects.update_or_create(
             resourceid_id=scheme_resource_instance_id,
             source="arches-lingo",
@@ -32,6 +38,7 @@ class SchemeIdentifierView(LingoEditorMixin, APIBase):
                 "identifier_type": "identifier",
             },
         )
+        invalidate_identifiers_on_commit([*previous_identifiers, identifier])
 
         tile_data = {
             SCHEME_IDENTIFIER_CONTENT_NODE: identifier,
@@ -2,15 +2,13 @@ from django.http import Http404, HttpResponseRedirect
 from django.urls import reverse
 from django.views import View
 
-from arches.app.models.models import ResourceIdentifier
+from arches_lingo.utils.identifier_cache import resolve_identifier
 
 
 class SchemeConceptRedirectView(View):
     def get(self, request, scheme_identifier, concept_identifier):
-        concept_resource_instance_id = (
-            ResourceIdentifier.objects.filter(identifier=concept_identifier)
-            .values_list("resourceid", flat=True)
-            .first()
+        concept_resource_instance_id = resolve_identifier(
+            concept_identifier, source=None
         )
 
         if concept_resource_instance_id is None:
@@ -0,0 +1,190 @@
+import json
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from django.contrib.auth.models import Group, User
+from django.urls import reverse
+
+from arches.app.models.models import LoadEvent, TileModel
+
+from arches_lingo.const import (
+    CONCEPT_NAME_CONTENT_NODE,
+    CONCEPT_NAME_NODEGROUP,
+    RELATION_STATUS_ASCRIBED_COMPARATE_NODEID,
+    RELATION_STATUS_NODEGROUP,
+)
+from arches_lingo.etl_modules.lingo_bulk_operations import LingoBulkOperations
+from arches_lingo.functions.reciprocal_relationship import (
+    DELETE_COUNTERPART,
+    ReciprocalRelationshipFunction,
+)
+from arches_lingo.utils.bulk_revert import BULK_REVERT_OPERATION, run_bulk_revert
+
+from tests.test_edit_log import EditLogTestMixin
+from tests.tests import ViewTests
+
+
+class BulkRevertTests(EditLogTestMixin, ViewTests):
+    """Tests for scheme-wide point-in-time revert."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.base_time = datetime(2025, 6, 1, 12, 0, 0)  # naive — USE_TZ=False
+
+    def _edit_label_after_target(self, concept):
+        tile = TileModel.objects.get(
+            resourceinstance=concept, nodegroup_id=CONCEPT_NAME_NODEGROUP
+        )
+        original_data = dict(tile.data)
+        self._create_edit(
+            concept,
+            "tile create",
+            self.base_time - timedelta(hours=1),
+            tileid=tile.pk,
+            nodegroupid=CONCEPT_NAME_NODEGROUP,
+            newvalue=original_data,
+        )
+        tile.data = {**original_data, CONCEPT_NAME_CONTENT_NODE: "Bad bulk edit"}
+        tile.save()
+        self._create_edit(
+            concept,
+            "tile edit",
+            self.base_time + timedelta(hours=1),
+            tileid=tile.pk,
+            nodegroupid=CONCEPT_NAME_NODEGROUP,
+            newvalue=tile.data,
+            oldvalue=original_data,
+        )
+        return tile, original_data
+
+    def _start(self, **load_details):
+        operation = LingoBulkOperations(userid=self.admin.id)
+        operation.start(
+            BULK_REVERT_OPERATION,
+            target_timestamp=self.base_time.isoformat(),
+            scheme_id=str(self.scheme.pk),
+            **load_details,
+        )
+        return operation
+
+    def test_reverts_every_concept_in_scheme(self):
+        edited = [self._edit_label_after_target(c) for c in self.concepts[:3]]
+        operation = self._start()
+
+        errors = run_bulk_revert(operation.loadid, self.admin.id, chunk_size=2)
+
+        self.assertEqual(errors, [])
+        for tile, original_data in edited:
+            tile.refresh_from_db()
+            self.assertEqual(tile.data, original_data)
+        load_event = operation.get_load_event()
+        self.assertEqual(load_event.status, "completed")
+        self.assertEqual(load_event.load_details["processed"], 3)
+        self.assertEqual(load_event.load_details["total"], 3)
+
+    def test_resumes_after_last_checkpoint(self):
+        edited = sorted(
+            (self._edit_label_after_target(c) for c in self.concepts[:2]),
+            key=lambda pair: str(pair[0].resourceinstance_id),
+        )
+        (first_tile, _first_data), (second_tile, second_data) = edited
+        operation = self._start(
+            last_resourceid=str(first_tile.resourceinstance_id), processed=1
+        )
+
+        run_bulk_revert(operation.loadid, self.admin.id)
+
+        first_tile.refresh_from_db()
+        second_tile.refresh_from_db()
+        self.assertEqual(first_tile.data[CONCEPT_NAME_CONTENT_NODE], "Bad bulk edit")
+        self.assertEqual(second_tile.data, second_data)
+        self.assertEqual(operation.get_details()["processed"], 2)
+
+    @patch(
+        "arches.app.utils.task_management.check_if_celery_available",
+        return_value=False,
+    )
+    def test_endpoint_runs_revert_and_reports_progress(self, _celery):
+        self._edit_label_after_target(self.concepts[0])
+
+        response = self.client.post(
+            reverse("api-lingo-scheme-revert", args=[self.scheme.pk]),
+            data=json.dumps({"timestamp": self.base_time.isoformat()}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 202)
+        loadid = json.loads(response.content)["loadid"]
+
+        status = json.loads(
+            self.client.get(reverse("api-lingo-bulk-operation", args=[loadid])).content
+        )
+        self.assertEqual(status["status"], "completed")
+        self.assertEqual(status["load_details"]["processed"], 1)
+
+    def test_status_for_unknown_operation_returns_404(self):
+        with self.assertLogs("django.request", level="WARNING"):
+            response = self.client.get(
+                reverse("api-lingo-bulk-operation", args=[uuid.uuid4()])
+            )
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(LoadEvent.objects.filter(status="running").exists())
+
+    def test_revert_of_non_scheme_resource_returns_404(self):
+        with self.assertLogs("django.request", level="WARNING"):
+            response = self.client.post(
+                reverse("api-lingo-scheme-revert", args=[self.concepts[0].pk]),
+                data=json.dumps({"timestamp": self.base_time.isoformat()}),
+                content_type="application/json",
+            )
+        self.assertEqual(response.status_code, 404)
+
+    def test_status_of_another_users_operation_returns_404(self):
+        operation = self._start()
+        editor = User.objects.create_user(username="other_editor", password="test")
+        editor.groups.add(Group.objects.get(name="Lingo Editor"))
+        self.client.force_login(editor)
+
+        with self.assertLogs("django.request", level="WARNING"):
+            response = self.client.get(
+                reverse("api-lingo-bulk-operation", args=[operation.loadid])
+            )
+        self.assertEqual(response.status_code, 404)
+
+    def test_reverted_relation_tiles_sync_counterparts_per_chunk(self):
+        concept, related_concept = self.concepts[0], self.concepts[1]
+        relation_data = {
+            RELATION_STATUS_ASCRIBED_COMPARATE_NODEID: [
+                {"resourceId": str(related_concept.pk)}
+            ]
+        }
+        tile = TileModel.objects.create(
+            resourceinstance=concept,
+            nodegroup_id=RELATION_STATUS_NODEGROUP,
+            data=relation_data,
+        )
+        self._create_edit(
+            concept,
+            "tile create",
+            self.base_time + timedelta(hours=1),
+            tileid=tile.pk,
+            nodegroupid=RELATION_STATUS_NODEGROUP,
+            newvalue=relation_data,
+        )
+        operation = self._start()
+
+        with (
+            patch.object(
+                ReciprocalRelationshipFunction, "sync_counterparts"
+            ) as sync_counterparts,
+            # Reverted resources are reindexed on commit; search is out of scope.
+            patch("arches_lingo.utils.edit_log.Resource"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            run_bulk_revert(operation.loadid, self.admin.id)
+
+        self.assertFalse(TileModel.objects.filter(pk=tile.pk).exists())
+        sync_counterparts.assert_called_once_with(
+            {(str(concept.pk), str(related_concept.pk)): DELETE_COUNTERPART}
+        )
@@ -0,0 +1,36 @@
+from arches_lingo.models import ConceptIdentifierCounter
+from arches_lingo.utils.concept_identifier_allocator import (
+    allocate_concept_identifier_range,
+)
+
+from tests.tests import ViewTests
+
+
+class ConceptIdentifierAllocatorTests(ViewTests):
+    """Tests for batch concept identifier allocation."""
+
+    def _counter(self):
+        return ConceptIdentifierCounter.objects.create(
+            scheme=self.scheme, start_number=100, next_number=100
+        )
+
+    def test_range_is_contiguous_and_advances_counter(self):
+        counter = self._counter()
+
+        numbers = allocate_concept_identifier_range(self.scheme.pk, count=3)
+
+        self.assertEqual(list(numbers), [100, 101, 102])
+        counter.refresh_from_db()
+        self.assertEqual(counter.next_number, 103)
+
+    def test_consecutive_ranges_do_not_overlap(self):
+        self._counter()
+
+        first = allocate_concept_identifier_range(self.scheme.pk, count=2)
+        second = allocate_concept_identifier_range(self.scheme.pk, count=2)
+
+        self.assertEqual((list(first), list(second)), ([100, 101], [102, 103]))
+
+    def test_missing_counter_raises(self):
+        with self.assertRaises(ConceptIdentifierCounter.DoesNotExist):
+            allocate_concept_identifier_range(self.scheme.pk, count=1)
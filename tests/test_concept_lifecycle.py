@@ -2,25 +2,35 @@ import json
 import uuid
 from unittest.mock import MagicMock, patch
 
+from arches.app.models.models import EditLog, LoadEvent, TileModel
 from django.contrib.auth.models import User
 from django.test import SimpleTestCase
 from django.urls import reverse
 
 from arches_lingo.const import (
     CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID,
+    CLASSIFICATION_STATUS_NODEGROUP,
+    RELATION_STATUS_ASCRIBED_COMPARATE_NODEID,
+    RELATION_STATUS_NODEGROUP,
     TOP_CONCEPT_OF_NODE_AND_NODEGROUP,
 )
+from arches_lingo.models import ConceptSet, ConceptSetMember
 from arches_lingo.utils.concept_lifecycle import (
     DRAFT_STATE_ID,
     EDITING_STATE_ID,
+    LIFECYCLE_STATE_EDIT_TYPE,
     RETIRED_STATE_ID,
+    ConceptTransitionResult,
+    bulk_unretire_concepts,
     delete_concept,
     get_all_descendant_ids,
     get_broader_ids,
     get_scheme_id_if_top_concept,
     orphan_children,
+    preview_concept_removal,
     reparent_children,
     retire_concept,
+    transition_concepts_lifecycle_state,
     unretire_concept,
 )
 from tests.tests import ViewTests
@@ -93,148 +103,169 @@ class GetSchemeIdIfTopConceptTests(SimpleTestCase):
         self.assertIsNone(get_scheme_id_if_top_concept(CONCEPT_A))
 
 
-class GetAllDescendantIdsTests(SimpleTestCase):
+class GetAllDescendantIdsTests(ViewTests):
+    # concepts[n] is narrower than concepts[n - 1] and concepts[0].
+
     def test_returns_empty_for_leaf(self):
-        with patch(
-            "arches_lingo.utils.concept_lifecycle.get_narrower_ids", return_value=set()
-        ):
-            self.assertEqual(get_all_descendant_ids(CONCEPT_A), set())
+        self.assertEqual(get_all_descendant_ids(str(self.concepts[4].pk)), set())
 
     def test_traverses_multiple_levels(self):
-        narrower_map = {CONCEPT_A: {CONCEPT_B}, CONCEPT_B: {CONCEPT_C}}
-        with patch(
-            "arches_lingo.utils.concept_lifecycle.get_narrower_ids",
-            side_effect=lambda cid: narrower_map.get(cid, set()),
-        ):
-            self.assertEqual(get_all_descendant_ids(CONCEPT_A), {CONCEPT_B, CONCEPT_C})
+        self.assertEqual(
+            get_all_descendant_ids(str(self.concepts[2].pk)),
+            {str(self.concepts[3].pk), str(self.concepts[4].pk)},
+        )
 
     def test_handles_diamond_without_duplicates(self):
-        concept_d = str(uuid.uuid4())
-        narrower_map = {
-            CONCEPT_A: {CONCEPT_B, CONCEPT_C},
-            CONCEPT_B: {concept_d},
-            CONCEPT_C: {concept_d},
-        }
-        with patch(
-            "arches_lingo.utils.concept_lifecycle.get_narrower_ids",
-            side_effect=lambda cid: narrower_map.get(cid, set()),
-        ):
-            self.assertEqual(
-                get_all_descendant_ids(CONCEPT_A), {CONCEPT_B, CONCEPT_C, concept_d}
-            )
+        self.assertEqual(
+            get_all_descendant_ids(str(self.concepts[0].pk)),
+            {str(concept.pk) for concept in self.concepts[1:]},
+        )
 
     def test_terminates_on_cycle(self):
-        narrower_map = {CONCEPT_A: {CONCEPT_B}, CONCEPT_B: {CONCEPT_A}}
-        with patch(
-            "arches_lingo.utils.concept_lifecycle.get_narrower_ids",
-            side_effect=lambda cid: narrower_map.get(cid, set()),
-        ):
-            self.assertEqual(get_all_descendant_ids(CONCEPT_A), {CONCEPT_B})
+        TileModel.objects.create(
+            resourceinstance=self.concepts[0],
+            nodegroup_id=CLASSIFICATION_STATUS_NODEGROUP,
+            data={
+                CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID: [
+                    {"resourceId": str(self.concepts[4].pk)}
+                ]
+            },
+        )
+        self.assertEqual(
+            get_all_descendant_ids(str(self.concepts[3].pk)),
+            {
+                str(concept.pk)
+                for concept in self.concepts
+                if concept.pk != self.concepts[3].pk
+            },
+        )
 
 
-class OrphanChildrenTests(SimpleTestCase):
-    def test_removes_concept_from_broader_refs(self):
-        tile = _mock_tile(resource_id=CONCEPT_B, broader_ids=[CONCEPT_A, CONCEPT_C])
-        fetched = MagicMock(data={})
+class ChildRewriteTestMixin:
+    def _broader_ids(self, concept):
+        tile = TileModel.objects.filter(
+            resourceinstance=concept, nodegroup_id=CLASSIFICATION_STATUS_NODEGROUP
+        ).first()
+        if not tile:
+            return None
+        return [
+            reference["resourceId"]
+            for reference in tile.data[
+                CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID
+            ]
+        ]
 
-        with (
-            patch("arches_lingo.utils.concept_lifecycle.TileModel") as MockTileModel,
-            patch("arches_lingo.utils.concept_lifecycle.Tile") as MockTile,
-        ):
-            MockTileModel.objects.filter.return_value = [tile]
-            MockTile.objects.get.return_value = fetched
-            orphan_children(CONCEPT_A)
+    def _is_top_concept(self, concept):
+        return TileModel.objects.filter(
+            resourceinstance=concept, nodegroup_id=TOP_CONCEPT_OF_NODE_AND_NODEGROUP
+        ).exists()
 
-        MockTile.objects.get.assert_called_once_with(tileid=tile.tileid)
-        saved_refs = fetched.data[CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID]
-        self.assertEqual([r["resourceId"] for r in saved_refs], [CONCEPT_C])
-        fetched.save.assert_called_once_with(request=None)
 
-    def test_deletes_tile_when_no_broader_refs_remain(self):
-        tile = _mock_tile(resource_id=CONCEPT_B, broader_ids=[CONCEPT_A])
+class OrphanChildrenTests(ChildRewriteTestMixin, ViewTests):
+    def test_removes_concept_from_broader_refs(self):
+        changed = orphan_children(str(self.concepts[3].pk), user=self.admin)
 
-        with (
-            patch("arches_lingo.utils.concept_lifecycle.TileModel") as MockTileModel,
-            patch("arches_lingo.utils.concept_lifecycle.Tile") as MockTile,
-        ):
-            MockTileModel.objects.filter.return_value = [tile]
-            orphan_children(CONCEPT_A)
+        self.assertEqual(changed, {str(self.concepts[4].pk)})
+        self.assertEqual(
+            self._broader_ids(self.concepts[4]), [str(self.concepts[0].pk)]
+        )
+        edit = EditLog.objects.get(resourceinstanceid=str(self.concepts[4].pk))
+        self.assertEqual(edit.edittype, "tile edit")
+        self.assertEqual(edit.userid, str(self.admin.pk))
 
-        tile.delete.assert_called_once()
-        MockTile.objects.get.assert_not_called()
+    def test_deletes_tile_when_no_broader_refs_remain(self):
+        orphan_children(str(self.concepts[0].pk))
 
+        self.assertIsNone(self._broader_ids(self.concepts[1]))
+        self.assertFalse(self._is_top_concept(self.concepts[1]))
+        self.assertEqual(
+            self._broader_ids(self.concepts[2]), [str(self.concepts[1].pk)]
+        )
 
-class ReparentChildrenTests(SimpleTestCase):
-    def test_swaps_removed_concept_for_new_parent(self):
-        tile = _mock_tile(resource_id=CONCEPT_C, broader_ids=[CONCEPT_A])
-        fetched = MagicMock(data={})
 
-        with (
-            patch("arches_lingo.utils.concept_lifecycle.TileModel") as MockTileModel,
-            patch("arches_lingo.utils.concept_lifecycle.Tile") as MockTile,
-        ):
-            MockTileModel.objects.filter.return_value = [tile]
-            MockTile.objects.get.return_value = fetched
-            reparent_children(CONCEPT_A, {CONCEPT_B}, scheme_id=None)
+class ReparentChildrenTests(ChildRewriteTestMixin, ViewTests):
+    def test_swaps_removed_concept_for_new_parent(self):
+        reparent_children(
+            str(self.concepts[3].pk), {str(self.concepts[2].pk)}, scheme_id=None
+        )
 
-        MockTile.objects.get.assert_called_once_with(tileid=tile.tileid)
-        saved_refs = fetched.data[CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID]
-        self.assertEqual([r["resourceId"] for r in saved_refs], [CONCEPT_B])
-        fetched.save.assert_called_once_with(request=None)
+        self.assertEqual(
+            self._broader_ids(self.concepts[4]),
+            [str(self.concepts[0].pk), str(self.concepts[2].pk)],
+        )
 
     def test_does_not_duplicate_parent_already_present(self):
-        tile = _mock_tile(resource_id=CONCEPT_C, broader_ids=[CONCEPT_A, CONCEPT_B])
-        fetched = MagicMock(data={})
-
-        with (
-            patch("arches_lingo.utils.concept_lifecycle.TileModel") as MockTileModel,
-            patch("arches_lingo.utils.concept_lifecycle.Tile") as MockTile,
-        ):
-            MockTileModel.objects.filter.return_value = [tile]
-            MockTile.objects.get.return_value = fetched
-            reparent_children(CONCEPT_A, {CONCEPT_B}, scheme_id=None)
+        reparent_children(
+            str(self.concepts[3].pk), {str(self.concepts[0].pk)}, scheme_id=None
+        )
 
-        saved_refs = fetched.data[CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID]
         self.assertEqual(
-            len([r for r in saved_refs if r["resourceId"] == CONCEPT_B]), 1
+            self._broader_ids(self.concepts[4]), [str(self.concepts[0].pk)]
         )
 
     def test_promotes_to_top_concept_when_no_parents_remain(self):
-        tile = _mock_tile(resource_id=CONCEPT_B, broader_ids=[CONCEPT_A])
-
-        with (
-            patch("arches_lingo.utils.concept_lifecycle.TileModel") as MockTileModel,
-            patch("arches_lingo.utils.concept_lifecycle.Tile") as MockTile,
-        ):
-            MockTileModel.objects.filter.return_value = [tile]
-            reparent_children(CONCEPT_A, set(), scheme_id=SCHEME_S)
+        changed = reparent_children(
+            str(self.concepts[0].pk), set(), scheme_id=str(self.scheme.pk)
+        )
 
-        tile.delete.assert_called_once()
-        MockTile.assert_called_once_with(
-            resourceinstance_id=CONCEPT_B,
-            nodegroup_id=TOP_CONCEPT_OF_NODE_AND_NODEGROUP,
-            data={TOP_CONCEPT_OF_NODE_AND_NODEGROUP: [{"resourceId": SCHEME_S}]},
+        self.assertIn(str(self.concepts[1].pk), changed)
+        self.assertIsNone(self._broader_ids(self.concepts[1]))
+        self.assertTrue(self._is_top_concept(self.concepts[1]))
+        self.assertEqual(
+            set(
+                EditLog.objects.filter(
+                    resourceinstanceid=str(self.concepts[1].pk)
+                ).values_list("edittype", flat=True)
+            ),
+            {"tile delete", "tile create"},
         )
-        MockTile.return_value.save.assert_called_once_with(request=None)
 
     def test_just_deletes_tile_when_no_parents_remain_and_no_scheme(self):
-        tile = _mock_tile(resource_id=CONCEPT_B, broader_ids=[CONCEPT_A])
+        reparent_children(str(self.concepts[0].pk), set(), scheme_id=None)
 
-        with (
-            patch("arches_lingo.utils.concept_lifecycle.TileModel") as MockTileModel,
-            patch("arches_lingo.utils.concept_lifecycle.Tile") as MockTile,
-        ):
-            MockTileModel.objects.filter.return_value = [tile]
-            reparent_children(CONCEPT_A, set(), scheme_id=None)
+        self.assertIsNone(self._broader_ids(self.concepts[1]))
+        self.assertFalse(self._is_top_concept(self.concepts[1]))
 
-        tile.delete.assert_called_once()
-        MockTile.assert_not_called()
+
+class PreviewConceptRemovalTests(ViewTests):
+    def test_counts_rows_touched_by_each_strategy(self):
+        preview = preview_concept_removal(str(self.concepts[0].pk))
+
+        self.assertEqual(
+            preview["reparent"],
+            {
+                "classification_tiles_updated": 3,
+                "classification_tiles_deleted": 1,
+                "top_concept_tiles_created": 1,
+            },
+        )
+        self.assertEqual(preview["orphan"]["top_concept_tiles_created"], 0)
+        self.assertEqual(preview["delete_children"]["descendant_concepts"], 4)
+
+    def test_preview_writes_nothing(self):
+        before = TileModel.objects.count()
+        preview_concept_removal(str(self.concepts[0].pk))
+        self.assertEqual(TileModel.objects.count(), before)
+        self.assertFalse(EditLog.objects.exists())
+
+    def test_preview_endpoint(self):
+        response = self.client.get(
+            reverse("api-concept-removal-preview", kwargs={"pk": self.concepts[3].pk})
+        )
+        self.assertEqual(response.status_code, 200)
+        strategies = json.loads(response.content)["strategies"]
+        self.assertEqual(strategies["orphan"]["classification_tiles_updated"], 1)
 
 
 class DeleteConceptTests(SimpleTestCase):
     def setUp(self):
         self.concept = MagicMock()
         self.concept.pk = uuid.uuid4()
+        patcher = patch(
+            "arches_lingo.utils.concept_lifecycle.queue_relation_counterpart_deletes"
+        )
+        self.mock_queue_deletes = patcher.start()
+        self.addCleanup(patcher.stop)
 
     @patch("arches_lingo.utils.concept_lifecycle.ResourceInstance")
     def test_delete_children_deletes_descendants(self, MockResourceInstance):
@@ -248,6 +279,10 @@ class DeleteConceptTests(SimpleTestCase):
             delete_concept(self.concept, "delete_children")
         MockResourceInstance.objects.filter.return_value.delete.assert_called_once()
         self.concept.delete.assert_called_once()
+        self.assertEqual(
+            self.mock_queue_deletes.call_args_list,
+            [(({"child-id"},),), (([str(self.concept.pk)],),)],
+        )
 
     @patch("arches_lingo.utils.concept_lifecycle.ResourceInstance")
     def test_delete_children_raises_when_published_descendants_exist(
@@ -278,17 +313,46 @@ class DeleteConceptTests(SimpleTestCase):
         ):
             delete_concept(self.concept, "reparent")
         mock_reparent.assert_called_once_with(
-            str(self.concept.pk), {CONCEPT_B}, SCHEME_S
+            str(self.concept.pk), {CONCEPT_B}, SCHEME_S, user=None
         )
         self.concept.delete.assert_called_once()
 
     @patch("arches_lingo.utils.concept_lifecycle.orphan_children")
     def test_orphan_calls_orphan_children(self, mock_orphan):
         delete_concept(self.concept, "orphan")
-        mock_orphan.assert_called_once_with(str(self.concept.pk))
+        mock_orphan.assert_called_once_with(str(self.concept.pk), user=None)
         self.concept.delete.assert_called_once()
 
 
+class DeleteConceptRelationTests(ViewTests):
+    def test_counterparts_of_deleted_concept_are_removed(self):
+        deleted_concept, related_concept = self.concepts[4], self.concepts[0]
+        for resource, comparate in (
+            (deleted_concept, related_concept),
+            (related_concept, deleted_concept),
+        ):
+            TileModel.objects.create(
+                resourceinstance=resource,
+                nodegroup_id=RELATION_STATUS_NODEGROUP,
+                data={
+                    RELATION_STATUS_ASCRIBED_COMPARATE_NODEID: [
+                        {"resourceId": str(comparate.pk)}
+                    ]
+                },
+                sortorder=0,
+            )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            delete_concept(deleted_concept, None)
+
+        self.assertFalse(
+            TileModel.objects.filter(
+                resourceinstance=related_concept,
+                nodegroup_id=RELATION_STATUS_NODEGROUP,
+            ).exists()
+        )
+
+
 class RetireConceptTests(SimpleTestCase):
     def setUp(self):
         self.concept = MagicMock()
@@ -318,12 +382,14 @@ class RetireConceptTests(SimpleTestCase):
             ),
         ):
             retire_concept(self.concept, "reparent")
-        mock_reparent.assert_called_once_with(str(self.concept.pk), {CONCEPT_B}, None)
+        mock_reparent.assert_called_once_with(
+            str(self.concept.pk), {CONCEPT_B}, None, user=None
+        )
 
     @patch("arches_lingo.utils.concept_lifecycle.orphan_children")
     def test_orphan_calls_orphan_children(self, mock_orphan):
         retire_concept(self.concept, "orphan")
-        mock_orphan.assert_called_once_with(str(self.concept.pk))
+        mock_orphan.assert_called_once_with(str(self.concept.pk), user=None)
 
     def test_concept_is_marked_retired_after_strategy(self):
         with patch("arches_lingo.utils.concept_lifecycle.orphan_children"):
@@ -392,7 +458,7 @@ class ConceptDeleteViewTests(ViewTests):
                 reverse("api-concept-delete", kwargs={"pk": uuid.uuid4()})
             )
         self.assertEqual(response.status_code, 200)
-        mock_delete.assert_called_once_with(mock_concept, None)
+        mock_delete.assert_called_once_with(mock_concept, None, user=self.admin)
 
     @patch("arches_lingo.views.api.concepts.ResourceInstance.objects.get")
     def test_delete_children_with_published_descendants_returns_400(self, mock_get):
@@ -478,37 +544,120 @@ class ConceptRetireViewTests(ViewTests):
                 self.assertEqual(mock_retire.call_args.args[1], strategy)
 
 
-class UnretireConceptTests(SimpleTestCase):
-    def setUp(self):
-        self.concept = MagicMock()
-        self.concept.pk = uuid.uuid4()
+class UnretireConceptTests(ViewTests):
+    """Tests for set-based unretire and lifecycle transitions."""
 
-    @patch("arches_lingo.utils.concept_lifecycle.ResourceInstance")
-    def test_cascade_updates_retired_descendants(self, MockResourceInstance):
-        with patch(
-            "arches_lingo.utils.concept_lifecycle.get_all_descendant_ids",
-            return_value={"child-id"},
-        ):
-            unretire_concept(self.concept, cascade=True)
-        MockResourceInstance.objects.filter.return_value.update.assert_called_once_with(
-            resource_instance_lifecycle_state_id=EDITING_STATE_ID
-        )
+    def _set_state(self, concept, state_id):
+        concept.resource_instance_lifecycle_state_id = state_id
+        concept.save(update_fields=["resource_instance_lifecycle_state"])
 
-    @patch("arches_lingo.utils.concept_lifecycle.ResourceInstance")
-    def test_no_cascade_skips_descendants(self, MockResourceInstance):
-        unretire_concept(self.concept, cascade=False)
-        MockResourceInstance.objects.filter.assert_not_called()
+    def _state(self, concept):
+        concept.refresh_from_db()
+        return concept.resource_instance_lifecycle_state_id
+
+    def test_cascade_unretires_retired_descendants(self):
+        for concept in self.concepts[:3]:
+            self._set_state(concept, RETIRED_STATE_ID)
+        self._set_state(self.concepts[3], DRAFT_STATE_ID)
+
+        result = unretire_concept(self.concepts[0], cascade=True)
 
-    def test_concept_is_marked_editing_after_unretire(self):
-        with patch("arches_lingo.utils.concept_lifecycle.ResourceInstance"):
-            unretire_concept(self.concept, cascade=False)
         self.assertEqual(
-            self.concept.resource_instance_lifecycle_state_id, EDITING_STATE_ID
+            result.concept_ids, {str(concept.pk) for concept in self.concepts[:3]}
         )
-        self.concept.save.assert_called_once_with(
-            update_fields=["resource_instance_lifecycle_state"]
+        for concept in self.concepts[:3]:
+            self.assertEqual(self._state(concept), EDITING_STATE_ID)
+        self.assertEqual(self._state(self.concepts[3]), DRAFT_STATE_ID)
+
+    def test_no_cascade_skips_descendants(self):
+        for concept in self.concepts[:2]:
+            self._set_state(concept, RETIRED_STATE_ID)
+
+        unretire_concept(self.concepts[0], cascade=False)
+
+        self.assertEqual(self._state(self.concepts[0]), EDITING_STATE_ID)
+        self.assertEqual(self._state(self.concepts[1]), RETIRED_STATE_ID)
+
+    def test_state_changes_share_one_edit_log_transaction(self):
+        for concept in self.concepts[:2]:
+            self._set_state(concept, RETIRED_STATE_ID)
+
+        bulk_unretire_concepts(
+            [concept.pk for concept in self.concepts[:2]], user=self.admin
+        )
+
+        edits = EditLog.objects.filter(edittype=LIFECYCLE_STATE_EDIT_TYPE)
+        self.assertEqual(edits.count(), 2)
+        self.assertEqual(edits.values("transactionid").distinct().count(), 1)
+        self.assertEqual(edits.first().newvalue, str(EDITING_STATE_ID))
+
+    def test_disallowed_transition_writes_nothing(self):
+        self._set_state(self.concepts[0], DRAFT_STATE_ID)
+
+        with self.assertRaises(ValueError):
+            transition_concepts_lifecycle_state([self.concepts[0].pk], EDITING_STATE_ID)
+
+        self.assertEqual(self._state(self.concepts[0]), DRAFT_STATE_ID)
+        self.assertFalse(
+            EditLog.objects.filter(edittype=LIFECYCLE_STATE_EDIT_TYPE).exists()
+        )
+
+    @patch("arches_lingo.utils.concept_reindex.index_resources_using_singleprocessing")
+    def test_small_sets_are_reindexed_on_commit(self, mock_index):
+        for concept in self.concepts[:2]:
+            self._set_state(concept, RETIRED_STATE_ID)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_unretire_concepts(
+                [concept.pk for concept in self.concepts[:2]], user=self.admin
+            )
+
+        mock_index.assert_called_once()
+        ((resources,), _kwargs) = mock_index.call_args
+        self.assertEqual(
+            {str(pk) for pk in resources.values_list("pk", flat=True)},
+            {str(concept.pk) for concept in self.concepts[:2]},
         )
 
+    @patch(
+        "arches_lingo.utils.concept_reindex.index_resources_using_singleprocessing",
+        side_effect=RuntimeError("search unavailable"),
+    )
+    def test_indexing_error_after_commit_is_logged(self, _index):
+        self._set_state(self.concepts[0], RETIRED_STATE_ID)
+
+        with (
+            self.assertLogs("arches_lingo.utils.concept_lifecycle", level="ERROR"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            result = bulk_unretire_concepts([self.concepts[0].pk], user=self.admin)
+
+        self.assertEqual(result.concept_ids, {str(self.concepts[0].pk)})
+        self.assertEqual(self._state(self.concepts[0]), EDITING_STATE_ID)
+
+    @patch(
+        "arches.app.utils.task_management.check_if_celery_available",
+        return_value=False,
+    )
+    @patch("arches_lingo.utils.concept_reindex.index_resources_using_singleprocessing")
+    def test_large_sets_are_reindexed_in_one_background_job(self, mock_index, _celery):
+        for concept in self.concepts:
+            self._set_state(concept, RETIRED_STATE_ID)
+
+        with (
+            self.settings(LINGO_BULK_REINDEX_BACKGROUND_THRESHOLD=2),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            result = bulk_unretire_concepts(
+                [concept.pk for concept in self.concepts], user=self.admin
+            )
+
+        self.assertIsNotNone(result.reindex_loadid)
+        mock_index.assert_called_once()
+        load_event = LoadEvent.objects.get(loadid=result.reindex_loadid)
+        self.assertEqual(load_event.status, "completed")
+        self.assertEqual(load_event.load_details["processed"], len(self.concepts))
+
 
 class ConceptUnretireViewTests(ViewTests):
     """Tests for POST /api/lingo/concept/<pk>/unretire."""
@@ -529,7 +678,10 @@ class ConceptUnretireViewTests(ViewTests):
         )
         self.assertEqual(response.status_code, 403)
 
-    @patch("arches_lingo.views.api.concept_lifecycle.unretire_concept")
+    @patch(
+        "arches_lingo.views.api.concept_lifecycle.unretire_concept",
+        return_value=ConceptTransitionResult(set(), None),
+    )
     def test_unretire_concept_returns_200(self, mock_unretire):
         response = self.client.post(
             reverse("api-concept-unretire", kwargs={"pk": self.concepts[0].pk})
@@ -537,7 +689,10 @@ class ConceptUnretireViewTests(ViewTests):
         self.assertEqual(response.status_code, 200)
         self.assertTrue(json.loads(response.content)["unretired"])
 
-    @patch("arches_lingo.views.api.concept_lifecycle.unretire_concept")
+    @patch(
+        "arches_lingo.views.api.concept_lifecycle.unretire_concept",
+        return_value=ConceptTransitionResult(set(), None),
+    )
     def test_cascade_true_is_passed_to_unretire(self, mock_unretire):
         self.client.post(
             reverse("api-concept-unretire", kwargs={"pk": self.concepts[0].pk}),
@@ -545,7 +700,10 @@ class ConceptUnretireViewTests(ViewTests):
         )
         self.assertEqual(mock_unretire.call_args.args[1], True)
 
-    @patch("arches_lingo.views.api.concept_lifecycle.unretire_concept")
+    @patch(
+        "arches_lingo.views.api.concept_lifecycle.unretire_concept",
+        return_value=ConceptTransitionResult(set(), None),
+    )
     def test_cascade_false_by_default(self, mock_unretire):
         self.client.post(
             reverse("api-concept-unretire", kwargs={"pk": self.concepts[0].pk}),
@@ -601,3 +759,34 @@ class SchemeUnretireConceptsViewTests(ViewTests):
         self.assertEqual(
             active_concept.resource_instance_lifecycle_state_id, EDITING_STATE_ID
         )
+
+
+class ConceptSetUnretireViewTests(ViewTests):
+    """Tests for POST /api/concept-sets/<pk>/unretire."""
+
+    def test_unknown_concept_set_returns_404(self):
+        with self.assertLogs("django.request", level="WARNING"):
+            response = self.client.post(
+                reverse("api-concept-set-unretire", kwargs={"pk": 999999})
+            )
+        self.assertEqual(response.status_code, 404)
+
+    def test_retired_members_are_unretired(self):
+        retired_concept = self.concepts[2]
+        retired_concept.resource_instance_lifecycle_state_id = RETIRED_STATE_ID
+        retired_concept.save(update_fields=["resource_instance_lifecycle_state"])
+        concept_set = ConceptSet.objects.create(user=self.admin, name="Retired")
+        ConceptSetMember.objects.create(
+            concept_set=concept_set, concept_id=retired_concept.pk
+        )
+
+        response = self.client.post(
+            reverse("api-concept-set-unretire", kwargs={"pk": concept_set.pk})
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)["count"], 1)
+        retired_concept.refresh_from_db()
+        self.assertEqual(
+            retired_concept.resource_instance_lifecycle_state_id, EDITING_STATE_ID
+        )
@@ -0,0 +1,113 @@
+from django.test import override_settings
+
+from arches.app.models.models import ResourceIdentifier, ResourceInstance, TileModel
+
+from arches_lingo.const import CONCEPTS_GRAPH_ID, URI_CONTENT_NODE, URI_NODEGROUP
+from arches_lingo.functions.update_concept_lifecycle_states_for_scheme import (
+    UpdateConceptLifecycleStatesForScheme,
+)
+
+from tests.tests import ViewTests
+
+URL_TEMPLATE = "http://example.org/<scheme_identifier>/<concept_identifier>"
+
+
+class RecalculateConceptUrisTests(ViewTests):
+    """Both URI recalculation modes must produce the same tiles."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        ResourceIdentifier.objects.bulk_create(
+            ResourceIdentifier(
+                resourceid=concept,
+                identifier=str(index + 1),
+                source="arches-lingo",
+                identifier_type="identifier",
+            )
+            for index, concept in enumerate(cls.concepts)
+        )
+
+    def _recalculate(self):
+        UpdateConceptLifecycleStatesForScheme()._recalculate_non_retired_concept_uris(
+            url_template=URL_TEMPLATE,
+            scheme_identifier_value="S1",
+            concept_graph_id=CONCEPTS_GRAPH_ID,
+            related_non_retired_concepts_queryset=ResourceInstance.objects.filter(
+                pk__in=[concept.pk for concept in self.concepts]
+            ),
+        )
+
+    def _uri_by_concept_id(self):
+        return {
+            tile.resourceinstance_id: tile.data[URI_CONTENT_NODE]
+            for tile in TileModel.objects.filter(nodegroup_id=URI_NODEGROUP)
+        }
+
+    def _assert_expected_uris(self):
+        self.assertEqual(
+            self._uri_by_concept_id(),
+            {
+                concept.pk: f"http://example.org/S1/{index + 1}"
+                for index, concept in enumerate(self.concepts)
+            },
+        )
+
+    def test_sql_mode_creates_and_updates_uri_tiles(self):
+        with override_settings(LINGO_URI_RECALCULATION_MODE="sql"):
+            self._recalculate()
+            self._assert_expected_uris()
+
+            ResourceIdentifier.objects.filter(resourceid=self.concepts[0]).update(
+                identifier="99"
+            )
+            self._recalculate()
+
+        self.assertEqual(
+            self._uri_by_concept_id()[self.concepts[0].pk], "http://example.org/S1/99"
+        )
+        self.assertEqual(
+            TileModel.objects.filter(nodegroup_id=URI_NODEGROUP).count(), 5
+        )
+
+    def test_stream_mode_creates_and_updates_uri_tiles(self):
+        with override_settings(LINGO_URI_RECALCULATION_MODE="stream"):
+            self._recalculate()
+            self._assert_expected_uris()
+
+            ResourceIdentifier.objects.filter(resourceid=self.concepts[0]).update(
+                identifier="99"
+            )
+            self._recalculate()
+
+        self.assertEqual(
+            self._uri_by_concept_id()[self.concepts[0].pk], "http://example.org/S1/99"
+        )
+        self.assertEqual(
+            TileModel.objects.filter(nodegroup_id=URI_NODEGROUP).count(), 5
+        )
+
+    def test_modes_pick_the_same_identifier_when_there_are_several(self):
+        ResourceIdentifier.objects.create(
+            resourceid=self.concepts[0],
+            identifier="extra",
+            source="arches-lingo",
+            identifier_type="identifier",
+        )
+        first_identifier = (
+            ResourceIdentifier.objects.filter(
+                resourceid=self.concepts[0], source="arches-lingo"
+            )
+            .order_by("pk")
+            .values_list("identifier", flat=True)
+            .first()
+        )
+
+        for mode in ("sql", "stream"):
+            with self.subTest(mode=mode):
+                with override_settings(LINGO_URI_RECALCULATION_MODE=mode):
+                    self._recalculate()
+                self.assertEqual(
+                    self._uri_by_concept_id()[self.concepts[0].pk],
+                    f"http://example.org/S1/{first_identifier}",
+                )
@@ -1,7 +1,11 @@
 import json
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
+from unittest import mock
 
+from django.core.cache import caches
+from django.test import override_settings
 from django.urls import reverse
 
 from arches.app.datatypes.datatypes import DataTypeFactory
@@ -24,6 +28,11 @@ from arches_lingo.const import (
     SCHEMES_GRAPH_ID,
 )
 
+from arches_lingo.utils.dashboard_cache import (
+    DASHBOARD_CACHE_ALIAS,
+    build_dashboard_cache_key,
+)
+
 from tests.tests import ViewTests
 
 
@@ -65,6 +74,10 @@ class DashboardTestMixin:
 class DashboardStatsViewTests(DashboardTestMixin, ViewTests):
     """Tests for GET /api/lingo/dashboard."""
 
+    def setUp(self):
+        super().setUp()
+        caches[DASHBOARD_CACHE_ALIAS].clear()
+
     def test_concept_count_all_schemes(self):
         response = self.client.get(reverse("api-lingo-dashboard"))
         data = json.loads(response.content)
@@ -307,6 +320,116 @@ class DashboardStatsViewTests(DashboardTestMixin, ViewTests):
         self.assertEqual(response.status_code, 400)
 
 
+class DashboardStatsCacheTests(DashboardTestMixin, ViewTests):
+    """Tests for the stale-while-revalidate dashboard cache."""
+
+    def setUp(self):
+        super().setUp()
+        caches[DASHBOARD_CACHE_ALIAS].clear()
+
+    def test_cache_key_ignores_scheme_order(self):
+        first_id, second_id = str(uuid.uuid4()), str(uuid.uuid4())
+        self.assertEqual(
+            build_dashboard_cache_key([first_id, second_id], 7),
+            build_dashboard_cache_key([second_id, first_id], 7),
+        )
+        self.assertNotEqual(
+            build_dashboard_cache_key([first_id], 7),
+            build_dashboard_cache_key([first_id], 30),
+        )
+
+    def test_fresh_entry_is_served_from_cache(self):
+        self.client.get(reverse("api-lingo-dashboard"))
+        ResourceInstance.objects.create(graph_id=CONCEPTS_GRAPH_ID, name="Late")
+
+        response = self.client.get(reverse("api-lingo-dashboard"))
+        data = json.loads(response.content)
+
+        self.assertEqual(data["concept_count"], 5)
+
+    def test_user_display_name_not_cached(self):
+        cache = caches[DASHBOARD_CACHE_ALIAS]
+        cache.set(
+            build_dashboard_cache_key([], None),
+            {"computed_at": time.time(), "body": {"concept_count": 99}},
+        )
+
+        response = self.client.get(reverse("api-lingo-dashboard"))
+        data = json.loads(response.content)
+
+        self.assertEqual(data["concept_count"], 99)
+        self.assertEqual(data["user_display_name"], "admin")
+
+    @mock.patch("arches_lingo.utils.dashboard_cache._refresh_in_background")
+    def test_stale_entry_served_while_single_refresh_scheduled(self, refresh):
+        cache = caches[DASHBOARD_CACHE_ALIAS]
+        cache.set(
+            build_dashboard_cache_key([], None),
+            {"computed_at": time.time() - 10_000, "body": {"concept_count": 99}},
+        )
+
+        first = json.loads(self.client.get(reverse("api-lingo-dashboard")).content)
+        second = json.loads(self.client.get(reverse("api-lingo-dashboard")).content)
+
+        self.assertEqual(first["concept_count"], 99)
+        self.assertEqual(second["concept_count"], 99)
+        # The lock is still held, so only the first request schedules a rebuild.
+        self.assertEqual(refresh.call_count, 1)
+
+    @mock.patch(
+        "arches_lingo.utils.dashboard_cache.task_management.check_if_celery_available",
+        return_value=False,
+    )
+    def test_stale_entry_refreshed_on_request_without_celery(self, _celery):
+        cache = caches[DASHBOARD_CACHE_ALIAS]
+        cache_key = build_dashboard_cache_key([], None)
+        cache.set(
+            cache_key,
+            {"computed_at": time.time() - 10_000, "body": {"concept_count": 99}},
+        )
+
+        data = json.loads(self.client.get(reverse("api-lingo-dashboard")).content)
+
+        self.assertEqual(data["concept_count"], 99)
+        self.assertNotEqual(cache.get(cache_key)["body"]["concept_count"], 99)
+        self.assertIsNone(cache.get(f"{cache_key}:lock"))
+
+    @mock.patch("arches_lingo.utils.dashboard_cache.time.sleep")
+    @mock.patch("arches_lingo.utils.dashboard_cache.build_dashboard_stats")
+    def test_cold_miss_waits_for_build_in_progress(self, build, sleep):
+        cache = caches[DASHBOARD_CACHE_ALIAS]
+        cache_key = build_dashboard_cache_key([], None)
+        # Another request holds the lock while it builds the entry
+        cache.add(f"{cache_key}:lock", True)
+        sleep.side_effect = lambda _seconds: cache.set(
+            cache_key, {"computed_at": time.time(), "body": {"concept_count": 99}}
+        )
+
+        data = json.loads(self.client.get(reverse("api-lingo-dashboard")).content)
+
+        self.assertEqual(data["concept_count"], 99)
+        build.assert_not_called()
+
+    def test_cold_miss_releases_lock(self):
+        cache = caches[DASHBOARD_CACHE_ALIAS]
+        cache_key = build_dashboard_cache_key([], None)
+
+        self.client.get(reverse("api-lingo-dashboard"))
+
+        self.assertIsNotNone(cache.get(cache_key))
+        self.assertIsNone(cache.get(f"{cache_key}:lock"))
+
+    @override_settings(LINGO_DASHBOARD_CACHE_TIMEOUT=0)
+    def test_zero_timeout_disables_cache(self):
+        self.client.get(reverse("api-lingo-dashboard"))
+        ResourceInstance.objects.create(graph_id=CONCEPTS_GRAPH_ID, name="Late")
+
+        response = self.client.get(reverse("api-lingo-dashboard"))
+        data = json.loads(response.content)
+
+        self.assertEqual(data["concept_count"], 6)
+
+
 class MissingTranslationsViewTests(DashboardTestMixin, ViewTests):
     """Tests for GET /api/lingo/concepts/missing-translations."""
 
@@ -4,10 +4,11 @@ from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
-from arches.app.models.models import EditLog, NodeGroup
+from arches.app.models.models import EditLog, NodeGroup, TileModel
 from arches.app.models.tile import Tile as RealTile
 
 from django.contrib.auth.models import User
+from django.db.models import Max
 from django.test import override_settings
 from django.urls import reverse
 
@@ -15,9 +16,20 @@ from arches_lingo.const import (
     CONCEPT_NAME_CONTENT_NODE,
     CONCEPT_NAME_LANGUAGE_NODE,
     CONCEPT_NAME_NODEGROUP,
+    RELATION_STATUS_ASCRIBED_COMPARATE_NODEID,
+    RELATION_STATUS_NODEGROUP,
     SCHEME_NAME_NODEGROUP,
 )
-from arches_lingo.utils.edit_log import revert_resource_to_timestamp
+from arches_lingo.functions.reciprocal_relationship import (
+    DELETE_COUNTERPART,
+    ReciprocalRelationshipFunction,
+)
+from arches_lingo.models import ResourceTileSnapshot
+from arches_lingo.utils.edit_log import (
+    bulk_revert_resource_to_timestamp,
+    preview_revert_resource_to_timestamp,
+    revert_resource_to_timestamp,
+)
 from tests.tests import ViewTests
 
 
@@ -157,6 +169,98 @@ class EditLogGetViewTests(EditLogTestMixin, ViewTests):
 
         self.assertEqual(response.status_code, 200)
 
+    def test_page_size_returns_cursor_for_next_page(self):
+        url = reverse("api-lingo-edit-log", args=[self.scheme.pk])
+        first_page = json.loads(self.client.get(url, {"page_size": 1}).content)
+
+        self.assertEqual(len(first_page["edits"]), 1)
+        self.assertEqual(first_page["edits"][0]["edittype"], "create")
+        self.assertIsNotNone(first_page["next_cursor"])
+
+        second_page = json.loads(
+            self.client.get(
+                url, {"page_size": 1, "cursor": first_page["next_cursor"]}
+            ).content
+        )
+        self.assertEqual(second_page["edits"][0]["edittype"], "tile create")
+        self.assertIsNone(second_page["next_cursor"])
+
+    def test_pagination_continues_through_edits_without_timestamp(self):
+        for _ in range(2):
+            self._create_edit(self.scheme, "tile edit", None)
+        url = reverse("api-lingo-edit-log", args=[self.scheme.pk])
+
+        edits = []
+        cursor = None
+        while True:
+            params = {"page_size": 1, **({"cursor": cursor} if cursor else {})}
+            page = json.loads(self.client.get(url, params).content)
+            edits.extend(page["edits"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(
+            [edit["edittype"] for edit in edits],
+            ["create", "tile create", "tile edit", "tile edit"],
+        )
+        self.assertEqual(len({edit["editlogid"] for edit in edits}), 4)
+
+    def test_last_page_has_no_cursor(self):
+        data = self._get_edit_log()
+        self.assertIsNone(data["next_cursor"])
+
+    @patch("arches_lingo.views.api.edit_log.DEFAULT_EDIT_LOG_PAGE_SIZE", 1)
+    def test_request_without_page_size_is_paginated(self):
+        data = self._get_edit_log()
+
+        self.assertEqual(len(data["edits"]), 1)
+        self.assertIsNotNone(data["next_cursor"])
+
+    def test_filters_by_edit_type(self):
+        response = self.client.get(
+            reverse("api-lingo-edit-log", args=[self.scheme.pk]),
+            {"edittype": "tile create"},
+        )
+        data = json.loads(response.content)
+
+        self.assertEqual(
+            {entry["edittype"] for entry in data["edits"]}, {"tile create"}
+        )
+
+    def test_filters_by_date_range(self):
+        response = self.client.get(
+            reverse("api-lingo-edit-log", args=[self.scheme.pk]),
+            {"until": (self.base_time + timedelta(minutes=1)).isoformat()},
+        )
+        data = json.loads(response.content)
+
+        self.assertEqual([entry["edittype"] for entry in data["edits"]], ["create"])
+
+    def test_invalid_cursor_returns_400(self):
+        with self.assertLogs("django.request", level="WARNING"):
+            response = self.client.get(
+                reverse("api-lingo-edit-log", args=[self.scheme.pk]),
+                {"cursor": "not-a-cursor"},
+            )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_permission_checked_once_per_nodegroup(self):
+        for minutes in range(10, 15):
+            self._create_edit(
+                self.scheme,
+                "tile edit",
+                self.base_time + timedelta(minutes=minutes),
+                nodegroupid=SCHEME_NAME_NODEGROUP,
+                tileid=uuid.uuid4(),
+            )
+
+        with patch.object(User, "has_perm", return_value=True) as has_perm:
+            self._get_edit_log()
+
+        self.assertEqual(has_perm.call_count, 1)
+
 
 class EditLogPostViewTests(EditLogTestMixin, ViewTests):
     """HTTP-level tests for POST /api/lingo/resource/<id>/edit-log (auth, request parsing)."""
@@ -693,3 +797,223 @@ class EditLogRevertUtilTests(EditLogTestMixin, ViewTests):
 
         self.assertEqual(len(errors), 1)
         self.assertIn("Cannot restore nested tile", errors[0])
+
+
+class EditLogRevertPreviewTests(EditLogTestMixin, ViewTests):
+    """Tests for the dry-run preview and bulk execution of reverts."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.base_time = datetime(2025, 6, 1, 12, 0, 0)  # naive — USE_TZ=False
+
+    def _create_label_history(self, concept):
+        original_data = {
+            CONCEPT_NAME_CONTENT_NODE: "Original label",
+            CONCEPT_NAME_LANGUAGE_NODE: "en",
+        }
+        modified_data = {
+            CONCEPT_NAME_CONTENT_NODE: "Modified label",
+            CONCEPT_NAME_LANGUAGE_NODE: "en",
+        }
+        tile = TileModel.objects.create(
+            resourceinstance=concept,
+            nodegroup_id=CONCEPT_NAME_NODEGROUP,
+            data=modified_data,
+        )
+        self._create_edit(
+            concept,
+            "tile create",
+            self.base_time - timedelta(hours=1),
+            tileid=tile.pk,
+            nodegroupid=CONCEPT_NAME_NODEGROUP,
+            newvalue=original_data,
+        )
+        self._create_edit(
+            concept,
+            "tile edit",
+            self.base_time + timedelta(hours=1),
+            tileid=tile.pk,
+            nodegroupid=CONCEPT_NAME_NODEGROUP,
+            newvalue=modified_data,
+            oldvalue=original_data,
+        )
+        return tile, original_data
+
+    def test_preview_reports_update_without_applying_it(self):
+        concept = self.concepts[0]
+        tile, original_data = self._create_label_history(concept)
+
+        changes = preview_revert_resource_to_timestamp(str(concept.pk), self.base_time)
+
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0]["action"], "update")
+        self.assertEqual(changes[0]["target"], original_data)
+        self.assertEqual(changes[0]["changed_nodes"], [CONCEPT_NAME_CONTENT_NODE])
+        tile.refresh_from_db()
+        self.assertEqual(tile.data[CONCEPT_NAME_CONTENT_NODE], "Modified label")
+
+    def test_preview_reports_delete_for_tile_created_after_target(self):
+        concept = self.concepts[0]
+        tile = TileModel.objects.create(
+            resourceinstance=concept,
+            nodegroup_id=CONCEPT_NAME_NODEGROUP,
+            data={CONCEPT_NAME_CONTENT_NODE: "Extra label"},
+        )
+        self._create_edit(
+            concept,
+            "tile create",
+            self.base_time + timedelta(hours=1),
+            tileid=tile.pk,
+            nodegroupid=CONCEPT_NAME_NODEGROUP,
+            newvalue=tile.data,
+        )
+
+        changes = preview_revert_resource_to_timestamp(str(concept.pk), self.base_time)
+
+        self.assertEqual([change["action"] for change in changes], ["delete"])
+
+    def test_dry_run_request_returns_changes(self):
+        concept = self.concepts[0]
+        self._create_label_history(concept)
+
+        response = self.client.post(
+            reverse("api-lingo-edit-log", args=[concept.pk]),
+            data=json.dumps({"timestamp": self.base_time.isoformat(), "dry_run": True}),
+            content_type="application/json",
+        )
+        data = json.loads(response.content)
+
+        self.assertEqual(data["status"], "preview")
+        self.assertEqual(len(data["changes"]), 1)
+
+    def test_bulk_revert_applies_changes_and_logs_them(self):
+        concept = self.concepts[0]
+        tile, original_data = self._create_label_history(concept)
+
+        errors = bulk_revert_resource_to_timestamp(
+            str(concept.pk), self.base_time, self.admin
+        )
+
+        self.assertEqual(errors, [])
+        tile.refresh_from_db()
+        self.assertEqual(tile.data, original_data)
+        revert_edit = EditLog.objects.filter(
+            tileinstanceid=str(tile.pk), note__startswith="Reverted to"
+        ).get()
+        self.assertEqual(revert_edit.edittype, "tile edit")
+        self.assertEqual(revert_edit.newvalue, original_data)
+
+    def _create_deleted_label_history(self, concept):
+        tileid = uuid.uuid4()
+        data = {CONCEPT_NAME_CONTENT_NODE: "Deleted label"}
+        self._create_edit(
+            concept,
+            "tile create",
+            self.base_time - timedelta(hours=1),
+            tileid=tileid,
+            nodegroupid=CONCEPT_NAME_NODEGROUP,
+            newvalue=data,
+        )
+        self._create_edit(
+            concept,
+            "tile delete",
+            self.base_time + timedelta(hours=1),
+            tileid=tileid,
+            nodegroupid=CONCEPT_NAME_NODEGROUP,
+            oldvalue=data,
+        )
+        return tileid
+
+    def test_bulk_revert_places_recreated_tile_after_siblings(self):
+        concept = self.concepts[0]
+        last_sortorder = (
+            TileModel.objects.filter(
+                resourceinstance=concept, nodegroup_id=CONCEPT_NAME_NODEGROUP
+            ).aggregate(last=Max("sortorder"))["last"]
+            or 0
+        )
+        tileid = self._create_deleted_label_history(concept)
+
+        errors = bulk_revert_resource_to_timestamp(
+            str(concept.pk), self.base_time, self.admin
+        )
+
+        self.assertEqual(errors, [])
+        self.assertEqual(TileModel.objects.get(pk=tileid).sortorder, last_sortorder + 1)
+
+    def test_bulk_revert_restores_sortorder_from_snapshot(self):
+        concept = self.concepts[0]
+        tileid = self._create_deleted_label_history(concept)
+        ResourceTileSnapshot.objects.create(
+            resourceinstance=concept,
+            snapshot_time=self.base_time - timedelta(minutes=30),
+            tiles={
+                str(tileid): {
+                    "nodegroupid": CONCEPT_NAME_NODEGROUP,
+                    "parenttileid": None,
+                    "sortorder": 7,
+                    "data": {CONCEPT_NAME_CONTENT_NODE: "Deleted label"},
+                }
+            },
+        )
+
+        bulk_revert_resource_to_timestamp(str(concept.pk), self.base_time, self.admin)
+
+        self.assertEqual(TileModel.objects.get(pk=tileid).sortorder, 7)
+
+    def test_bulk_revert_syncs_reciprocal_relationships(self):
+        concept, related_concept = self.concepts[0], self.concepts[1]
+        relation_data = {
+            RELATION_STATUS_ASCRIBED_COMPARATE_NODEID: [
+                {"resourceId": str(related_concept.pk)}
+            ]
+        }
+        tile = TileModel.objects.create(
+            resourceinstance=concept,
+            nodegroup_id=RELATION_STATUS_NODEGROUP,
+            data=relation_data,
+        )
+        self._create_edit(
+            concept,
+            "tile create",
+            self.base_time + timedelta(hours=1),
+            tileid=tile.pk,
+            nodegroupid=RELATION_STATUS_NODEGROUP,
+            newvalue=relation_data,
+        )
+
+        with (
+            patch.object(
+                ReciprocalRelationshipFunction, "sync_counterparts"
+            ) as sync_counterparts,
+            # The resource is reindexed on commit too; search is out of scope.
+            patch("arches_lingo.utils.edit_log.Resource"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            bulk_revert_resource_to_timestamp(
+                str(concept.pk), self.base_time, self.admin
+            )
+
+        sync_counterparts.assert_called_once_with(
+            {(str(concept.pk), str(related_concept.pk)): DELETE_COUNTERPART}
+        )
+
+    def test_dry_run_omits_nodegroups_the_user_cannot_read(self):
+        concept = self.concepts[0]
+        self._create_label_history(concept)
+
+        with patch.object(
+            User,
+            "has_perm",
+            side_effect=lambda perm, obj=None: perm != "read_nodegroup",
+        ):
+            response = self.client.post(
+                reverse("api-lingo-edit-log", args=[concept.pk]),
+                data=json.dumps(
+                    {"timestamp": self.base_time.isoformat(), "dry_run": True}
+                ),
+                content_type="application/json",
+            )
+
+        self.assertEqual(json.loads(response.content)["changes"], [])
@@ -0,0 +1,109 @@
+import json
+
+from django.core.cache import caches
+from django.urls import reverse
+
+from arches.app.models.models import ResourceIdentifier, ResourceInstance
+
+from arches_lingo.utils.identifier_cache import (
+    IDENTIFIER_CACHE_ALIAS,
+    MAX_BULK_RESOLVE_IDENTIFIERS,
+    invalidate_identifiers,
+    invalidate_identifiers_on_commit,
+    resolve_identifier,
+)
+
+from tests.tests import ViewTests
+
+
+class IdentifierResolveTests(ViewTests):
+    """Tests for cached identifier resolution and the bulk resolve endpoint."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        ResourceIdentifier.objects.create(
+            resourceid=cls.concepts[0],
+            identifier="1001",
+            source="arches-lingo",
+            identifier_type="identifier",
+        )
+
+    def setUp(self):
+        super().setUp()
+        caches[IDENTIFIER_CACHE_ALIAS].clear()
+
+    def test_resolution_is_cached(self):
+        self.assertEqual(resolve_identifier("1001"), str(self.concepts[0].pk))
+        with self.assertNumQueries(0):
+            self.assertEqual(resolve_identifier("1001"), str(self.concepts[0].pk))
+
+    def test_misses_are_cached(self):
+        self.assertIsNone(resolve_identifier("missing"))
+        with self.assertNumQueries(0):
+            self.assertIsNone(resolve_identifier("missing"))
+
+    def test_invalidation_drops_cached_miss(self):
+        self.assertIsNone(resolve_identifier("1002"))
+        ResourceIdentifier.objects.create(
+            resourceid=self.concepts[1],
+            identifier="1002",
+            source="arches-lingo",
+            identifier_type="identifier",
+        )
+
+        invalidate_identifiers(["1002"])
+
+        self.assertEqual(resolve_identifier("1002"), str(self.concepts[1].pk))
+
+    def test_invalidation_waits_for_commit(self):
+        resolve_identifier("1001")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_identifiers_on_commit(["1001"])
+            with self.assertNumQueries(0):
+                resolve_identifier("1001")
+
+        with self.assertNumQueries(1):
+            resolve_identifier("1001")
+
+    def test_deleting_resource_drops_cached_identifier(self):
+        self.assertEqual(resolve_identifier("1001"), str(self.concepts[0].pk))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ResourceInstance.objects.filter(pk=self.concepts[0].pk).delete()
+
+        self.assertIsNone(resolve_identifier("1001"))
+
+    def test_resolve_endpoint_returns_404_for_unknown_identifier(self):
+        with self.assertLogs("django.request", level="WARNING"):
+            response = self.client.get(
+                reverse(
+                    "api-lingo-concept-resolve",
+                    kwargs={"scheme_identifier": "s", "concept_identifier": "nope"},
+                )
+            )
+        self.assertEqual(response.status_code, 404)
+
+    def test_bulk_resolve_endpoint(self):
+        response = self.client.post(
+            reverse("api-lingo-identifiers-resolve"),
+            data=json.dumps({"identifiers": ["1001", "missing"]}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content)["resolved"],
+            {"1001": str(self.concepts[0].pk), "missing": None},
+        )
+
+    def test_bulk_resolve_rejects_too_many_identifiers(self):
+        identifiers = [str(n) for n in range(MAX_BULK_RESOLVE_IDENTIFIERS + 1)]
+        with self.assertLogs("django.request", level="WARNING"):
+            response = self.client.post(
+                reverse("api-lingo-identifiers-resolve"),
+                data=json.dumps({"identifiers": identifiers}),
+                content_type="application/json",
+            )
+        self.assertEqual(response.status_code, 400)
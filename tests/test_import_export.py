@@ -1,30 +1,53 @@
+import gzip
 import json
 import os
+import random
+import uuid
+from collections import defaultdict
 from io import BytesIO, StringIO
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import mock_open, patch
 
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.core import management
 from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
 from django.http import HttpRequest
-from django.test import TestCase, TransactionTestCase
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
 
 from arches.app.models.models import (
     DRelationType,
+    EditLog,
     ETLModule,
     LoadEvent,
+    LoadStaging,
     Relation,
     ResourceInstance,
+    TileModel,
     UserXNotification,
     Value,
 )
 from arches.app.utils.skos import SKOSReader
 from arches_querysets.models import ResourceTileTree
-
-from arches_lingo.etl_modules.migrate_to_lingo import LingoResourceImporter
+from pyld import jsonld
+from rdflib import Graph, Literal, URIRef
+from rdflib.namespace import DCTERMS, SKOS
+
+from arches_lingo import const
+from arches_lingo.etl_modules.migrate_to_lingo import (
+    STAGING_WRITER_BULK_CREATE,
+    STAGING_WRITER_COPY,
+    ImportPlan,
+    LingoResourceImporter,
+)
 from arches_lingo.etl_modules.lingo_resource_exporter import LingoResourceExporter
+from arches_lingo.utils.import_performance import ImportPerformance, rss_kb
+from arches_lingo.utils import rdf_sources, staging_pool
+from arches_lingo.utils.ntriples import parse_line
+from arches_lingo.utils.rdf_xml import iter_subject_statements
+from arches_lingo.utils.skos import SKOS_IMPORT_BASEUUID, SKOSReader as LingoSKOSReader
 from tests.tests import ViewTests
 
 from .test_settings import PROJECT_TEST_ROOT
@@ -154,6 +177,13 @@ class ImportTests(TransactionTestCase):
             stdout=stdout,
         )
         self._assert_resources_loaded()
+        self.assertIn("Import performance:", stdout.getvalue())
+        phases = LoadEvent.objects.first().load_details["performance"]["phases"]
+        self.assertLessEqual(
+            {"parse", "transform", "stage", "validate", "save_to_tiles", "index"},
+            phases.keys(),
+        )
+        self.assertEqual(phases["parse"]["concepts"], 16)
         print("Test import from CLI completed.\n")
 
         # Reverse load to clear out the loaded resources
@@ -265,6 +295,780 @@ class ImportTests(TransactionTestCase):
         )
         self.assertIn("Import failed", latest_notification.message)
 
+    def test_delta_reimport_stages_only_changed_tiles(self):
+        management.call_command(
+            "packages",
+            operation="import_lingo_resources",
+            source=str(self.fixture_path),
+            overwrite=True,
+            delta=True,
+            stdout=StringIO(),
+        )
+        self._assert_resources_loaded()
+
+        edition = Path(settings.UPLOADED_FILES_DIR) / "tmp" / self.file_name
+        edition.parent.mkdir(parents=True, exist_ok=True)
+        edition.write_text(
+            self.fixture_path.read_text(encoding="utf-8").replace(
+                '"value": "junk sculpture"', '"value": "junk assemblage"'
+            ),
+            encoding="utf-8",
+        )
+        self.addCleanup(edition.unlink)
+        management.call_command(
+            "packages",
+            operation="import_lingo_resources",
+            source=str(edition),
+            overwrite=True,
+            delta=True,
+            stdout=StringIO(),
+        )
+
+        reimport = LoadEvent.objects.order_by("load_start_time").last()
+        self.assertEqual(reimport.status, "indexed")
+        self.assertEqual(
+            list(
+                LoadStaging.objects.filter(load_event=reimport).values_list(
+                    "operation", flat=True
+                )
+            ),
+            ["update"],
+        )
+        self.assertEqual(ResourceTileTree.get_tiles(graph_slug="concept").count(), 16)
+        self.assertTrue(
+            ResourceTileTree.get_tiles(graph_slug="concept")
+            .filter(
+                appellative_status_ascribed_name_content__any_contains="junk assemblage"
+            )
+            .exists()
+        )
+
+    def test_delta_reimport_stages_deletes(self):
+        # The first import is not a delta import: delta imports must still
+        # match the resources it created
+        management.call_command(
+            "packages",
+            operation="import_lingo_resources",
+            source=str(self.fixture_path),
+            overwrite=True,
+            stdout=StringIO(),
+        )
+        german_scope_note = "Arbeit, die"
+        edition = Path(settings.UPLOADED_FILES_DIR) / "tmp" / self.file_name
+        edition.parent.mkdir(parents=True, exist_ok=True)
+        edition.write_text(
+            "".join(
+                line
+                for line in self.fixture_path.read_text(encoding="utf-8").splitlines(
+                    keepends=True
+                )
+                if german_scope_note not in line
+            ),
+            encoding="utf-8",
+        )
+        self.addCleanup(edition.unlink)
+        management.call_command(
+            "packages",
+            operation="import_lingo_resources",
+            source=str(edition),
+            overwrite=True,
+            delta=True,
+            stdout=StringIO(),
+        )
+
+        reimport = LoadEvent.objects.order_by("load_start_time").last()
+        self.assertEqual(reimport.status, "indexed")
+        self.assertEqual(
+            list(
+                LoadStaging.objects.filter(load_event=reimport).values_list(
+                    "operation", flat=True
+                )
+            ),
+            ["delete"],
+        )
+        concepts = ResourceTileTree.get_tiles(graph_slug="concept")
+        self.assertEqual(concepts.count(), 16)
+        junk_sculpture = concepts.get(
+            appellative_status_ascribed_name_content__any_contains="Gerümpelplastik"
+        )
+        statement_tile_trees = junk_sculpture.aliased_data.statement
+        self.assertEqual(len(statement_tile_trees), 1)
+        self.assertNotIn(german_scope_note, str(statement_tile_trees[0].aliased_data))
+
+
+class StreamingSKOSReaderTests(TestCase):
+    """Tests for reading SKOS files without building a graph."""
+
+    fixture_path = (
+        Path(PROJECT_TEST_ROOT) / "fixtures" / "data" / "skos_rdf_import_example.xml"
+    )
+
+    def _tiles_by_resource(self, resources):
+        tiles_by_resource = defaultdict(list)
+        for resource in resources:
+            tiles_by_resource[str(resource["resourceinstanceid"])].extend(
+                json.dumps(mock_tile, sort_keys=True)
+                for mock_tile in resource["tile_data"]
+            )
+        return tiles_by_resource
+
+    def test_nested_nodes_are_grouped_by_subject(self):
+        rdf_xml = b"""<?xml version="1.0" encoding="utf-8"?>
+            <rdf:RDF
+              xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+              xmlns:skos="http://www.w3.org/2004/02/skos/core#"
+              xml:lang="de"
+            >
+              <skos:Concept rdf:about="http://example.org/parent">
+                <skos:prefLabel>Eltern</skos:prefLabel>
+                <skos:narrower>
+                  <skos:Concept rdf:about="http://example.org/child">
+                    <skos:prefLabel xml:lang="en">child</skos:prefLabel>
+                  </skos:Concept>
+                </skos:narrower>
+              </skos:Concept>
+            </rdf:RDF>
+        """
+        groups = dict(iter_subject_statements(BytesIO(rdf_xml)))
+
+        self.assertEqual(
+            set(groups), {"http://example.org/parent", "http://example.org/child"}
+        )
+        parent_statements = dict(
+            (str(predicate).rsplit("#", 1)[1], object)
+            for predicate, object in groups["http://example.org/parent"]
+        )
+        self.assertEqual(parent_statements["narrower"], "http://example.org/child")
+        self.assertEqual(parent_statements["prefLabel"].language, "de")
+        (child_label,) = [
+            object
+            for predicate, object in groups["http://example.org/child"]
+            if str(predicate).endswith("#prefLabel")
+        ]
+        self.assertEqual(child_label.language, "en")
+
+    def test_stream_matches_graph_import(self):
+        graph_reader = LingoSKOSReader()
+        schemes, concepts = graph_reader.extract_concepts_from_skos_for_lingo_import(
+            graph_reader.read_file(str(self.fixture_path))
+        )
+
+        with open(self.fixture_path, "rb") as skos_file:
+            streamed = list(
+                LingoSKOSReader().iter_lingo_resources_from_rdf_xml(skos_file)
+            )
+
+        self.assertEqual(
+            {
+                str(resource["resourceinstanceid"])
+                for resource in streamed
+                if resource["type"] == "Scheme"
+            },
+            {str(scheme["resourceinstanceid"]) for scheme in schemes},
+        )
+        expected = self._tiles_by_resource(schemes + concepts)
+        actual = self._tiles_by_resource(streamed)
+        self.assertEqual(set(actual), set(expected))
+        for resourceinstanceid, mock_tiles in expected.items():
+            with self.subTest(resourceinstanceid=resourceinstanceid):
+                self.assertCountEqual(actual[resourceinstanceid], mock_tiles)
+
+    def test_other_serializations_match_rdf_xml(self):
+        with open(self.fixture_path, "rb") as skos_file:
+            expected = self._tiles_by_resource(
+                LingoSKOSReader().iter_lingo_resources(
+                    skos_file, "xml", SKOS_IMPORT_BASEUUID
+                )
+            )
+        graph = Graph().parse(str(self.fixture_path), format="xml")
+        ntriples = graph.serialize(format="nt", encoding="utf-8")
+        # Dumps are sorted by subject; an N-Triples group per subject.
+        sorted_ntriples = b"\n".join(sorted(ntriples.splitlines()))
+        turtle = graph.serialize(format="turtle", encoding="utf-8")
+        document = jsonld.compact(
+            jsonld.from_rdf(ntriples.decode(), {"format": "application/nquads"}),
+            {"skos": str(SKOS), "dcterms": str(DCTERMS)},
+        )
+
+        sources = (
+            ("skos.nt.gz", gzip.compress(sorted_ntriples)),
+            ("skos.ttl", turtle),
+            ("skos.ttl.gz", gzip.compress(turtle)),
+            ("skos.jsonld", json.dumps(document).encode()),
+        )
+        for file_name, data in sources:
+            with self.subTest(file_name=file_name):
+                _name, serialization, gzipped = rdf_sources.split_file_name(file_name)
+                resources = LingoSKOSReader().iter_lingo_resources(
+                    rdf_sources.decompress(BytesIO(data), gzipped),
+                    serialization,
+                    SKOS_IMPORT_BASEUUID,
+                )
+                self.assertEqual(self._tiles_by_resource(resources), expected)
+
+    def test_turtle_yields_each_subject_once(self):
+        turtle = b"""
+            @prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+            <http://example.org/concept> skos:prefLabel "Concept"@en ;
+                skos:broader <http://example.org/parent> .
+            <http://example.org/parent> skos:prefLabel "Parent"@en .
+        """
+        read = rdf_sources.subject_statement_reader(BytesIO(turtle), "turtle")
+
+        groups = list(read())
+
+        self.assertCountEqual(
+            [subject for subject, _statements in groups],
+            [URIRef("http://example.org/concept"), URIRef("http://example.org/parent")],
+        )
+        self.assertCountEqual(
+            dict(groups)[URIRef("http://example.org/concept")],
+            [
+                (SKOS.prefLabel, Literal("Concept", lang="en")),
+                (SKOS.broader, URIRef("http://example.org/parent")),
+            ],
+        )
+        self.assertEqual(dict(read()), dict(groups))
+
+    def test_jsonld_statements_match_other_parsers(self):
+        document = {
+            "@context": {"skos": str(SKOS)},
+            "@id": "http://example.org/concept",
+            "skos:prefLabel": {"@value": "Concept", "@language": "en"},
+            "skos:notation": "C1",
+            "skos:broader": {"@id": "http://example.org/parent"},
+        }
+        read = rdf_sources.subject_statement_reader(
+            BytesIO(json.dumps(document).encode()), "json-ld"
+        )
+
+        groups = list(read())
+
+        self.assertEqual(len(groups), 1)
+        subject, statements = groups[0]
+        self.assertEqual(subject, URIRef("http://example.org/concept"))
+        self.assertCountEqual(
+            statements,
+            [
+                (SKOS.prefLabel, Literal("Concept", lang="en")),
+                (SKOS.notation, Literal("C1")),
+                (SKOS.broader, URIRef("http://example.org/parent")),
+            ],
+        )
+        self.assertEqual(list(read()), groups)
+
+    def _assert_same_tiles(self, resources, expected):
+        actual = self._tiles_by_resource(resources)
+        self.assertEqual(set(actual), set(expected))
+        for resourceinstanceid, mock_tiles in expected.items():
+            with self.subTest(resourceinstanceid=resourceinstanceid):
+                self.assertCountEqual(actual[resourceinstanceid], mock_tiles)
+
+    def test_unsorted_ntriples_match_rdf_xml(self):
+        with open(self.fixture_path, "rb") as skos_file:
+            expected = self._tiles_by_resource(
+                LingoSKOSReader().iter_lingo_resources(
+                    skos_file, "xml", SKOS_IMPORT_BASEUUID
+                )
+            )
+        lines = (
+            Graph()
+            .parse(str(self.fixture_path), format="xml")
+            .serialize(format="nt", encoding="utf-8")
+            .splitlines()
+        )
+        random.Random(0).shuffle(lines)
+
+        resources = LingoSKOSReader().iter_lingo_resources(
+            BytesIO(b"\n".join(lines)), "nt", SKOS_IMPORT_BASEUUID
+        )
+
+        self._assert_same_tiles(resources, expected)
+
+    def test_subject_split_across_descriptions(self):
+        header = b"""<?xml version="1.0" encoding="utf-8"?>
+            <rdf:RDF
+              xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+              xmlns:skos="http://www.w3.org/2004/02/skos/core#"
+              xml:lang="en"
+            >
+              <skos:ConceptScheme rdf:about="http://example.org/scheme">
+                <skos:prefLabel>Scheme</skos:prefLabel>
+              </skos:ConceptScheme>
+        """
+        merged = (
+            header
+            + b"""
+              <rdf:Description rdf:about="http://example.org/concept">
+                <skos:prefLabel>Concept</skos:prefLabel>
+                <skos:inScheme rdf:resource="http://example.org/scheme"/>
+              </rdf:Description>
+            </rdf:RDF>
+        """
+        )
+        split = (
+            header
+            + b"""
+              <rdf:Description rdf:about="http://example.org/concept">
+                <skos:prefLabel>Concept</skos:prefLabel>
+              </rdf:Description>
+              <rdf:Description rdf:about="http://example.org/concept">
+                <skos:inScheme rdf:resource="http://example.org/scheme"/>
+              </rdf:Description>
+            </rdf:RDF>
+        """
+        )
+        expected = self._tiles_by_resource(
+            LingoSKOSReader().iter_lingo_resources(
+                BytesIO(merged), "xml", SKOS_IMPORT_BASEUUID
+            )
+        )
+
+        resources = LingoSKOSReader().iter_lingo_resources(
+            BytesIO(split), "xml", SKOS_IMPORT_BASEUUID
+        )
+
+        self.assertEqual(len(expected), 2)
+        self._assert_same_tiles(resources, expected)
+
+    def test_ntriples_terms_are_unescaped(self):
+        subject, predicate, object = parse_line(
+            "<http://example.org/a> <http://www.w3.org/2004/02/skos/core#prefLabel> "
+            '"caf\\u00E9 \\"noir\\""@fr .'
+        )
+        self.assertEqual(subject, URIRef("http://example.org/a"))
+        self.assertEqual(predicate, SKOS.prefLabel)
+        self.assertEqual(object, Literal('caf\u00e9 "noir"', lang="fr"))
+        self.assertIsNone(parse_line("# comment"))
+        with self.assertRaises(ValueError):
+            parse_line("<http://example.org/a> skos:prefLabel .")
+
+    def test_unsupported_extension_is_rejected(self):
+        with self.assertRaises(ValueError):
+            rdf_sources.split_file_name("skos.csv.gz")
+
+
+def prepare_in_process(chunks, workers, loadid, userid, lookups_by_type):
+    """Stand-in for the staging process pool, which cannot reach the test
+    database from spawned workers."""
+    importer = LingoResourceImporter(loadid=loadid, userid=userid)
+    import_plans = {
+        resource_type: ImportPlan(importer, *lookups)
+        for resource_type, lookups in lookups_by_type.items()
+    }
+    for chunk in chunks:
+        yield importer.prepare_staging_chunk(chunk, import_plans)
+
+
+class StagingWriterTests(TestCase):
+    """Staging writers and worker settings all stage identical rows."""
+
+    @classmethod
+    def setUpTestData(cls):
+        ViewTests.setUpTestData()
+        ImportTests.register_etl_module()
+
+    def _importer(self, staging_writer=STAGING_WRITER_COPY, staging_workers=1):
+        load_event = LoadEvent.objects.create(
+            user_id=1,
+            etl_module=ETLModule.objects.get(slug="migrate-to-lingo"),
+            status="running",
+        )
+        return LingoResourceImporter(
+            loadid=load_event.loadid,
+            userid=1,
+            staging_writer=staging_writer,
+            staging_workers=staging_workers,
+        )
+
+    def _fixture_resources(self):
+        with open(StreamingSKOSReaderTests.fixture_path, "rb") as skos_file:
+            yield from LingoSKOSReader().iter_lingo_resources_from_rdf_xml(skos_file)
+
+    def _staged_rows(self, importer):
+        return list(
+            LoadStaging.objects.filter(load_event_id=importer.loadid)
+            .order_by("resourceid", "nodegroup_id", "sortorder")
+            .values(
+                "resourceid",
+                "nodegroup_id",
+                "sortorder",
+                "value",
+                "nodegroup_depth",
+                "source_description",
+                "passes_validation",
+                "operation",
+                "parenttileid",
+            )
+        )
+
+    def _stage_fixture(self, staging_writer, staging_workers=1):
+        importer = self._importer(staging_writer, staging_workers)
+        with connection.cursor() as cursor:
+            importer.populate_staging_table(
+                cursor, self._fixture_resources(), importer.get_lookups_by_type()
+            )
+        return self._staged_rows(importer)
+
+    def test_copy_writer_matches_bulk_create(self):
+        copied = self._stage_fixture(STAGING_WRITER_COPY)
+        created = self._stage_fixture(STAGING_WRITER_BULK_CREATE)
+
+        self.assertTrue(copied)
+        self.assertEqual(copied, created)
+
+    @patch(
+        "arches_lingo.etl_modules.migrate_to_lingo.STAGING_WORKER_CHUNK_CONCEPT_COUNT",
+        3,
+    )
+    @patch(
+        "arches_lingo.etl_modules.migrate_to_lingo.staging_pool.iter_prepared_chunks",
+        side_effect=prepare_in_process,
+    )
+    def test_pooled_preparation_matches_serial(self, mock_pool):
+        serial = self._stage_fixture(STAGING_WRITER_COPY)
+        pooled = self._stage_fixture(STAGING_WRITER_COPY, staging_workers=2)
+
+        mock_pool.assert_called_once()
+        self.assertEqual(pooled, serial)
+
+    def test_staging_pool_worker_prepares_chunks(self):
+        importer = self._importer()
+        resources = list(self._fixture_resources())
+        lookups_by_type = importer.get_lookups_by_type()
+        import_plans = {
+            resource_type: ImportPlan(importer, *lookups)
+            for resource_type, lookups in lookups_by_type.items()
+        }
+        self.addCleanup(staging_pool._worker.clear)
+
+        staging_pool._init_worker(str(importer.loadid), 1, lookups_by_type)
+
+        self.assertEqual(
+            staging_pool._prepare_chunk(resources[:3]),
+            importer.prepare_staging_chunk(resources[:3], import_plans),
+        )
+        self.assertEqual(
+            staging_pool._prepare_chunk(resources[3:]),
+            importer.prepare_staging_chunk(resources[3:], import_plans),
+        )
+
+    @patch("arches_lingo.etl_modules.migrate_to_lingo.os.cpu_count", return_value=4)
+    def test_staging_workers_are_clamped(self, mock_cpu_count):
+        parse = LingoResourceImporter.parse_staging_workers
+        default = settings.LINGO_IMPORT_STAGING_WORKERS
+
+        self.assertEqual(parse("2"), 2)
+        self.assertEqual(parse(None), default)
+        self.assertEqual(parse(""), default)
+        self.assertEqual(parse("many"), default)
+        self.assertEqual(parse("0"), 1)
+        self.assertEqual(parse("-3"), 1)
+        self.assertEqual(parse("1000"), max(default, 4))
+
+    def test_write_rejects_unknown_staging_writer(self):
+        importer = self._importer(staging_writer="insert")
+
+        response = importer.write(request=None)
+
+        self.assertFalse(response["success"])
+        self.assertIn("insert", response["message"])
+        self.assertEqual(LoadEvent.objects.get(pk=importer.loadid).status, "failed")
+
+    def test_compare_staging_writers_rolls_back(self):
+        importer = LingoResourceImporter(loadid=str(uuid.uuid4()), userid=1)
+        importer.file = open(StreamingSKOSReaderTests.fixture_path, "rb")
+        self.addCleanup(importer.file.close)
+
+        statistics_by_writer = importer.compare_staging_writers()
+
+        self.assertEqual(
+            list(statistics_by_writer),
+            [STAGING_WRITER_COPY, STAGING_WRITER_BULK_CREATE],
+        )
+        self.assertEqual(
+            statistics_by_writer[STAGING_WRITER_COPY]["tiles"],
+            statistics_by_writer[STAGING_WRITER_BULK_CREATE]["tiles"],
+        )
+        self.assertFalse(LoadEvent.objects.filter(pk=importer.loadid).exists())
+        self.assertFalse(LoadStaging.objects.filter(load_event_id=importer.loadid))
+
+    def test_intermediate_file_round_trips_resources(self):
+        importer = self._importer()
+        resources = list(self._fixture_resources())
+
+        path, resource_count = importer.write_intermediate_file(iter(resources))
+        self.addCleanup(importer.delete_intermediate_file, path)
+
+        self.assertEqual(resource_count, len(resources))
+        self.assertEqual(
+            list(importer.read_intermediate_file(path)),
+            json.loads(json.dumps(resources, cls=DjangoJSONEncoder)),
+        )
+
+    @patch("arches_lingo.etl_modules.migrate_to_lingo.STAGING_BATCH_CONCEPT_COUNT", 3)
+    def test_resumed_staging_matches_uninterrupted(self):
+        uninterrupted = self._stage_fixture(STAGING_WRITER_COPY)
+        resources = list(self._fixture_resources())
+        importer = self._importer()
+        lookups_by_type = importer.get_lookups_by_type()
+
+        with connection.cursor() as cursor:
+            # A run that stopped after its first two chunks
+            importer.populate_staging_table(cursor, resources[:6], lookups_by_type)
+            staged_resources = importer.get_load_details()["staged_resources"]
+            self.assertEqual(staged_resources, 6)
+
+            resumed = LingoResourceImporter(loadid=importer.loadid, userid=1)
+            resumed.populate_staging_table(
+                cursor,
+                resources[staged_resources:],
+                lookups_by_type,
+                staged_resources=staged_resources,
+            )
+
+        self.assertEqual(resumed.get_load_details()["staged_resources"], len(resources))
+        self.assertEqual(self._staged_rows(importer), uninterrupted)
+
+
+class RDMExtractionTests(TestCase):
+    """Tests for reading schemes and concepts from the RDM."""
+
+    @classmethod
+    def setUpTestData(cls):
+        ViewTests.setUpTestData()
+        ImportTests.register_etl_module()
+        skos = SKOSReader()
+        skos.save_concepts_from_skos(
+            skos.read_file(str(StreamingSKOSReaderTests.fixture_path))
+        )
+        cls.scheme_conceptid = Value.objects.get(value="Test Thesaurus").concept_id
+
+    def test_estimate_counts_scheme_and_concepts(self):
+        request = HttpRequest()
+        request.method = "POST"
+        request.user = User.objects.get(username="admin")
+        request.POST["scheme"] = str(self.scheme_conceptid)
+        importer = LingoResourceImporter(loadid=None, userid=1)
+
+        response = importer.estimate_concept_count(request)
+
+        # The fixture's scheme and its 16 concepts
+        self.assertEqual(
+            response["data"], {"concept_count": 17, "runs_in_background": False}
+        )
+
+    def test_concepts_are_merged_with_their_matched_concepts(self):
+        junk_sculpture = Value.objects.get(value="junk sculpture").concept
+        Relation(
+            conceptfrom=junk_sculpture,
+            conceptto=Value.objects.get(value="Example Concept 1").concept,
+            relationtype=DRelationType.objects.get(relationtype="relatedMatch"),
+        ).save()
+        importer = LingoResourceImporter(loadid=None, userid=1)
+
+        with connection.cursor() as cursor:
+            schemes, concepts = importer.extract_schemes_and_concepts_from_rdm(
+                cursor, self.scheme_conceptid
+            )
+            concepts = list(concepts)
+
+        self.assertEqual(len(schemes), 1)
+        self.assertEqual(len(concepts), 16)
+        concept_ids = [concept["resourceinstanceid"] for concept in concepts]
+        self.assertEqual(concept_ids, sorted(concept_ids))
+        junk_sculpture_tiles = next(
+            concept["tile_data"]
+            for concept in concepts
+            if concept["resourceinstanceid"] == junk_sculpture.pk
+        )
+        self.assertIn(
+            "relatedMatch",
+            [
+                tile["match_status"]["match_status_ascribed_relation"]
+                for tile in junk_sculpture_tiles
+                if "match_status" in tile
+            ],
+        )
+
+
+class ImportPerformanceTests(SimpleTestCase):
+    """Tests for the per-phase import report."""
+
+    def test_phases_record_counters_and_report_updates(self):
+        reports = []
+        performance = ImportPerformance(
+            {"phases": {"parse": {"seconds": 2.0, "peak_rss_kb": 1}}},
+            on_update=reports.append,
+        )
+
+        with performance.phase("stage") as counters:
+            counters["tiles"] = 3
+
+        report = reports[-1]
+        self.assertEqual(list(report["phases"]), ["parse", "stage"])
+        self.assertEqual(report["phases"]["stage"]["tiles"], 3)
+        self.assertGreaterEqual(report["total_seconds"], 2.0)
+        self.assertTrue(ImportPerformance.format(report)[1].startswith("stage"))
+        self.assertNotIn("peak_rss_kb", report["phases"]["stage"])
+        self.assertIn("process lifetime peak", ImportPerformance.format(report)[-1])
+
+    def test_rss_is_sampled_from_proc(self):
+        with (
+            patch("builtins.open", mock_open(read_data="1000 250 30 1 0 200 0\n")),
+            patch("os.sysconf", return_value=4096),
+        ):
+            self.assertEqual(rss_kb(), 1000)
+
+        with patch("builtins.open", side_effect=OSError):
+            self.assertIsNone(rss_kb())
+
+
+class ImportPlanTests(TestCase):
+    """Tests for the compiled per-graph tile staging lookups."""
+
+    @classmethod
+    def setUpTestData(cls):
+        ViewTests.setUpTestData()
+        ImportTests.register_etl_module()
+
+    def setUp(self):
+        load_event = LoadEvent.objects.create(
+            user_id=1,
+            etl_module=ETLModule.objects.get(slug="migrate-to-lingo"),
+            status="running",
+        )
+        self.importer = LingoResourceImporter(loadid=load_event.loadid, userid=1)
+        nodegroup_lookup, nodes = self.importer.get_graph_tree(const.CONCEPTS_GRAPH_ID)
+        self.import_plan = ImportPlan(
+            self.importer, nodegroup_lookup, self.importer.get_node_lookup(nodes)
+        )
+
+    def test_blank_tile_values_are_independent(self):
+        nodegroupid = self.import_plan.node_lookup["statement"]["nodeid"]
+        nodeid = self.import_plan.node_lookup["statement_content"]["nodeid"]
+
+        first = self.import_plan.blank_tile_value(nodegroupid)
+        first[nodeid]["value"] = "changed"
+        second = self.import_plan.blank_tile_value(nodegroupid)
+
+        self.assertIsNone(second[nodeid]["value"])
+        self.assertEqual(second[nodeid]["datatype"], first[nodeid]["datatype"])
+
+    def test_validation_errors_are_written_per_batch(self):
+        with patch.object(
+            self.importer,
+            "prepare_data_for_loading",
+            return_value=(None, [{"title": "Invalid", "message": "bad value"}]),
+        ):
+            tile_value, valid = self.importer.create_tile_value(
+                {"statement": {"statement_content": "text"}},
+                "statement",
+                self.import_plan,
+            )
+
+        nodeid = self.import_plan.node_lookup["statement_content"]["nodeid"]
+        self.assertFalse(valid)
+        self.assertEqual(tile_value[nodeid]["notes"], "bad value")
+        self.assertEqual(len(self.importer.pending_load_errors), 1)
+
+        with connection.cursor() as cursor:
+            self.importer.write_load_errors(cursor)
+            cursor.execute(
+                "SELECT message FROM load_errors WHERE loadid = %s",
+                [self.importer.loadid],
+            )
+            self.assertEqual(cursor.fetchall(), [("bad value",)])
+        self.assertEqual(self.importer.pending_load_errors, [])
+
+
+class RelationCounterpartSyncTests(ViewTests):
+    """Tests for mirroring relation tiles written by save_to_tiles."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        ImportTests.register_etl_module()
+
+    def _relation_tile(self, resource, related):
+        return TileModel.objects.create(
+            resourceinstance=resource,
+            nodegroup_id=const.RELATION_STATUS_NODEGROUP,
+            data={
+                const.RELATION_STATUS_ASCRIBED_COMPARATE_NODEID: [
+                    {"resourceId": str(related.pk)}
+                ]
+            },
+            sortorder=0,
+        )
+
+    def _relation_tiles_on(self, resource):
+        return TileModel.objects.filter(
+            resourceinstance=resource,
+            nodegroup_id=const.RELATION_STATUS_NODEGROUP,
+        )
+
+    def test_saved_and_deleted_relations_sync_counterparts(self):
+        source, added, removed = self.concepts[0], self.concepts[1], self.concepts[2]
+        self._relation_tile(removed, source)
+        deleted_tile = self._relation_tile(source, removed)
+        # As read before save_to_tiles deleted one tile and inserted the other
+        staged = [(deleted_tile.pk, source.pk, "delete", deleted_tile.data)]
+        deleted_tile.delete()
+        saved_tile = self._relation_tile(source, added)
+        staged.append((saved_tile.pk, source.pk, "insert", None))
+        importer = LingoResourceImporter(loadid=None, userid=1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            importer.sync_relation_counterparts(staged)
+
+        self.assertFalse(self._relation_tiles_on(removed).exists())
+        (counterpart,) = self._relation_tiles_on(added)
+        self.assertEqual(
+            counterpart.data[const.RELATION_STATUS_ASCRIBED_COMPARATE_NODEID][0][
+                "resourceId"
+            ],
+            str(source.pk),
+        )
+
+    def test_staged_delete_removes_tile_before_syncing_counterpart(self):
+        source, related = self.concepts[0], self.concepts[1]
+        counterpart = self._relation_tile(related, source)
+        deleted_tile = self._relation_tile(source, related)
+        load_event = LoadEvent.objects.create(
+            user_id=1,
+            etl_module=ETLModule.objects.get(slug="migrate-to-lingo"),
+            status="completed",
+        )
+        LoadStaging.objects.create(
+            load_event=load_event,
+            nodegroup_id=const.RELATION_STATUS_NODEGROUP,
+            resourceid=source.pk,
+            tileid=deleted_tile.pk,
+            value={},
+            passes_validation=True,
+            nodegroup_depth=1,
+            operation="delete",
+        )
+        importer = LingoResourceImporter(loadid=load_event.loadid, userid=1)
+        importer.performance = ImportPerformance()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            importer.apply_staged_deletes(importer.read_staged_relation_tiles())
+
+        self.assertFalse(TileModel.objects.filter(pk=deleted_tile.pk).exists())
+        self.assertFalse(TileModel.objects.filter(pk=counterpart.pk).exists())
+        self.assertTrue(
+            EditLog.objects.filter(
+                transactionid=load_event.loadid,
+                tileinstanceid=str(deleted_tile.pk),
+                edittype="tile delete",
+            ).exists()
+        )
+        self.assertEqual(
+            list(importer.performance.phases), ["delete", "reciprocal_sync"]
+        )
+
 
 class ExportTests(TestCase):
 
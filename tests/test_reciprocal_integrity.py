@@ -0,0 +1,199 @@
+import csv
+import json
+import os
+import tempfile
+import uuid
+from datetime import datetime
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.urls import reverse
+
+from arches.app.models.models import LoadEvent, TileModel
+
+from arches_lingo.const import (
+    RELATION_STATUS_ASCRIBED_COMPARATE_NODEID,
+    RELATION_STATUS_ASCRIBED_RELATION_NODEID,
+    RELATION_STATUS_NODEGROUP,
+)
+from arches_lingo.functions.reciprocal_relationship import (
+    ReciprocalRelationshipFunction,
+)
+from arches_lingo.utils.reciprocal_integrity import (
+    DANGLING,
+    MISMATCH,
+    ORPHAN,
+    audit_reciprocal_relationships,
+    repair_reciprocal_relationships,
+    start_reciprocal_integrity_audit,
+)
+
+from tests.test_edit_log import EditLogTestMixin
+from tests.tests import ViewTests
+
+# These tests can be run from the command line via:
+# python manage.py test tests.test_reciprocal_integrity --settings="tests.test_settings"
+
+
+class ReciprocalIntegrityTests(EditLogTestMixin, ViewTests):
+    """Tests for auditing and repairing reciprocal relationship tiles."""
+
+    def setUp(self):
+        super().setUp()
+        self.fn = ReciprocalRelationshipFunction()
+        self.first = str(self.concepts[0].pk)
+        self.second = str(self.concepts[1].pk)
+
+    def _relation_tile(self, resource_id, related_resource_id, relation="related"):
+        return TileModel.objects.create(
+            tileid=uuid.uuid4(),
+            resourceinstance_id=resource_id,
+            nodegroup_id=RELATION_STATUS_NODEGROUP,
+            data={
+                **{node_id: None for node_id in self.fn.MIRRORED_NODES},
+                RELATION_STATUS_ASCRIBED_RELATION_NODEID: relation,
+                RELATION_STATUS_ASCRIBED_COMPARATE_NODEID: (
+                    self.fn._build_comparate_value(related_resource_id)
+                ),
+            },
+            sortorder=0,
+        )
+
+    def _counterparts_on(self, resource_id):
+        return TileModel.objects.filter(
+            resourceinstance_id=resource_id, nodegroup_id=RELATION_STATUS_NODEGROUP
+        )
+
+    def test_consistent_pair_has_no_issues(self):
+        self._relation_tile(self.first, self.second)
+        self._relation_tile(self.second, self.first)
+
+        relation_tile_count, issues = audit_reciprocal_relationships()
+
+        self.assertEqual(relation_tile_count, 2)
+        self.assertEqual(issues, [])
+
+    def test_orphan_is_reported_and_repaired(self):
+        tile = self._relation_tile(self.first, self.second)
+
+        _count, issues = audit_reciprocal_relationships()
+        (issue,) = issues
+        self.assertEqual(issue.kind, ORPHAN)
+        self.assertEqual(issue.tileid, str(tile.pk))
+        self.assertEqual(issue.related_resourceid, self.second)
+
+        self.assertEqual(repair_reciprocal_relationships(issues), 1)
+        (counterpart,) = self._counterparts_on(self.second)
+        self.assertEqual(
+            counterpart.data[RELATION_STATUS_ASCRIBED_RELATION_NODEID], "related"
+        )
+        self.assertEqual(audit_reciprocal_relationships()[1], [])
+
+    def test_repair_runs_every_batch_and_reindexes(self):
+        third = str(self.concepts[2].pk)
+        self._relation_tile(self.first, self.second)
+        self._relation_tile(self.first, third)
+        _count, issues = audit_reciprocal_relationships()
+
+        # The indexer is not mocked: each batch's reindex runs on commit
+        with (
+            self.assertNoLogs("arches_lingo.utils.concept_lifecycle", level="ERROR"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            repaired = repair_reciprocal_relationships(issues, batch_size=1)
+
+        self.assertEqual(repaired, 2)
+        self.assertTrue(self._counterparts_on(self.second).exists())
+        self.assertTrue(self._counterparts_on(third).exists())
+        self.assertEqual(audit_reciprocal_relationships()[1], [])
+
+    def test_mismatch_repaired_from_most_recent_edit(self):
+        stale = self._relation_tile(self.first, self.second, relation="stale")
+        current = self._relation_tile(self.second, self.first, relation="current")
+        self._create_edit(
+            self.concepts[1],
+            "tile edit",
+            datetime.now(),
+            tileid=current.pk,
+            nodegroupid=RELATION_STATUS_NODEGROUP,
+            newvalue=current.data,
+        )
+
+        _count, issues = audit_reciprocal_relationships()
+        (issue,) = issues
+        self.assertEqual(issue.kind, MISMATCH)
+
+        repair_reciprocal_relationships(issues)
+        stale.refresh_from_db()
+        current.refresh_from_db()
+        self.assertEqual(
+            stale.data[RELATION_STATUS_ASCRIBED_RELATION_NODEID], "current"
+        )
+        self.assertEqual(
+            current.data[RELATION_STATUS_ASCRIBED_RELATION_NODEID], "current"
+        )
+
+    def test_dangling_relation_is_not_repaired(self):
+        self._relation_tile(self.first, str(uuid.uuid4()))
+
+        _count, issues = audit_reciprocal_relationships()
+        self.assertEqual([issue.kind for issue in issues], [DANGLING])
+
+        self.assertEqual(repair_reciprocal_relationships(issues), 0)
+
+    def test_command_writes_csv_report(self):
+        tile = self._relation_tile(self.first, self.second)
+        with tempfile.TemporaryDirectory() as directory:
+            report_path = os.path.join(directory, "report.csv")
+            call_command(
+                "audit_reciprocal_relationships",
+                format="csv",
+                output=report_path,
+                stderr=StringIO(),
+            )
+            with open(report_path, newline="") as report_file:
+                rows = list(csv.DictReader(report_file))
+
+        self.assertEqual([row["tileid"] for row in rows], [str(tile.pk)])
+        self.assertFalse(self._counterparts_on(self.second).exists())
+
+    @patch(
+        "arches.app.utils.task_management.check_if_celery_available",
+        return_value=False,
+    )
+    def test_background_audit_records_summary(self, _celery):
+        self._relation_tile(self.first, self.second)
+
+        loadid = start_reciprocal_integrity_audit(self.admin, repair=True)
+
+        load_details = LoadEvent.objects.get(loadid=loadid).load_details
+        self.assertEqual(load_details[ORPHAN], 1)
+        self.assertEqual(load_details["repaired"], 1)
+        self.assertEqual(len(load_details["issues"]), 1)
+        self.assertTrue(self._counterparts_on(self.second).exists())
+
+    @patch(
+        "arches.app.utils.task_management.check_if_celery_available",
+        return_value=False,
+    )
+    def test_audit_endpoint_starts_repair(self, _celery):
+        self._relation_tile(self.first, self.second)
+
+        response = self.client.post(
+            reverse("api-lingo-reciprocal-relationship-audit"),
+            data=json.dumps({"repair": True}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 202)
+        status = json.loads(
+            self.client.get(
+                reverse(
+                    "api-lingo-bulk-operation",
+                    args=[json.loads(response.content)["loadid"]],
+                )
+            ).content
+        )
+        self.assertEqual(status["load_details"]["repaired"], 1)
+        self.assertTrue(self._counterparts_on(self.second).exists())
@@ -1,8 +1,11 @@
 import uuid
 from unittest.mock import MagicMock, call, patch
 
+from django.db.models import Q
 from django.test import SimpleTestCase, TestCase
 
+from arches.app.models.models import TileModel
+
 from arches_lingo.const import (
     RELATION_STATUS_ASCRIBED_COMPARATE_NODEID,
     RELATION_STATUS_ASCRIBED_RELATION_NODEID,
@@ -16,14 +19,21 @@ from arches_lingo.const import (
     RELATION_STATUS_TIMESPAN_END_OF_THE_END_NODEID,
 )
 from arches_lingo.functions.reciprocal_relationship import (
+    DELETE_COUNTERPART,
     RECIPROCAL_SYNC_CONTEXT,
     ReciprocalRelationshipFunction,
+    _sync_deferred_batch,
     _thread_local,
+    deferred_reciprocal_sync,
 )
 
+from tests.tests import ViewTests
+
 # These tests can be run from the command line via:
 # python manage.py test tests.test_reciprocal_relationship --settings="tests.test_settings"
 
+ON_COMMIT = "arches_lingo.functions.reciprocal_relationship.transaction.on_commit"
+
 RESOURCE_A = str(uuid.uuid4())
 RESOURCE_B = str(uuid.uuid4())
 
@@ -179,49 +189,74 @@ class FindCounterpartTileTests(SimpleTestCase):
     def setUp(self):
         self.fn = ReciprocalRelationshipFunction()
 
-    def _make_db_tile(self, comparate_resource_id):
-        tile = MagicMock()
-        tile.data = {
-            RELATION_STATUS_ASCRIBED_COMPARATE_NODEID: _comparate(comparate_resource_id)
-        }
-        return tile
-
     @patch("arches_lingo.functions.reciprocal_relationship.Tile")
-    def test_returns_matching_tile(self, MockTile):
-        matching = self._make_db_tile(RESOURCE_A)
-        MockTile.objects.filter.return_value = [matching]
+    def test_filters_by_comparate_containment(self, MockTile):
+        matching = MagicMock()
+        MockTile.objects.filter.return_value.order_by.return_value.first.return_value = (
+            matching
+        )
 
         result = self.fn._find_counterpart_tile(RESOURCE_B, RESOURCE_A)
 
         self.assertIs(result, matching)
+        comparate_lookup = (
+            f"data__{RELATION_STATUS_ASCRIBED_COMPARATE_NODEID}__contains"
+        )
         MockTile.objects.filter.assert_called_once_with(
+            Q(**{comparate_lookup: [{"resourceId": RESOURCE_A}]})
+            | Q(**{comparate_lookup: {"resourceId": RESOURCE_A}}),
             resourceinstance_id=RESOURCE_B,
             nodegroup_id=RELATION_STATUS_NODEGROUP,
         )
 
     @patch("arches_lingo.functions.reciprocal_relationship.Tile")
-    def test_returns_none_when_no_tiles_exist(self, MockTile):
-        MockTile.objects.filter.return_value = []
+    def test_returns_none_when_no_tile_points_back(self, MockTile):
+        MockTile.objects.filter.return_value.order_by.return_value.first.return_value = (
+            None
+        )
         result = self.fn._find_counterpart_tile(RESOURCE_B, RESOURCE_A)
         self.assertIsNone(result)
 
-    @patch("arches_lingo.functions.reciprocal_relationship.Tile")
-    def test_returns_none_when_no_tile_points_back(self, MockTile):
-        # Tile exists but comparate points elsewhere, not back to RESOURCE_A
-        other = self._make_db_tile(str(uuid.uuid4()))
-        MockTile.objects.filter.return_value = [other]
 
-        result = self.fn._find_counterpart_tile(RESOURCE_B, RESOURCE_A)
-        self.assertIsNone(result)
+class FindCounterpartTileQueryTests(ViewTests):
+    """Database tests for the containment lookup in _find_counterpart_tile."""
 
-    @patch("arches_lingo.functions.reciprocal_relationship.Tile")
-    def test_returns_first_matching_tile_among_many(self, MockTile):
-        non_match = self._make_db_tile(str(uuid.uuid4()))
-        matching = self._make_db_tile(RESOURCE_A)
-        MockTile.objects.filter.return_value = [non_match, matching]
+    def setUp(self):
+        super().setUp()
+        self.fn = ReciprocalRelationshipFunction()
+        self.target_id = str(self.concepts[1].pk)
+        self.pointing_to_id = str(self.concepts[0].pk)
 
-        result = self.fn._find_counterpart_tile(RESOURCE_B, RESOURCE_A)
-        self.assertIs(result, matching)
+    def _relation_tile(self, comparate_value):
+        return TileModel.objects.create(
+            tileid=uuid.uuid4(),
+            resourceinstance_id=self.target_id,
+            nodegroup_id=RELATION_STATUS_NODEGROUP,
+            data={RELATION_STATUS_ASCRIBED_COMPARATE_NODEID: comparate_value},
+            sortorder=0,
+        )
+
+    def test_matches_list_format_comparate(self):
+        self._relation_tile(_comparate(str(uuid.uuid4())))
+        matching = self._relation_tile(_comparate(self.pointing_to_id))
+
+        result = self.fn._find_counterpart_tile(self.target_id, self.pointing_to_id)
+
+        self.assertEqual(result.tileid, matching.tileid)
+
+    def test_matches_dict_format_comparate(self):
+        matching = self._relation_tile({"resourceId": self.pointing_to_id})
+
+        result = self.fn._find_counterpart_tile(self.target_id, self.pointing_to_id)
+
+        self.assertEqual(result.tileid, matching.tileid)
+
+    def test_returns_none_when_no_tile_points_back(self):
+        self._relation_tile(_comparate(str(uuid.uuid4())))
+
+        self.assertIsNone(
+            self.fn._find_counterpart_tile(self.target_id, self.pointing_to_id)
+        )
 
 
 class PostSaveTests(SimpleTestCase):
@@ -499,3 +534,166 @@ class UpdateCounterpartTileTests(SimpleTestCase):
             "arches_lingo.functions.reciprocal_relationship", level="ERROR"
         ):
             self.fn._update_counterpart_tile(source_tile, counterpart, RESOURCE_A)
+
+
+class DeferredSyncTests(SimpleTestCase):
+    """Unit tests for queuing reciprocal sync inside deferred_reciprocal_sync."""
+
+    def setUp(self):
+        self.fn = ReciprocalRelationshipFunction()
+        _thread_local.syncing_save = False
+        _thread_local.deferred_batch = None
+
+    def test_post_save_queues_counterpart_data(self):
+        tile = _make_tile(
+            data={RELATION_STATUS_ASCRIBED_COMPARATE_NODEID: _comparate(RESOURCE_B)}
+        )
+        with (
+            patch.object(self.fn, "_find_counterpart_tile") as mock_find,
+            patch.object(
+                ReciprocalRelationshipFunction, "sync_counterparts"
+            ) as mock_sync,
+            patch(ON_COMMIT, side_effect=lambda callback: callback()),
+        ):
+            with deferred_reciprocal_sync():
+                self.fn.post_save(tile, request=None)
+            mock_find.assert_not_called()
+
+        ((counterpart_changes,), _kwargs) = mock_sync.call_args
+        self.assertEqual(list(counterpart_changes), [(RESOURCE_A, RESOURCE_B)])
+        self.assertEqual(
+            counterpart_changes[(RESOURCE_A, RESOURCE_B)][
+                RELATION_STATUS_ASCRIBED_COMPARATE_NODEID
+            ][0]["resourceId"],
+            RESOURCE_A,
+        )
+
+    def test_delete_queues_counterpart_removal(self):
+        tile = _make_tile(
+            data={RELATION_STATUS_ASCRIBED_COMPARATE_NODEID: _comparate(RESOURCE_B)}
+        )
+        with (
+            patch.object(self.fn, "_find_counterpart_tile") as mock_find,
+            patch.object(
+                ReciprocalRelationshipFunction, "sync_counterparts"
+            ) as mock_sync,
+            patch(ON_COMMIT, side_effect=lambda callback: callback()),
+        ):
+            with deferred_reciprocal_sync():
+                self.fn.delete(tile, request=None)
+            mock_find.assert_not_called()
+
+        mock_sync.assert_called_once_with(
+            {(RESOURCE_A, RESOURCE_B): DELETE_COUNTERPART}
+        )
+
+    def test_nothing_synced_when_block_raises(self):
+        tile = _make_tile(
+            data={RELATION_STATUS_ASCRIBED_COMPARATE_NODEID: _comparate(RESOURCE_B)}
+        )
+        with patch.object(
+            ReciprocalRelationshipFunction, "sync_counterparts"
+        ) as mock_sync:
+            with self.assertRaises(RuntimeError):
+                with deferred_reciprocal_sync():
+                    self.fn.post_save(tile, request=None)
+                    raise RuntimeError
+            mock_sync.assert_not_called()
+        self.assertIsNone(_thread_local.deferred_batch)
+
+    def test_failed_batch_starts_repair_audit(self):
+        tile = _make_tile(
+            data={RELATION_STATUS_ASCRIBED_COMPARATE_NODEID: _comparate(RESOURCE_B)}
+        )
+        user = MagicMock()
+        with (
+            patch.object(
+                ReciprocalRelationshipFunction,
+                "sync_counterparts",
+                side_effect=RuntimeError("boom"),
+            ),
+            patch(
+                "arches_lingo.utils.reciprocal_integrity."
+                "start_reciprocal_integrity_audit"
+            ) as mock_start_audit,
+            patch(ON_COMMIT, side_effect=lambda callback: callback()),
+            self.assertLogs(
+                "arches_lingo.functions.reciprocal_relationship", level="ERROR"
+            ),
+        ):
+            with deferred_reciprocal_sync(user):
+                self.fn.post_save(tile, request=None)
+
+        mock_start_audit.assert_called_once_with(user, repair=True)
+
+
+class SyncCounterpartsTests(ViewTests):
+    """Database tests for batched counterpart reconciliation."""
+
+    def setUp(self):
+        super().setUp()
+        self.fn = ReciprocalRelationshipFunction()
+        self.source_id = str(self.concepts[0].pk)
+        self.related_id = str(self.concepts[1].pk)
+
+    def _counterpart_tiles(self):
+        return TileModel.objects.filter(
+            resourceinstance_id=self.related_id,
+            nodegroup_id=RELATION_STATUS_NODEGROUP,
+        )
+
+    def _counterpart_data(self):
+        tile = _make_tile(
+            resource_id=self.source_id,
+            data={
+                RELATION_STATUS_ASCRIBED_COMPARATE_NODEID: _comparate(self.related_id)
+            },
+        )
+        return self.fn._build_counterpart_data(tile, self.source_id)
+
+    def test_creates_then_removes_counterpart(self):
+        self.fn.sync_counterparts(
+            {(self.source_id, self.related_id): self._counterpart_data()}
+        )
+        (counterpart,) = self._counterpart_tiles()
+        self.assertEqual(
+            counterpart.data[RELATION_STATUS_ASCRIBED_COMPARATE_NODEID][0][
+                "resourceId"
+            ],
+            self.source_id,
+        )
+
+        self.fn.sync_counterparts(
+            {(self.source_id, self.related_id): DELETE_COUNTERPART}
+        )
+        self.assertFalse(self._counterpart_tiles().exists())
+
+    @patch(
+        "arches_lingo.utils.concept_reindex.index_resources_using_singleprocessing",
+        side_effect=RuntimeError("search unavailable"),
+    )
+    def test_indexing_error_does_not_start_repair_audit(self, _index):
+        with (
+            patch(
+                "arches_lingo.utils.reciprocal_integrity."
+                "start_reciprocal_integrity_audit"
+            ) as mock_start_audit,
+            self.assertLogs("arches_lingo.utils.concept_lifecycle", level="ERROR"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            _sync_deferred_batch(
+                {(self.source_id, self.related_id): self._counterpart_data()},
+                self.admin,
+            )
+
+        mock_start_audit.assert_not_called()
+        self.assertTrue(self._counterpart_tiles().exists())
+
+    def test_skips_pairs_changed_in_both_directions(self):
+        self.fn.sync_counterparts(
+            {
+                (self.source_id, self.related_id): self._counterpart_data(),
+                (self.related_id, self.source_id): self._counterpart_data(),
+            }
+        )
+        self.assertFalse(self._counterpart_tiles().exists())
@@ -0,0 +1,209 @@
+import json
+from unittest.mock import patch
+
+from django.urls import reverse
+
+from arches.app.models.models import (
+    EditLog,
+    LoadEvent,
+    ResourceIdentifier,
+    ResourceInstance,
+    TileModel,
+)
+
+from arches_lingo.const import (
+    CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID,
+    CLASSIFICATION_STATUS_NODEGROUP,
+    CONCEPTS_GRAPH_ID,
+    CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID,
+    IDENTIFIER_CONTENT_NODE,
+    IDENTIFIER_NODEGROUP,
+    SCHEME_IDENTIFIER_CONTENT_NODE,
+    SCHEME_IDENTIFIER_NODEGROUP,
+)
+from arches_lingo.functions.update_concept_lifecycle_states_for_scheme import (
+    UpdateConceptLifecycleStatesForScheme,
+)
+from arches_lingo.utils.concept_lifecycle import (
+    DRAFT_STATE_ID,
+    get_scheme_concept_ids,
+)
+from arches_lingo.utils.scheme_clone import clone_scheme
+
+from tests.tests import ViewTests
+
+# These tests can be run from the command line via:
+# python manage.py test tests.test_scheme_clone --settings="tests.test_settings"
+
+
+class SchemeCloneTests(ViewTests):
+    """Tests for the set-based scheme deep copy."""
+
+    def _referenced_ids(self, resource_ids, nodegroup_id, node_id):
+        return {
+            reference["resourceId"]
+            for tile in TileModel.objects.filter(
+                resourceinstance_id__in=resource_ids, nodegroup_id=nodegroup_id
+            )
+            for reference in tile.data[node_id]
+        }
+
+    def test_clone_copies_concepts_with_rewritten_references(self):
+        original_ids = [self.scheme.pk, *(concept.pk for concept in self.concepts)]
+        original_tile_count = TileModel.objects.filter(
+            resourceinstance_id__in=original_ids
+        ).count()
+
+        new_scheme_id, _transaction_id = clone_scheme(self.scheme.pk, self.admin)
+
+        new_scheme = ResourceInstance.objects.get(pk=new_scheme_id)
+        self.assertEqual(
+            new_scheme.resource_instance_lifecycle_state_id, DRAFT_STATE_ID
+        )
+        cloned_concept_ids = get_scheme_concept_ids(new_scheme_id)
+        self.assertEqual(len(cloned_concept_ids), len(self.concepts))
+        self.assertTrue(cloned_concept_ids.isdisjoint(str(c.pk) for c in self.concepts))
+        self.assertEqual(
+            TileModel.objects.filter(
+                resourceinstance_id__in=[new_scheme_id, *cloned_concept_ids]
+            ).count(),
+            original_tile_count,
+        )
+
+        self.assertEqual(
+            self._referenced_ids(
+                cloned_concept_ids,
+                CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID,
+                CONCEPTS_PART_OF_SCHEME_NODEGROUP_ID,
+            ),
+            {new_scheme_id},
+        )
+        broader_ids = self._referenced_ids(
+            cloned_concept_ids,
+            CLASSIFICATION_STATUS_NODEGROUP,
+            CLASSIFICATION_STATUS_ASCRIBED_CLASSIFICATION_NODEID,
+        )
+        self.assertTrue(broader_ids)
+        self.assertTrue(broader_ids <= cloned_concept_ids)
+
+    def test_original_scheme_is_untouched(self):
+        clone_scheme(self.scheme.pk, self.admin)
+
+        self.assertEqual(
+            get_scheme_concept_ids(self.scheme.pk),
+            {str(concept.pk) for concept in self.concepts},
+        )
+
+    def test_clone_with_identifier_registers_it(self):
+        TileModel.objects.create(
+            resourceinstance=self.scheme,
+            nodegroup_id=SCHEME_IDENTIFIER_NODEGROUP,
+            data={SCHEME_IDENTIFIER_CONTENT_NODE: "S1"},
+            sortorder=0,
+        )
+
+        new_scheme_id, transaction_id = clone_scheme(
+            self.scheme.pk, self.admin, scheme_identifier="S2"
+        )
+
+        self.assertEqual(
+            list(
+                ResourceIdentifier.objects.filter(resourceid=new_scheme_id).values_list(
+                    "identifier", flat=True
+                )
+            ),
+            ["S2"],
+        )
+        self.assertEqual(
+            EditLog.objects.filter(transactionid=transaction_id).first().note,
+            "Cloned from scheme %s" % self.scheme.pk,
+        )
+
+    @patch("arches_lingo.functions.update_concept_lifecycle_states_for_scheme.ListItem")
+    def test_promoting_clone_keeps_renumbered_identifiers(self, mock_list_item):
+        mock_list_item.objects.get.return_value.build_tile_value.return_value = {}
+        TileModel.objects.create(
+            resourceinstance=self.concepts[0],
+            nodegroup_id=IDENTIFIER_NODEGROUP,
+            data={IDENTIFIER_CONTENT_NODE: "7"},
+            sortorder=0,
+        )
+        new_scheme_id, _transaction_id = clone_scheme(self.scheme.pk, self.admin)
+        cloned_concept_ids = get_scheme_concept_ids(new_scheme_id)
+
+        function = UpdateConceptLifecycleStatesForScheme()
+        with patch.object(
+            function, "_get_nodegroup_data_with_widget_defaults", return_value={}
+        ):
+            function._handle_draft_concepts_promoted_to_active(
+                new_scheme_id,
+                CONCEPTS_GRAPH_ID,
+                ResourceInstance.objects.filter(pk__in=cloned_concept_ids),
+                None,
+            )
+
+        identifier_tiles = TileModel.objects.filter(
+            resourceinstance_id__in=cloned_concept_ids,
+            nodegroup_id=IDENTIFIER_NODEGROUP,
+        )
+        self.assertEqual(identifier_tiles.count(), len(cloned_concept_ids))
+        self.assertEqual(
+            ResourceIdentifier.objects.filter(
+                resourceid__in=cloned_concept_ids
+            ).count(),
+            len(cloned_concept_ids),
+        )
+
+    @patch(
+        "arches.app.utils.task_management.check_if_celery_available",
+        return_value=False,
+    )
+    @patch("arches_lingo.utils.concept_reindex.index_resources_using_singleprocessing")
+    def test_endpoint_clones_and_indexes_new_resources(self, mock_index, _celery):
+        response = self.client.post(
+            reverse("api-lingo-scheme-clone", args=[self.scheme.pk]),
+            data=json.dumps({}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 202)
+        load_event = LoadEvent.objects.get(
+            loadid=json.loads(response.content)["loadid"]
+        )
+        self.assertEqual(load_event.status, "completed")
+        self.assertEqual(load_event.load_details["processed"], len(self.concepts) + 1)
+        self.assertTrue(
+            ResourceInstance.objects.filter(
+                pk=load_event.load_details["new_scheme_id"]
+            ).exists()
+        )
+        mock_index.assert_called_once()
+
+    @patch(
+        "arches.app.utils.task_management.check_if_celery_available",
+        return_value=False,
+    )
+    @patch(
+        "arches_lingo.utils.concept_reindex.index_resources_using_singleprocessing",
+        side_effect=RuntimeError("search unavailable"),
+    )
+    def test_indexing_error_keeps_committed_clone_successful(self, _index, _celery):
+        with self.assertLogs("arches_lingo.utils.scheme_clone", level="ERROR"):
+            response = self.client.post(
+                reverse("api-lingo-scheme-clone", args=[self.scheme.pk]),
+                data=json.dumps({}),
+                content_type="application/json",
+            )
+
+        load_event = LoadEvent.objects.get(
+            loadid=json.loads(response.content)["loadid"]
+        )
+        self.assertEqual(load_event.status, "completed")
+        self.assertTrue(load_event.successful)
+        self.assertEqual(load_event.load_details["phase"], "index_failed")
+        self.assertIn("search unavailable", load_event.load_details["index_error"])
+        self.assertTrue(
+            ResourceInstance.objects.filter(
+                pk=load_event.load_details["new_scheme_id"]
+            ).exists()
+        )
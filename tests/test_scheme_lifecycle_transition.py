@@ -0,0 +1,143 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.http import HttpRequest
+from django.test import override_settings
+from django.urls import reverse
+
+from arches.app.models.models import ResourceInstance
+
+from arches_lingo.etl_modules.lingo_bulk_operations import LingoBulkOperations
+from arches_lingo.functions.update_concept_lifecycle_states_for_scheme import (
+    ACTIVE_RESOURCE_INSTANCE_LIFECYCLE_STATE_ID,
+    DRAFT_RESOURCE_INSTANCE_LIFECYCLE_STATE_ID,
+    UpdateConceptLifecycleStatesForScheme,
+)
+from arches_lingo.models import ConceptIdentifierCounter
+from arches_lingo.utils.concept_lifecycle import EDITING_STATE_ID
+from arches_lingo.utils.scheme_lifecycle_transition import (
+    SCHEME_LIFECYCLE_TRANSITION_OPERATION,
+    run_scheme_lifecycle_transition,
+)
+
+from tests.tests import ViewTests
+
+FUNCTION_MODULE = "arches_lingo.functions.update_concept_lifecycle_states_for_scheme"
+
+
+class SchemeLifecycleTransitionTests(ViewTests):
+    """Tests for chunked, background scheme lifecycle transitions."""
+
+    def _start(self, **load_details):
+        operation = LingoBulkOperations(userid=self.admin.id)
+        operation.start(
+            SCHEME_LIFECYCLE_TRANSITION_OPERATION,
+            scheme_id=str(self.scheme.pk),
+            new_state_id=str(EDITING_STATE_ID),
+            is_scheme_promoting_to_active=False,
+            processed=0,
+            **load_details,
+        )
+        return operation
+
+    def _editing_concept_ids(self):
+        return set(
+            ResourceInstance.objects.filter(
+                pk__in=[concept.pk for concept in self.concepts],
+                resource_instance_lifecycle_state_id=EDITING_STATE_ID,
+            ).values_list("pk", flat=True)
+        )
+
+    def test_transitions_every_concept_in_chunks(self):
+        operation = self._start()
+
+        run_scheme_lifecycle_transition(operation.loadid, self.admin.id, chunk_size=2)
+
+        self.assertEqual(
+            self._editing_concept_ids(), {concept.pk for concept in self.concepts}
+        )
+        load_event = operation.get_load_event()
+        self.assertEqual(load_event.status, "completed")
+        self.assertEqual(load_event.load_details["processed"], 5)
+        self.assertEqual(load_event.load_details["total"], 5)
+
+    def test_resumes_after_last_checkpoint(self):
+        concept_ids = sorted(concept.pk for concept in self.concepts)
+        operation = self._start(last_resourceid=str(concept_ids[2]), processed=3)
+
+        run_scheme_lifecycle_transition(operation.loadid, self.admin.id)
+
+        self.assertEqual(self._editing_concept_ids(), set(concept_ids[3:]))
+        self.assertEqual(operation.get_details()["processed"], 5)
+
+    def test_status_endpoint_returns_latest_transition(self):
+        operation = self._start()
+
+        response = self.client.get(
+            reverse("api-lingo-scheme-lifecycle-transition", args=[self.scheme.pk])
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)["loadid"], operation.loadid)
+
+    @override_settings(LINGO_LIFECYCLE_TRANSITION_BACKGROUND_THRESHOLD=4)
+    @patch(
+        "arches.app.utils.task_management.check_if_celery_available",
+        return_value=True,
+    )
+    def test_background_only_above_threshold(self, _celery):
+        function = UpdateConceptLifecycleStatesForScheme()
+        request = HttpRequest()
+        request.user = self.admin
+        concepts = ResourceInstance.objects.filter(
+            pk__in=[concept.pk for concept in self.concepts]
+        )
+
+        self.assertTrue(function._should_run_in_background(concepts, request))
+        self.assertFalse(
+            function._should_run_in_background(
+                concepts.exclude(pk=self.concepts[0].pk), request
+            )
+        )
+
+    @override_settings(LINGO_LIFECYCLE_TRANSITION_BACKGROUND_THRESHOLD=0)
+    @patch(
+        "arches.app.utils.task_management.check_if_celery_available",
+        return_value=True,
+    )
+    @patch(
+        f"{FUNCTION_MODULE}.start_scheme_lifecycle_transition",
+        side_effect=RuntimeError,
+    )
+    def test_background_promotion_is_atomic_with_scheme_changes(self, _start, _celery):
+        ConceptIdentifierCounter.objects.filter(scheme_id=self.scheme.pk).delete()
+
+        def promote_scheme(scheme_resource_instance_id, **kwargs):
+            ConceptIdentifierCounter.objects.create(
+                scheme_id=scheme_resource_instance_id
+            )
+            return None, None
+
+        request = HttpRequest()
+        request.user = self.admin
+        function = UpdateConceptLifecycleStatesForScheme()
+        with (
+            patch.object(
+                function,
+                "_handle_scheme_promoted_to_active",
+                side_effect=promote_scheme,
+            ),
+            self.assertRaises(RuntimeError),
+        ):
+            function.on_update_lifecycle_state(
+                self.scheme,
+                SimpleNamespace(id=DRAFT_RESOURCE_INSTANCE_LIFECYCLE_STATE_ID),
+                SimpleNamespace(id=ACTIVE_RESOURCE_INSTANCE_LIFECYCLE_STATE_ID),
+                request,
+                context=None,
+            )
+
+        self.assertFalse(
+            ConceptIdentifierCounter.objects.filter(scheme_id=self.scheme.pk).exists()
+        )
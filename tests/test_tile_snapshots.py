@@ -0,0 +1,165 @@
+import json
+from datetime import datetime, timedelta
+
+from django.urls import reverse
+
+from arches.app.models.models import TileModel
+
+from arches_lingo.const import CONCEPT_NAME_CONTENT_NODE, CONCEPT_NAME_NODEGROUP
+from arches_lingo.models import ResourceTileSnapshot
+from arches_lingo.utils.edit_log import build_revert_plan
+from arches_lingo.utils.tile_snapshots import (
+    get_resource_tiles_at,
+    get_resources_due_for_snapshot,
+    prune_snapshots,
+    take_snapshots,
+)
+
+from tests.test_edit_log import EditLogTestMixin
+from tests.tests import ViewTests
+
+
+class TileSnapshotTests(EditLogTestMixin, ViewTests):
+    """Tests for periodic tile-state snapshots and snapshot-based replay."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.concept = cls.concepts[0]
+        cls.label_tile = TileModel.objects.get(
+            resourceinstance=cls.concept, nodegroup_id=CONCEPT_NAME_NODEGROUP
+        )
+
+    def _snapshot_at(self, snapshot_time):
+        take_snapshots([self.concept.pk])
+        snapshot = ResourceTileSnapshot.objects.get(resourceinstance=self.concept)
+        snapshot.snapshot_time = snapshot_time
+        snapshot.save()
+        return snapshot
+
+    def _edit_label(self, timestamp, value):
+        data = {**self.label_tile.data, CONCEPT_NAME_CONTENT_NODE: value}
+        self._create_edit(
+            self.concept,
+            "tile edit",
+            timestamp,
+            tileid=self.label_tile.pk,
+            nodegroupid=CONCEPT_NAME_NODEGROUP,
+            newvalue=data,
+        )
+        return data
+
+    def test_take_snapshots_records_current_tiles(self):
+        take_snapshots([self.concept.pk])
+
+        snapshot = ResourceTileSnapshot.objects.get(resourceinstance=self.concept)
+        self.assertEqual(
+            snapshot.tiles[str(self.label_tile.pk)]["data"], self.label_tile.data
+        )
+        self.assertEqual(
+            snapshot.tiles[str(self.label_tile.pk)]["nodegroupid"],
+            str(CONCEPT_NAME_NODEGROUP),
+        )
+
+    def test_due_resources_respect_edit_threshold(self):
+        self._edit_label(datetime.now(), "Edited")
+
+        due = {str(resourceid) for resourceid in get_resources_due_for_snapshot(1)}
+
+        self.assertIn(str(self.concept.pk), due)
+        self.assertNotIn(str(self.concepts[1].pk), due)
+
+    def test_tiles_at_replays_edits_after_snapshot(self):
+        snapshot_time = datetime(2025, 1, 1)
+        self._snapshot_at(snapshot_time)
+        edited = self._edit_label(snapshot_time + timedelta(hours=1), "Later")
+
+        before_time, before = get_resource_tiles_at(
+            self.concept.pk, snapshot_time + timedelta(minutes=30)
+        )
+        _after_time, after = get_resource_tiles_at(
+            self.concept.pk, snapshot_time + timedelta(hours=2)
+        )
+
+        self.assertEqual(before_time, snapshot_time)
+        self.assertEqual(before[str(self.label_tile.pk)]["data"], self.label_tile.data)
+        self.assertEqual(after[str(self.label_tile.pk)]["data"], edited)
+
+    def test_tiles_at_replays_edit_committed_after_snapshot(self):
+        snapshot_time = datetime(2025, 1, 1)
+        # Stamped before the snapshot, but not in the tiles it read
+        self._snapshot_at(snapshot_time)
+        edited = self._edit_label(snapshot_time - timedelta(seconds=30), "Late")
+
+        _snapshot_time, tiles = get_resource_tiles_at(
+            self.concept.pk, snapshot_time + timedelta(hours=1)
+        )
+
+        self.assertEqual(tiles[str(self.label_tile.pk)]["data"], edited)
+
+    def test_tiles_at_without_snapshot_keeps_current_placement(self):
+        edit_time = datetime(2025, 1, 1)
+        self._edit_label(edit_time, "Edited")
+
+        snapshot_time, tiles = get_resource_tiles_at(
+            self.concept.pk, edit_time + timedelta(minutes=1)
+        )
+
+        self.assertIsNone(snapshot_time)
+        self.assertEqual(
+            tiles[str(self.label_tile.pk)]["sortorder"], self.label_tile.sortorder
+        )
+
+    def test_prune_keeps_latest_snapshot_of_each_resource(self):
+        old_time = datetime.now() - timedelta(days=365)
+        self._snapshot_at(old_time)
+        take_snapshots([self.concept.pk, self.concepts[1].pk])
+        ResourceTileSnapshot.objects.filter(resourceinstance=self.concepts[1]).update(
+            snapshot_time=old_time
+        )
+
+        deleted = prune_snapshots(retention_days=30)
+
+        self.assertEqual(deleted, 1)
+        self.assertEqual(
+            ResourceTileSnapshot.objects.filter(resourceinstance=self.concept).count(),
+            1,
+        )
+        self.assertTrue(
+            ResourceTileSnapshot.objects.filter(
+                resourceinstance=self.concepts[1]
+            ).exists()
+        )
+
+    def test_revert_plan_uses_snapshot_state(self):
+        snapshot_time = datetime(2025, 1, 1)
+        self._snapshot_at(snapshot_time)
+        self._edit_label(snapshot_time + timedelta(hours=1), "Later")
+
+        plan = build_revert_plan(self.concept.pk, snapshot_time + timedelta(minutes=30))
+
+        ((tileid, _nodegroupid, last_edit),) = plan
+        self.assertEqual(tileid, str(self.label_tile.pk))
+        self.assertEqual(last_edit.newvalue, self.label_tile.data)
+
+    def test_as_of_endpoint_returns_tiles(self):
+        snapshot_time = datetime(2025, 1, 1)
+        self._snapshot_at(snapshot_time)
+
+        response = self.client.get(
+            reverse("api-lingo-resource-as-of", args=[self.concept.pk]),
+            {"timestamp": (snapshot_time + timedelta(minutes=1)).isoformat()},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        body = json.loads(response.content)
+        self.assertEqual(body["snapshot_time"], snapshot_time.isoformat())
+        self.assertIn(str(self.label_tile.pk), {t["tileid"] for t in body["tiles"]})
+
+    def test_as_of_endpoint_rejects_bad_timestamp(self):
+        with self.assertLogs("django.request", level="WARNING"):
+            response = self.client.get(
+                reverse("api-lingo-resource-as-of", args=[self.concept.pk]),
+                {"timestamp": "yesterday"},
+            )
+        self.assertEqual(response.status_code, 400)